@@ -37,6 +37,7 @@ from aea.helpers.exec_timeout import ExecTimeoutThreadGuard, TimeoutException
 from aea.helpers.logging import AgentLoggerAdapter
 from aea.identity.base import Identity
 from aea.mail.base import Envelope
+from aea.multiplexer import OutBoxPolicy, PriorityLane
 from aea.protocols.base import Message
 from aea.protocols.default.message import DefaultMessage
 from aea.registries.filter import Filter
@@ -76,6 +77,12 @@ class AEA(Agent):
         default_routing: Optional[Dict[PublicId, PublicId]] = None,
         connection_ids: Optional[Collection[PublicId]] = None,
         search_service_address: str = "oef",
+        priority_lanes: Optional[Sequence[PriorityLane]] = None,
+        in_queue_high_watermark: Optional[int] = None,
+        in_queue_low_watermark: Optional[int] = None,
+        out_queue_maxsize: int = 0,
+        outbox_policy: OutBoxPolicy = OutBoxPolicy.BLOCK,
+        outbox_timeout: Optional[float] = None,
         **kwargs,
     ) -> None:
         """
@@ -96,6 +103,12 @@ class AEA(Agent):
         :param default_routing: dictionary for default routing.
         :param connection_ids: active connection ids. Default: consider all the ones in the resources.
         :param search_service_address: the address of the search service used.
+        :param priority_lanes: the priority lanes of the in queue. If None, envelopes are processed in FIFO order.
+        :param in_queue_high_watermark: the in queue size at which the receiving is suspended. If None, it is never suspended.
+        :param in_queue_low_watermark: the in queue size at which the receiving is resumed. If None, half of the high watermark.
+        :param out_queue_maxsize: the maximum size of the out queue. If 0, the out queue is unbounded.
+        :param outbox_policy: what the outbox does when the out queue is full.
+        :param outbox_timeout: the maximum time to wait for the out queue, with the blocking policy.
         :param kwargs: keyword arguments to be attached in the agent context namespace.
 
         :return: None
@@ -107,7 +120,14 @@ class AEA(Agent):
             timeout=timeout,
             loop_mode=loop_mode,
             runtime_mode=runtime_mode,
+            in_queue_high_watermark=in_queue_high_watermark,
+            in_queue_low_watermark=in_queue_low_watermark,
+            out_queue_maxsize=out_queue_maxsize,
+            outbox_policy=outbox_policy,
+            outbox_timeout=outbox_timeout,
         )
+        if priority_lanes:
+            self.multiplexer.set_priority_lanes(priority_lanes)
 
         self.max_reactions = max_reactions
         self._task_manager = TaskManager()
@@ -244,6 +264,8 @@ class AEA(Agent):
         envelope = self.inbox.get_nowait()  # type: Optional[Envelope]
         if envelope is not None:
             self._handle(envelope)
+            # the handlers only receive the message, so nothing else holds the envelope.
+            envelope.release()
 
     def _handle(self, envelope: Envelope) -> None:
         """
@@ -252,7 +274,7 @@ class AEA(Agent):
         :param envelope: the envelope to handle.
         :return: None
         """
-        logger.debug("Handling envelope: {}".format(envelope))
+        logger.debug("Handling envelope: %s", envelope)
         protocol = self.resources.get_protocol(envelope.protocol_id)
 
         # TODO specify error handler in config and make this work for different skill/protocol versions.
@@ -34,6 +34,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -68,6 +69,7 @@ from aea.configurations.constants import (
     DEFAULT_PROTOCOL,
     DEFAULT_SKILL,
 )
+from aea.configurations.image import AgentImage
 from aea.configurations.loader import ConfigLoader
 from aea.contracts import contract_registry
 from aea.crypto.helpers import (
@@ -88,6 +90,7 @@ from aea.helpers.logging import AgentLoggerAdapter
 from aea.helpers.pypi import is_satisfiable
 from aea.helpers.pypi import merge_dependencies
 from aea.identity.base import Identity
+from aea.multiplexer import OutBoxPolicy, PriorityLane
 from aea.registries.resources import Resources
 
 PathLike = Union[os.PathLike, Path, str]
@@ -303,6 +306,8 @@ class AEABuilder:
     DEFAULT_LOOP_MODE = "async"
     DEFAULT_RUNTIME_MODE = "threaded"
     DEFAULT_SEARCH_SERVICE_ADDRESS = "oef"
+    DEFAULT_OUT_QUEUE_MAXSIZE = 0
+    DEFAULT_OUTBOX_POLICY = OutBoxPolicy.BLOCK
 
     # pylint: disable=attribute-defined-outside-init
 
@@ -367,6 +372,12 @@ class AEABuilder:
         self._loop_mode: Optional[str] = None
         self._runtime_mode: Optional[str] = None
         self._search_service_address: Optional[str] = None
+        self._priority_lanes: List[PriorityLane] = []
+        self._in_queue_high_watermark: Optional[int] = None
+        self._in_queue_low_watermark: Optional[int] = None
+        self._out_queue_maxsize: Optional[int] = None
+        self._outbox_policy: Optional[OutBoxPolicy] = None
+        self._outbox_timeout: Optional[float] = None
 
         self._package_dependency_manager = _DependenciesManager()
         if self._with_default_packages:
@@ -498,6 +509,56 @@ class AEABuilder:
         self._search_service_address = search_service_address
         return self
 
+    def set_priority_lanes(
+        self, priority_lanes: Sequence[PriorityLane]
+    ) -> "AEABuilder":
+        """
+        Set the priority lanes of the in queue.
+
+        :param priority_lanes: the priority lanes. If empty, envelopes are processed in FIFO order.
+        :return: self
+        """
+        self._priority_lanes = list(priority_lanes)
+        return self
+
+    def set_in_queue_watermarks(
+        self, high_watermark: Optional[int], low_watermark: Optional[int] = None
+    ) -> "AEABuilder":
+        """
+        Set the watermarks of the in queue.
+
+        :param high_watermark: the in queue size at which the receiving is suspended. If None, it is never suspended.
+        :param low_watermark: the in queue size at which the receiving is resumed. If None, half of the high watermark.
+        :return: self
+        """
+        self._in_queue_high_watermark = high_watermark
+        self._in_queue_low_watermark = low_watermark
+        return self
+
+    def set_out_queue_maxsize(self, out_queue_maxsize: Optional[int]) -> "AEABuilder":
+        """
+        Set the maximum size of the out queue.
+
+        :param out_queue_maxsize: the maximum size of the out queue. If 0, the out queue is unbounded.
+        :return: self
+        """
+        self._out_queue_maxsize = out_queue_maxsize
+        return self
+
+    def set_outbox_policy(
+        self, outbox_policy: Optional[OutBoxPolicy], timeout: Optional[float] = None
+    ) -> "AEABuilder":
+        """
+        Set the policy of the outbox when the out queue is full.
+
+        :param outbox_policy: the policy
+        :param timeout: the maximum time to wait for the out queue, with the blocking policy.
+        :return: self
+        """
+        self._outbox_policy = outbox_policy
+        self._outbox_timeout = timeout
+        return self
+
     def _add_default_packages(self) -> None:
         """Add default packages."""
         # add default protocol
@@ -662,12 +723,22 @@ class AEABuilder:
         configuration = ComponentConfiguration.load(
             component_type, directory, skip_consistency_check
         )
+        configuration.directory = directory
+        self._add_component_configuration(configuration)
+        return self
+
+    def _add_component_configuration(
+        self, configuration: ComponentConfiguration
+    ) -> None:
+        """
+        Add an already loaded component configuration, with the directory set.
+
+        :param configuration: the component configuration.
+        :return: None
+        """
         self._check_can_add(configuration)
         # update dependency graph
         self._package_dependency_manager.add_component(configuration)
-        configuration.directory = directory
-
-        return self
 
     def add_component_instance(self, component: Component) -> "AEABuilder":
         """
@@ -907,6 +978,12 @@ class AEABuilder:
             runtime_mode=self._get_runtime_mode(),
             connection_ids=connection_ids,
             search_service_address=self._get_search_service_address(),
+            priority_lanes=self._priority_lanes,
+            in_queue_high_watermark=self._in_queue_high_watermark,
+            in_queue_low_watermark=self._in_queue_low_watermark,
+            out_queue_maxsize=self._get_out_queue_maxsize(),
+            outbox_policy=self._get_outbox_policy(),
+            outbox_timeout=self._outbox_timeout,
             **deepcopy(self._context_namespace),
         )
         self._load_and_add_components(
@@ -1002,6 +1079,30 @@ class AEABuilder:
             self._loop_mode if self._loop_mode is not None else self.DEFAULT_LOOP_MODE
         )
 
+    def _get_out_queue_maxsize(self) -> int:
+        """
+        Return the maximum size of the out queue.
+
+        :return: the maximum size of the out queue
+        """
+        return (
+            self._out_queue_maxsize
+            if self._out_queue_maxsize is not None
+            else self.DEFAULT_OUT_QUEUE_MAXSIZE
+        )
+
+    def _get_outbox_policy(self) -> OutBoxPolicy:
+        """
+        Return the policy of the outbox.
+
+        :return: the policy of the outbox
+        """
+        return (
+            self._outbox_policy
+            if self._outbox_policy is not None
+            else self.DEFAULT_OUTBOX_POLICY
+        )
+
     def _get_runtime_mode(self) -> str:
         """
         Return the runtime mode name.
@@ -1149,6 +1250,19 @@ class AEABuilder:
         :params aea_project_path: PathLike root directory of the agent project.
         :param skip_consistency_check: if True, the consistency check are skipped.
 
+        :return: None
+        """
+        self._set_agent_settings(agent_configuration)
+        for configuration in self._load_component_configurations(
+            agent_configuration, aea_project_path, skip_consistency_check
+        ):
+            self._add_component_configuration(configuration)
+
+    def _set_agent_settings(self, agent_configuration: AgentConfig) -> None:
+        """
+        Set builder variables from AgentConfig, except the components.
+
+        :params agent_configuration: AgentConfig to get values from.
         :return: None
         """
         # set name and other configurations
@@ -1171,6 +1285,27 @@ class AEABuilder:
         self.set_default_routing(agent_configuration.default_routing)
         self.set_loop_mode(agent_configuration.loop_mode)
         self.set_runtime_mode(agent_configuration.runtime_mode)
+        self.set_priority_lanes(
+            [
+                PriorityLane(
+                    name,
+                    lane["weight"],
+                    [PublicId.from_str(p) for p in lane.get("protocols", [])],
+                )
+                for name, lane in agent_configuration.priority_lanes.items()
+            ]
+        )
+        self.set_in_queue_watermarks(
+            agent_configuration.in_queue_high_watermark,
+            agent_configuration.in_queue_low_watermark,
+        )
+        self.set_out_queue_maxsize(agent_configuration.out_queue_maxsize)
+        self.set_outbox_policy(
+            OutBoxPolicy(agent_configuration.outbox_policy)
+            if agent_configuration.outbox_policy is not None
+            else None,
+            agent_configuration.outbox_timeout,
+        )
 
         if (
             agent_configuration._default_connection  # pylint: disable=protected-access
@@ -1205,6 +1340,37 @@ class AEABuilder:
         ) in agent_configuration.ledger_apis_dict.items():
             self.add_ledger_api_config(ledger_identifier, ledger_api_conf)
 
+    def _set_from_agent_image(
+        self, agent_image: AgentImage, aea_project_path: Path
+    ) -> None:
+        """
+        Set builder variables from an agent image.
+
+        :param agent_image: an up-to-date agent image.
+        :param aea_project_path: PathLike root directory of the agent project.
+        :return: None
+        """
+        agent_configuration = agent_image.agent_configuration
+        self._set_agent_settings(agent_configuration)
+        for configuration in agent_image.get_component_configurations(aea_project_path):
+            self._add_component_configuration(configuration)
+
+    def _load_component_configurations(
+        self,
+        agent_configuration: AgentConfig,
+        aea_project_path: Path,
+        skip_consistency_check: bool,
+    ) -> List[ComponentConfiguration]:
+        """
+        Load the configurations of the agent components, in the order they have to be added.
+
+        Every configuration file is loaded (and checked) once.
+
+        :params agent_configuration: AgentConfig to get the component ids from.
+        :params aea_project_path: PathLike root directory of the agent project.
+        :param skip_consistency_check: if True, the consistency check are skipped.
+        :return: the list of component configurations, with the directory set.
+        """
         component_ids = itertools.chain(
             [
                 ComponentId(ComponentType.PROTOCOL, p_id)
@@ -1218,50 +1384,45 @@ class AEABuilder:
                 ComponentId(ComponentType.CONNECTION, p_id)
                 for p_id in agent_configuration.connections
             ],
+            [
+                ComponentId(ComponentType.SKILL, p_id)
+                for p_id in agent_configuration.skills
+            ],
         )
+        configurations = []  # type: List[ComponentConfiguration]
+        skill_configurations = {}  # type: Dict[ComponentId, SkillConfig]
         for component_id in component_ids:
             component_path = self._find_component_directory_from_component_id(
                 aea_project_path, component_id
             )
-            self.add_component(
-                component_id.component_type,
-                component_path,
-                skip_consistency_check=skip_consistency_check,
+            configuration = ComponentConfiguration.load(
+                component_id.component_type, component_path, skip_consistency_check
             )
+            configuration.directory = component_path
+            if component_id.component_type == ComponentType.SKILL:
+                skill_configurations[component_id] = cast(SkillConfig, configuration)
+            else:
+                configurations.append(configuration)
 
-        skill_ids = [
-            ComponentId(ComponentType.SKILL, p_id)
-            for p_id in agent_configuration.skills
-        ]
+        if len(skill_configurations) == 0:
+            return configurations
 
-        if len(skill_ids) == 0:
-            return
-
-        skill_import_order = self._find_import_order(
-            skill_ids, aea_project_path, skip_consistency_check
+        skill_import_order = self._find_import_order(skill_configurations)
+        configurations.extend(
+            skill_configurations[skill_id] for skill_id in skill_import_order
         )
-        for skill_id in skill_import_order:
-            component_path = self._find_component_directory_from_component_id(
-                aea_project_path, skill_id
-            )
-            self.add_component(
-                skill_id.component_type,
-                component_path,
-                skip_consistency_check=skip_consistency_check,
-            )
+        return configurations
 
+    @staticmethod
     def _find_import_order(
-        self,
-        skill_ids: List[ComponentId],
-        aea_project_path: Path,
-        skip_consistency_check: bool,
+        skill_configurations: Dict[ComponentId, SkillConfig],
     ) -> List[ComponentId]:
         """Find import order for skills.
 
         We need to handle skills separately, since skills can depend on each other.
 
         That is, we need to:
-        - load the skill configurations to find the import order
+        - use the skill configurations to find the import order
         - detect if there are cycles
         - import skills from the leaves of the dependency graph, by finding a topological ordering.
         """
@@ -1270,18 +1431,8 @@ class AEABuilder:
         # the adjacency list for the inverse dependency graph
         supports: Dict[ComponentId, Set[ComponentId]] = defaultdict(set)
         # nodes with no incoming edges
-        roots = copy(skill_ids)
-        for skill_id in skill_ids:
-            component_path = self._find_component_directory_from_component_id(
-                aea_project_path, skill_id
-            )
-            configuration = cast(
-                SkillConfig,
-                ComponentConfiguration.load(
-                    skill_id.component_type, component_path, skip_consistency_check
-                ),
-            )
-
+        roots = list(skill_configurations.keys())
+        for skill_id, configuration in skill_configurations.items():
             if len(configuration.skills) != 0:
                 roots.remove(skill_id)
             depends_on[skill_id].update(
@@ -1324,11 +1475,18 @@ class AEABuilder:
         - set default ledger
         - load every component
 
+        If the project contains an up-to-date agent image (see 'build_agent_image'),
+        the configurations are read from it instead of the configuration files.
+
         :param aea_project_path: path to the AEA project.
         :param skip_consistency_check: if True, the consistency check are skipped.
         :return: an AEABuilder.
         """
         aea_project_path = Path(aea_project_path)
+        builder = cls._from_agent_image(aea_project_path, skip_consistency_check)
+        if builder is not None:
+            return builder
+
         cls._try_to_load_agent_configuration_file(aea_project_path)
         _verify_or_create_private_keys(aea_project_path)
         builder = AEABuilder(with_default_packages=False)
@@ -1347,6 +1505,81 @@ class AEABuilder:
         )
         return builder
 
+    @classmethod
+    def _from_agent_image(
+        cls, aea_project_path: Path, skip_consistency_check: bool = False
+    ) -> Optional["AEABuilder"]:
+        """
+        Construct the builder from the agent image of an AEA project.
+
+        :param aea_project_path: path to the AEA project.
+        :param skip_consistency_check: if True, the image can have been built without consistency checks.
+        :return: an AEABuilder, or None if there is no up-to-date agent image.
+        """
+        agent_image = AgentImage.load(aea_project_path)
+        if agent_image is None or not agent_image.is_up_to_date(
+            aea_project_path, skip_consistency_check
+        ):
+            return None
+
+        agent_configuration = agent_image.agent_configuration
+        if _verify_or_create_private_keys_of_configuration(
+            aea_project_path, agent_configuration
+        ):
+            # the agent configuration file has to be updated, hence the image is stale.
+            loader = ConfigLoader.from_configuration_type(PackageType.AGENT)
+            with (aea_project_path / DEFAULT_AEA_CONFIG_FILE).open(
+                mode="w", encoding="utf-8"
+            ) as fp:
+                loader.dump(agent_configuration, fp)
+            return None
+
+        logging.config.dictConfig(agent_configuration.logging_config)  # type: ignore
+        builder = AEABuilder(with_default_packages=False)
+        builder._set_from_agent_image(agent_image, aea_project_path)
+        return builder
+
+    @classmethod
+    def build_agent_image(
+        cls, aea_project_path: PathLike, skip_consistency_check: bool = False
+    ) -> Path:
+        """
+        Build the agent image of an AEA project.
+
+        The agent image stores the validated configurations of the agent and of its components,
+        in import order, so that 'from_aea_project' can skip parsing, validation and fingerprint
+        checks as long as the project files do not change.
+
+        :param aea_project_path: path to the AEA project.
+        :param skip_consistency_check: if True, the consistency check are skipped.
+        :return: the path to the agent image file.
+        """
+        aea_project_path = Path(aea_project_path)
+        cls._try_to_load_agent_configuration_file(aea_project_path)
+        _verify_or_create_private_keys(aea_project_path)
+
+        configuration_file = aea_project_path / DEFAULT_AEA_CONFIG_FILE
+        loader = ConfigLoader.from_configuration_type(PackageType.AGENT)
+        with configuration_file.open(mode="r", encoding="utf-8") as fp:
+            agent_configuration = loader.load(fp)
+
+        builder = AEABuilder(with_default_packages=False)
+        builder._set_agent_settings(agent_configuration)
+        component_configurations = builder._load_component_configurations(
+            agent_configuration, aea_project_path, skip_consistency_check
+        )
+        # check that the components can be added, e.g. that the dependencies are satisfied.
+        for configuration in component_configurations:
+            builder._add_component_configuration(configuration)
+
+        agent_image = AgentImage.from_configurations(
+            aea_project_path,
+            agent_configuration,
+            component_configurations,
+            consistency_checked=not skip_consistency_check,
+        )
+        return agent_image.dump(aea_project_path)
+
     def _load_and_add_components(
         self,
         component_type: ComponentType,
@@ -1450,6 +1683,25 @@ def _verify_or_create_private_keys(aea_project_path: Path) -> None:
     fp_read = path_to_configuration.open(mode="r", encoding="utf-8")
     agent_configuration = agent_loader.load(fp_read)
 
+    _verify_or_create_private_keys_of_configuration(
+        aea_project_path, agent_configuration
+    )
+
+    fp_write = path_to_configuration.open(mode="w", encoding="utf-8")
+    agent_loader.dump(agent_configuration, fp_write)
+
+
+def _verify_or_create_private_keys_of_configuration(
+    aea_project_path: Path, agent_configuration: AgentConfig
+) -> bool:
+    """
+    Verify or create the private keys of an agent configuration.
+
+    :param aea_project_path: path to the AEA project.
+    :param agent_configuration: the agent configuration; updated with the created keys.
+    :return: True if some private key has been created, False otherwise.
+    """
+    is_updated = False
     for identifier, _value in agent_configuration.private_key_paths.read_all():
         if identifier not in crypto_registry.supported_ids:
             ValueError("Unsupported identifier in private key paths.")
@@ -1461,6 +1713,7 @@ def _verify_or_create_private_keys(aea_project_path: Path) -> None:
                 identifier, private_key_file=str(aea_project_path / private_key_path)
             )
             agent_configuration.private_key_paths.update(identifier, private_key_path)
+            is_updated = True
         else:
             try:
                 try_validate_private_key_path(
@@ -1475,6 +1728,4 @@ def _verify_or_create_private_keys(aea_project_path: Path) -> None:
                     )
                 )
                 raise
-
-    fp_write = path_to_configuration.open(mode="w", encoding="utf-8")
-    agent_loader.dump(agent_configuration, fp_write)
+    return is_updated
@@ -27,7 +27,7 @@ from typing import Dict, List, Optional, Type
 from aea.agent_loop import BaseAgentLoop, SyncAgentLoop
 from aea.connections.base import Connection
 from aea.identity.base import Identity
-from aea.multiplexer import InBox, Multiplexer, OutBox
+from aea.multiplexer import InBox, Multiplexer, OutBox, OutBoxPolicy
 from aea.runtime import AsyncRuntime, BaseRuntime, ThreadedRuntime
 
 
@@ -92,6 +92,11 @@ class Agent(ABC):
         timeout: float = 1.0,
         loop_mode: Optional[str] = None,
         runtime_mode: Optional[str] = None,
+        in_queue_high_watermark: Optional[int] = None,
+        in_queue_low_watermark: Optional[int] = None,
+        out_queue_maxsize: int = 0,
+        outbox_policy: OutBoxPolicy = OutBoxPolicy.BLOCK,
+        outbox_timeout: Optional[float] = None,
     ) -> None:
         """
         Instantiate the agent.
@@ -102,15 +107,31 @@ class Agent(ABC):
         :param timeout: the time in (fractions of) seconds to time out an agent between act and react
         :param loop_mode: loop_mode to choose agent run loop.
         :param runtime_mode: runtime mode to up agent.
+        :param in_queue_high_watermark: the in queue size at which the receiving is suspended. If None, it is never suspended.
+        :param in_queue_low_watermark: the in queue size at which the receiving is resumed. If None, half of the high watermark.
+        :param out_queue_maxsize: the maximum size of the out queue. If 0, the out queue is unbounded.
+        :param outbox_policy: what the outbox does when the out queue is full.
+        :param outbox_timeout: the maximum time to wait for the out queue, with the blocking policy.
 
         :return: None
         """
         self._identity = identity
         self._connections = connections
 
-        self._multiplexer = Multiplexer(self._connections, loop=loop)
+        self._multiplexer = Multiplexer(
+            self._connections,
+            loop=loop,
+            in_queue_high_watermark=in_queue_high_watermark,
+            in_queue_low_watermark=in_queue_low_watermark,
+            out_queue_maxsize=out_queue_maxsize,
+        )
         self._inbox = InBox(self._multiplexer)
-        self._outbox = OutBox(self._multiplexer, identity.address)
+        self._outbox = OutBox(
+            self._multiplexer,
+            identity.address,
+            policy=outbox_policy,
+            timeout=outbox_timeout,
+        )
         self._liveness = Liveness()
         self._timeout = timeout
 
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Implementation of the 'aea build' subcommand."""
+
+from pathlib import Path
+from typing import cast
+
+import click
+
+from aea.aea_builder import AEABuilder
+from aea.cli.utils.context import Context
+from aea.cli.utils.decorators import check_aea_project
+from aea.configurations.image import AgentImage
+
+
+@click.command()
+@click.option(
+    "--remove",
+    "is_remove",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Remove the agent image instead of building it.",
+)
+@click.pass_context
+@check_aea_project
+def build(click_context, is_remove: bool):
+    """Build the agent image to speed up the agent startup."""
+    ctx = cast(Context, click_context.obj)
+    if is_remove:
+        AgentImage.remove(Path(ctx.cwd))
+        click.echo("Agent image removed.")
+        return
+    image_path = build_agent_image(ctx)
+    click.echo("Agent image built: {}".format(image_path))
+
+
+def build_agent_image(ctx: Context) -> Path:
+    """
+    Build the agent image of the AEA project.
+
+    :param ctx: the CLI context.
+    :return: the path to the agent image.
+    :raises ClickException: if the agent image cannot be built.
+    """
+    try:
+        return AEABuilder.build_agent_image(
+            Path(ctx.cwd), skip_consistency_check=ctx.config["skip_consistency_check"]
+        )
+    except Exception as e:
+        raise click.ClickException(str(e))
@@ -24,42 +24,48 @@
 import click
 
 import aea
-from aea.cli.add import add
-from aea.cli.add_key import add_key
-from aea.cli.config import config
-from aea.cli.create import create
-from aea.cli.delete import delete
-from aea.cli.eject import eject
-from aea.cli.fetch import fetch
-from aea.cli.fingerprint import fingerprint
-from aea.cli.freeze import freeze
-from aea.cli.generate import generate
-from aea.cli.generate_key import generate_key
-from aea.cli.generate_wealth import generate_wealth
-from aea.cli.get_address import get_address
-from aea.cli.get_wealth import get_wealth
-from aea.cli.init import init
-from aea.cli.install import install
-from aea.cli.interact import interact
-from aea.cli.launch import launch
-from aea.cli.list import list_command as _list
-from aea.cli.login import login
-from aea.cli.logout import logout
-from aea.cli.publish import publish
-from aea.cli.push import push
-from aea.cli.register import register
-from aea.cli.remove import remove
-from aea.cli.run import run
-from aea.cli.scaffold import scaffold
-from aea.cli.search import search
+from aea.cli.utils.click_utils import LazyGroup
 from aea.cli.utils.config import get_or_create_cli_config
 from aea.cli.utils.constants import AUTHOR_KEY
 from aea.cli.utils.context import Context
 from aea.cli.utils.loggers import logger, simple_verbosity_option
 from aea.helpers.win32 import enable_ctrl_c_support
 
+# the modules of the subcommands are imported only when the subcommand is invoked.
+SUBCOMMANDS = {
+    "list": "aea.cli.list:list_command",
+    "add-key": "aea.cli.add_key:add_key",
+    "add": "aea.cli.add:add",
+    "build": "aea.cli.build:build",
+    "create": "aea.cli.create:create",
+    "config": "aea.cli.config:config",
+    "delete": "aea.cli.delete:delete",
+    "eject": "aea.cli.eject:eject",
+    "fetch": "aea.cli.fetch:fetch",
+    "fingerprint": "aea.cli.fingerprint:fingerprint",
+    "freeze": "aea.cli.freeze:freeze",
+    "generate-key": "aea.cli.generate_key:generate_key",
+    "generate-wealth": "aea.cli.generate_wealth:generate_wealth",
+    "generate": "aea.cli.generate:generate",
+    "get-address": "aea.cli.get_address:get_address",
+    "get-wealth": "aea.cli.get_wealth:get_wealth",
+    "init": "aea.cli.init:init",
+    "install": "aea.cli.install:install",
+    "interact": "aea.cli.interact:interact",
+    "launch": "aea.cli.launch:launch",
+    "login": "aea.cli.login:login",
+    "logout": "aea.cli.logout:logout",
+    "publish": "aea.cli.publish:publish",
+    "push": "aea.cli.push:push",
+    "register": "aea.cli.register:register",
+    "remove": "aea.cli.remove:remove",
+    "run": "aea.cli.run:run",
+    "scaffold": "aea.cli.scaffold:scaffold",
+    "search": "aea.cli.search:search",
+}
 
-@click.group(name="aea")
+
+@click.group(name="aea", cls=LazyGroup, lazy_commands=SUBCOMMANDS)
 @click.version_option(aea.__version__, prog_name="aea")
 @simple_verbosity_option(logger, default="INFO")
 @click.option(
@@ -107,33 +113,3 @@ def _init_gui() -> None:
         raise click.ClickException(
             "Author is not set up. Please run 'aea init' and then restart."
         )
-
-
-cli.add_command(_list)
-cli.add_command(add_key)
-cli.add_command(add)
-cli.add_command(create)
-cli.add_command(config)
-cli.add_command(delete)
-cli.add_command(eject)
-cli.add_command(fetch)
-cli.add_command(fingerprint)
-cli.add_command(freeze)
-cli.add_command(generate_key)
-cli.add_command(generate_wealth)
-cli.add_command(generate)
-cli.add_command(get_address)
-cli.add_command(get_wealth)
-cli.add_command(init)
-cli.add_command(install)
-cli.add_command(interact)
-cli.add_command(launch)
-cli.add_command(login)
-cli.add_command(logout)
-cli.add_command(publish)
-cli.add_command(push)
-cli.add_command(register)
-cli.add_command(remove)
-cli.add_command(run)
-cli.add_command(scaffold)
-cli.add_command(search)
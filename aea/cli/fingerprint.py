@@ -18,8 +18,10 @@
 # ------------------------------------------------------------------------------
 
 """Implementation of the 'aea add' subcommand."""
+import re
+import time
 from pathlib import Path
-from typing import Dict, cast
+from typing import Dict, List, Tuple, cast
 
 import click
 
@@ -32,16 +34,34 @@ from aea.configurations.base import (  # noqa: F401 # pylint: disable=unused-imp
     _compute_fingerprint,
 )
 from aea.configurations.base import (
+    DEFAULT_REGISTRY_PATH,
+    PackageConfiguration,
+    PackageType,
     PublicId,
+    _compute_fingerprints,
     _get_default_configuration_file_name_from_type,
 )
 from aea.configurations.loader import ConfigLoader
 
 
-@click.group()
+@click.group(invoke_without_command=True)
+@click.option(
+    "--all",
+    "fingerprint_all",
+    is_flag=True,
+    help="Fingerprint all the packages of the local registry.",
+)
 @click.pass_context
-def fingerprint(click_context):
+def fingerprint(click_context, fingerprint_all: bool):
     """Fingerprint a resource."""
+    if click_context.invoked_subcommand is not None:
+        if fingerprint_all:
+            raise click.UsageError("Option '--all' cannot be used with a subcommand.")
+        return
+    if not fingerprint_all:
+        click.echo(click_context.get_help())
+        return
+    _fingerprint_all(click_context)
 
 
 @fingerprint.command()
@@ -117,3 +137,97 @@ def _fingerprint_item(click_context, item_type, item_public_id) -> None:
         config_loader.dump(config, open(config_file_path, "w"))
     except Exception as e:
         raise click.ClickException(str(e))
+
+
+def _fingerprint_all(click_context) -> None:
+    """
+    Fingerprint all the packages of the local registry.
+
+    The files of all the packages are hashed in the same batch,
+    and only the configuration files whose fingerprints changed are updated.
+
+    :param click_context: the click context.
+    :return: None
+    """
+    ctx = cast(Context, click_context.obj)
+    registry_path = Path(ctx.cwd, DEFAULT_REGISTRY_PATH)
+    if not registry_path.is_dir():
+        raise click.ClickException(
+            "Local registry not found at path {}".format(registry_path)
+        )
+
+    start_time = time.time()
+    packages = []  # type: List[Tuple[Path, PackageConfiguration]]
+    try:
+        for item_type in (
+            PackageType.PROTOCOL,
+            PackageType.CONNECTION,
+            PackageType.CONTRACT,
+            PackageType.SKILL,
+        ):
+            config_loader = ConfigLoader.from_configuration_type(item_type)
+            default_config_file_name = _get_default_configuration_file_name_from_type(
+                item_type
+            )
+            for config_file_path in sorted(
+                registry_path.glob(
+                    "*/{}/*/{}".format(item_type.to_plural(), default_config_file_name)
+                )
+            ):
+                with config_file_path.open() as fp:
+                    packages.append((config_file_path, config_loader.load(fp)))
+
+        fingerprints = _compute_fingerprints(
+            [
+                (config_file_path.parent, config.fingerprint_ignore_patterns)
+                for config_file_path, config in packages
+            ]
+        )
+        updated = []  # type: List[Path]
+        for (config_file_path, config), fingerprints_dict in zip(
+            packages, fingerprints
+        ):
+            if config.fingerprint == fingerprints_dict:
+                continue
+            _replace_fingerprint(config_file_path, fingerprints_dict)
+            updated.append(config_file_path.parent)
+    except Exception as e:
+        raise click.ClickException(str(e))
+
+    for package_dir in updated:
+        click.echo("Updated fingerprints of {}".format(package_dir))
+    click.echo(
+        "Fingerprinted {} packages ({} files) in {:.2f} seconds, {} updated.".format(
+            len(packages),
+            sum(len(fingerprints_dict) for fingerprints_dict in fingerprints),
+            time.time() - start_time,
+            len(updated),
+        )
+    )
+
+
+def _replace_fingerprint(config_file_path: Path, fingerprints: Dict[str, str]) -> None:
+    """
+    Replace the fingerprint section of a configuration file.
+
+    The rest of the file is left untouched, as loading and dumping the configuration
+    would not preserve e.g. the environment variable placeholders.
+
+    :param config_file_path: the path to the configuration file.
+    :param fingerprints: the fingerprints.
+    :return: None
+    """
+    if fingerprints:
+        replacement = "\nfingerprint:\n{}".format(
+            "".join(
+                "  {}: {}\n".format(file_name, file_hash)
+                for file_name, file_hash in sorted(fingerprints.items())
+            )
+        )
+    else:
+        replacement = "\nfingerprint: {}\n"
+    content = config_file_path.read_text(encoding="utf-8")
+    new_content = re.sub(
+        r"\nfingerprint:.*\n(?:[ \t]+.*\n)*", lambda _: replacement, content, count=1,
+    )
+    config_file_path.write_text(new_content, encoding="utf-8")
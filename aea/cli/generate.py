@@ -46,14 +46,19 @@ def generate(click_context):
 
 @generate.command()
 @click.argument("protocol_specification_path", type=str, required=True)
+@click.option(
+    "--slots",
+    is_flag=True,
+    help="Store the fields of the messages in slots, instead of a dictionary.",
+)
 @click.pass_context
-def protocol(click_context, protocol_specification_path: str):
+def protocol(click_context, protocol_specification_path: str, slots: bool):
     """Generate a protocol based on a specification and add it to the configuration file and agent."""
-    _generate_item(click_context, "protocol", protocol_specification_path)
+    _generate_item(click_context, "protocol", protocol_specification_path, slots)
 
 
 @clean_after
-def _generate_item(click_context, item_type, specification_path):
+def _generate_item(click_context, item_type, specification_path, slots=False):
     """Generate an item based on a specification and add it to the configuration file and agent."""
     ctx = cast(Context, click_context.obj)
 
@@ -103,7 +108,9 @@ def _generate_item(click_context, item_type, specification_path):
         )
 
         output_path = os.path.join(ctx.cwd, item_type_plural)
-        protocol_generator = ProtocolGenerator(specification_path, output_path)
+        protocol_generator = ProtocolGenerator(
+            specification_path, output_path, slots=slots
+        )
         protocol_generator.generate()
 
         # Add the item to the configurations
@@ -19,19 +19,21 @@
 
 """Implementation of the 'aea install' subcommand."""
 
-import pprint
 import subprocess  # nosec
 import sys
-from typing import List, Optional, cast
+import time
+from typing import Dict, List, Optional, cast
 
 import click
 
 from aea.cli.utils.context import Context
 from aea.cli.utils.decorators import check_aea_project
 from aea.cli.utils.loggers import logger
-from aea.configurations.base import Dependency
+from aea.configurations.base import Dependencies, Dependency
 from aea.exceptions import AEAException
 
+DEFAULT_INSTALL_TIMEOUT = 300.0
+
 
 @click.command()
 @click.option(
@@ -42,20 +44,46 @@ from aea.exceptions import AEAException
     default=None,
     help="Install from the given requirements file.",
 )
+@click.option(
+    "--find-links",
+    "find_links",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, readable=True),
+    required=False,
+    default=None,
+    help="Look for packages also in the given directory (e.g. a local wheel cache).",
+)
+@click.option(
+    "--no-index",
+    "no_index",
+    is_flag=True,
+    help="Do not use the package indexes, e.g. to install offline with --find-links.",
+)
 @click.pass_context
 @check_aea_project
-def install(click_context, requirement: Optional[str]):
+def install(
+    click_context, requirement: Optional[str], find_links: Optional[str], no_index: bool
+):
     """Install the dependencies."""
     ctx = cast(Context, click_context.obj)
-    do_install(ctx, requirement)
+    do_install(ctx, requirement, find_links=find_links, no_index=no_index)
 
 
-def do_install(ctx: Context, requirement: Optional[str] = None) -> None:
+def do_install(
+    ctx: Context,
+    requirement: Optional[str] = None,
+    find_links: Optional[str] = None,
+    no_index: bool = False,
+) -> None:
     """
     Install necessary dependencies.
 
+    The dependencies without a package index are installed with a single run
+    of pip, and those pinned to an index with one run for each index.
+
     :param ctx: context object.
     :param requirement: optional str requirement.
+    :param find_links: optional directory where to look for packages (e.g. a wheel cache).
+    :param no_index: whether to ignore the package indexes.
 
     :return: None
     :raises: ClickException if AEAException occurres.
@@ -63,46 +91,156 @@ def do_install(ctx: Context, requirement: Optional[str] = None) -> None:
     try:
         if requirement:
             logger.debug("Installing the dependencies in '{}'...".format(requirement))
-            _install_from_requirement(requirement)
+            _install_from_requirement(
+                requirement, find_links=find_links, no_index=no_index
+            )
         else:
             logger.debug("Installing all the dependencies...")
+            start_time = time.time()
             dependencies = ctx.get_dependencies()
-            for name, d in dependencies.items():
-                _install_dependency(name, d)
+            click.echo(
+                "Collected {} dependencies in {:.2f} seconds.".format(
+                    len(dependencies), time.time() - start_time
+                )
+            )
+            start_time = time.time()
+            _install_dependencies(
+                dependencies, find_links=find_links, no_index=no_index
+            )
+            click.echo(
+                "Installed {} dependencies in {:.2f} seconds.".format(
+                    len(dependencies), time.time() - start_time
+                )
+            )
     except AEAException as e:
         raise click.ClickException(str(e))
 
 
-def _install_dependency(dependency_name: str, dependency: Dependency):
-    click.echo("Installing {}...".format(pprint.pformat(dependency_name)))
-    try:
-        index = dependency.get("index", None)
-        git_url = dependency.get("git", None)
+def _dependency_to_requirement(dependency_name: str, dependency: Dependency) -> str:
+    """
+    Get the pip requirement specifier of a dependency.
+
+    :param dependency_name: the name of the package.
+    :param dependency: the dependency.
+    :return: the requirement specifier.
+    """
+    git_url = dependency.get("git", None)
+    if git_url is not None:
         revision = dependency.get("ref", "")
-        version_constraint = dependency.get("version", "")
-        command = [sys.executable, "-m", "pip", "install"]
-        if git_url is not None:
-            command += ["-i", index] if index is not None else []
-            command += ["git+" + git_url + "@" + revision + "#egg=" + dependency_name]
-        else:
-            command += ["-i", index] if index is not None else []
-            command += [dependency_name + version_constraint]
+        return "git+{}{}#egg={}".format(
+            git_url, "@" + revision if revision else "", dependency_name
+        )
+    return dependency_name + dependency.get("version", "")
+
+
+def _group_by_index(dependencies: Dependencies) -> Dict[Optional[str], Dependencies]:
+    """
+    Group the dependencies by their package index.
+
+    :param dependencies: the dependencies.
+    :return: the dependencies of each index, with None for those without an index.
+    """
+    groups = {}  # type: Dict[Optional[str], Dependencies]
+    for name, dependency in dependencies.items():
+        groups.setdefault(dependency.get("index", None), {})[name] = dependency
+    return groups
+
+
+def _get_pip_install_command(
+    dependencies: Dependencies,
+    find_links: Optional[str] = None,
+    no_index: bool = False,
+    index_url: Optional[str] = None,
+) -> List[str]:
+    """
+    Get the pip command to install a set of dependencies in one run.
+
+    :param dependencies: the dependencies.
+    :param find_links: optional directory where to look for packages.
+    :param no_index: whether to ignore the package indexes.
+    :param index_url: the package index to install from, instead of the default one.
+    :return: the command.
+    """
+    command = [sys.executable, "-m", "pip", "install"]
+    if no_index:
+        command += ["--no-index"]
+    elif index_url is not None:
+        command += ["--index-url", index_url]
+    if find_links is not None:
+        command += ["--find-links", find_links]
+    command += [
+        _dependency_to_requirement(name, dependency)
+        for name, dependency in sorted(dependencies.items())
+    ]
+    return command
+
+
+def _install_dependencies(
+    dependencies: Dependencies, find_links: Optional[str] = None, no_index: bool = False
+) -> None:
+    """
+    Install a set of dependencies.
+
+    The dependencies without a package index are installed with a single run of
+    pip. A dependency pinned to an index is installed from that index only, in a
+    run with the other dependencies pinned to it.
+
+    :param dependencies: the dependencies.
+    :param find_links: optional directory where to look for packages.
+    :param no_index: whether to ignore the package indexes.
+    :return: None
+    :raises: AEAException if the installation fails.
+    """
+    groups = (
+        {None: dependencies} if no_index else _group_by_index(dependencies)
+    )  # type: Dict[Optional[str], Dependencies]
+    # the dependencies without an index first.
+    for index_url in sorted(groups, key=lambda index: index or ""):
+        _install_dependencies_from_index(
+            groups[index_url], find_links, no_index, index_url
+        )
+
+
+def _install_dependencies_from_index(
+    dependencies: Dependencies,
+    find_links: Optional[str] = None,
+    no_index: bool = False,
+    index_url: Optional[str] = None,
+) -> None:
+    """
+    Install a set of dependencies with a single run of pip.
+
+    :param dependencies: the dependencies.
+    :param find_links: optional directory where to look for packages.
+    :param no_index: whether to ignore the package indexes.
+    :param index_url: the package index to install from, instead of the default one.
+    :return: None
+    :raises: AEAException if the installation fails.
+    """
+    if len(dependencies) == 0:
+        return
+    click.echo("Installing {}...".format(", ".join(sorted(dependencies.keys()))))
+    try:
+        command = _get_pip_install_command(
+            dependencies, find_links, no_index, index_url
+        )
         logger.debug("Calling '{}'".format(" ".join(command)))
-        return_code = _run_install_subprocess(command)
+        install_timeout = DEFAULT_INSTALL_TIMEOUT * len(dependencies)
+        return_code = _run_install_subprocess(command, install_timeout)
         if return_code == 1:
             # try a second time
-            return_code = _run_install_subprocess(command)
+            return_code = _run_install_subprocess(command, install_timeout)
         assert return_code == 0, "Return code != 0."
     except Exception as e:
         raise AEAException(
-            "An error occurred while installing {}, {}: {}".format(
-                dependency_name, dependency, str(e)
+            "An error occurred while installing {}: {}".format(
+                sorted(dependencies.keys()), str(e)
             )
         )
 
 
 def _run_install_subprocess(
-    install_command: List[str], install_timeout: float = 300
+    install_command: List[str], install_timeout: float = DEFAULT_INSTALL_TIMEOUT
 ) -> int:
     """
     Try executing install command.
@@ -123,19 +261,27 @@ def _run_install_subprocess(
     return return_code
 
 
-def _install_from_requirement(file: str, install_timeout: float = 300) -> None:
+def _install_from_requirement(
+    file: str,
+    install_timeout: float = DEFAULT_INSTALL_TIMEOUT,
+    find_links: Optional[str] = None,
+    no_index: bool = False,
+) -> None:
     """
     Install from requirements.
 
     :param file: requirement.txt file path
     :param install_timeout: timeout to wait pip to install
+    :param find_links: optional directory where to look for packages.
+    :param no_index: whether to ignore the package indexes.
 
     :return: None
     """
     try:
-        returncode = _run_install_subprocess(
-            [sys.executable, "-m", "pip", "install", "-r", file], install_timeout
-        )
+        command = [sys.executable, "-m", "pip", "install", "-r", file]
+        command += ["--no-index"] if no_index else []
+        command += ["--find-links", find_links] if find_links is not None else []
+        returncode = _run_install_subprocess(command, install_timeout)
         assert returncode == 0, "Return code != 0."
     except Exception:
         raise AEAException(
@@ -35,6 +35,7 @@ from aea.cli.utils.package_utils import (
     try_get_item_source_path,
     try_get_item_target_path,
 )
+from aea.cli.utils.registry_index import RegistryIndex
 from aea.configurations.base import CRUDCollection, DEFAULT_AEA_CONFIG_FILE, PublicId
 from aea.configurations.constants import (
     DEFAULT_CONNECTION,
@@ -133,6 +134,9 @@ def _save_agent_locally(ctx: Context) -> None:
     source_path = os.path.join(ctx.cwd, DEFAULT_AEA_CONFIG_FILE)
     target_path = os.path.join(target_dir, DEFAULT_AEA_CONFIG_FILE)
     copyfile(source_path, target_path)
+    RegistryIndex(ctx.agent_config.registry_path).update_item(
+        item_type_plural, ctx.agent_config.author, ctx.agent_config.name
+    )
     click.echo(
         'Agent "{}" successfully saved in packages folder.'.format(
             ctx.agent_config.name
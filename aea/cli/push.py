@@ -34,6 +34,7 @@ from aea.cli.utils.package_utils import (
     try_get_item_source_path,
     try_get_item_target_path,
 )
+from aea.cli.utils.registry_index import RegistryIndex
 from aea.configurations.base import PublicId
 
 
@@ -112,6 +113,9 @@ def _save_item_locally(ctx: Context, item_type: str, item_id: PublicId) -> None:
     )
     _check_package_public_id(source_path, item_type, item_id)
     copytree(source_path, target_path)
+    RegistryIndex(ctx.agent_config.registry_path).update_item(
+        item_type_plural, ctx.agent_config.author, item_id.name
+    )
     click.echo(
         '{} "{}" successfully saved in packages folder.'.format(
             item_type.title(), item_id
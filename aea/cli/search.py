@@ -32,8 +32,8 @@ from aea.cli.utils.context import Context
 from aea.cli.utils.decorators import pass_ctx
 from aea.cli.utils.formatting import format_items, retrieve_details
 from aea.cli.utils.loggers import logger
+from aea.cli.utils.registry_index import RegistryIndex
 from aea.configurations.base import (
-    DEFAULT_AEA_CONFIG_FILE,
     DEFAULT_CONNECTION_CONFIG_FILE,
     DEFAULT_CONTRACT_CONFIG_FILE,
     DEFAULT_PROTOCOL_CONFIG_FILE,
@@ -161,7 +161,6 @@ def _search_items_locally(ctx, item_type_plural):
     registry = cast(str, ctx.config.get("registry_directory"))
     result = []  # type: List[Dict]
     configs = {
-        "agents": {"loader": ctx.agent_loader, "config_file": DEFAULT_AEA_CONFIG_FILE},
         "connections": {
             "loader": ctx.connection_loader,
             "config_file": DEFAULT_CONNECTION_CONFIG_FILE,
@@ -189,14 +188,8 @@ def _search_items_locally(ctx, item_type_plural):
             result,
         )
 
-    # look in packages dir for all other packages
-    _get_details_from_dir(
-        configs[item_type_plural]["loader"],
-        registry,
-        "*/{}".format(item_type_plural),
-        configs[item_type_plural]["config_file"],
-        result,
-    )
+    # look in packages dir for all other packages, through the registry index
+    result.extend(RegistryIndex(registry).items(item_type_plural))
 
     return sorted(result, key=lambda k: k["name"])
 
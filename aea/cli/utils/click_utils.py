@@ -19,10 +19,11 @@
 
 """Module with click utils of the aea cli."""
 
+import importlib
 import os
 from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import click
 
@@ -151,3 +152,43 @@ class AEAJsonPathType(click.ParamType):
             )
             ctx.obj.set_config("configuration_loader", config_loader)
             return json_path
+
+
+class LazyGroup(click.Group):
+    """
+    A click.Group whose subcommands are imported on first use.
+
+    Subcommands are registered by import path, in the form 'path.to.module:command_name',
+    so that running a command only imports the module that implements it.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Initialize the lazy group.
+
+        :param lazy_commands: mapping from subcommand names to import paths.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})  # type: Dict[str, str]
+
+    def add_lazy_command(self, name: str, import_path: str) -> None:
+        """
+        Register a subcommand by import path.
+
+        :param name: the name of the subcommand.
+        :param import_path: the import path of the subcommand, e.g. 'aea.cli.add:add'.
+        :return: None
+        """
+        self.lazy_commands[name] = import_path
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List the names of the subcommands, without importing them."""
+        return sorted(set(self.commands.keys()) | set(self.lazy_commands.keys()))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a subcommand, importing its module if needed."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr_name = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr_name)
+            self.add_command(command, cmd_name)
+        return self.commands.get(cmd_name)
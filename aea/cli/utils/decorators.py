@@ -38,6 +38,7 @@ from aea.configurations.base import (
     _compare_fingerprints,
     _get_default_configuration_file_name_from_type,
 )
+from aea.configurations.image import AgentImage
 from aea.configurations.loader import ConfigLoaders
 from aea.exceptions import AEAException
 
@@ -104,13 +105,25 @@ def _validate_config_consistency(ctx: Context):
         )
 
 
+def _is_agent_image_up_to_date(ctx: Context) -> bool:
+    """
+    Check whether the project has an up-to-date agent image, built with consistency checks.
+
+    :param ctx: the context
+    :return: True if the consistency of the project has already been verified.
+    """
+    aea_project_path = Path(ctx.cwd)
+    agent_image = AgentImage.load(aea_project_path)
+    return agent_image is not None and agent_image.is_up_to_date(aea_project_path)
+
+
 def _check_aea_project(args):
     try:
         click_context = args[0]
         ctx = cast(Context, click_context.obj)
         try_to_load_agent_config(ctx)
         skip_consistency_check = ctx.config["skip_consistency_check"]
-        if not skip_consistency_check:
+        if not skip_consistency_check and not _is_agent_image_up_to_date(ctx):
             _validate_config_consistency(ctx)
     except Exception as e:
         raise click.ClickException(str(e))
@@ -33,6 +33,7 @@ from aea import AEA_DIR
 from aea.cli.utils.constants import NOT_PERMITTED_AUTHORS
 from aea.cli.utils.context import Context
 from aea.cli.utils.loggers import logger
+from aea.cli.utils.registry_index import RegistryIndex
 from aea.configurations.base import (
     AgentConfig,
     DEFAULT_AEA_CONFIG_FILE,
@@ -232,35 +233,29 @@ def find_item_locally(ctx, item_type, item_public_id) -> Path:
     item_type_plural = item_type + "s"
     item_name = item_public_id.name
 
-    # check in registry
+    # check in registry, through the registry index
     registry_path = os.path.join(ctx.cwd, ctx.agent_config.registry_path)
     package_path = Path(
         registry_path, item_public_id.author, item_type_plural, item_name
     )
-    config_file_name = _get_default_configuration_file_name_from_type(item_type)
-    item_configuration_filepath = package_path / config_file_name
-    if not item_configuration_filepath.exists():
-        raise click.ClickException(
-            "Cannot find {}: '{}'.".format(item_type, item_public_id)
-        )
-
-    # try to load the item configuration file
     try:
-        item_configuration_loader = ConfigLoader.from_configuration_type(
-            PackageType(item_type)
-        )
-        item_configuration = item_configuration_loader.load(
-            item_configuration_filepath.open()
+        details = RegistryIndex(registry_path).get(
+            item_type_plural, item_public_id.author, item_name
         )
     except ValidationError as e:
         raise click.ClickException(
             "{} configuration file not valid: {}".format(item_type.capitalize(), str(e))
         )
+    if details is None:
+        raise click.ClickException(
+            "Cannot find {}: '{}'.".format(item_type, item_public_id)
+        )
 
     # check that the configuration file of the found package matches the expected author and version.
-    version = item_configuration.version
-    author = item_configuration.author
-    if item_public_id.author != author or item_public_id.version != version:
+    if (
+        item_public_id.author != details["author"]
+        or item_public_id.version != details["version"]
+    ):
         raise click.ClickException(
             "Cannot find {} with author and version specified.".format(item_type)
         )
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Module with the on-disk index of a local registry.
+
+The index of a registry is kept in the user's '~/.aea/registry_index' directory,
+so that registries under version control or read-only are not modified. There
+is one JSON file for each '<author>/<item type>' directory of the registry: for
+each package it keeps the details shown by 'aea search' and the fingerprint of
+the package, so that the configuration files do not have to be loaded again on
+each search, and a lookup only reads the file of the author of the package.
+
+The index is kept up to date lazily: the packages of a directory are listed
+again only if the modification time of the directory has changed, and a
+configuration file is loaded again only if its own modification time has changed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aea.cli.utils.constants import REGISTRY_INDEX_DIR
+from aea.cli.utils.loggers import logger
+from aea.configurations.base import (
+    PackageType,
+    _get_default_configuration_file_name_from_type,
+)
+from aea.configurations.loader import ConfigLoader
+
+INDEX_FORMAT_VERSION = 1
+_DETAILS_KEYS = ("public_id", "name", "author", "description", "version")
+
+DirectoryKey = Tuple[str, str]
+
+
+def _mtime(path: str) -> Optional[int]:
+    """Get the modification time of a path, in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _item_type_from_plural(item_type_plural: str) -> PackageType:
+    """Get the package type from the plural of an item type."""
+    return PackageType(item_type_plural[:-1])
+
+
+class RegistryIndex:
+    """The index of the packages of a local registry."""
+
+    def __init__(self, registry_path: str, index_directory: str = REGISTRY_INDEX_DIR):
+        """
+        Initialize the index of a local registry.
+
+        :param registry_path: the path to the local registry.
+        :param index_directory: the directory of the indexes of all the registries.
+        """
+        self._registry_path = os.path.realpath(registry_path)
+        self._index_path = os.path.join(
+            index_directory,
+            hashlib.sha256(self._registry_path.encode("utf-8")).hexdigest()[:32],
+        )
+        self._directories = {}  # type: Dict[DirectoryKey, Dict[str, Any]]
+        self._changed = set()  # type: Set[DirectoryKey]
+        self._loaders = {}  # type: Dict[str, ConfigLoader]
+
+    @property
+    def index_path(self) -> str:
+        """Get the path to the directory of the index files of the registry."""
+        return self._index_path
+
+    def _directory_index_path(self, key: DirectoryKey) -> str:
+        """Get the path to the index file of a '<author>/<item type>' directory."""
+        return os.path.join(self._index_path, "{}.{}.json".format(*key))
+
+    def _directory(self, key: DirectoryKey) -> Dict[str, Any]:
+        """
+        Get the index of a '<author>/<item type>' directory, loading its file if needed.
+
+        :param key: the author and the item type (plural).
+        :return: the index of the directory, empty if there is no valid index file.
+        """
+        directory = self._directories.get(key)
+        if directory is not None:
+            return directory
+        try:
+            with open(self._directory_index_path(key), "r", encoding="utf-8") as fp:
+                directory = json.load(fp)
+        except (OSError, ValueError):
+            directory = None
+        if (
+            not isinstance(directory, dict)
+            or directory.get("version") != INDEX_FORMAT_VERSION
+            or directory.get("registry_path") != self._registry_path
+            or not isinstance(directory.get("items"), dict)
+        ):
+            directory = {
+                "version": INDEX_FORMAT_VERSION,
+                "registry_path": self._registry_path,
+                "mtime": None,
+                "items": {},
+            }
+        self._directories[key] = directory
+        return directory
+
+    def save(self) -> None:
+        """
+        Write the index files which have changed.
+
+        Each file is replaced atomically. If they cannot be written, the registry is left unindexed.
+
+        :return: None
+        """
+        for key in sorted(self._changed):
+            path = self._directory_index_path(key)
+            try:
+                os.makedirs(self._index_path, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self._index_path, prefix=os.path.basename(path), suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                        json.dump(
+                            self._directories[key],
+                            fp,
+                            separators=(",", ":"),
+                            sort_keys=True,
+                        )
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+            except OSError as e:
+                logger.debug("Cannot write registry index: {}".format(e))
+                return
+        self._changed.clear()
+
+    def _forget_directory(self, key: DirectoryKey) -> None:
+        """Remove the index of a directory which is not in the registry anymore."""
+        self._directories.pop(key, None)
+        self._changed.discard(key)
+        try:
+            os.remove(self._directory_index_path(key))
+        except OSError:
+            pass
+
+    def _loader(self, item_type_plural: str) -> ConfigLoader:
+        """Get the configuration loader of an item type."""
+        loader = self._loaders.get(item_type_plural)
+        if loader is None:
+            loader = ConfigLoader.from_configuration_type(
+                _item_type_from_plural(item_type_plural)
+            )
+            self._loaders[item_type_plural] = loader
+        return loader
+
+    def _refresh_item(
+        self, item_type_plural: str, author: str, name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Bring the entry of a package up to date.
+
+        :param item_type_plural: the item type (plural).
+        :param author: the author of the package.
+        :param name: the name of the package.
+        :return: the entry, or None if the package is not in the registry.
+        """
+        key = (author, item_type_plural)
+        items = self._directory(key)["items"]
+        config_path = os.path.join(
+            self._registry_path,
+            author,
+            item_type_plural,
+            name,
+            _get_default_configuration_file_name_from_type(
+                _item_type_from_plural(item_type_plural)
+            ),
+        )
+        mtime = _mtime(config_path)
+        entry = items.get(name)
+        if mtime is None:
+            if entry is not None:
+                del items[name]
+                self._changed.add(key)
+            return None
+        if entry is not None and entry["mtime"] == mtime:
+            return entry
+
+        with open(config_path, "r", encoding="utf-8") as fp:
+            config = self._loader(item_type_plural).load(fp)
+        entry = {
+            "public_id": str(config.public_id),
+            "name": config.name,
+            "author": config.author,
+            "description": config.description,
+            "version": config.version,
+            "fingerprint": dict(getattr(config, "fingerprint", {})),
+            "mtime": mtime,
+        }
+        items[name] = entry
+        self._changed.add(key)
+        return entry
+
+    def _refresh_directory(
+        self, author: str, item_type_plural: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Bring the entries of a '<author>/<item type>' directory up to date.
+
+        :param author: the author.
+        :param item_type_plural: the item type (plural).
+        :return: the entries of the packages in the directory.
+        """
+        key = (author, item_type_plural)
+        directory_path = os.path.join(self._registry_path, author, item_type_plural)
+        mtime = _mtime(directory_path)
+        if mtime is None:
+            self._forget_directory(key)
+            return []
+
+        directory = self._directory(key)
+        if directory["mtime"] != mtime:
+            names = sorted(
+                name
+                for name in os.listdir(directory_path)
+                if name != "scaffold"
+                and os.path.isdir(os.path.join(directory_path, name))
+            )
+            for name in set(directory["items"]) - set(names):
+                del directory["items"][name]
+            directory["mtime"] = mtime
+            self._changed.add(key)
+        else:
+            names = sorted(directory["items"])
+
+        entries = []  # type: List[Dict[str, Any]]
+        for name in names:
+            entry = self._refresh_item(item_type_plural, author, name)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    def items(self, item_type_plural: str) -> List[Dict[str, Any]]:
+        """
+        Get the details of all the packages of a type in the registry.
+
+        :param item_type_plural: the item type (plural).
+        :return: the details of the packages, as in 'aea search'.
+        """
+        try:
+            authors = sorted(
+                author
+                for author in os.listdir(self._registry_path)
+                if os.path.isdir(os.path.join(self._registry_path, author))
+            )
+        except OSError:
+            return []
+
+        suffix = ".{}.json".format(item_type_plural)
+        try:
+            indexed_authors = [
+                file_name[: -len(suffix)]
+                for file_name in os.listdir(self._index_path)
+                if file_name.endswith(suffix)
+            ]
+        except OSError:
+            indexed_authors = []
+        for author in set(indexed_authors) - set(authors):
+            self._forget_directory((author, item_type_plural))
+
+        results = []  # type: List[Dict[str, Any]]
+        for author in authors:
+            for entry in self._refresh_directory(author, item_type_plural):
+                results.append({key: entry[key] for key in _DETAILS_KEYS})
+        self.save()
+        return results
+
+    def get(
+        self, item_type_plural: str, author: str, name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the entry of a package, updating the index for this package only.
+
+        :param item_type_plural: the item type (plural).
+        :param author: the author of the package.
+        :param name: the name of the package.
+        :return: the details and the fingerprint of the package, or None if it is not in the registry.
+        """
+        entry = self._refresh_item(item_type_plural, author, name)
+        self.save()
+        if entry is None:
+            return None
+        result = {key: entry[key] for key in _DETAILS_KEYS}
+        result["fingerprint"] = dict(entry["fingerprint"])
+        return result
+
+    def update_item(self, item_type_plural: str, author: str, name: str) -> None:
+        """
+        Update the index after a package has been written to the registry.
+
+        :param item_type_plural: the item type (plural).
+        :param author: the author of the package.
+        :param name: the name of the package.
+        :return: None
+        """
+        self._refresh_item(item_type_plural, author, name)
+        self.save()
@@ -47,7 +47,7 @@ from packaging.version import Version
 import semver
 
 import aea
-from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.fingerprint import get_default_engine
 
 T = TypeVar("T")
 DEFAULT_VERSION = "0.1.0"
@@ -1256,6 +1256,12 @@ class AgentConfig(PackageConfiguration):
         default_routing: Optional[Dict] = None,
         loop_mode: Optional[str] = None,
         runtime_mode: Optional[str] = None,
+        priority_lanes: Optional[Dict] = None,
+        in_queue_high_watermark: Optional[int] = None,
+        in_queue_low_watermark: Optional[int] = None,
+        out_queue_maxsize: Optional[int] = None,
+        outbox_policy: Optional[str] = None,
+        outbox_timeout: Optional[float] = None,
     ):
         """Instantiate the agent configuration object."""
         super().__init__(
@@ -1305,6 +1311,14 @@ class AgentConfig(PackageConfiguration):
         )  # type: Dict[PublicId, PublicId]
         self.loop_mode = loop_mode
         self.runtime_mode = runtime_mode
+        self.priority_lanes = (
+            priority_lanes if priority_lanes is not None else {}
+        )  # type: Dict[str, Dict]
+        self.in_queue_high_watermark: Optional[int] = in_queue_high_watermark
+        self.in_queue_low_watermark: Optional[int] = in_queue_low_watermark
+        self.out_queue_maxsize: Optional[int] = out_queue_maxsize
+        self.outbox_policy: Optional[str] = outbox_policy
+        self.outbox_timeout: Optional[float] = outbox_timeout
 
     @property
     def package_dependencies(self) -> Set[ComponentId]:
@@ -1438,6 +1452,19 @@ class AgentConfig(PackageConfiguration):
         if self.runtime_mode is not None:
             config["runtime_mode"] = self.runtime_mode
 
+        if self.priority_lanes != {}:
+            config["priority_lanes"] = self.priority_lanes
+        if self.in_queue_high_watermark is not None:
+            config["in_queue_high_watermark"] = self.in_queue_high_watermark
+        if self.in_queue_low_watermark is not None:
+            config["in_queue_low_watermark"] = self.in_queue_low_watermark
+        if self.out_queue_maxsize is not None:
+            config["out_queue_maxsize"] = self.out_queue_maxsize
+        if self.outbox_policy is not None:
+            config["outbox_policy"] = self.outbox_policy
+        if self.outbox_timeout is not None:
+            config["outbox_timeout"] = self.outbox_timeout
+
         return config
 
     @classmethod
@@ -1464,6 +1491,12 @@ class AgentConfig(PackageConfiguration):
             default_routing=cast(Dict, obj.get("default_routing", {})),
             loop_mode=cast(str, obj.get("loop_mode")),
             runtime_mode=cast(str, obj.get("runtime_mode")),
+            priority_lanes=cast(Dict, obj.get("priority_lanes", {})),
+            in_queue_high_watermark=cast(int, obj.get("in_queue_high_watermark")),
+            in_queue_low_watermark=cast(int, obj.get("in_queue_low_watermark")),
+            out_queue_maxsize=cast(int, obj.get("out_queue_maxsize")),
+            outbox_policy=cast(str, obj.get("outbox_policy")),
+            outbox_timeout=cast(float, obj.get("outbox_timeout")),
         )
 
         for crypto_id, path in obj.get("private_key_paths", {}).items():
@@ -1754,27 +1787,29 @@ def _compute_fingerprint(
 ) -> Dict[str, str]:
     ignore_patterns = ignore_patterns if ignore_patterns is not None else []
     ignore_patterns = set(ignore_patterns).union(DEFAULT_FINGERPRINT_IGNORE_PATTERNS)
-    hasher = IPFSHashOnly()
-    fingerprints = {}  # type: Dict[str, str]
-    # find all valid files of the package
-    all_files = [
-        x
-        for x in package_directory.glob("**/*")
-        if x.is_file()
-        and (
-            x.match("*.py") or not any(x.match(pattern) for pattern in ignore_patterns)
-        )
-    ]
+    return get_default_engine().compute(package_directory, ignore_patterns)
 
-    for file in all_files:
-        file_hash = hasher.get(str(file))
-        key = str(file.relative_to(package_directory))
-        assert key not in fingerprints, "Key in fingerprints!"  # nosec
-        # use '/' as path separator
-        normalized_path = Path(key).as_posix()
-        fingerprints[normalized_path] = file_hash
 
-    return fingerprints
+def _compute_fingerprints(
+    packages: Sequence[Tuple[Path, Optional[Collection[str]]]]
+) -> List[Dict[str, str]]:
+    """
+    Compute the fingerprints of several packages at once.
+
+    :param packages: list of pairs (package directory, ignore patterns).
+    :return: the fingerprints, in the same order of the packages.
+    """
+    return get_default_engine().compute_many(
+        [
+            (
+                package_directory,
+                set(ignore_patterns if ignore_patterns is not None else []).union(
+                    DEFAULT_FINGERPRINT_IGNORE_PATTERNS
+                ),
+            )
+            for package_directory, ignore_patterns in packages
+        ]
+    )
 
 
 def _compare_fingerprints(
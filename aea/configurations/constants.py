@@ -22,12 +22,11 @@
 from aea.configurations.base import DEFAULT_LICENSE as DL
 from aea.configurations.base import DEFAULT_REGISTRY_PATH as DRP
 from aea.configurations.base import PublicId
-from aea.crypto.fetchai import FetchAICrypto
 
 DEFAULT_CONNECTION = PublicId.from_str("fetchai/stub:0.6.0")
 DEFAULT_PROTOCOL = PublicId.from_str("fetchai/default:0.3.0")
 DEFAULT_SKILL = PublicId.from_str("fetchai/error:0.3.0")
-DEFAULT_LEDGER = FetchAICrypto.identifier
+DEFAULT_LEDGER = "fetchai"
 DEFAULT_REGISTRY_PATH = DRP
 DEFAULT_LICENSE = DL
 SIGNING_PROTOCOL = PublicId.from_str("fetchai/signing:0.1.0")
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains the agent image, a build-time cache of an AEA project.
+
+The image stores the validated agent and component configurations, in import order,
+together with a snapshot of the project files (sizes and modification times).
+As long as the snapshot matches the project on disk, the configurations can be
+reused without parsing and validating the YAML files or recomputing fingerprints.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type, cast
+
+import aea
+from aea.configurations.base import (
+    AgentConfig,
+    ComponentConfiguration,
+    ComponentType,
+    ConnectionConfig,
+    ContractConfig,
+    DEFAULT_AEA_CONFIG_FILE,
+    ProtocolConfig,
+    SkillConfig,
+)
+
+DEFAULT_AGENT_IMAGE_FILE = ".aea_image.json"
+AGENT_IMAGE_FORMAT_VERSION = 1
+
+IGNORED_DIRECTORIES = {"__pycache__"}
+IGNORED_SUFFIXES = {".pyc", ".pyo"}
+
+FileStats = Dict[str, Tuple[int, int]]
+
+_CONFIGURATION_CLASSES = {
+    ComponentType.PROTOCOL: ProtocolConfig,
+    ComponentType.CONNECTION: ConnectionConfig,
+    ComponentType.CONTRACT: ContractConfig,
+    ComponentType.SKILL: SkillConfig,
+}  # type: Dict[ComponentType, Type[ComponentConfiguration]]
+
+
+def _file_digest(path: Path) -> str:
+    """Compute the SHA-256 digest of a (small) file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _directory_stats(directory: Path) -> FileStats:
+    """
+    Compute size and modification time (in nanoseconds) of all the files in a directory.
+
+    :param directory: the directory.
+    :return: mapping from the relative POSIX path of each file to (size, mtime_ns).
+    """
+    result = {}  # type: FileStats
+    for root, dirs, files in os.walk(str(directory)):
+        dirs[:] = sorted(d for d in dirs if d not in IGNORED_DIRECTORIES)
+        for file_name in files:
+            if os.path.splitext(file_name)[1] in IGNORED_SUFFIXES:
+                continue
+            file_path = os.path.join(root, file_name)
+            stat = os.stat(file_path)
+            key = Path(os.path.relpath(file_path, str(directory))).as_posix()
+            result[key] = (stat.st_size, stat.st_mtime_ns)
+    return result
+
+
+class ComponentImage:
+    """The image of a component of the agent."""
+
+    def __init__(
+        self,
+        component_type: ComponentType,
+        directory: str,
+        configuration_json: Dict,
+        key_order: List[str],
+        file_stats: FileStats,
+    ):
+        """
+        Initialize the component image.
+
+        :param component_type: the component type.
+        :param directory: the component directory, relative to the project root.
+        :param configuration_json: the JSON representation of the validated configuration.
+        :param key_order: the key order of the configuration file.
+        :param file_stats: the stats of the files in the component directory.
+        """
+        self.component_type = component_type
+        self.directory = directory
+        self.configuration_json = configuration_json
+        self.key_order = key_order
+        self.file_stats = file_stats
+
+    @classmethod
+    def from_configuration(
+        cls, configuration: ComponentConfiguration, aea_project_path: Path
+    ) -> "ComponentImage":
+        """
+        Make the image of a loaded component configuration.
+
+        :param configuration: the component configuration, with the directory set.
+        :param aea_project_path: the root of the AEA project.
+        :return: the component image.
+        """
+        assert configuration.directory is not None, "Directory not set."
+        directory = Path(configuration.directory)
+        return ComponentImage(
+            configuration.component_type,
+            Path(os.path.relpath(str(directory), str(aea_project_path))).as_posix(),
+            configuration.json,
+            list(configuration._key_order),  # pylint: disable=protected-access
+            _directory_stats(directory),
+        )
+
+    def is_up_to_date(self, aea_project_path: Path) -> bool:
+        """Check that the component files have not changed."""
+        return _directory_stats(aea_project_path / self.directory) == self.file_stats
+
+    def get_configuration(self, aea_project_path: Path) -> ComponentConfiguration:
+        """
+        Get the configuration object of the component.
+
+        :param aea_project_path: the root of the AEA project.
+        :return: the configuration object, with the directory set.
+        """
+        configuration_class = _CONFIGURATION_CLASSES[self.component_type]
+        configuration = cast(
+            ComponentConfiguration,
+            configuration_class.from_json(self.configuration_json),
+        )
+        configuration._key_order = list(  # pylint: disable=protected-access
+            self.key_order
+        )
+        configuration.directory = aea_project_path / self.directory
+        return configuration
+
+    @property
+    def json(self) -> Dict:
+        """Compute the JSON representation."""
+        return {
+            "component_type": self.component_type.value,
+            "directory": self.directory,
+            "configuration": self.configuration_json,
+            "key_order": self.key_order,
+            "files": {path: list(stats) for path, stats in self.file_stats.items()},
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict) -> "ComponentImage":
+        """Build from a JSON object."""
+        return ComponentImage(
+            ComponentType(obj["component_type"]),
+            obj["directory"],
+            obj["configuration"],
+            obj["key_order"],
+            {path: (stats[0], stats[1]) for path, stats in obj["files"].items()},
+        )
+
+
+class AgentImage:
+    """
+    The image of an AEA project.
+
+    The components are stored in the order they must be added to the builder.
+    """
+
+    def __init__(
+        self,
+        agent_configuration_json: Dict,
+        agent_configuration_digest: str,
+        components: List[ComponentImage],
+        consistency_checked: bool,
+        aea_version: str = aea.__version__,
+    ):
+        """
+        Initialize the agent image.
+
+        :param agent_configuration_json: the JSON representation of the validated agent configuration.
+        :param agent_configuration_digest: the SHA-256 digest of the agent configuration file.
+        :param components: the component images, in import order.
+        :param consistency_checked: whether fingerprints and versions of the components have been verified.
+        :param aea_version: the version of the framework that built the image.
+        """
+        self.agent_configuration_json = agent_configuration_json
+        self.agent_configuration_digest = agent_configuration_digest
+        self.components = components
+        self.consistency_checked = consistency_checked
+        self.aea_version = aea_version
+
+    @classmethod
+    def from_configurations(
+        cls,
+        aea_project_path: Path,
+        agent_configuration: AgentConfig,
+        component_configurations: List[ComponentConfiguration],
+        consistency_checked: bool,
+    ) -> "AgentImage":
+        """
+        Make the image of a loaded AEA project.
+
+        :param aea_project_path: the root of the AEA project.
+        :param agent_configuration: the agent configuration.
+        :param component_configurations: the component configurations, in import order and with the directory set.
+        :param consistency_checked: whether the components have been checked for consistency.
+        :return: the agent image.
+        """
+        return AgentImage(
+            agent_configuration.json,
+            _file_digest(aea_project_path / DEFAULT_AEA_CONFIG_FILE),
+            [
+                ComponentImage.from_configuration(configuration, aea_project_path)
+                for configuration in component_configurations
+            ],
+            consistency_checked,
+        )
+
+    def is_up_to_date(
+        self, aea_project_path: Path, skip_consistency_check: bool = False
+    ) -> bool:
+        """
+        Check whether the image can be used in place of the project files.
+
+        :param aea_project_path: the root of the AEA project.
+        :param skip_consistency_check: if False, the image must have been built with consistency checks.
+        :return: True if the image is still valid, False otherwise.
+        """
+        if self.aea_version != aea.__version__:
+            return False
+        if not skip_consistency_check and not self.consistency_checked:
+            return False
+        try:
+            if (
+                _file_digest(aea_project_path / DEFAULT_AEA_CONFIG_FILE)
+                != self.agent_configuration_digest
+            ):
+                return False
+            return all(
+                component.is_up_to_date(aea_project_path)
+                for component in self.components
+            )
+        except OSError:
+            return False
+
+    @property
+    def agent_configuration(self) -> AgentConfig:
+        """Get the agent configuration object."""
+        return AgentConfig.from_json(self.agent_configuration_json)
+
+    def get_component_configurations(
+        self, aea_project_path: Path
+    ) -> List[ComponentConfiguration]:
+        """
+        Get the component configurations, in import order.
+
+        :param aea_project_path: the root of the AEA project.
+        :return: the list of component configurations.
+        """
+        return [
+            component.get_configuration(aea_project_path)
+            for component in self.components
+        ]
+
+    @property
+    def json(self) -> Dict:
+        """Compute the JSON representation."""
+        return {
+            "format_version": AGENT_IMAGE_FORMAT_VERSION,
+            "aea_version": self.aea_version,
+            "consistency_checked": self.consistency_checked,
+            "agent_configuration": self.agent_configuration_json,
+            "agent_configuration_digest": self.agent_configuration_digest,
+            "components": [component.json for component in self.components],
+        }
+
+    @classmethod
+    def from_json(cls, obj: Dict) -> "AgentImage":
+        """Build from a JSON object."""
+        return AgentImage(
+            obj["agent_configuration"],
+            obj["agent_configuration_digest"],
+            [ComponentImage.from_json(component) for component in obj["components"]],
+            obj["consistency_checked"],
+            aea_version=obj["aea_version"],
+        )
+
+    def dump(self, aea_project_path: Path) -> Path:
+        """
+        Write the image in the AEA project directory.
+
+        :param aea_project_path: the root of the AEA project.
+        :return: the path of the image file.
+        """
+        image_path = aea_project_path / DEFAULT_AGENT_IMAGE_FILE
+        tmp_path = image_path.with_name(image_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump(self.json, fp, separators=(",", ":"))
+        os.replace(str(tmp_path), str(image_path))
+        return image_path
+
+    @classmethod
+    def load(cls, aea_project_path: Path) -> Optional["AgentImage"]:
+        """
+        Read the image from the AEA project directory.
+
+        :param aea_project_path: the root of the AEA project.
+        :return: the agent image, or None if not present or unreadable.
+        """
+        image_path = aea_project_path / DEFAULT_AGENT_IMAGE_FILE
+        try:
+            with image_path.open("r", encoding="utf-8") as fp:
+                obj = json.load(fp)
+            if obj.get("format_version") != AGENT_IMAGE_FORMAT_VERSION:
+                return None
+            return AgentImage.from_json(obj)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def remove(aea_project_path: Path) -> None:
+        """
+        Remove the image from the AEA project directory, if present.
+
+        :param aea_project_path: the root of the AEA project.
+        :return: None
+        """
+        image_path = aea_project_path / DEFAULT_AGENT_IMAGE_FILE
+        if image_path.exists():
+            image_path.unlink()
@@ -43,16 +43,8 @@ class Contract(BaseContract):
         :return: the contract instance
         """
         ledger_api = cast(EthereumApi, ledger_api)
-        if contract_address is None:
-            instance = ledger_api.api.eth.contract(
-                abi=cls.contract_interface["abi"],
-                bytecode=cls.contract_interface["bytecode"],
-            )
-        else:
-            instance = ledger_api.api.eth.contract(
-                address=contract_address,
-                abi=cls.contract_interface["abi"],
-                bytecode=cls.contract_interface["bytecode"],
-            )
+        instance = ledger_api.get_contract_instance(
+            cls.contract_interface, contract_address
+        )
         instance = cast(EthereumContract, instance)
         return instance
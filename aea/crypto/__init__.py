@@ -17,9 +17,18 @@
 #
 # ------------------------------------------------------------------------------
 
-"""This module contains the crypto modules."""
+"""
+This module contains the crypto modules.
 
-from aea.crypto.registries import register_crypto, register_ledger_api  # noqa
+The ledger backends are registered by entry point, so that their modules
+(and their dependencies) are imported only on first use.
+"""
+
+from aea.crypto.registries import (  # noqa
+    register_crypto,
+    register_faucet_api,
+    register_ledger_api,
+)
 
 register_crypto(id_="fetchai", entry_point="aea.crypto.fetchai:FetchAICrypto")
 register_crypto(id_="ethereum", entry_point="aea.crypto.ethereum:EthereumCrypto")
@@ -34,3 +43,7 @@ register_ledger_api(id_="ethereum", entry_point="aea.crypto.ethereum:EthereumApi
 register_ledger_api(
     id_="cosmos", entry_point="aea.crypto.cosmos:CosmosApi",
 )
+
+register_faucet_api(id_="fetchai", entry_point="aea.crypto.fetchai:FetchAIFaucetApi")
+register_faucet_api(id_="ethereum", entry_point="aea.crypto.ethereum:EthereumFaucetApi")
+register_faucet_api(id_="cosmos", entry_point="aea.crypto.cosmos:CosmosFaucetApi")
@@ -19,13 +19,148 @@
 
 """Abstract module wrapping the public and private key cryptography and ledger api."""
 
+import hashlib
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, BinaryIO, Generic, Optional, Tuple, TypeVar
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import wraps
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from aea.mail.base import Address
 
 
 EntityClass = TypeVar("EntityClass")
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_HTTP_TIMEOUT = 30.0
+DEFAULT_RECOVERY_CACHE_SIZE = 4096
+DEFAULT_NONCE_RESYNC_TIMEOUT = 60.0
+# below this number of recoveries, starting worker processes costs more than it saves.
+MIN_RECOVERIES_PER_PROCESS = 64
+
+RecoveryRequest = Tuple[bytes, str, bool]
+RecoverMessage = TypeVar("RecoverMessage", bound=Callable[..., Tuple[Address, ...]])
+
+
+class RecoveryCache:
+    """A bounded LRU cache of the addresses recovered from signed messages."""
+
+    def __init__(self, maxsize: int = DEFAULT_RECOVERY_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        :param maxsize: the maximum number of recoveries kept.
+        """
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # type: OrderedDict[bytes, Tuple[Address, ...]]
+
+    @staticmethod
+    def key(message: bytes, signature: str, is_deprecated_mode: bool = False) -> bytes:
+        """
+        Get the key of a recovery: a digest of the message, the signature and the mode.
+
+        :param message: the message
+        :param signature: the signature
+        :param is_deprecated_mode: if the deprecated signing was used
+        :return: the key
+        """
+        hasher = hashlib.sha256(b"\x01" if is_deprecated_mode else b"\x00")
+        hasher.update(len(message).to_bytes(8, "big"))
+        hasher.update(message)
+        hasher.update(signature.encode("utf-8"))
+        return hasher.digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[Address, ...]]:
+        """
+        Get the addresses of a recovery, and mark it as recently used.
+
+        :param key: the key of the recovery
+        :return: the addresses, or None if the recovery is not in the cache
+        """
+        with self._lock:
+            addresses = self._entries.get(key)
+            if addresses is not None:
+                self._entries.move_to_end(key)
+            return addresses
+
+    def put(self, key: bytes, addresses: Tuple[Address, ...]) -> None:
+        """
+        Add the addresses of a recovery, evicting the least recently used one if the cache is full.
+
+        :param key: the key of the recovery
+        :param addresses: the addresses
+        :return: None
+        """
+        with self._lock:
+            self._entries[key] = addresses
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the recoveries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get the number of recoveries in the cache."""
+        return len(self._entries)
+
+
+def cached_recovery(recover_message: RecoverMessage) -> RecoverMessage:
+    """
+    Cache the recoveries of the 'recover_message' method of a helper.
+
+    The cache is available as the 'cache' attribute of the decorated function,
+    and the undecorated function as its '__wrapped__' attribute.
+
+    :param recover_message: the function recovering the addresses of a signed message.
+    :return: the decorated function.
+    """
+    cache = RecoveryCache()
+
+    @wraps(recover_message)
+    def wrapper(
+        message: bytes, signature: str, is_deprecated_mode: bool = False
+    ) -> Tuple[Address, ...]:
+        key = RecoveryCache.key(message, signature, is_deprecated_mode)
+        addresses = cache.get(key)
+        if addresses is None:
+            addresses = recover_message(message, signature, is_deprecated_mode)
+            cache.put(key, addresses)
+        return addresses
+
+    wrapper.cache = cache  # type: ignore
+    return cast(RecoverMessage, wrapper)
+
+
+def _recover_messages_uncached(
+    helper: Type["Helper"], requests: Sequence[RecoveryRequest]
+) -> List[Tuple[Address, ...]]:
+    """Recover the addresses of signed messages without the cache, in a worker process."""
+    recover_message = getattr(
+        helper.recover_message, "__wrapped__", helper.recover_message
+    )
+    return [recover_message(*request) for request in requests]
 
 
 class Crypto(Generic[EntityClass], ABC):
@@ -193,6 +328,63 @@ class Helper(ABC):
         :return: the recovered addresses
         """
 
+    @classmethod
+    def recover_messages(
+        cls, requests: Sequence[RecoveryRequest], processes: Optional[int] = None,
+    ) -> List[Tuple[Address, ...]]:
+        """
+        Recover the addresses of many signed messages.
+
+        The recoveries which are not cached are spread over a pool of worker
+        processes, if there are enough of them to make up for starting it.
+
+        :param requests: the messages, signatures and whether the deprecated signing was used.
+        :param processes: the number of worker processes, by default the number of CPUs.
+        :return: the recovered addresses, in the order of the requests.
+        """
+        cache = getattr(
+            cls.recover_message, "cache", None
+        )  # type: Optional[RecoveryCache]
+        results = [None] * len(requests)  # type: List[Optional[Tuple[Address, ...]]]
+        missing = {}  # type: Dict[bytes, List[int]]
+        for index, request in enumerate(requests):
+            key = RecoveryCache.key(*request)
+            addresses = cache.get(key) if cache is not None else None
+            if addresses is None:
+                missing.setdefault(key, []).append(index)
+            else:
+                results[index] = addresses
+
+        keys = list(missing.keys())
+        missing_requests = [requests[missing[key][0]] for key in keys]
+        processes = min(
+            processes if processes is not None else (os.cpu_count() or 1),
+            len(missing_requests) // MIN_RECOVERIES_PER_PROCESS,
+        )
+        if processes > 1:
+            chunk_size = -(-len(missing_requests) // processes)
+            chunks = [
+                missing_requests[start : start + chunk_size]
+                for start in range(0, len(missing_requests), chunk_size)
+            ]
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                recovered = [
+                    addresses
+                    for chunk_addresses in executor.map(
+                        _recover_messages_uncached, [cls] * len(chunks), chunks
+                    )
+                    for addresses in chunk_addresses
+                ]
+        else:
+            recovered = _recover_messages_uncached(cls, missing_requests)
+
+        for key, addresses in zip(keys, recovered):
+            if cache is not None:
+                cache.put(key, addresses)
+            for index in missing[key]:
+                results[index] = addresses
+        return cast(List[Tuple[Address, ...]], results)
+
 
 class LedgerApi(Helper, ABC):
     """Interface for ledger APIs."""
@@ -269,6 +461,163 @@ class LedgerApi(Helper, ABC):
         :return: the tx, if present
         """
 
+    def clear_contract_instances(
+        self,
+        contract_interface: Optional[Dict[str, Any]] = None,
+        contract_address: Optional[str] = None,
+    ) -> None:
+        """
+        Clear the cached contract instances, for the ledger APIs which cache them.
+
+        :param contract_interface: if provided, only clear the instances of this contract interface.
+        :param contract_address: if provided, only clear the instances at this contract address.
+        :return: None
+        """
+
+
+class NonceManager:
+    """
+    Allocate the nonces of the transactions of each address locally.
+
+    The nonce of an address is synchronised with the ledger on its first use,
+    and then incremented locally for each transaction built, so that many
+    transactions can be built and sent without waiting for the previous ones
+    to be settled. The ledger APIs reset the nonce of an address when a send
+    fails, so that it is synchronised again on its next use.
+
+    A transaction built but never sent leaves a gap in the nonces, which
+    blocks the later transactions of the address. So the nonce of an address
+    is also synchronised again when none was allocated to it for the resync
+    timeout: the transactions built before then are assumed to be sent, or
+    abandoned.
+
+    The nonces of an address are allocated one at a time, but the ledger is
+    queried without blocking the allocations for the other addresses.
+    """
+
+    def __init__(self, resync_timeout: float = DEFAULT_NONCE_RESYNC_TIMEOUT) -> None:
+        """
+        Initialize the nonce manager.
+
+        :param resync_timeout: the time, in seconds, after which the nonce of an idle address is synchronised again.
+        """
+        self.resync_timeout = resync_timeout
+        self._lock = threading.Lock()
+        self._address_locks = {}  # type: Dict[Address, threading.Lock]
+        # the next nonce of each address, and the time of its last allocation.
+        self._next_nonces = {}  # type: Dict[Address, Tuple[int, float]]
+        # the lowest nonce of each address to allocate after its synchronisation.
+        self._min_nonces = {}  # type: Dict[Address, int]
+
+    def _get_address_lock(self, address: Address) -> threading.Lock:
+        """
+        Get the lock of an address.
+
+        :param address: the address.
+        :return: the lock.
+        """
+        with self._lock:
+            return self._address_locks.setdefault(address, threading.Lock())
+
+    def allocate(
+        self, address: Address, get_ledger_nonce: Callable[[], Optional[int]]
+    ) -> Optional[int]:
+        """
+        Allocate the nonce of the next transaction of an address.
+
+        :param address: the address.
+        :param get_ledger_nonce: get the next nonce of the address from the ledger, or None if it cannot be retrieved.
+        :return: the nonce, or None if it had to be synchronised and could not be retrieved.
+        """
+        with self._get_address_lock(address):
+            now = time.monotonic()
+            nonce = None  # type: Optional[int]
+            if address in self._next_nonces:
+                nonce, allocated_at = self._next_nonces[address]
+                if now - allocated_at > self.resync_timeout:
+                    ledger_nonce = get_ledger_nonce()
+                    if ledger_nonce is not None:
+                        nonce = ledger_nonce
+            else:
+                nonce = get_ledger_nonce()
+                if nonce is None:
+                    return None
+                nonce = max(nonce, self._min_nonces.pop(address, nonce))
+            self._next_nonces[address] = (nonce + 1, now)
+            return nonce
+
+    def reset(
+        self, address: Optional[Address] = None, min_nonce: Optional[int] = None
+    ) -> None:
+        """
+        Forget the nonce of an address, so that it is synchronised with the ledger on its next use.
+
+        The ledgers which only count the settled transactions in the nonce of an
+        address give a lower nonce than the transactions sent and not yet settled.
+        The nonce of the transaction which could not be sent is then the lowest
+        nonce to allocate, unless the ledger has settled others since.
+
+        :param address: the address, or None to reset all the addresses.
+        :param min_nonce: the lowest nonce to allocate after the synchronisation, if any.
+        :return: None
+        """
+        if address is None:
+            with self._lock:
+                addresses = list(self._address_locks)
+            for address_ in addresses:
+                with self._get_address_lock(address_):
+                    self._next_nonces.pop(address_, None)
+                    self._min_nonces.pop(address_, None)
+            return
+        with self._get_address_lock(address):
+            self._next_nonces.pop(address, None)
+            if min_nonce is not None:
+                self._min_nonces[address] = min(
+                    min_nonce, self._min_nonces.get(address, min_nonce)
+                )
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """An HTTP adapter with a default timeout for the requests which do not set one."""
+
+    def __init__(self, timeout: Optional[float] = None, **kwargs) -> None:
+        """
+        Initialize the adapter.
+
+        :param timeout: the default timeout of the requests, in seconds.
+        """
+        self._timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        """Send a request, with the default timeout if it does not set one."""
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, **kwargs)
+
+
+def make_http_session(
+    pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+    timeout: Optional[float] = DEFAULT_HTTP_TIMEOUT,
+) -> requests.Session:
+    """
+    Make an HTTP session for the REST calls of a ledger API.
+
+    The connections are kept alive and reused between requests, instead of
+    opening a new connection (and doing a new TLS handshake) for each of them.
+
+    :param pool_size: the maximum number of connections kept alive for each host.
+    :param timeout: the default timeout of the requests, in seconds, or None for no timeout.
+    :return: the session.
+    """
+    session = requests.Session()
+    adapter = _TimeoutHTTPAdapter(
+        timeout=timeout, pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class FaucetApi(ABC):
     """Interface for testnet faucet APIs."""
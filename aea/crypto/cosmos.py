@@ -25,7 +25,7 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Any, BinaryIO, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
 from bech32 import bech32_encode, convertbits
 
@@ -34,7 +34,18 @@ from ecdsa.util import sigencode_string_canonize
 
 import requests
 
-from aea.crypto.base import Crypto, FaucetApi, Helper, LedgerApi
+from aea.crypto.base import (
+    Crypto,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_HTTP_TIMEOUT,
+    DEFAULT_NONCE_RESYNC_TIMEOUT,
+    FaucetApi,
+    Helper,
+    LedgerApi,
+    NonceManager,
+    cached_recovery,
+    make_http_session,
+)
 from aea.helpers.base import try_decorator
 from aea.mail.base import Address
 
@@ -235,6 +246,7 @@ class CosmosHelper(Helper):
         return address
 
     @staticmethod
+    @cached_recovery
     def recover_message(
         message: bytes, signature: str, is_deprecated_mode: bool = False
     ) -> Tuple[Address, ...]:
@@ -268,12 +280,24 @@ class CosmosApi(LedgerApi, CosmosHelper):
 
     def __init__(self, **kwargs):
         """
-        Initialize the Ethereum ledger APIs.
+        Initialize the Cosmos ledger APIs.
+
+        :param pool_size: the maximum number of HTTP connections kept alive to the REST endpoint.
+        :param timeout: the timeout of the HTTP requests, in seconds.
+        :param nonce_resync_timeout: the time, in seconds, after which the sequence of an idle sender is retrieved again.
         """
         self._api = None
         self.network_address = kwargs.pop("address", DEFAULT_ADDRESS)
         self.denom = kwargs.pop("denom", DEFAULT_CURRENCY_DENOM)
         self.chain_id = kwargs.pop("chain_id", DEFAULT_CHAIN_ID)
+        self._session = make_http_session(
+            pool_size=kwargs.pop("pool_size", DEFAULT_HTTP_POOL_SIZE),
+            timeout=kwargs.pop("timeout", DEFAULT_HTTP_TIMEOUT),
+        )
+        self._nonce_manager = NonceManager(
+            kwargs.pop("nonce_resync_timeout", DEFAULT_NONCE_RESYNC_TIMEOUT)
+        )
+        self._account_numbers = {}  # type: Dict[Address, int]
 
     @property
     def api(self) -> None:
@@ -293,7 +317,7 @@ class CosmosApi(LedgerApi, CosmosHelper):
         """Try get the balance of a given account."""
         balance = None  # type: Optional[int]
         url = self.network_address + f"/bank/balances/{address}"
-        response = requests.get(url=url)
+        response = self._session.get(url=url)
         if response.status_code == 200:
             result = response.json()["result"]
             if len(result) == 0:
@@ -320,6 +344,9 @@ class CosmosApi(LedgerApi, CosmosHelper):
         """
         Submit a transfer transaction to the ledger.
 
+        The sequence of the transaction is allocated locally, after the account
+        number and sequence of the sender have been retrieved on its first transaction.
+
         :param sender_address: the sender address of the payer.
         :param destination_address: the destination address of the payee.
         :param amount: the amount of wealth to be transferred.
@@ -330,9 +357,12 @@ class CosmosApi(LedgerApi, CosmosHelper):
         """
         denom = denom if denom is not None else self.denom
         chain_id = chain_id if chain_id is not None else self.chain_id
-        account_number, sequence = self._try_get_account_number_and_sequence(
-            sender_address
+        next_sequence = self._nonce_manager.allocate(
+            sender_address, lambda: self._get_ledger_sequence(sender_address)
         )
+        if next_sequence is None:
+            return None
+        account_number = self._account_numbers[sender_address]
         transfer = {
             "type": "cosmos-sdk/MsgSend",
             "value": {
@@ -343,7 +373,7 @@ class CosmosApi(LedgerApi, CosmosHelper):
         }
         tx = {
             "account_number": str(account_number),
-            "sequence": str(sequence),
+            "sequence": str(next_sequence),
             "chain_id": chain_id,
             "fee": {
                 "gas": str(gas),
@@ -354,6 +384,20 @@ class CosmosApi(LedgerApi, CosmosHelper):
         }
         return tx
 
+    def _get_ledger_sequence(self, address: Address) -> Optional[int]:
+        """
+        Get the sequence of an address from the ledger, and keep its account number.
+
+        :param address: the address
+        :return: the sequence, if retrieved
+        """
+        result = self._try_get_account_number_and_sequence(address)
+        if result is None:
+            return None
+        account_number, sequence = result
+        self._account_numbers[address] = account_number
+        return sequence
+
     @try_decorator(
         "Encountered exception when trying to get account number and sequence: {}",
         logger_method=logger.warning,
@@ -369,7 +413,7 @@ class CosmosApi(LedgerApi, CosmosHelper):
         """
         result = None  # type: Optional[Tuple[int, int]]
         url = self.network_address + f"/auth/accounts/{address}"
-        response = requests.get(url=url)
+        response = self._session.get(url=url)
         if response.status_code == 200:
             result = (
                 int(response.json()["result"]["value"]["account_number"]),
@@ -381,12 +425,46 @@ class CosmosApi(LedgerApi, CosmosHelper):
         """
         Send a signed transaction and wait for confirmation.
 
+        If the transaction cannot be sent, the sequence of the sender, if it can be
+        recovered, is synchronised again with the ledger on its next transaction.
+        The ledger only counts the settled transactions in the sequence, so the
+        sequences of the transactions sent before, and not yet settled, are not
+        allocated again.
+
         :param tx_signed: the signed transaction
         :return: tx_digest, if present
         """
         tx_digest = self._try_send_signed_transaction(tx_signed)
+        if tx_digest is None:
+            sender_address = self._try_get_sender_address(tx_signed)
+            if sender_address is not None:
+                self._nonce_manager.reset(
+                    sender_address, self._try_get_sequence(tx_signed)
+                )
         return tx_digest
 
+    @staticmethod
+    @try_decorator("Unable to get the sender: {}", logger_method=logger.debug)
+    def _try_get_sender_address(tx_signed: Any) -> Optional[Address]:
+        """
+        Try get the sender address of a signed transfer transaction.
+
+        :param tx_signed: the signed transaction
+        :return: the sender address, if found
+        """
+        return tx_signed["tx"]["msg"][0]["value"]["from_address"]
+
+    @staticmethod
+    @try_decorator("Unable to get the sequence: {}", logger_method=logger.debug)
+    def _try_get_sequence(tx_signed: Any) -> Optional[int]:
+        """
+        Try get the sequence of a signed transaction.
+
+        :param tx_signed: the signed transaction
+        :return: the sequence, if found
+        """
+        return int(tx_signed["tx"]["signatures"][0]["sequence"])
+
     @try_decorator(
         "Encountered exception when trying to send tx: {}", logger_method=logger.warning
     )
@@ -399,8 +477,8 @@ class CosmosApi(LedgerApi, CosmosHelper):
         """
         tx_digest = None  # type: Optional[str]
         url = self.network_address + "/txs"
-        response = requests.post(url=url, json=tx_signed)
-        if response.status_code == 200:
+        response = self._session.post(url=url, json=tx_signed)
+        if response.status_code == 200 and not response.json().get("code"):
             tx_digest = response.json()["txhash"]
         return tx_digest
 
@@ -427,7 +505,7 @@ class CosmosApi(LedgerApi, CosmosHelper):
         """
         result = None  # type: Optional[Any]
         url = self.network_address + f"/txs/{tx_digest}"
-        response = requests.get(url=url)
+        response = self._session.get(url=url)
         if response.status_code == 200:
             result = response.json()
         return result
@@ -35,7 +35,15 @@ import requests
 
 from web3 import HTTPProvider, Web3
 
-from aea.crypto.base import Crypto, FaucetApi, Helper, LedgerApi
+from aea.crypto.base import (
+    Crypto,
+    DEFAULT_NONCE_RESYNC_TIMEOUT,
+    FaucetApi,
+    Helper,
+    LedgerApi,
+    NonceManager,
+    cached_recovery,
+)
 from aea.helpers.base import try_decorator
 from aea.mail.base import Address
 
@@ -62,7 +70,9 @@ class EthereumCrypto(Crypto[Account]):
         """
         super().__init__(private_key_path=private_key_path)
         bytes_representation = Web3.toBytes(hexstr=self.entity.key.hex())
-        self._public_key = str(keys.PrivateKey(bytes_representation).public_key)
+        # the parsed key signs without parsing the raw key again for each signature.
+        self._private_key = keys.PrivateKey(bytes_representation)
+        self._public_key = str(self._private_key.public_key)
         self._address = str(self.entity.address)
 
     @property
@@ -108,11 +118,15 @@ class EthereumCrypto(Crypto[Account]):
         :return: signature of the message in string form
         """
         if is_deprecated_mode and len(message) == 32:
-            signature_dict = self.entity.signHash(message)
+            signature_dict = Account.signHash(  # pylint: disable=no-value-for-parameter
+                message, private_key=self._private_key
+            )
             signed_msg = signature_dict["signature"].hex()
         else:
             signable_message = encode_defunct(primitive=message)
-            signature = self.entity.sign_message(signable_message=signable_message)
+            signature = Account.sign_message(  # pylint: disable=no-value-for-parameter
+                signable_message=signable_message, private_key=self._private_key
+            )
             signed_msg = signature["signature"].hex()
         return signed_msg
 
@@ -123,8 +137,9 @@ class EthereumCrypto(Crypto[Account]):
         :param transaction: the transaction to be signed
         :return: signed transaction
         """
-        signed_transaction = self.entity.sign_transaction(transaction_dict=transaction)
-        #  Note: self.entity.signTransaction(transaction_dict=transaction) == signed_transaction
+        signed_transaction = Account.sign_transaction(  # pylint: disable=no-value-for-parameter
+            transaction_dict=transaction, private_key=self._private_key
+        )
         return signed_transaction
 
     @classmethod
@@ -212,6 +227,7 @@ class EthereumHelper(Helper):
         return address
 
     @staticmethod
+    @cached_recovery
     def recover_message(
         message: bytes, signature: str, is_deprecated_mode: bool = False
     ) -> Tuple[Address, ...]:
@@ -246,11 +262,19 @@ class EthereumApi(LedgerApi, EthereumHelper):
         Initialize the Ethereum ledger APIs.
 
         :param address: the endpoint for Web3 APIs.
+        :param nonce_resync_timeout: the time, in seconds, after which the nonce of an idle sender is retrieved again.
         """
         assert address is not None, "address is a required key word argument"
         self._api = Web3(HTTPProvider(endpoint_uri=address))
         self._gas_price = kwargs.pop("gas_price", DEFAULT_GAS_PRICE)
         self._chain_id = kwargs.pop("chain_id", DEFAULT_CHAIN_ID)
+        # contract instances, by identity of the contract interface and contract address.
+        self._contract_instances = (
+            {}
+        )  # type: Dict[Tuple[int, Optional[str]], Tuple[Dict[str, Any], Any]]
+        self._nonce_manager = NonceManager(
+            kwargs.pop("nonce_resync_timeout", DEFAULT_NONCE_RESYNC_TIMEOUT)
+        )
 
     @property
     def api(self) -> Web3:
@@ -280,6 +304,9 @@ class EthereumApi(LedgerApi, EthereumHelper):
         """
         Submit a transfer transaction to the ledger.
 
+        The nonce of the transaction is allocated locally, after the transaction
+        count of the sender has been retrieved on its first transaction.
+
         :param sender_address: the sender address of the payer.
         :param destination_address: the destination address of the payee.
         :param amount: the amount of wealth to be transferred.
@@ -291,7 +318,7 @@ class EthereumApi(LedgerApi, EthereumHelper):
         """
         chain_id = chain_id if chain_id is not None else self._chain_id
         gas_price = gas_price if gas_price is not None else self._gas_price
-        nonce = self._try_get_transaction_count(sender_address)
+        nonce = self.allocate_nonce(sender_address)
 
         transaction = {
             "nonce": nonce,
@@ -314,11 +341,25 @@ class EthereumApi(LedgerApi, EthereumHelper):
 
         return transaction
 
+    def allocate_nonce(self, address: Address) -> Optional[int]:
+        """
+        Allocate the nonce of the next transaction of an address.
+
+        The transactions built by contracts use it too, so that they do not reuse
+        the nonces of the transfers not yet sent, and conversely.
+
+        :param address: the address.
+        :return: the nonce, or None if the transaction count could not be retrieved.
+        """
+        return self._nonce_manager.allocate(
+            address, lambda: self._try_get_transaction_count(address)
+        )
+
     @try_decorator("Unable to retrieve transaction count: {}", logger_method="warning")
     def _try_get_transaction_count(self, address: Address) -> Optional[int]:
         """Try get the transaction count."""
         nonce = self._api.eth.getTransactionCount(  # pylint: disable=no-member
-            self._api.toChecksumAddress(address)
+            self._api.toChecksumAddress(address), "pending"
         )
         return nonce
 
@@ -336,12 +377,32 @@ class EthereumApi(LedgerApi, EthereumHelper):
         """
         Send a signed transaction and wait for confirmation.
 
+        If the transaction cannot be sent, the nonce of the sender, if it can be
+        recovered, is synchronised again with the ledger on its next transaction.
+
         :param tx_signed: the signed transaction
         :return: tx_digest, if present
         """
         tx_digest = self._try_send_signed_transaction(tx_signed)
+        if tx_digest is None:
+            sender_address = self._try_get_sender_address(tx_signed)
+            if sender_address is not None:
+                self._nonce_manager.reset(sender_address)
         return tx_digest
 
+    @try_decorator("Unable to recover the sender: {}", logger_method="debug")
+    def _try_get_sender_address(self, tx_signed: Any) -> Optional[Address]:
+        """
+        Try recover the sender address of a signed transaction.
+
+        :param tx_signed: the signed transaction
+        :return: the sender address, if recovered
+        """
+        tx_signed = cast(AttributeDict, tx_signed)
+        return Account.recover_transaction(  # pylint: disable=no-value-for-parameter
+            tx_signed.rawTransaction
+        )
+
     @try_decorator("Unable to send transaction: {}", logger_method="warning")
     def _try_send_signed_transaction(self, tx_signed: Any) -> Optional[str]:
         """
@@ -404,6 +465,56 @@ class EthereumApi(LedgerApi, EthereumHelper):
         tx = self._api.eth.getTransaction(tx_digest)  # pylint: disable=no-member
         return tx
 
+    def get_contract_instance(
+        self, contract_interface: Dict[str, Any], contract_address: Optional[str] = None
+    ) -> Any:
+        """
+        Get the web3 instance of a contract.
+
+        Instances are cached, as building them from the ABI is expensive.
+
+        :param contract_interface: the contract interface, with the ABI and the bytecode.
+        :param contract_address: the contract address, or None for a contract to deploy.
+        :return: the contract instance
+        """
+        key = (id(contract_interface), contract_address)
+        cached = self._contract_instances.get(key)
+        if cached is not None and cached[0] is contract_interface:
+            return cached[1]
+        if contract_address is None:
+            instance = self._api.eth.contract(  # pylint: disable=no-member
+                abi=contract_interface["abi"], bytecode=contract_interface["bytecode"],
+            )
+        else:
+            instance = self._api.eth.contract(  # pylint: disable=no-member
+                address=contract_address,
+                abi=contract_interface["abi"],
+                bytecode=contract_interface["bytecode"],
+            )
+        self._contract_instances[key] = (contract_interface, instance)
+        return instance
+
+    def clear_contract_instances(
+        self,
+        contract_interface: Optional[Dict[str, Any]] = None,
+        contract_address: Optional[str] = None,
+    ) -> None:
+        """
+        Clear the cached contract instances.
+
+        :param contract_interface: if provided, only clear the instances of this contract interface.
+        :param contract_address: if provided, only clear the instances at this contract address.
+        :return: None
+        """
+        keys = [
+            key
+            for key, (interface, _) in self._contract_instances.items()
+            if (contract_interface is None or interface is contract_interface)
+            and (contract_address is None or key[1] == contract_address)
+        ]
+        for key in keys:
+            self._contract_instances.pop(key, None)
+
 
 class EthereumFaucetApi(FaucetApi):
     """Ethereum testnet faucet API."""
@@ -38,7 +38,16 @@ from fetchai.ledger.serialisation import sha256_hash, transaction
 
 import requests
 
-from aea.crypto.base import Crypto, FaucetApi, Helper, LedgerApi
+from aea.crypto.base import (
+    Crypto,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_HTTP_TIMEOUT,
+    FaucetApi,
+    Helper,
+    LedgerApi,
+    cached_recovery,
+    make_http_session,
+)
 from aea.helpers.base import try_decorator
 from aea.mail.base import Address
 
@@ -207,6 +216,7 @@ class FetchAIHelper(Helper):
         return address
 
     @staticmethod
+    @cached_recovery
     def recover_message(
         message: bytes, signature: str, is_deprecated_mode: bool = False
     ) -> Tuple[Address, ...]:
@@ -242,14 +252,30 @@ class FetchAIApi(LedgerApi, FetchAIHelper):
         """
         Initialize the Fetch.AI ledger APIs.
 
-        :param kwargs: key word arguments (expects either a pair of 'host' and 'port' or a 'network')
+        The endpoints of the underlying API share one HTTP session, which keeps
+        its connections alive between requests.
+
+        :param kwargs: key word arguments (expects either a pair of 'host' and 'port' or a 'network',
+            and optionally the 'pool_size' and 'timeout' of the HTTP connections)
         """
         assert (
             "host" in kwargs and "port" in kwargs
         ) or "network" in kwargs, (
             "expects either a pair of 'host' and 'port' or a 'network'"
         )
+        session = make_http_session(
+            pool_size=kwargs.pop("pool_size", DEFAULT_HTTP_POOL_SIZE),
+            timeout=kwargs.pop("timeout", DEFAULT_HTTP_TIMEOUT),
+        )
         self._api = FetchaiLedgerApi(**kwargs)
+        for endpoint in (
+            self._api.tokens,
+            self._api.contracts,
+            self._api.tx,
+            self._api.server,
+            self._api.governance,
+        ):
+            endpoint._session = session  # pylint: disable=protected-access
 
     @property
     def api(self) -> FetchaiLedgerApi:
@@ -23,28 +23,21 @@ import logging
 import sys
 from typing import Optional
 
-from aea.crypto.cosmos import CosmosCrypto, CosmosFaucetApi
-from aea.crypto.ethereum import EthereumCrypto, EthereumFaucetApi
-from aea.crypto.fetchai import FetchAICrypto, FetchAIFaucetApi
-from aea.crypto.registries import make_crypto
+from aea.crypto.registries import faucet_apis_registry, make_crypto, make_faucet_api
 
 COSMOS_PRIVATE_KEY_FILE = "cosmos_private_key.txt"
 FETCHAI_PRIVATE_KEY_FILE = "fet_private_key.txt"
 ETHEREUM_PRIVATE_KEY_FILE = "eth_private_key.txt"
+# keyed by ledger identifier, so that the ledger backends are not imported here.
 TESTNETS = {
-    FetchAICrypto.identifier: "testnet",
-    EthereumCrypto.identifier: "ropsten",
-    CosmosCrypto.identifier: "testnet",
+    "fetchai": "testnet",
+    "ethereum": "ropsten",
+    "cosmos": "testnet",
 }
 IDENTIFIER_TO_KEY_FILES = {
-    CosmosCrypto.identifier: COSMOS_PRIVATE_KEY_FILE,
-    EthereumCrypto.identifier: ETHEREUM_PRIVATE_KEY_FILE,
-    FetchAICrypto.identifier: FETCHAI_PRIVATE_KEY_FILE,
-}
-IDENTIFIER_TO_FAUCET_APIS = {
-    CosmosCrypto.identifier: CosmosFaucetApi(),
-    EthereumCrypto.identifier: EthereumFaucetApi(),
-    FetchAICrypto.identifier: FetchAIFaucetApi(),
+    "cosmos": COSMOS_PRIVATE_KEY_FILE,
+    "ethereum": ETHEREUM_PRIVATE_KEY_FILE,
+    "fetchai": FETCHAI_PRIVATE_KEY_FILE,
 }
 
 logger = logging.getLogger(__name__)
@@ -99,6 +92,6 @@ def try_generate_testnet_wealth(identifier: str, address: str) -> None:
     :param address: the address to check for
     :return: None
     """
-    faucet_api = IDENTIFIER_TO_FAUCET_APIS.get(identifier, None)
-    if faucet_api is not None:
+    if identifier in faucet_apis_registry.supported_ids:
+        faucet_api = make_faucet_api(identifier)
         faucet_api.get_wealth(address)
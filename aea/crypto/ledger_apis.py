@@ -19,21 +19,12 @@
 
 """Module wrapping all the public and private keys cryptography."""
 import logging
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Optional, Union
 
 from aea.crypto.base import LedgerApi
-from aea.crypto.cosmos import CosmosApi
-from aea.crypto.ethereum import EthereumApi
-from aea.crypto.fetchai import FetchAIApi
-from aea.crypto.registries import make_ledger_api
+from aea.crypto.registries import ledger_apis_registry, make_ledger_api
 from aea.mail.base import Address
 
-SUPPORTED_LEDGER_APIS = {
-    CosmosApi.identifier: CosmosApi,
-    EthereumApi.identifier: EthereumApi,
-    FetchAIApi.identifier: FetchAIApi,
-}  # type: Dict[str, Type[LedgerApi]]
-
 logger = logging.getLogger(__name__)
 
 
@@ -179,9 +170,9 @@ class LedgerApis:
         :return: True if correctly settled, False otherwise
         """
         assert (
-            identifier in SUPPORTED_LEDGER_APIS.keys()
+            identifier in ledger_apis_registry.supported_ids
         ), "Not a registered ledger api identifier."
-        api_class = SUPPORTED_LEDGER_APIS[identifier]
+        api_class = ledger_apis_registry.get_class(identifier)
         is_settled = api_class.is_transaction_settled(tx_receipt)
         return is_settled
 
@@ -206,9 +197,9 @@ class LedgerApis:
         :return: True if is valid , False otherwise
         """
         assert (
-            identifier in SUPPORTED_LEDGER_APIS.keys()
+            identifier in ledger_apis_registry.supported_ids
         ), "Not a registered ledger api identifier."
-        api_class = SUPPORTED_LEDGER_APIS[identifier]
+        api_class = ledger_apis_registry.get_class(identifier)
         is_valid = api_class.is_transaction_valid(tx, seller, client, tx_nonce, amount)
         return is_valid
 
@@ -223,8 +214,8 @@ class LedgerApis:
         :return: return the hash in hex.
         """
         assert (
-            identifier in SUPPORTED_LEDGER_APIS.keys()
+            identifier in ledger_apis_registry.supported_ids
         ), "Not a registered ledger api identifier."
-        api_class = SUPPORTED_LEDGER_APIS[identifier]
+        api_class = ledger_apis_registry.get_class(identifier)
         tx_nonce = api_class.generate_tx_nonce(seller=seller, client=client)
         return tx_nonce
@@ -17,10 +17,10 @@
 #
 # ------------------------------------------------------------------------------
 
-"""This module contains the crypto and the ledger APIs registries."""
+"""This module contains the crypto, the ledger APIs and the faucet APIs registries."""
 from typing import Callable
 
-from aea.crypto.base import Crypto, LedgerApi
+from aea.crypto.base import Crypto, FaucetApi, LedgerApi
 from aea.crypto.registries.base import Registry
 
 crypto_registry: Registry[Crypto] = Registry[Crypto]()
@@ -30,3 +30,7 @@ make_crypto: Callable[..., Crypto] = crypto_registry.make
 ledger_apis_registry: Registry[LedgerApi] = Registry[LedgerApi]()
 register_ledger_api = ledger_apis_registry.register
 make_ledger_api: Callable[..., LedgerApi] = ledger_apis_registry.make
+
+faucet_apis_registry: Registry[FaucetApi] = Registry[FaucetApi]()
+register_faucet_api = faucet_apis_registry.register
+make_faucet_api: Callable[..., FaucetApi] = faucet_apis_registry.make
@@ -201,6 +201,21 @@ class Registry(Generic[ItemType]):
         item = spec.make(**kwargs)
         return item
 
+    def get_class(
+        self, id_: Union[ItemId, str], module: Optional[str] = None
+    ) -> Type[ItemType]:
+        """
+        Get the class associated with an item id, importing its module if needed.
+
+        :param id_: the id of the item class. Make sure it has been registered earlier
+            before calling this function.
+        :param module: dotted path to a module to load before looking up the item id (see 'make').
+        :return: the item class.
+        """
+        item_id = ItemId(id_)
+        spec = self._get_spec(item_id, module=module)
+        return spec.entry_point.load()
+
     def has_spec(self, item_id: ItemId) -> bool:
         """
         Check whether there exist a spec associated with an item id.
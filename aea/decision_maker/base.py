@@ -231,6 +231,33 @@ class ProtectedQueue(Queue):
         )  # type: Optional[Message]
         return internal_message
 
+    def protected_get_batch(
+        self, access_code: str, max_size: int, block=True, timeout=None
+    ) -> List[Optional[Message]]:
+        """
+        Access protected get method, for the internal messages already on the queue.
+
+        Waits for the first internal message as the get method does, then takes
+        the following ones, if any, without waiting.
+
+        :param access_code: the access code
+        :param max_size: the maximum number of internal messages to get
+        :param block: If optional args block is true and timeout is None (the default), block if necessary until an item is available.
+        :param timeout: If timeout is a positive number, it blocks at most timeout seconds and raises the Empty exception if no item was available within that time.
+        :raises: ValueError, if caller is not permitted
+        :return: the internal messages, in order
+        """
+        if self._access_code_hash != _hash(access_code):
+            raise ValueError("Wrong code, access not permitted!")
+        internal_messages = [
+            super().get(block=block, timeout=timeout)
+        ]  # type: List[Optional[Message]]
+        with self.not_empty:
+            while len(internal_messages) < max_size and self._qsize() > 0:
+                internal_messages.append(self._get())
+            self.not_full.notify(len(internal_messages) - 1)
+        return internal_messages
+
 
 class DecisionMakerHandler(ABC):
     """This class implements the decision maker."""
@@ -282,19 +309,38 @@ class DecisionMakerHandler(ABC):
         :return: None
         """
 
+    def handle_batch(self, messages: List[Message]) -> None:
+        """
+        Handle a batch of internal messages from the skills, in order.
+
+        By default, the messages are handled one at a time.
+
+        :param messages: the internal messages
+        :return: None
+        """
+        for message in messages:
+            self.handle(message)
+
 
 class DecisionMaker:
     """This class implements the decision maker."""
 
+    DEFAULT_MAX_BATCH_SIZE = 100
+
     def __init__(
-        self, decision_maker_handler: DecisionMakerHandler,
+        self,
+        decision_maker_handler: DecisionMakerHandler,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
     ):
         """
         Initialize the decision maker.
 
         :param agent_name: the agent name
         :param decision_maker_handler: the decision maker handler
+        :param max_batch_size: the maximum number of internal messages taken from the in queue and handled at once.
         """
+        assert max_batch_size > 0, "The maximum batch size must be positive."
+        self._max_batch_size = max_batch_size
         self._agent_name = decision_maker_handler.identity.name
         self._queue_access_code = uuid.uuid4().hex
         self._message_in_queue = ProtectedQueue(
@@ -350,24 +396,27 @@ class DecisionMaker:
 
         Performs the following while not stopped:
 
-        - gets internal messages from the in queue and calls handle() on them
+        - gets the internal messages on the in queue, waiting for at least one,
+          and calls handle_batch() on them
 
         :return: None
         """
         while not self._stopped:
-            message = self.message_in_queue.protected_get(
-                self._queue_access_code, block=True
-            )  # type: Optional[Message]
-
-            if message is None:
-                logger.debug(
-                    "[{}]: Received empty message. Quitting the processing loop...".format(
-                        self._agent_name
+            messages = []  # type: List[Message]
+            for message in self.message_in_queue.protected_get_batch(
+                self._queue_access_code, self._max_batch_size, block=True
+            ):
+                if message is None:
+                    logger.debug(
+                        "[{}]: Received empty message. Quitting the processing loop...".format(
+                            self._agent_name
+                        )
                     )
-                )
-                continue
+                    continue
+                messages.append(message)
 
-            self.handle(message)
+            if messages:
+                self.handle_batch(messages)
 
     def handle(self, message: Message) -> None:
         """
@@ -379,3 +428,15 @@ class DecisionMaker:
         message.counterparty = uuid4().hex  # TODO: temporary fix only
         message.is_incoming = True
         self.decision_maker_handler.handle(message)
+
+    def handle_batch(self, messages: List[Message]) -> None:
+        """
+        Handle a batch of internal messages from the skills, in order.
+
+        :param messages: the internal messages
+        :return: None
+        """
+        for message in messages:
+            message.counterparty = uuid4().hex  # TODO: temporary fix only
+            message.is_incoming = True
+        self.decision_maker_handler.handle_batch(messages)
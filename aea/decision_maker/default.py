@@ -33,6 +33,7 @@ from aea.helpers.dialogue.base import DialogueLabel as BaseDialogueLabel
 from aea.helpers.preference_representations.base import (
     linear_utility,
     logarithmic_utility,
+    marginal_logarithmic_utilities,
 )
 from aea.helpers.transaction.base import SignedMessage, SignedTransaction, Terms
 from aea.identity.base import Identity
@@ -500,6 +501,28 @@ class Preferences(BasePreferences):
         )
         return marginal_utility
 
+    def marginal_utilities_by_good_id(
+        self, ownership_state: BaseOwnershipState, delta_quantity: int
+    ) -> Dict[str, float]:
+        """
+        Compute the marginal utility of changing the quantity of each good on its own.
+
+        This is equivalent to calling 'marginal_utility' with a change of
+        'delta_quantity' of each good in turn, but computed in one pass.
+
+        :param ownership_state: the ownership state against which to compute the marginal utilities.
+        :param delta_quantity: the change in the quantity of each good
+        :return: the marginal utility by good id
+        """
+        assert self.is_initialized, "Preferences params not set!"
+        ownership_state = cast(OwnershipState, ownership_state)
+        return marginal_logarithmic_utilities(
+            self.utility_params_by_good_id,
+            ownership_state.quantities_by_good_id,
+            delta_quantity,
+            self._quantity_shift,
+        )
+
     def utility_diff_from_transaction(
         self, ownership_state: BaseOwnershipState, terms: Terms
     ) -> float:
@@ -585,7 +608,9 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
         :return: None
         """
         if isinstance(message, SigningMessage):
-            self._handle_signing_message(message)
+            response = self._handle_signing_message(message)
+            if response is not None:
+                self.message_out_queue.put(response)
         elif isinstance(message, StateUpdateMessage):
             self._handle_state_update_message(message)
         else:  # pragma: no cover
@@ -595,12 +620,35 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
                 )
             )
 
-    def _handle_signing_message(self, signing_msg: SigningMessage) -> None:
+    def handle_batch(self, messages: List[Message]) -> None:
+        """
+        Handle a batch of internal messages from the skills, in order.
+
+        The responses to consecutive signing messages are put on the out queue together.
+
+        :param messages: the internal messages
+        :return: None
+        """
+        responses = []  # type: List[Message]
+        for message in messages:
+            if isinstance(message, SigningMessage):
+                response = self._handle_signing_message(message)
+                if response is not None:
+                    responses.append(response)
+            else:
+                self.message_out_queue.put_many(responses)
+                responses = []
+                self.handle(message)
+        self.message_out_queue.put_many(responses)
+
+    def _handle_signing_message(
+        self, signing_msg: SigningMessage
+    ) -> Optional[SigningMessage]:
         """
         Handle a signing message.
 
         :param signing_msg: the transaction message
-        :return: None
+        :return: the response, if any
         """
         if not self.context.goal_pursuit_readiness.is_ready:
             logger.debug(
@@ -618,29 +666,27 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
                     self.agent_name
                 )
             )
-            return
+            return None
 
         # check if the transaction is acceptable and process it accordingly
         if signing_msg.performative == SigningMessage.Performative.SIGN_MESSAGE:
-            self._handle_message_signing(signing_msg, signing_dialogue)
-        elif signing_msg.performative == SigningMessage.Performative.SIGN_TRANSACTION:
-            self._handle_transaction_signing(signing_msg, signing_dialogue)
-        else:  # pragma: no cover
-            logger.error(
-                "[{}]: Unexpected transaction message performative".format(
-                    self.agent_name
-                )
-            )
+            return self._handle_message_signing(signing_msg, signing_dialogue)
+        if signing_msg.performative == SigningMessage.Performative.SIGN_TRANSACTION:
+            return self._handle_transaction_signing(signing_msg, signing_dialogue)
+        logger.error(  # pragma: no cover
+            "[{}]: Unexpected transaction message performative".format(self.agent_name)
+        )
+        return None  # pragma: no cover
 
     def _handle_message_signing(
         self, signing_msg: SigningMessage, signing_dialogue: SigningDialogue
-    ) -> None:
+    ) -> SigningMessage:
         """
         Handle a message for signing.
 
         :param signing_msg: the signing message
         :param signing_dialogue: the signing dialogue
-        :return: None
+        :return: the response
         """
         signing_msg_response = SigningMessage(
             performative=SigningMessage.Performative.ERROR,
@@ -673,17 +719,17 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
                 )
         signing_msg_response.counterparty = signing_msg.counterparty
         signing_dialogue.update(signing_msg_response)
-        self.message_out_queue.put(signing_msg_response)
+        return signing_msg_response
 
     def _handle_transaction_signing(
         self, signing_msg: SigningMessage, signing_dialogue: SigningDialogue
-    ) -> None:
+    ) -> SigningMessage:
         """
         Handle a transaction for signing.
 
         :param signing_msg: the signing message
         :param signing_dialogue: the signing dialogue
-        :return: None
+        :return: the response
         """
         signing_msg_response = SigningMessage(
             performative=SigningMessage.Performative.ERROR,
@@ -712,7 +758,7 @@ class DecisionMakerHandler(BaseDecisionMakerHandler):
                 )
         signing_msg_response.counterparty = signing_msg.counterparty
         signing_dialogue.update(signing_msg_response)
-        self.message_out_queue.put(signing_msg_response)
+        return signing_msg_response
 
     def _is_acceptable_for_signing(self, signing_msg: SigningMessage) -> bool:
         """
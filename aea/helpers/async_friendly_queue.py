@@ -20,16 +20,33 @@
 import asyncio
 import queue
 from collections import deque
-from typing import Any
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+
+def _set_result_if_not_done(waiter: asyncio.Future) -> None:
+    """Wake up a waiter, unless it has been cancelled in the meantime."""
+    if not waiter.done():
+        waiter.set_result(True)
 
 
 class AsyncFriendlyQueue(queue.Queue):
-    """queue.Queue with async_get method."""
+    """queue.Queue with async_get and async_wait_drained methods."""
 
     def __init__(self, *args, **kwargs):
         """Init queue."""
         super().__init__(*args, **kwargs)
         self._non_empty_waiters = deque()
+        self._drained_waiters = []  # type: List[Tuple[int, asyncio.Future]]
 
     def put(  # pylint: disable=signature-differs
         self, item: Any, *args, **kwargs
@@ -47,13 +64,78 @@ class AsyncFriendlyQueue(queue.Queue):
                 waiter.set_result, True
             )
 
+    def put_many(self, items: Sequence[Any]) -> None:
+        """
+        Put several items into the queue at once.
+
+        The queue is locked, and its waiters woken up, once for all the items.
+        Bounded queues put the items one at a time, as they may have to wait for free slots.
+
+        :param items: the items to put in the queue, in order
+        :return: None
+        """
+        if not items:
+            return
+        if self.maxsize > 0:
+            for item in items:
+                self.put(item)
+            return
+        with self.not_full:
+            for item in items:
+                self._put(item)
+            self.unfinished_tasks += len(items)
+            self.not_empty.notify(len(items))
+        for _ in range(min(len(items), len(self._non_empty_waiters))):
+            waiter = self._non_empty_waiters.popleft()
+            waiter._loop.call_soon_threadsafe(  # pylint: disable=protected-access
+                _set_result_if_not_done, waiter
+            )
+
     def get(self, *args, **kwargs) -> Any:  # pylint: disable=signature-differs
         """
         Get an item into the queue.
 
         :param args, kwargs: similar to queue.Queue.get
         """
-        return super().get(*args, **kwargs)
+        item = super().get(*args, **kwargs)
+        if self._drained_waiters:
+            self._notify_drained_waiters()
+        return item
+
+    def _notify_drained_waiters(self) -> None:
+        """Wake up the waiters of a queue size the queue has been drained to."""
+        with self.mutex:
+            size = self._qsize()
+            ready = [waiter for limit, waiter in self._drained_waiters if size <= limit]
+            self._drained_waiters = [
+                (limit, waiter)
+                for limit, waiter in self._drained_waiters
+                if size > limit
+            ]
+        for waiter in ready:
+            waiter._loop.call_soon_threadsafe(  # pylint: disable=protected-access
+                _set_result_if_not_done, waiter
+            )
+
+    async def async_wait_drained(self, size: int = 0) -> None:
+        """
+        Wait until the queue holds at most a given number of items.
+
+        :param size: the number of items.
+        :return: None
+        """
+        with self.mutex:
+            if self._qsize() <= size:
+                return
+            waiter = asyncio.Future()  # type: asyncio.Future
+            self._drained_waiters.append((size, waiter))
+        try:
+            await waiter
+        finally:
+            with self.mutex:
+                self._drained_waiters = [
+                    (limit, w) for limit, w in self._drained_waiters if w is not waiter
+                ]
 
     async def async_wait(self) -> None:
         """
@@ -85,3 +167,88 @@ class AsyncFriendlyQueue(queue.Queue):
                 return self.get_nowait()
             except queue.Empty:
                 pass
+
+
+class WeightedFairQueue(AsyncFriendlyQueue):
+    """
+    AsyncFriendlyQueue made of lanes, dequeued in weighted fair order.
+
+    Every item goes to the lane given by the lane function, or to the default lane.
+    Items of the same lane are dequeued in FIFO order. When several lanes are
+    not empty, they are served by smooth weighted round-robin: a lane with weight w
+    gets w / (sum of the weights of the non-empty lanes) of the dequeues,
+    so no lane starves.
+    """
+
+    def __init__(
+        self,
+        weights: Dict[str, int],
+        get_lane: Callable[[Any], Optional[str]],
+        default_lane: str,
+        maxsize: int = 0,
+    ):
+        """
+        Init queue.
+
+        :param weights: the weight of each lane.
+        :param get_lane: the function returning the lane of an item. If None or unknown, the item goes to the default lane.
+        :param default_lane: the default lane, one of the weighted lanes.
+        :param maxsize: the maximum size of the queue, as for queue.Queue.
+        """
+        assert default_lane in weights, "Default lane must have a weight."
+        assert all(
+            weight > 0 for weight in weights.values()
+        ), "Weights must be positive."
+        self._weights = dict(weights)
+        self._get_lane = get_lane
+        self._default_lane = default_lane
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        """Initialize the lanes (called by queue.Queue)."""
+        self._lanes = {
+            lane: deque() for lane in self._weights
+        }  # type: Dict[str, Deque[Any]]
+        self._current_weights = {lane: 0 for lane in self._weights}
+        self._size = 0
+
+    def _qsize(self) -> int:
+        """Get the number of items (called by queue.Queue)."""
+        return self._size
+
+    def _put(self, item: Any) -> None:
+        """Put an item in its lane (called by queue.Queue)."""
+        lane = self._get_lane(item)
+        if lane not in self._lanes:
+            lane = self._default_lane
+        self._lanes[cast(str, lane)].append(item)
+        self._size += 1
+
+    def _get(self) -> Any:
+        """Get an item from the next lane to serve (called by queue.Queue)."""
+        total_weight = 0
+        selected = None  # type: Optional[str]
+        for lane, items in self._lanes.items():
+            if not items:
+                continue
+            weight = self._weights[lane]
+            self._current_weights[lane] += weight
+            total_weight += weight
+            if (
+                selected is None
+                or self._current_weights[lane] > self._current_weights[selected]
+            ):
+                selected = lane
+        selected = cast(str, selected)
+        self._current_weights[selected] -= total_weight
+        items = self._lanes[selected]
+        item = items.popleft()
+        if not items:
+            self._current_weights[selected] = 0
+        self._size -= 1
+        return item
+
+    def lane_sizes(self) -> Dict[str, int]:
+        """Get the number of items in each lane."""
+        with self.mutex:
+            return {lane: len(items) for lane, items in self._lanes.items()}
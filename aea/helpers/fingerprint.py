@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains the fingerprint engine of the packages.
+
+The engine hashes the files of one or more packages, the large ones in a thread pool,
+and keeps a persistent cache of the file hashes keyed by (path, size, mtime_ns),
+so that unchanged files are not read again.
+"""
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Collection, Dict, List, Optional, Sequence, Set, Tuple
+
+from aea.helpers.ipfs.base import IPFSHashOnly
+
+FINGERPRINT_CACHE_ENV = "AEA_FINGERPRINT_CACHE"
+DEFAULT_FINGERPRINT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".aea", "fingerprint_cache.json"
+)
+FINGERPRINT_CACHE_FORMAT_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+FileKey = Tuple[str, int, int]
+PackageSpec = Tuple[Path, Optional[Collection[str]]]
+
+
+class FileHashCache:
+    """
+    Persistent cache of file hashes.
+
+    An entry is valid as long as the file has the same size and modification time.
+    The cache is loaded on first use and written with 'save', only if it changed.
+    """
+
+    MAX_ENTRIES = 100000
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        :param path: the path of the cache file. If None, the cache is kept in memory.
+        """
+        self._path = path
+        self._entries = None  # type: Optional[Dict[str, Tuple[int, int, str]]]
+        self._used = set()  # type: Set[str]
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Optional[str]:
+        """Get the path of the cache file."""
+        return self._path
+
+    def _load(self) -> Dict[str, Tuple[int, int, str]]:
+        """Load the entries from the cache file, if not done yet."""
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if self._path is None or not os.path.exists(self._path):
+            return self._entries
+        try:
+            with open(self._path, "r", encoding="utf-8") as fp:
+                obj = json.load(fp)
+            if obj.get("format_version") == FINGERPRINT_CACHE_FORMAT_VERSION:
+                self._entries = {
+                    path: (entry[0], entry[1], entry[2])
+                    for path, entry in obj["entries"].items()
+                }
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            logger.debug("Cannot read the fingerprint cache at {}.".format(self._path))
+        return self._entries
+
+    def get(self, key: FileKey) -> Optional[str]:
+        """
+        Get the hash of a file.
+
+        :param key: the absolute path, the size and the modification time of the file.
+        :return: the hash, or None if not cached or stale.
+        """
+        path, size, mtime_ns = key
+        with self._lock:
+            entry = self._load().get(path)
+            if entry is None or entry[0] != size or entry[1] != mtime_ns:
+                return None
+            self._used.add(path)
+            return entry[2]
+
+    def set(self, key: FileKey, file_hash: str) -> None:
+        """
+        Set the hash of a file.
+
+        :param key: the absolute path, the size and the modification time of the file.
+        :param file_hash: the hash.
+        :return: None
+        """
+        path, size, mtime_ns = key
+        with self._lock:
+            self._load()[path] = (size, mtime_ns, file_hash)
+            self._used.add(path)
+            self._dirty = True
+
+    def save(self) -> None:
+        """
+        Write the cache file, if the cache changed.
+
+        If the cache is too large, only the entries used by this process are kept.
+
+        :return: None
+        """
+        with self._lock:
+            if self._path is None or not self._dirty or self._entries is None:
+                return
+            entries = self._entries
+            if len(entries) > self.MAX_ENTRIES:
+                entries = {path: entries[path] for path in self._used}
+                self._entries = entries
+            obj = {
+                "format_version": FINGERPRINT_CACHE_FORMAT_VERSION,
+                "entries": {path: list(entry) for path, entry in entries.items()},
+            }
+            tmp_path = "{}.{}.tmp".format(self._path, os.getpid())
+            try:
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as fp:
+                    json.dump(obj, fp, separators=(",", ":"))
+                os.replace(tmp_path, self._path)
+                self._dirty = False
+            except OSError:
+                logger.debug(
+                    "Cannot write the fingerprint cache at {}.".format(self._path)
+                )
+
+
+class FingerprintEngine:
+    """Compute the fingerprints of packages, hashing the large files concurrently."""
+
+    PARALLEL_MIN_SIZE = 64 * 1024
+
+    def __init__(
+        self, max_workers: Optional[int] = None, cache: Optional[FileHashCache] = None
+    ):
+        """
+        Initialize the engine.
+
+        :param max_workers: the number of hashing threads. If None, it depends on the number of CPUs.
+        :param cache: the file hash cache. If None, nothing is cached.
+        """
+        self._max_workers = (
+            max_workers
+            if max_workers is not None
+            else min(32, (os.cpu_count() or 1) + 4)
+        )
+        self._cache = cache
+        self._hasher = IPFSHashOnly()
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._executor_lock = threading.Lock()
+
+    @property
+    def cache(self) -> Optional[FileHashCache]:
+        """Get the file hash cache."""
+        return self._cache
+
+    @staticmethod
+    def list_files(
+        package_directory: Path, ignore_patterns: Optional[Collection[str]] = None
+    ) -> List[Path]:
+        """
+        List the files of a package that are fingerprinted.
+
+        :param package_directory: the package directory.
+        :param ignore_patterns: filename patterns whose matches will be ignored (Python files are never ignored).
+        :return: the list of files.
+        """
+        patterns = ignore_patterns if ignore_patterns is not None else []
+        return [
+            x
+            for x in package_directory.glob("**/*")
+            if x.is_file()
+            and (x.match("*.py") or not any(x.match(pattern) for pattern in patterns))
+        ]
+
+    def compute(
+        self, package_directory: Path, ignore_patterns: Optional[Collection[str]] = None
+    ) -> Dict[str, str]:
+        """
+        Compute the fingerprint of a package.
+
+        :param package_directory: the package directory.
+        :param ignore_patterns: filename patterns whose matches will be ignored.
+        :return: mapping from the relative POSIX path of each file to its IPFS hash.
+        """
+        return self.compute_many([(package_directory, ignore_patterns)])[0]
+
+    def compute_many(self, packages: Sequence[PackageSpec]) -> List[Dict[str, str]]:
+        """
+        Compute the fingerprints of several packages at once.
+
+        The files of all the packages are hashed in the same batch.
+
+        :param packages: list of pairs (package directory, ignore patterns).
+        :return: the fingerprints, in the same order of the packages.
+        """
+        files_by_package = [
+            self.list_files(package_directory, ignore_patterns)
+            for package_directory, ignore_patterns in packages
+        ]
+        all_files = [file for files in files_by_package for file in files]
+        hashes = self._hash_files(all_files)
+
+        results = []  # type: List[Dict[str, str]]
+        for (package_directory, _), files in zip(packages, files_by_package):
+            fingerprints = {}  # type: Dict[str, str]
+            for file in files:
+                key = file.relative_to(package_directory).as_posix()
+                assert key not in fingerprints, "Key in fingerprints!"  # nosec
+                fingerprints[key] = hashes[file]
+            results.append(fingerprints)
+        return results
+
+    def _hash_files(self, files: List[Path]) -> Dict[Path, str]:
+        """
+        Hash files, using the cache when possible.
+
+        :param files: the files.
+        :return: mapping from file to hash.
+        """
+        hashes = {}  # type: Dict[Path, str]
+        misses = []  # type: List[Tuple[Path, Optional[FileKey]]]
+        for file in files:
+            key = self._get_key(file) if self._cache is not None else None
+            file_hash = self._cache.get(key) if key is not None else None  # type: ignore
+            if file_hash is None:
+                misses.append((file, key))
+            else:
+                hashes[file] = file_hash
+
+        # hashing of small files is dominated by GIL-bound work: only large files
+        # are worth dispatching to the thread pool.
+        large = []  # type: List[Tuple[Path, Optional[FileKey]]]
+        small = []  # type: List[Tuple[Path, Optional[FileKey]]]
+        for miss in misses:
+            if self._get_size(miss) >= self.PARALLEL_MIN_SIZE:
+                large.append(miss)
+            else:
+                small.append(miss)
+        futures = []
+        if len(large) > 1 and self._max_workers > 1:
+            executor = self._get_executor()
+            futures = [
+                (miss, executor.submit(self._hasher.get, str(miss[0])))
+                for miss in large
+            ]
+        else:
+            small = large + small
+
+        computed = [(miss, self._hasher.get(str(miss[0]))) for miss in small]
+        computed.extend((miss, future.result()) for miss, future in futures)
+
+        for (file, key), file_hash in computed:
+            hashes[file] = file_hash
+            if key is not None:
+                self._cache.set(key, file_hash)  # type: ignore
+        if misses and self._cache is not None:
+            self._cache.save()
+        return hashes
+
+    @staticmethod
+    def _get_key(file: Path) -> Optional[FileKey]:
+        """Get the cache key of a file."""
+        try:
+            stat = os.stat(str(file))
+        except OSError:
+            return None
+        return os.path.abspath(str(file)), stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _get_size(miss: Tuple[Path, Optional[FileKey]]) -> int:
+        """Get the size of a file to hash, from its cache key if available."""
+        file, key = miss
+        if key is not None:
+            return key[1]
+        try:
+            return os.stat(str(file)).st_size
+        except OSError:
+            return 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="fingerprint",
+                )
+            return self._executor
+
+
+_default_engine = None  # type: Optional[FingerprintEngine]
+_default_engine_lock = threading.Lock()
+
+
+def get_default_engine() -> FingerprintEngine:
+    """
+    Get the fingerprint engine shared by the framework.
+
+    The file hash cache is stored at the path in the environment variable
+    'AEA_FINGERPRINT_CACHE' (an empty value disables the persistence),
+    or in the '.aea' directory of the user home.
+
+    :return: the fingerprint engine.
+    """
+    global _default_engine  # pylint: disable=global-statement
+    with _default_engine_lock:
+        if _default_engine is None:
+            cache_path = os.environ.get(
+                FINGERPRINT_CACHE_ENV, DEFAULT_FINGERPRINT_CACHE_PATH
+            )
+            _default_engine = FingerprintEngine(
+                cache=FileHashCache(cache_path if cache_path != "" else None)
+            )
+        return _default_engine
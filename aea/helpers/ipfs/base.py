@@ -21,7 +21,8 @@
 
 import codecs
 import hashlib
-import re
+import os
+from typing import Iterable, Iterator
 
 import base58
 
@@ -40,23 +41,111 @@ def _dos2unix(file_content: bytes) -> bytes:
     :param file_content: teh content of the file.
     :return the same content but with the line terminator
     """
-    return re.sub(b"\r$", b"", file_content, flags=re.M)
+    # equivalent to re.sub(b"\r$", b"", file_content, flags=re.M), but faster
+    content = file_content.replace(b"\r\n", b"\n")
+    return content[:-1] if content.endswith(b"\r") else content
+
+
+def _encode_varint(value: int) -> bytes:
+    """
+    Encode an unsigned integer as a protobuf varint.
+
+    :param value: the integer.
+    :return: the encoded integer.
+    """
+    result = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+        else:
+            result.append(byte)
+            return bytes(result)
+
+
+def _iter_dos2unix_chunks(file_path: str, chunk_size: int) -> Iterator[bytes]:
+    """
+    Read a file in chunks, replacing the CR/LF line terminators with LF.
+
+    This is the streaming version of '_dos2unix': a CR is dropped
+    if it is followed by a LF or if it is the last byte of the file.
+
+    :param file_path: the file path.
+    :param chunk_size: the size of the chunks to read.
+    :return: iterator over the converted chunks.
+    """
+    pending = b""
+    with open(file_path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            data = pending + chunk
+            pending = b""
+            if data.endswith(b"\r"):
+                # it depends on the next byte, keep it for the next chunk
+                data, pending = data[:-1], data[-1:]
+            yield data.replace(b"\r\n", b"\n")
+    # a CR at the end of the file is dropped, as in '_dos2unix'
 
 
 class IPFSHashOnly:
     """A helper class which allows construction of an IPFS hash without interacting with an IPFS daemon."""
 
+    # files larger than this are hashed in chunks, without reading them in memory.
+    STREAMING_THRESHOLD = 1024 * 1024
+    CHUNK_SIZE = 1024 * 1024
+
     def get(self, file_path: str) -> str:
         """
         Get the IPFS hash for a single file.
 
+        Files larger than STREAMING_THRESHOLD are read in chunks, twice: once
+        to compute the size of the content after the line terminator conversion,
+        and once to hash it.
+
         :param file_path: the file path
         """
-        with open(file_path, "rb") as file:
-            file_b = _dos2unix(file.read())
-        file_pb = self._pb_serialize_file(file_b)
-        ipfs_hash = self._generate_multihash(file_pb)
-        return ipfs_hash
+        if os.path.getsize(file_path) > self.STREAMING_THRESHOLD:
+            size = sum(
+                len(chunk)
+                for chunk in _iter_dos2unix_chunks(file_path, self.CHUNK_SIZE)
+            )
+            chunks = _iter_dos2unix_chunks(
+                file_path, self.CHUNK_SIZE
+            )  # type: Iterable[bytes]
+        else:
+            with open(file_path, "rb") as file:
+                file_b = _dos2unix(file.read())
+            size, chunks = len(file_b), (file_b,)
+        return self._hash_file_node(chunks, size)
+
+    @classmethod
+    def _hash_file_node(cls, chunks: Iterable[bytes], size: int) -> str:
+        """
+        Hash the file node of a file content, without building it in memory.
+
+        The result is the same as '_generate_multihash(_pb_serialize_file(content))',
+        as the protobuf serialization of the node is made of a header,
+        the content and a trailer.
+
+        :param chunks: the chunks of the file content.
+        :param size: the size of the file content.
+        :return: the IPFS hash
+        """
+        # unixfs.Data{Type: File, Data: <content>, filesize: <size>}
+        data_header = b"\x08\x02" + b"\x12" + _encode_varint(size)
+        data_trailer = b"\x18" + _encode_varint(size)
+        data_length = len(data_header) + size + len(data_trailer)
+        # merkledag.PBNode{Data: <unixfs.Data>}
+        node_header = b"\x0a" + _encode_varint(data_length)
+
+        sha256 = hashlib.sha256(node_header + data_header)
+        for chunk in chunks:
+            sha256.update(chunk)
+        sha256.update(data_trailer)
+        return cls._encode_multihash(sha256.hexdigest())
 
     @staticmethod
     def _pb_serialize_file(data: bytes) -> bytes:
@@ -89,6 +178,16 @@ class IPFSHashOnly:
         :return: string representing the hash
         """
         sha256_hash = hashlib.sha256(pb_data).hexdigest()
+        return IPFSHashOnly._encode_multihash(sha256_hash)
+
+    @staticmethod
+    def _encode_multihash(sha256_hash: str) -> str:
+        """
+        Encode a SHA-256 digest as an IPFS multihash.
+
+        :param sha256_hash: the hex digest.
+        :return: string representing the hash
+        """
         multihash_hex = SHA256_ID + LEN_SHA256 + sha256_hash
         multihash_bytes = codecs.decode(str.encode(multihash_hex), "hex")
         ipfs_hash = base58.b58encode(multihash_bytes)
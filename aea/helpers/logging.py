@@ -18,12 +18,52 @@
 # ------------------------------------------------------------------------------
 """Logging helpers."""
 import logging
+from collections.abc import Mapping
 from logging import Logger, LoggerAdapter
 from typing import Any, MutableMapping, Optional, Tuple, Union
 
 
+class AgentLogMessage:
+    """
+    The message of a log record of an agent.
+
+    It keeps the agent name, the message and its arguments separate,
+    and renders them only when the record is formatted by a handler.
+    """
+
+    __slots__ = ("agent_name", "msg", "args")
+
+    def __init__(self, agent_name: str, msg: Any, args: Tuple[Any, ...] = ()):
+        """
+        Initialize the log message.
+
+        :param agent_name: the agent name.
+        :param msg: the message, possibly with %-style placeholders.
+        :param args: the arguments of the message.
+        """
+        self.agent_name = agent_name
+        self.msg = msg
+        # as in logging.LogRecord, a single non-empty mapping is used for named placeholders.
+        self.args = args  # type: Union[Tuple[Any, ...], Mapping]
+        if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            self.args = args[0]
+
+    def __str__(self) -> str:
+        """Render the message, prepending the agent name."""
+        msg = str(self.msg)
+        if self.args:
+            msg = msg % self.args
+        return f"[{self.agent_name}] {msg}"
+
+
 class AgentLoggerAdapter(LoggerAdapter):
-    """This class is a logger adapter that prepends the agent name to log messages."""
+    """
+    This class is a logger adapter that prepends the agent name to log messages.
+
+    Messages and arguments are wrapped in an AgentLogMessage: nothing is formatted
+    unless the level is enabled and the record is emitted. The agent name is also
+    available to formatters and filters as the 'agent_name' attribute of the record.
+    """
 
     def __init__(self, logger: Logger, agent_name: str):
         """
@@ -33,11 +73,22 @@ class AgentLoggerAdapter(LoggerAdapter):
         """
         super().__init__(logger, dict(agent_name=agent_name))
 
+    def log(self, level: int, msg: Any, *args: Any, **kwargs: Any) -> None:
+        """Log a message with the agent name, if the level is enabled."""
+        if self.isEnabledFor(level):
+            msg, processed_kwargs = self.process(
+                AgentLogMessage(self.extra["agent_name"], msg, args), kwargs
+            )
+            self.logger.log(level, msg, **processed_kwargs)
+
     def process(
         self, msg: Any, kwargs: MutableMapping[str, Any]
     ) -> Tuple[Any, MutableMapping[str, Any]]:
         """Prepend the agent name to every log message."""
-        return f"[{self.extra['agent_name']}] {msg}", kwargs
+        if not isinstance(msg, AgentLogMessage):
+            msg = AgentLogMessage(self.extra["agent_name"], msg)
+        kwargs["extra"] = dict(self.extra, **(kwargs.get("extra") or {}))
+        return msg, kwargs
 
 
 class WithLogger:
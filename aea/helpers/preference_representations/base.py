@@ -40,14 +40,53 @@ def logarithmic_utility(
         quantity_shift >= 0
     ), "The quantity_shift argument must be a non-negative integer."
     goodwise_utility = [
-        utility_params_by_good_id[good_id] * math.log(quantity + quantity_shift)
-        if quantity + quantity_shift > 0
-        else -10000
+        _goodwise_logarithmic_utility(
+            utility_params_by_good_id[good_id], quantity, quantity_shift
+        )
         for good_id, quantity in quantities_by_good_id.items()
     ]
     return sum(goodwise_utility)
 
 
+def _goodwise_logarithmic_utility(
+    utility_param: float, quantity: int, quantity_shift: int
+) -> float:
+    """Compute the term of the logarithmic utility of one good."""
+    if quantity + quantity_shift > 0:
+        return utility_param * math.log(quantity + quantity_shift)
+    return -10000
+
+
+def marginal_logarithmic_utilities(
+    utility_params_by_good_id: Dict[str, float],
+    quantities_by_good_id: Dict[str, int],
+    delta_quantity: int,
+    quantity_shift: int = 1,
+) -> Dict[str, float]:
+    """
+    Compute the marginal utility of changing the quantity of each good on its own, in one pass.
+
+    The logarithmic utility is a sum of terms of one good each, so changing the
+    quantity of one good only changes its own term.
+
+    :param utility_params_by_good_id: utility params by good identifier
+    :param quantities_by_good_id: quantities by good identifier
+    :param delta_quantity: the change in the quantity of each good
+    :param quantity_shift: a non-negative factor to shift the quantities in the utility function
+    :return: the marginal utility by good identifier
+    """
+    assert (
+        quantity_shift >= 0
+    ), "The quantity_shift argument must be a non-negative integer."
+    marginal_utilities = {}  # type: Dict[str, float]
+    for good_id, quantity in quantities_by_good_id.items():
+        utility_param = utility_params_by_good_id[good_id]
+        marginal_utilities[good_id] = _goodwise_logarithmic_utility(
+            utility_param, quantity + delta_quantity, quantity_shift
+        ) - _goodwise_logarithmic_utility(utility_param, quantity, quantity_shift)
+    return marginal_utilities
+
+
 def linear_utility(
     exchange_params_by_currency_id: Dict[str, float],
     balance_by_currency_id: Dict[str, int],
@@ -230,22 +230,15 @@ class Description:
             raise AttributeInconsistencyException("Missing required attribute.")
 
         # check that all values are defined in the data model
-        all_attributes = [attribute.name for attribute in self.data_model.attributes]
-        if not all(key in all_attributes for key in self.values.keys()):
+        attributes_by_name = self.data_model.attributes_by_name
+        if not all(key in attributes_by_name for key in self.values.keys()):
             raise AttributeInconsistencyException(
                 "Have extra attribute not in data model."
             )
 
         # check that each of the provided values are consistent with that specified in the data model
         for key, value in self.values.items():
-            attribute = next(
-                (
-                    attribute
-                    for attribute in self.data_model.attributes
-                    if attribute.name == key
-                ),
-                None,
-            )
+            attribute = attributes_by_name[key]
             if not isinstance(value, attribute.type):
                 # values does not match type in data model
                 raise AttributeInconsistencyException(
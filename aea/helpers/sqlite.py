@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a SQLite access layer with pooled connections."""
+
+import os
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Sequence, Tuple
+from urllib.request import pathname2url
+
+
+class SQLiteDatabase:
+    """
+    Access to a SQLite database file, with one connection per thread.
+
+    The connection of a thread is opened on first use and kept open, so that the
+    compiled statements are cached across queries. In WAL journal mode, readers
+    do not block the writer and a commit does not rewrite the database file.
+    """
+
+    DEFAULT_TIMEOUT = 300.0
+    CACHED_STATEMENTS = 128
+
+    def __init__(
+        self,
+        path: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        wal: bool = True,
+        read_only: bool = False,
+    ):
+        """
+        Initialize the database access.
+
+        :param path: the path of the database file, created if not present.
+        :param timeout: the time in seconds to wait for a lock held by another connection.
+        :param wal: whether to put the database in WAL journal mode.
+        :param read_only: whether to open the database file read-only. It must then exist, and its journal mode is left as is.
+        """
+        self._path = path
+        self._timeout = timeout
+        self._wal = wal and not read_only
+        self._read_only = read_only
+        self._local = threading.local()
+        self._connections = []  # type: List[sqlite3.Connection]
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        """Get the path of the database file."""
+        return self._path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the connection of the current thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if self._read_only:
+                database = "file:{}?mode=ro".format(
+                    pathname2url(os.path.abspath(self._path))
+                )
+            else:
+                database = self._path
+            connection = sqlite3.connect(
+                database,
+                timeout=self._timeout,
+                uri=self._read_only,
+                cached_statements=self.CACHED_STATEMENTS,
+                # the connection is only used by its thread, but it can be closed by any thread.
+                check_same_thread=False,
+            )
+            if self._wal:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                self._connections.append(connection)
+            self._local.connection = connection
+        return connection
+
+    def execute(self, command: str, variables: Sequence[Any] = ()) -> List[Tuple]:
+        """
+        Execute a statement in its own transaction.
+
+        :param command: the SQL statement.
+        :param variables: the values of the statement parameters.
+        :return: the rows of the result.
+        """
+        connection = self.connection
+        with connection:
+            return connection.execute(command, variables).fetchall()
+
+    def execute_many(self, command: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Execute a statement for each row of parameters, all in one transaction.
+
+        :param command: the SQL statement, e.g. an INSERT.
+        :param rows: the values of the statement parameters, for each execution.
+        :return: the number of modified rows.
+        """
+        connection = self.connection
+        with connection:
+            return connection.executemany(command, rows).rowcount
+
+    def close(self) -> None:
+        """
+        Close the connections of all the threads.
+
+        The database can still be used: new connections are opened on demand.
+
+        :return: None
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
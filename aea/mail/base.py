@@ -20,7 +20,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import List, Optional, Union
 from urllib.parse import urlparse
 
 from aea.configurations.base import ProtocolId, PublicId, SkillId
@@ -32,6 +32,8 @@ logger = logging.getLogger(__name__)
 
 Address = str
 
+DEFAULT_POOL_SIZE = 1024
+
 
 class AEAConnectionError(Exception):
     """Exception class for connection errors."""
@@ -234,7 +236,7 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
         if uri_raw != "":  # empty string means this field is not set in proto3
             uri = URI(uri_raw=uri_raw)
             context = EnvelopeContext(uri=uri)
-            envelope = Envelope(
+            envelope = Envelope.acquire(
                 to=to,
                 sender=sender,
                 protocol_id=protocol_id,
@@ -242,7 +244,7 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
                 context=context,
             )
         else:
-            envelope = Envelope(
+            envelope = Envelope.acquire(
                 to=to, sender=sender, protocol_id=protocol_id, message=message,
             )
 
@@ -252,10 +254,80 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
 DefaultEnvelopeSerializer = ProtobufEnvelopeSerializer
 
 
+class EnvelopePool:
+    """
+    A freelist of envelopes.
+
+    Pooling is opt-in: it is enabled by setting `Envelope.pool` to a pool.
+    The owner of an envelope releases it explicitly, with `Envelope.release`, when it is done with it;
+    the envelope is then given to the next envelope made with `Envelope.acquire`.
+    The agent releases the envelopes of its inbox once handled: the skills only receive their messages.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        """
+        Initialize the pool.
+
+        :param max_size: the maximum number of free envelopes kept.
+        """
+        self.max_size = max_size
+        self._free = []  # type: List[Envelope]
+
+    def acquire(
+        self,
+        to: Address,
+        sender: Address,
+        protocol_id: ProtocolId,
+        message: Union[Message, bytes],
+        context: Optional[EnvelopeContext] = None,
+    ) -> "Envelope":
+        """
+        Get an envelope, from the pool if there is one.
+
+        :param to: the address of the receiver.
+        :param sender: the address of the sender.
+        :param protocol_id: the protocol id.
+        :param message: the protocol-specific message.
+        :param context: the optional envelope context.
+        :return: the envelope
+        """
+        try:
+            envelope = self._free.pop()
+        except IndexError:
+            return Envelope(to, sender, protocol_id, message, context)
+        envelope._to = to  # pylint: disable=protected-access
+        envelope._sender = sender  # pylint: disable=protected-access
+        envelope._protocol_id = protocol_id  # pylint: disable=protected-access
+        envelope._message = message  # pylint: disable=protected-access
+        envelope._context = (  # pylint: disable=protected-access
+            context if context is not None else EnvelopeContext()
+        )
+        return envelope
+
+    def release(self, envelope: "Envelope") -> None:
+        """
+        Give an envelope back to the pool.
+
+        :param envelope: the envelope, which must not be used anymore.
+        :return: None
+        """
+        if len(self._free) < self.max_size:
+            # drop the references to the message and the context.
+            envelope._message = b""  # pylint: disable=protected-access
+            envelope._context = None  # type: ignore  # pylint: disable=protected-access
+            self._free.append(envelope)
+
+    def __len__(self) -> int:
+        """Get the number of free envelopes."""
+        return len(self._free)
+
+
 class Envelope:
     """The top level message class for agent to agent communication."""
 
     default_serializer = DefaultEnvelopeSerializer()
+    # the pool of envelopes, if pooling is enabled.
+    pool = None  # type: Optional[EnvelopePool]
 
     def __init__(
         self,
@@ -280,6 +352,40 @@ class Envelope:
         self._message = message
         self._context = context if context is not None else EnvelopeContext()
 
+    @classmethod
+    def acquire(
+        cls,
+        to: Address,
+        sender: Address,
+        protocol_id: ProtocolId,
+        message: Union[Message, bytes],
+        context: Optional[EnvelopeContext] = None,
+    ) -> "Envelope":
+        """
+        Make an envelope, from the pool if pooling is enabled.
+
+        :param to: the address of the receiver.
+        :param sender: the address of the sender.
+        :param protocol_id: the protocol id.
+        :param message: the protocol-specific message.
+        :param context: the optional envelope context.
+        :return: the envelope
+        """
+        if cls.pool is None:
+            return cls(to, sender, protocol_id, message, context)
+        return cls.pool.acquire(to, sender, protocol_id, message, context)
+
+    def release(self) -> None:
+        """
+        Give the envelope back to the pool, if pooling is enabled.
+
+        The envelope must not be used afterwards.
+
+        :return: None
+        """
+        if self.pool is not None:
+            self.pool.release(self)
+
     @property
     def to(self) -> Address:
         """Get address of receiver."""
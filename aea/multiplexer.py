@@ -22,11 +22,12 @@ import queue
 import threading
 from asyncio.events import AbstractEventLoop
 from concurrent.futures._base import CancelledError
+from enum import Enum
 from typing import Collection, Dict, List, Optional, Sequence, Tuple, cast
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStatus
-from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
+from aea.helpers.async_friendly_queue import AsyncFriendlyQueue, WeightedFairQueue
 from aea.helpers.async_utils import ThreadedAsyncRunner, cancel_and_wait
 from aea.helpers.logging import WithLogger
 from aea.mail.base import (
@@ -40,14 +41,64 @@ from aea.mail.base import (
 from aea.protocols.base import Message
 
 
+class OutBoxPolicy(Enum):
+    """The policies of the outbox when the out queue of the multiplexer is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+
+
+DEFAULT_PRIORITY_LANE = "default"
+
+
+class PriorityLane:
+    """
+    A priority lane of the in queue.
+
+    The envelopes of the protocols of a lane are dequeued in FIFO order. When
+    several lanes have envelopes, each lane gets a share of the dequeues
+    proportional to its weight.
+    """
+
+    def __init__(self, name: str, weight: int, protocols: Collection[PublicId]):
+        """
+        Initialize the priority lane.
+
+        :param name: the name of the lane.
+        :param weight: the weight of the lane, a positive integer.
+        :param protocols: the ids of the protocols whose envelopes go to the lane.
+        """
+        assert weight > 0, "Weight of lane '{}' must be positive.".format(name)
+        self.name = name
+        self.weight = weight
+        self.protocols = frozenset(protocols)
+
+    def __repr__(self) -> str:
+        """Get the string representation."""
+        return "PriorityLane(name={}, weight={}, protocols={})".format(
+            self.name, self.weight, sorted(map(str, self.protocols))
+        )
+
+
 class AsyncMultiplexer(WithLogger):
-    """This class can handle multiple connections at once."""
+    """
+    This class can handle multiple connections at once.
+
+    Both queues are unbounded by default. With an in queue high watermark, the
+    multiplexer stops receiving from the connections when the in queue reaches
+    the high watermark, and resumes when it is drained to the low watermark.
+    With an out queue maximum size, putting an envelope in a full out queue
+    waits for the sending loop, or drops the oldest envelope (see OutBoxPolicy).
+    """
 
     def __init__(
         self,
         connections: Optional[Sequence[Connection]] = None,
         default_connection_index: int = 0,
         loop: Optional[AbstractEventLoop] = None,
+        in_queue_high_watermark: Optional[int] = None,
+        in_queue_low_watermark: Optional[int] = None,
+        out_queue_maxsize: int = 0,
     ):
         """
         Initialize the connection multiplexer.
@@ -57,9 +108,26 @@ class AsyncMultiplexer(WithLogger):
             This information is used for envelopes which don't specify any routing context.
             If connections is None, this parameter is ignored.
         :param loop: the event loop to run the multiplexer. If None, a new event loop is created.
-        :param agent_name: the name of the agent that owns the multiplexer, for logging purposes.
+        :param in_queue_high_watermark: the in queue size at which the receiving is suspended. If None, it is never suspended.
+        :param in_queue_low_watermark: the in queue size at which the receiving is resumed. If None, half of the high watermark.
+        :param out_queue_maxsize: the maximum size of the out queue. If 0, the out queue is unbounded.
         """
         super().__init__(default_logger)
+        if in_queue_high_watermark is not None:
+            assert in_queue_high_watermark > 0, "High watermark must be positive."
+            if in_queue_low_watermark is None:
+                in_queue_low_watermark = in_queue_high_watermark // 2
+            assert (
+                0 <= in_queue_low_watermark < in_queue_high_watermark
+            ), "Low watermark must be non-negative and lower than the high watermark."
+        assert out_queue_maxsize >= 0, "Out queue maximum size cannot be negative."
+        self._in_queue_high_watermark = in_queue_high_watermark
+        self._in_queue_low_watermark = in_queue_low_watermark
+        self._out_queue_maxsize = out_queue_maxsize
+        self._is_receiving_suspended = False
+        self._receiving_suspensions = 0
+        self._dropped_envelopes = 0
+
         self._connections: List[Connection] = []
         self._id_to_connection: Dict[PublicId, Connection] = {}
         self._default_connection: Optional[Connection] = None
@@ -68,6 +136,7 @@ class AsyncMultiplexer(WithLogger):
         self._connection_status = ConnectionStatus()
 
         self._in_queue = AsyncFriendlyQueue()  # type: AsyncFriendlyQueue
+        self._priority_lanes = ()  # type: Tuple[PriorityLane, ...]
         self._out_queue = None  # type: Optional[asyncio.Queue]
 
         self._recv_loop_task = None  # type: Optional[asyncio.Task]
@@ -142,6 +211,41 @@ class AsyncMultiplexer(WithLogger):
         """Get the in queue."""
         return self._in_queue
 
+    @property
+    def priority_lanes(self) -> Tuple[PriorityLane, ...]:
+        """Get the priority lanes of the in queue."""
+        return self._priority_lanes
+
+    def set_priority_lanes(self, lanes: Sequence[PriorityLane]) -> None:
+        """
+        Split the in queue in priority lanes.
+
+        The envelopes of the protocols not in any lane go to the default lane,
+        with weight 1 unless a lane named 'default' is given.
+
+        :param lanes: the priority lanes.
+        :return: None
+        """
+        assert (
+            not self._connection_status.is_connected
+        ), "Cannot set priority lanes while connected."
+        assert self._in_queue.empty(), "Cannot set priority lanes, in queue not empty."
+        weights = {DEFAULT_PRIORITY_LANE: 1}  # type: Dict[str, int]
+        lane_by_protocol = {}  # type: Dict[PublicId, str]
+        for lane in lanes:
+            weights[lane.name] = lane.weight
+            for protocol_id in lane.protocols:
+                assert (
+                    protocol_id not in lane_by_protocol
+                ), "Protocol {} in more than one lane.".format(protocol_id)
+                lane_by_protocol[protocol_id] = lane.name
+        self._priority_lanes = tuple(lanes)
+        self._in_queue = WeightedFairQueue(
+            weights,
+            lambda item: lane_by_protocol.get(getattr(item, "protocol_id", None)),
+            DEFAULT_PRIORITY_LANE,
+        )
+
     @property
     def out_queue(self) -> asyncio.Queue:
         """Get the out queue."""
@@ -150,6 +254,29 @@ class AsyncMultiplexer(WithLogger):
         ), "Accessing out queue before loop is started."
         return self._out_queue
 
+    @property
+    def is_receiving_suspended(self) -> bool:
+        """Check whether the receiving is suspended, waiting for the in queue to be drained."""
+        return self._is_receiving_suspended
+
+    @property
+    def queue_stats(self) -> Dict[str, int]:
+        """
+        Get the gauges of the queues.
+
+        :return: the current sizes of the in queue and of the out queue,
+            the number of times the receiving has been suspended
+            and the number of envelopes dropped from the out queue.
+        """
+        return {
+            "in_queue_size": self._in_queue.qsize(),
+            "out_queue_size": self._out_queue.qsize()
+            if self._out_queue is not None
+            else 0,
+            "receiving_suspensions": self._receiving_suspensions,
+            "dropped_envelopes": self._dropped_envelopes,
+        }
+
     @property
     def connections(self) -> Tuple[Connection, ...]:
         """Get the connections."""
@@ -180,7 +307,7 @@ class AsyncMultiplexer(WithLogger):
         self.logger.debug("Multiplexer connecting...")
         self._connection_consistency_checks()
         self._set_default_connection_if_none()
-        self._out_queue = asyncio.Queue()
+        self._out_queue = asyncio.Queue(maxsize=self._out_queue_maxsize)
         async with self._lock:
             if self.connection_status.is_connected:
                 self.logger.debug("Multiplexer already connected.")
@@ -228,7 +355,8 @@ class AsyncMultiplexer(WithLogger):
 
         if self._send_loop_task is not None and not self._send_loop_task.done():
             # send a 'stop' token (a None value) to wake up the coroutine waiting for outgoing envelopes.
-            await self.out_queue.put(None)
+            if not self.out_queue.full():
+                self.out_queue.put_nowait(None)
             await cancel_and_wait(self._send_loop_task)
             self._send_loop_task = None
 
@@ -332,7 +460,7 @@ class AsyncMultiplexer(WithLogger):
                         "Received empty envelope. Quitting the sending loop..."
                     )
                     return None
-                self.logger.debug("Sending envelope {}".format(str(envelope)))
+                self.logger.debug("Sending envelope %s", envelope)
                 await self._send(envelope)
             except asyncio.CancelledError:
                 self.logger.debug("Sending loop cancelled.")
@@ -358,13 +486,17 @@ class AsyncMultiplexer(WithLogger):
                 )
 
                 # process completed receiving tasks.
+                to_resume = []  # type: List[Connection]
                 for task in done:
                     envelope = task.result()
                     if envelope is not None:
                         self.in_queue.put_nowait(envelope)
+                    to_resume.append(task_to_connection.pop(task))
+
+                await self._wait_in_queue_drained()
 
-                    # reinstantiate receiving task, but only if the connection is still up.
-                    connection = task_to_connection.pop(task)
+                # reinstantiate receiving task, but only if the connection is still up.
+                for connection in to_resume:
                     if connection.connection_status.is_connected:
                         new_task = asyncio.ensure_future(connection.receive())
                         task_to_connection[new_task] = connection
@@ -382,6 +514,27 @@ class AsyncMultiplexer(WithLogger):
             t.cancel()
         self.logger.debug("Receiving loop terminated.")
 
+    async def _wait_in_queue_drained(self) -> None:
+        """Suspend the receiving while the in queue is over the high watermark."""
+        if (
+            self._in_queue_high_watermark is None
+            or self.in_queue.qsize() < self._in_queue_high_watermark
+        ):
+            return
+        self.logger.debug(
+            "In queue reached the high watermark (%s): suspending the receiving.",
+            self._in_queue_high_watermark,
+        )
+        self._is_receiving_suspended = True
+        self._receiving_suspensions += 1
+        try:
+            await self.in_queue.async_wait_drained(
+                cast(int, self._in_queue_low_watermark)
+            )
+        finally:
+            self._is_receiving_suspended = False
+        self.logger.debug("In queue drained: resuming the receiving.")
+
     async def _send(self, envelope: Envelope) -> None:
         """
         Send an envelope.
@@ -400,7 +553,7 @@ class AsyncMultiplexer(WithLogger):
         # second, try to route by default routing
         if connection_id is None and envelope.protocol_id in self.default_routing:
             connection_id = self.default_routing[envelope.protocol_id]
-            self.logger.debug("Using default routing: {}".format(connection_id))
+            self.logger.debug("Using default routing: %s", connection_id)
 
         if connection_id is not None and connection_id not in self._id_to_connection:
             raise AEAConnectionError(
@@ -408,9 +561,7 @@ class AsyncMultiplexer(WithLogger):
             )
 
         if connection_id is None:
-            self.logger.debug(
-                "Using default connection: {}".format(self.default_connection)
-            )
+            self.logger.debug("Using default connection: %s", self.default_connection)
             connection = self.default_connection
         else:
             connection = self._id_to_connection[connection_id]
@@ -478,6 +629,25 @@ class AsyncMultiplexer(WithLogger):
         """
         await self.out_queue.put(envelope)
 
+    def _put_drop_oldest(self, envelope: Envelope) -> None:
+        """
+        Put an envelope in the out queue, dropping the oldest envelopes if it is full.
+
+        :param envelope: the envelope to be sent.
+        :return: None
+        """
+        while self.out_queue.full():
+            dropped = self.out_queue.get_nowait()
+            self._dropped_envelopes += 1
+            self.logger.warning(
+                "Out queue is full: dropping the oldest envelope %s", dropped
+            )
+        self.out_queue.put_nowait(envelope)
+
+    async def _async_put_drop_oldest(self, envelope: Envelope) -> None:
+        """Put an envelope in the out queue, from another thread, dropping the oldest envelopes if it is full."""
+        self._put_drop_oldest(envelope)
+
     def put(self, envelope: Envelope) -> None:
         """
         Schedule an envelope for sending it.
@@ -487,6 +657,7 @@ class AsyncMultiplexer(WithLogger):
 
         :param envelope: the envelope to be sent.
         :return: None
+        :raises asyncio.QueueFull: if the out queue is full.
         """
         self.out_queue.put_nowait(envelope)
 
@@ -554,17 +725,88 @@ class Multiplexer(AsyncMultiplexer):
                 self.logger.debug("Thread stopped")
             self.logger.debug("Disconnected")
 
-    def put(self, envelope: Envelope) -> None:  # type: ignore  # cause overrides coroutine
+    def put(  # type: ignore  # cause overrides coroutine
+        self,
+        envelope: Envelope,
+        policy: OutBoxPolicy = OutBoxPolicy.BLOCK,
+        timeout: Optional[float] = None,
+    ) -> None:
         """
         Schedule an envelope for sending it.
 
         Notice that the output queue is an asyncio.Queue which uses an event loop
         running on a different thread than the one used in this function.
 
+        If the out queue is bounded, with the blocking policy the call waits until
+        the envelope is in the out queue. Called from the thread of the event loop,
+        e.g. by a skill under the asynchronous runtime, it cannot wait: it raises
+        queue.Full if the out queue is full (use async_put to wait).
+
+        :param envelope: the envelope to be sent.
+        :param policy: what to do if the out queue is full.
+        :param timeout: the maximum time to wait, with the blocking policy. If None, wait indefinitely.
+        :return: None
+        :raises queue.Full: if the envelope could not be put in the out queue within the timeout.
+        """
+        if self._is_loop_thread():
+            if policy == OutBoxPolicy.DROP_OLDEST:
+                self._put_drop_oldest(envelope)
+                return
+            try:
+                self.out_queue.put_nowait(envelope)
+            except asyncio.QueueFull:
+                raise queue.Full
+            return
+        if policy == OutBoxPolicy.DROP_OLDEST:
+            self._thread_runner.call(self._async_put_drop_oldest(envelope))
+            return
+        if self._out_queue_maxsize == 0:
+            self._thread_runner.call(super()._put(envelope))
+            return
+        # the timeout applies in the event loop, so that a timed out envelope is never put.
+        if not self._thread_runner.call(
+            self._put_with_timeout(envelope, timeout)
+        ).result():
+            raise queue.Full
+
+    async def _put_with_timeout(
+        self, envelope: Envelope, timeout: Optional[float]
+    ) -> bool:
+        """
+        Put an envelope in the out queue, waiting at most the timeout for a free slot.
+
+        :param envelope: the envelope to be sent.
+        :param timeout: the maximum time to wait. If None, wait indefinitely.
+        :return: whether the envelope was put in the out queue.
+        """
+        try:
+            await asyncio.wait_for(super()._put(envelope), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def async_put(self, envelope: Envelope) -> None:
+        """
+        Put an envelope in the out queue, waiting for a free slot if it is full.
+
+        It can be awaited from any event loop.
+
         :param envelope: the envelope to be sent.
         :return: None
         """
-        self._thread_runner.call(super()._put(envelope))  # .result(240)
+        if self._is_loop_thread():
+            await super()._put(envelope)
+        else:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(super()._put(envelope), self._loop)
+            )
+
+    def _is_loop_thread(self) -> bool:
+        """Check whether the caller runs in the event loop of the multiplexer."""
+        return (
+            asyncio.events._get_running_loop()  # pylint: disable=protected-access
+            is self._loop
+        )
 
     def setup(
         self,
@@ -621,9 +863,11 @@ class InBox:
         if envelope is None:
             raise Empty()
         self._multiplexer.logger.debug(
-            "Incoming envelope: to='{}' sender='{}' protocol_id='{}' message='{!r}'".format(
-                envelope.to, envelope.sender, envelope.protocol_id, envelope.message
-            )
+            "Incoming envelope: to='%s' sender='%s' protocol_id='%s' message='%r'",
+            envelope.to,
+            envelope.sender,
+            envelope.protocol_id,
+            envelope.message,
         )
         return envelope
 
@@ -652,9 +896,11 @@ class InBox:
         if envelope is None:
             raise Empty()
         self._multiplexer.logger.debug(
-            "Incoming envelope: to='{}' sender='{}' protocol_id='{}' message='{!r}'".format(
-                envelope.to, envelope.sender, envelope.protocol_id, envelope.message
-            )
+            "Incoming envelope: to='%s' sender='%s' protocol_id='%s' message='%r'",
+            envelope.to,
+            envelope.sender,
+            envelope.protocol_id,
+            envelope.message,
         )
         return envelope
 
@@ -673,16 +919,31 @@ class InBox:
 class OutBox:
     """A queue from where you can only enqueue envelopes."""
 
-    def __init__(self, multiplexer: Multiplexer, default_address: Address):
+    def __init__(
+        self,
+        multiplexer: Multiplexer,
+        default_address: Address,
+        policy: OutBoxPolicy = OutBoxPolicy.BLOCK,
+        timeout: Optional[float] = None,
+    ):
         """
         Initialize the outbox.
 
         :param multiplexer: the multiplexer
         :param default_address: the default address of the agent
+        :param policy: what to do when the out queue of the multiplexer is full
+        :param timeout: the maximum time to wait for the out queue, with the blocking policy
         """
         super().__init__()
         self._multiplexer = multiplexer
         self._default_address = default_address
+        self._policy = policy
+        self._timeout = timeout
+
+    @property
+    def policy(self) -> OutBoxPolicy:
+        """Get the policy when the out queue is full."""
+        return self._policy
 
     def empty(self) -> bool:
         """
@@ -700,18 +961,29 @@ class OutBox:
         :return: None
         """
         self._multiplexer.logger.debug(
-            "Put an envelope in the queue: to='{}' sender='{}' protocol_id='{}' message='{!r}' context='{}'...".format(
-                envelope.to,
-                envelope.sender,
-                envelope.protocol_id,
-                envelope.message,
-                envelope.context,
-            )
+            "Put an envelope in the queue: to='%s' sender='%s' protocol_id='%s' message='%r' context='%s'...",
+            envelope.to,
+            envelope.sender,
+            envelope.protocol_id,
+            envelope.message,
+            envelope.context,
         )
         assert isinstance(
             envelope.message, Message
         ), "Only Message type allowed in envelope message field when putting into outbox."
-        self._multiplexer.put(envelope)
+        self._multiplexer.put(envelope, policy=self._policy, timeout=self._timeout)
+
+    async def async_put(self, envelope: Envelope) -> None:
+        """
+        Put an envelope into the queue, waiting for a free slot if the queue is full.
+
+        :param envelope: the envelope.
+        :return: None
+        """
+        assert isinstance(
+            envelope.message, Message
+        ), "Only Message type allowed in envelope message field when putting into outbox."
+        await self._multiplexer.async_put(envelope)
 
     def put_message(
         self,
@@ -27,7 +27,17 @@ from abc import ABC, abstractmethod
 from copy import copy
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Type, cast
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from google.protobuf.struct_pb2 import Struct
 
@@ -48,6 +58,8 @@ Address = str
 class Message:
     """This class implements a message."""
 
+    __slots__ = ("_counterparty", "_body", "_is_incoming")
+
     protocol_id = None  # type: PublicId
     serializer = None  # type: Type["Serializer"]
 
@@ -104,7 +116,7 @@ class Message:
         self._is_incoming = is_incoming
 
     @property
-    def body(self) -> Dict:
+    def body(self) -> MutableMapping[str, Any]:
         """
         Get the body of the message (in dictionary form).
 
@@ -198,6 +210,187 @@ class Message:
         return self.serializer.encode(self)
 
 
+_UNSET = object()
+
+
+class SlottedMessage(Message):
+    """
+    A message storing each field of its protocol in its own slot.
+
+    The message classes generated in 'slots' mode declare, in '__slots__', one slot
+    for each field, named as the field with a leading underscore. A slot is empty
+    while its field is not set. Keys which are not fields of the protocol are kept
+    in a dictionary, created on first use.
+
+    The body is a view of the message (see SlottedBody): changes to it are applied
+    to the message.
+    """
+
+    __slots__ = ("_extras",)
+
+    _fields = ()  # type: Tuple[str, ...]
+    _field_set = frozenset()  # type: FrozenSet[str]
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the fields of the subclass from the slots of its hierarchy."""
+        super().__init_subclass__(**kwargs)  # type: ignore
+        fields = []
+        for klass in reversed(cls.__mro__):
+            if issubclass(klass, SlottedMessage) and klass is not SlottedMessage:
+                slots = klass.__dict__.get("__slots__", ())
+                fields.extend(slot[1:] for slot in slots if slot not in fields)
+        cls._fields = tuple(fields)
+        cls._field_set = frozenset(fields)
+
+    def __init__(self, body: Optional[Dict] = None, **kwargs):
+        """
+        Initialize a Message object.
+
+        :param body: the dictionary of values to hold.
+        :param kwargs: any additional value to add to the body. It will overwrite the body values.
+        """
+        self._counterparty = None  # type: Optional[Address]
+        self._is_incoming = False
+        self._extras = None  # type: Optional[Dict[str, Any]]
+        if body:
+            for key, value in body.items():
+                self.set(key, value)
+        for key, value in kwargs.items():
+            self.set(key, value)
+        try:
+            self._is_consistent()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(e)
+
+    @property
+    def body(self) -> MutableMapping[str, Any]:
+        """
+        Get the body of the message (in dictionary form).
+
+        It is a view of the message: setting or deleting its keys sets or unsets them in the message.
+
+        :return: the body
+        """
+        return SlottedBody(self)
+
+    @body.setter
+    def body(self, body: Dict) -> None:
+        """
+        Set the body of the message.
+
+        :param body: the body.
+        :return: None
+        """
+        body = dict(body)
+        for field in self._fields:
+            self.unset(field)
+        self._extras = None
+        for key, value in body.items():
+            self.set(key, value)
+
+    def _body_size(self) -> int:
+        """Get the number of keys of the body, without building it."""
+        size = len(self._extras) if self._extras else 0
+        for field in self._fields:
+            if hasattr(self, "_" + field):
+                size += 1
+        return size
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Set key and value pair.
+
+        :param key: the key.
+        :param value: the value.
+        :return: None
+        """
+        if key in self._field_set:
+            setattr(self, "_" + key, value)
+        else:
+            if self._extras is None:
+                self._extras = {}
+            self._extras[key] = value
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value for key."""
+        if key in self._field_set:
+            return getattr(self, "_" + key, None)
+        return self._extras.get(key, None) if self._extras else None
+
+    def unset(self, key: str) -> None:
+        """Unset value for key."""
+        if key in self._field_set:
+            if hasattr(self, "_" + key):
+                delattr(self, "_" + key)
+        elif self._extras:
+            self._extras.pop(key, None)
+
+    def is_set(self, key: str) -> bool:
+        """Check value is set for key."""
+        if key in self._field_set:
+            return hasattr(self, "_" + key)
+        return bool(self._extras) and key in cast(Dict[str, Any], self._extras)
+
+
+class SlottedBody(MutableMapping):
+    """
+    The body of a slotted message, as a mapping.
+
+    It is a view of the message: it reads the fields and the other keys set in the
+    message, and setting or deleting a key sets or unsets it in the message.
+    """
+
+    __slots__ = ("_message",)
+
+    def __init__(self, message: SlottedMessage):
+        """
+        Initialize the view.
+
+        :param message: the message.
+        """
+        self._message = message
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of a key set in the message."""
+        if not self._message.is_set(key):
+            raise KeyError(key)
+        return self._message.get(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a key in the message."""
+        self._message.set(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Unset a key in the message."""
+        if not self._message.is_set(key):
+            raise KeyError(key)
+        self._message.unset(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys set in the message: the fields, then the other keys."""
+        message = self._message
+        for field in message._fields:  # pylint: disable=protected-access
+            if hasattr(message, "_" + field):
+                yield field
+        extras = message._extras  # pylint: disable=protected-access
+        if extras:
+            yield from list(extras)
+
+    def __len__(self) -> int:
+        """Get the number of keys set in the message."""
+        return self._message._body_size()  # pylint: disable=protected-access
+
+    def __repr__(self) -> str:
+        """Get the representation of the body, as a dictionary."""
+        return repr(dict(self))
+
+    def copy(self) -> Dict[str, Any]:
+        """Get a copy of the body, as a dictionary, independent of the message."""
+        return dict(self)
+
+    __copy__ = copy
+
+
 class Encoder(ABC):
     """Encoder interface."""
 
@@ -271,7 +464,7 @@ class JSONSerializer(Serializer):
         :param msg: the message to be encoded.
         :return: the serialized message.
         """
-        bytes_msg = json.dumps(msg.body).encode("utf-8")
+        bytes_msg = json.dumps(dict(msg.body)).encode("utf-8")
         return bytes_msg
 
     @staticmethod
@@ -21,10 +21,10 @@
 
 import logging
 from enum import Enum
-from typing import Dict, Set, Tuple, cast
+from typing import Dict, Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 from aea.protocols.default.custom_types import ErrorCode as CustomErrorCode
 
 logger = logging.getLogger("aea.protocols.default.message")
@@ -32,7 +32,7 @@ logger = logging.getLogger("aea.protocols.default.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class DefaultMessage(Message):
+class DefaultMessage(SlottedMessage):
     """A protocol for exchanging any bytes message."""
 
     protocol_id = ProtocolId("fetchai", "default", "0.3.0")
@@ -49,6 +49,28 @@ class DefaultMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_content",
+        "_error_code",
+        "_error_data",
+        "_error_msg",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _content: bytes
+    _error_code: CustomErrorCode
+    _error_data: Dict[str, bytes]
+    _error_msg: str
+
+    _performatives = {"bytes", "error"}
+
     def __init__(
         self,
         performative: Performative,
@@ -65,14 +87,11 @@ class DefaultMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=DefaultMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {"bytes", "error"}
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = DefaultMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -82,50 +101,66 @@ class DefaultMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(DefaultMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def content(self) -> bytes:
         """Get the 'content' content from the message."""
-        assert self.is_set("content"), "'content' content is not set."
-        return cast(bytes, self.get("content"))
+        try:
+            return self._content
+        except AttributeError:
+            raise AssertionError("'content' content is not set.")
 
     @property
     def error_code(self) -> CustomErrorCode:
         """Get the 'error_code' content from the message."""
-        assert self.is_set("error_code"), "'error_code' content is not set."
-        return cast(CustomErrorCode, self.get("error_code"))
+        try:
+            return self._error_code
+        except AttributeError:
+            raise AssertionError("'error_code' content is not set.")
 
     @property
     def error_data(self) -> Dict[str, bytes]:
         """Get the 'error_data' content from the message."""
-        assert self.is_set("error_data"), "'error_data' content is not set."
-        return cast(Dict[str, bytes], self.get("error_data"))
+        try:
+            return self._error_data
+        except AttributeError:
+            raise AssertionError("'error_data' content is not set.")
 
     @property
     def error_msg(self) -> str:
         """Get the 'error_msg' content from the message."""
-        assert self.is_set("error_msg"), "'error_msg' content is not set."
-        return cast(str, self.get("error_msg"))
+        try:
+            return self._error_msg
+        except AttributeError:
+            raise AssertionError("'error_msg' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the default protocol."""
@@ -165,7 +200,7 @@ class DefaultMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == DefaultMessage.Performative.BYTES:
                 expected_nb_of_contents = 1
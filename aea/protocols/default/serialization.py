@@ -19,7 +19,7 @@
 
 """Serialization module for default protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -28,6 +28,59 @@ from aea.protocols.default.custom_types import ErrorCode
 from aea.protocols.default.message import DefaultMessage
 
 
+def _encode_bytes(msg: DefaultMessage, default_msg: Any) -> None:
+    """Encode the contents of the 'bytes' performative."""
+    performative = default_msg.bytes
+    performative.SetInParent()
+    content = msg.content
+    performative.content = content
+
+
+def _encode_error(msg: DefaultMessage, default_msg: Any) -> None:
+    """Encode the contents of the 'error' performative."""
+    performative = default_msg.error
+    performative.SetInParent()
+    error_code = msg.error_code
+    ErrorCode.encode(performative.error_code, error_code)
+    error_msg = msg.error_msg
+    performative.error_msg = error_msg
+    error_data = msg.error_data
+    performative.error_data.update(error_data)
+
+
+def _decode_bytes(default_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'bytes' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    content = default_pb.bytes.content
+    performative_content["content"] = content
+    return performative_content
+
+
+def _decode_error(default_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'error' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_error_code = default_pb.error.error_code
+    error_code = ErrorCode.decode(pb2_error_code)
+    performative_content["error_code"] = error_code
+    error_msg = default_pb.error.error_msg
+    performative_content["error_msg"] = error_msg
+    error_data = default_pb.error.error_data
+    error_data_dict = dict(error_data)
+    performative_content["error_data"] = error_data_dict
+    return performative_content
+
+
+_ENCODERS = {
+    "bytes": _encode_bytes,
+    "error": _encode_error,
+}  # type: Dict[str, Callable[[DefaultMessage, Any], None]]
+
+_DECODERS = {
+    "bytes": _decode_bytes,
+    "error": _decode_error,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class DefaultSerializer(Serializer):
     """Serialization for the 'default' protocol."""
 
@@ -48,22 +101,11 @@ class DefaultSerializer(Serializer):
         default_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == DefaultMessage.Performative.BYTES:
-            performative = default_pb2.DefaultMessage.Bytes_Performative()  # type: ignore
-            content = msg.content
-            performative.content = content
-            default_msg.bytes.CopyFrom(performative)
-        elif performative_id == DefaultMessage.Performative.ERROR:
-            performative = default_pb2.DefaultMessage.Error_Performative()  # type: ignore
-            error_code = msg.error_code
-            ErrorCode.encode(performative.error_code, error_code)
-            error_msg = msg.error_msg
-            performative.error_msg = error_msg
-            error_data = msg.error_data
-            performative.error_data.update(error_data)
-            default_msg.error.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, default_msg)
 
         default_bytes = default_msg.SerializeToString()
         return default_bytes
@@ -86,22 +128,11 @@ class DefaultSerializer(Serializer):
         target = default_pb.target
 
         performative = default_pb.WhichOneof("performative")
-        performative_id = DefaultMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == DefaultMessage.Performative.BYTES:
-            content = default_pb.bytes.content
-            performative_content["content"] = content
-        elif performative_id == DefaultMessage.Performative.ERROR:
-            pb2_error_code = default_pb.error.error_code
-            error_code = ErrorCode.decode(pb2_error_code)
-            performative_content["error_code"] = error_code
-            error_msg = default_pb.error.error_msg
-            performative_content["error_msg"] = error_msg
-            error_data = default_pb.error.error_data
-            error_data_dict = dict(error_data)
-            performative_content["error_data"] = error_data_dict
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(default_pb)
 
         return DefaultMessage(
             message_id=message_id,
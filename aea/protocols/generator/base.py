@@ -25,7 +25,7 @@ import os
 import shutil
 from datetime import date
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from aea.protocols.generator.common import (
     CUSTOM_TYPES_DOT_PY_FILE_NAME,
@@ -38,6 +38,7 @@ from aea.protocols.generator.common import (
     PYTHON_TYPE_TO_PROTO_TYPE,
     SERIALIZATION_DOT_PY_FILE_NAME,
     SERIALIZER_IMPORT,
+    SLOTTED_MESSAGE_IMPORT,
     _camel_case_to_snake_case,
     _create_protocol_file,
     _get_sub_types_of_compositional_types,
@@ -96,6 +97,7 @@ class ProtocolGenerator:
         path_to_protocol_specification: str,
         output_path: str = ".",
         path_to_protocol_package: Optional[str] = None,
+        slots: bool = False,
     ) -> None:
         """
         Instantiate a protocol generator.
@@ -103,6 +105,7 @@ class ProtocolGenerator:
         :param path_to_protocol_specification: path to protocol specification file
         :param output_path: the path to the location in which the protocol module is to be generated.
         :param path_to_protocol_package: the path to the protocol package
+        :param slots: whether the message class stores its fields in slots, instead of a dictionary.
 
         :return: None
         """
@@ -137,6 +140,7 @@ class ProtocolGenerator:
                 self.protocol_specification.name,
             )
         )
+        self.slots = slots
         self.indent = ""
 
         # Extract specification fields
@@ -181,6 +185,8 @@ class ProtocolGenerator:
         """
         Manage import statement for the typing package.
 
+        In 'slots' mode, 'cast' is only used in the checks of optional contents.
+
         :return: import statement for the typing package
         """
         ordered_packages = [
@@ -192,9 +198,12 @@ class ProtocolGenerator:
             "Union",
             "cast",
         ]
+        typing_imports = dict(self.spec.typing_imports)
+        if self.slots:
+            typing_imports["cast"] = typing_imports["Optional"]
         import_str = "from typing import "
         for package in ordered_packages:
-            if self.spec.typing_imports[package]:
+            if typing_imports[package]:
                 import_str += "{}, ".format(package)
         import_str = import_str[:-2]
         return import_str
@@ -581,87 +590,13 @@ class ProtocolGenerator:
             self._change_indent(-1)
         return check_str
 
-    def _message_class_str(self) -> str:
+    def _init_body_str(self) -> str:
         """
-        Produce the content of the Message class.
+        Produce the body of the __init__ method of the Message class, storing the fields in the body.
 
-        :return: the message.py file content
+        :return: the body of the __init__ method
         """
-        self._change_indent(0, "s")
-
-        # Header
-        cls_str = _copyright_header_str(self.protocol_specification.author) + "\n"
-
-        # Module docstring
-        cls_str += (
-            self.indent
-            + '"""This module contains {}\'s message definition."""\n\n'.format(
-                self.protocol_specification.name
-            )
-        )
-
-        # Imports
-        cls_str += self.indent + "import logging\n"
-        cls_str += self.indent + "from enum import Enum\n"
-        cls_str += self._import_from_typing_module() + "\n\n"
-        cls_str += self.indent + "from aea.configurations.base import ProtocolId\n"
-        cls_str += MESSAGE_IMPORT + "\n"
-        if self._import_from_custom_types_module() != "":
-            cls_str += "\n" + self._import_from_custom_types_module() + "\n"
-        else:
-            cls_str += self._import_from_custom_types_module()
-        cls_str += (
-            self.indent
-            + '\nlogger = logging.getLogger("aea.packages.{}.protocols.{}.message")\n'.format(
-                self.protocol_specification.author, self.protocol_specification.name
-            )
-        )
-        cls_str += self.indent + "\nDEFAULT_BODY_SIZE = 4\n"
-
-        # Class Header
-        cls_str += self.indent + "\n\nclass {}Message(Message):\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(1)
-        cls_str += self.indent + '"""{}"""\n\n'.format(
-            self.protocol_specification.description
-        )
-
-        # Class attributes
-        cls_str += self.indent + 'protocol_id = ProtocolId("{}", "{}", "{}")\n'.format(
-            self.protocol_specification.author,
-            self.protocol_specification.name,
-            self.protocol_specification.version,
-        )
-        for custom_type in self.spec.all_custom_types:
-            cls_str += "\n"
-            cls_str += self.indent + "{} = Custom{}\n".format(custom_type, custom_type)
-
-        # Performatives Enum
-        cls_str += "\n" + self._performatives_enum_str()
-
-        # __init__
-        cls_str += self.indent + "def __init__(\n"
-        self._change_indent(1)
-        cls_str += self.indent + "self,\n"
-        cls_str += self.indent + "performative: Performative,\n"
-        cls_str += self.indent + 'dialogue_reference: Tuple[str, str] = ("", ""),\n'
-        cls_str += self.indent + "message_id: int = 1,\n"
-        cls_str += self.indent + "target: int = 0,\n"
-        cls_str += self.indent + "**kwargs,\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "):\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Initialise an instance of {}Message.\n\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        cls_str += self.indent + ":param message_id: the message id.\n"
-        cls_str += self.indent + ":param dialogue_reference: the dialogue reference.\n"
-        cls_str += self.indent + ":param target: the message target.\n"
-        cls_str += self.indent + ":param performative: the message performative.\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "super().__init__(\n"
+        cls_str = self.indent + "super().__init__(\n"
         self._change_indent(1)
         cls_str += self.indent + "dialogue_reference=dialogue_reference,\n"
         cls_str += self.indent + "message_id=message_id,\n"
@@ -678,9 +613,15 @@ class ProtocolGenerator:
         cls_str += self.indent + "self._performatives = {}\n".format(
             self._performatives_str()
         )
-        self._change_indent(-1)
+        return cls_str
 
-        # Instance properties
+    def _properties_str(self) -> str:
+        """
+        Produce the properties of the Message class, reading the fields from the body.
+
+        :return: the properties string
+        """
+        cls_str = ""
         cls_str += self.indent + "@property\n"
         cls_str += self.indent + "def valid_performatives(self) -> Set[str]:\n"
         self._change_indent(1)
@@ -759,7 +700,247 @@ class ProtocolGenerator:
                 self._to_custom_custom(content_type), content_name
             )
             self._change_indent(-1)
+        return cls_str
+
+    def _slots_str(self) -> str:
+        """
+        Produce the slots of the Message class, one for each field, and their type annotations.
+
+        :return: the slots string
+        """
+        fields = [
+            ("dialogue_reference", "Tuple[str, str]"),
+            ("message_id", "int"),
+            ("target", "int"),
+            ("performative", "Performative"),
+        ]
+        for content_name in sorted(self.spec.all_unique_contents.keys()):
+            content_type = self.spec.all_unique_contents[content_name]
+            if content_type.startswith("Optional["):
+                content_type = _get_sub_types_of_compositional_types(content_type)[0]
+            fields.append((content_name, self._to_custom_custom(content_type)))
+
+        cls_str = self.indent + "__slots__ = (\n"
+        self._change_indent(1)
+        for field_name, _ in fields:
+            cls_str += self.indent + '"_{}",\n'.format(field_name)
+        self._change_indent(-1)
+        cls_str += self.indent + ")\n\n"
+        for field_name, field_type in fields:
+            cls_str += self.indent + "_{}: {}\n".format(field_name, field_type)
+        cls_str += "\n"
+        cls_str += self.indent + "_performatives = {}\n\n".format(
+            self._performatives_str()
+        )
+        return cls_str
+
+    def _slotted_init_body_str(self) -> str:
+        """
+        Produce the body of the __init__ method of the Message class, storing the fields in slots.
+
+        :return: the body of the __init__ method
+        """
+        cls_str = self.indent + "self._dialogue_reference = dialogue_reference\n"
+        cls_str += self.indent + "self._message_id = message_id\n"
+        cls_str += self.indent + "self._target = target\n"
+        cls_str += (
+            self.indent
+            + "self._performative = {}Message.Performative(\n".format(
+                self.protocol_specification_in_camel_case
+            )
+        )
+        self._change_indent(1)
+        cls_str += self.indent + "performative\n"
+        self._change_indent(-1)
+        cls_str += self.indent + ")\n"
+        cls_str += self.indent + "super().__init__(**kwargs)\n\n"
+        return cls_str
+
+    def _slotted_property_str(
+        self,
+        name: str,
+        return_type: str,
+        docstring: str,
+        error: Optional[str],
+        comment: str = "",
+    ) -> str:
+        """
+        Produce a property of the Message class, reading a field from its slot.
+
+        :param name: the name of the field.
+        :param return_type: the return type of the property.
+        :param docstring: the docstring of the property.
+        :param error: the error message if the field is not set, or None if the field is optional.
+        :param comment: the comment on the line of the signature.
+
+        :return: the property string
+        """
+        cls_str = self.indent + "@property\n"
+        cls_str += self.indent + "def {}(self) -> {}:{}\n".format(
+            name, return_type, comment
+        )
+        self._change_indent(1)
+        cls_str += self.indent + '"""{}"""\n'.format(docstring)
+        if error is None:
+            cls_str += self.indent + 'return getattr(self, "_{}", None)\n\n'.format(
+                name
+            )
+        else:
+            cls_str += self.indent + "try:\n"
+            self._change_indent(1)
+            cls_str += self.indent + "return self._{}\n".format(name)
+            self._change_indent(-1)
+            cls_str += self.indent + "except AttributeError:\n"
+            self._change_indent(1)
+            cls_str += self.indent + "raise AssertionError({})\n\n".format(error)
+            self._change_indent(-1)
+        self._change_indent(-1)
+        return cls_str
+
+    def _slotted_properties_str(self) -> str:
+        """
+        Produce the properties of the Message class, reading the fields from their slots.
+
+        :return: the properties string
+        """
+        cls_str = self.indent + "@property\n"
+        cls_str += self.indent + "def valid_performatives(self) -> Set[str]:\n"
+        self._change_indent(1)
+        cls_str += self.indent + '"""Get valid performatives."""\n'
+        cls_str += self.indent + "return self._performatives\n\n"
+        self._change_indent(-1)
+        cls_str += self._slotted_property_str(
+            "dialogue_reference",
+            "Tuple[str, str]",
+            "Get the dialogue_reference of the message.",
+            '"dialogue_reference is not set."',
+        )
+        cls_str += self._slotted_property_str(
+            "message_id",
+            "int",
+            "Get the message_id of the message.",
+            '"message_id is not set."',
+        )
+        cls_str += self._slotted_property_str(
+            "performative",
+            "Performative",
+            "Get the performative of the message.",
+            '"performative is not set."',
+            "  # type: ignore # noqa: F821",
+        )
+        cls_str += self._slotted_property_str(
+            "target", "int", "Get the target of the message.", '"target is not set."',
+        )
+        for content_name in sorted(self.spec.all_unique_contents.keys()):
+            content_type = self.spec.all_unique_contents[content_name]
+            cls_str += self._slotted_property_str(
+                content_name,
+                self._to_custom_custom(content_type),
+                "Get the '{}' content from the message.".format(content_name),
+                None
+                if content_type.startswith("Optional")
+                else "\"'{}' content is not set.\"".format(content_name),
+            )
+        return cls_str
+
+    def _message_class_str(self) -> str:
+        """
+        Produce the content of the Message class.
+
+        :return: the message.py file content
+        """
+        self._change_indent(0, "s")
+
+        # Header
+        cls_str = _copyright_header_str(self.protocol_specification.author) + "\n"
+
+        # Module docstring
+        cls_str += (
+            self.indent
+            + '"""This module contains {}\'s message definition."""\n\n'.format(
+                self.protocol_specification.name
+            )
+        )
+
+        # Imports
+        cls_str += self.indent + "import logging\n"
+        cls_str += self.indent + "from enum import Enum\n"
+        cls_str += self._import_from_typing_module() + "\n\n"
+        cls_str += self.indent + "from aea.configurations.base import ProtocolId\n"
+        cls_str += (SLOTTED_MESSAGE_IMPORT if self.slots else MESSAGE_IMPORT) + "\n"
+        if self._import_from_custom_types_module() != "":
+            cls_str += "\n" + self._import_from_custom_types_module() + "\n"
+        else:
+            cls_str += self._import_from_custom_types_module()
+        cls_str += (
+            self.indent
+            + '\nlogger = logging.getLogger("aea.packages.{}.protocols.{}.message")\n'.format(
+                self.protocol_specification.author, self.protocol_specification.name
+            )
+        )
+        cls_str += self.indent + "\nDEFAULT_BODY_SIZE = 4\n"
+
+        # Class Header
+        cls_str += self.indent + "\n\nclass {}Message({}):\n".format(
+            self.protocol_specification_in_camel_case,
+            "SlottedMessage" if self.slots else "Message",
+        )
+        self._change_indent(1)
+        cls_str += self.indent + '"""{}"""\n\n'.format(
+            self.protocol_specification.description
+        )
+
+        # Class attributes
+        cls_str += self.indent + 'protocol_id = ProtocolId("{}", "{}", "{}")\n'.format(
+            self.protocol_specification.author,
+            self.protocol_specification.name,
+            self.protocol_specification.version,
+        )
+        for custom_type in self.spec.all_custom_types:
+            cls_str += "\n"
+            cls_str += self.indent + "{} = Custom{}\n".format(custom_type, custom_type)
+
+        # Performatives Enum
+        cls_str += "\n" + self._performatives_enum_str()
+
+        # Slots
+        if self.slots:
+            cls_str += self._slots_str()
+
+        # __init__
+        cls_str += self.indent + "def __init__(\n"
+        self._change_indent(1)
+        cls_str += self.indent + "self,\n"
+        cls_str += self.indent + "performative: Performative,\n"
+        cls_str += self.indent + 'dialogue_reference: Tuple[str, str] = ("", ""),\n'
+        cls_str += self.indent + "message_id: int = 1,\n"
+        cls_str += self.indent + "target: int = 0,\n"
+        cls_str += self.indent + "**kwargs,\n"
+        self._change_indent(-1)
+        cls_str += self.indent + "):\n"
+        self._change_indent(1)
+        cls_str += self.indent + '"""\n'
+        cls_str += self.indent + "Initialise an instance of {}Message.\n\n".format(
+            self.protocol_specification_in_camel_case
+        )
+        cls_str += self.indent + ":param message_id: the message id.\n"
+        cls_str += self.indent + ":param dialogue_reference: the dialogue reference.\n"
+        cls_str += self.indent + ":param target: the message target.\n"
+        cls_str += self.indent + ":param performative: the message performative.\n"
+        cls_str += self.indent + '"""\n'
+        if self.slots:
+            cls_str += self._slotted_init_body_str()
+        else:
+            cls_str += self._init_body_str()
+        self._change_indent(-1)
+
+        # Instance properties
+        if self.slots:
+            cls_str += self._slotted_properties_str()
+        else:
+            cls_str += self._properties_str()
 
+        # check_consistency method
         # check_consistency method
         cls_str += self.indent + "def _is_consistent(self) -> bool:\n"
         self._change_indent(1)
@@ -813,7 +994,10 @@ class ProtocolGenerator:
 
         cls_str += self.indent + "# Check correct contents\n"
         cls_str += (
-            self.indent + "actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE\n"
+            self.indent
+            + "actual_nb_of_contents = {} - DEFAULT_BODY_SIZE\n".format(
+                "self._body_size()" if self.slots else "len(self.body)"
+            )
         )
         cls_str += self.indent + "expected_nb_of_contents = 0\n"
         counter = 1
@@ -1505,6 +1689,80 @@ class ProtocolGenerator:
             )
         return decoding_str
 
+    def _performative_encoder_str(
+        self, performative: str, contents: Dict[str, str]
+    ) -> str:
+        """
+        Produce the function encoding the contents of a performative.
+
+        The contents are assigned directly to the fields of the performative in the protobuf message.
+
+        :param performative: the performative
+        :param contents: the types of the contents of the performative, by name
+
+        :return: the encoding function string
+        """
+        cls_str = (
+            self.indent
+            + "\n\ndef _encode_{}(msg: {}Message, {}_msg: Any) -> None:\n".format(
+                performative,
+                self.protocol_specification_in_camel_case,
+                self.protocol_specification.name,
+            )
+        )
+        self._change_indent(1)
+        cls_str += (
+            self.indent
+            + '"""Encode the contents of the \'{}\' performative."""\n'.format(
+                performative
+            )
+        )
+        cls_str += self.indent + "performative = {}_msg.{}\n".format(
+            self.protocol_specification.name, performative
+        )
+        cls_str += self.indent + "performative.SetInParent()\n"
+        for content_name, content_type in contents.items():
+            cls_str += self._encoding_message_content_from_python_to_protobuf(
+                content_name, content_type
+            )
+        self._change_indent(-1)
+        return cls_str
+
+    def _performative_decoder_str(
+        self, performative: str, contents: Dict[str, str]
+    ) -> str:
+        """
+        Produce the function decoding the contents of a performative.
+
+        :param performative: the performative
+        :param contents: the types of the contents of the performative, by name
+
+        :return: the decoding function string
+        """
+        cls_str = (
+            self.indent
+            + "\n\ndef _decode_{}({}_pb: Any) -> Dict[str, Any]:\n".format(
+                performative, self.protocol_specification.name,
+            )
+        )
+        self._change_indent(1)
+        cls_str += (
+            self.indent
+            + '"""Decode the contents of the \'{}\' performative."""\n'.format(
+                performative
+            )
+        )
+        cls_str += (
+            self.indent + "performative_content = dict()  # type: Dict[str, Any]\n"
+        )
+        for content_name, content_type in contents.items():
+            cls_str += self._decoding_message_content_from_protobuf_to_python(
+                performative, content_name, content_type
+            )
+        cls_str += self.indent + "return performative_content\n"
+        self._change_indent(-1)
+        return cls_str
+
     def _serialization_class_str(self) -> str:
         """
         Produce the content of the Serialization class.
@@ -1525,7 +1783,7 @@ class ProtocolGenerator:
         )
 
         # Imports
-        cls_str += self.indent + "from typing import Any, Dict, cast\n\n"
+        cls_str += self.indent + "from typing import Any, Callable, Dict, cast\n\n"
         cls_str += MESSAGE_IMPORT + "\n"
         cls_str += SERIALIZER_IMPORT + "\n\n"
         cls_str += self.indent + "from {} import (\n    {}_pb2,\n)\n".format(
@@ -1542,6 +1800,37 @@ class ProtocolGenerator:
             self.path_to_protocol_package, self.protocol_specification_in_camel_case,
         )
 
+        # Encoders and decoders of the performatives
+        for performative, contents in self.spec.speech_acts.items():
+            cls_str += self._performative_encoder_str(performative, contents)
+        for performative, contents in self.spec.speech_acts.items():
+            cls_str += self._performative_decoder_str(performative, contents)
+
+        # Dispatch tables
+        cls_str += self.indent + "\n\n_ENCODERS = {\n"
+        self._change_indent(1)
+        for performative in self.spec.speech_acts.keys():
+            cls_str += self.indent + '"{}": _encode_{},\n'.format(
+                performative, performative
+            )
+        self._change_indent(-1)
+        cls_str += (
+            self.indent
+            + "}}  # type: Dict[str, Callable[[{}Message, Any], None]]\n".format(
+                self.protocol_specification_in_camel_case
+            )
+        )
+        cls_str += self.indent + "\n_DECODERS = {\n"
+        self._change_indent(1)
+        for performative in self.spec.speech_acts.keys():
+            cls_str += self.indent + '"{}": _decode_{},\n'.format(
+                performative, performative
+            )
+        self._change_indent(-1)
+        cls_str += (
+            self.indent + "}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]\n"
+        )
+
         # Class Header
         cls_str += self.indent + "\n\nclass {}Serializer(Serializer):\n".format(
             self.protocol_specification_in_camel_case,
@@ -1593,41 +1882,20 @@ class ProtocolGenerator:
             self.protocol_specification.name
         )
         cls_str += self.indent + "performative_id = msg.performative\n"
-        counter = 1
-        for performative, contents in self.spec.speech_acts.items():
-            if counter == 1:
-                cls_str += self.indent + "if "
-            else:
-                cls_str += self.indent + "elif "
-            cls_str += "performative_id == {}Message.Performative.{}:\n".format(
-                self.protocol_specification_in_camel_case, performative.upper()
-            )
-            self._change_indent(1)
-            cls_str += (
-                self.indent
-                + "performative = {}_pb2.{}Message.{}_Performative()  # type: ignore\n".format(
-                    self.protocol_specification.name,
-                    self.protocol_specification_in_camel_case,
-                    performative.title(),
-                )
-            )
-            for content_name, content_type in contents.items():
-                cls_str += self._encoding_message_content_from_python_to_protobuf(
-                    content_name, content_type
-                )
-            cls_str += self.indent + "{}_msg.{}.CopyFrom(performative)\n".format(
-                self.protocol_specification.name, performative
-            )
-
-            counter += 1
-            self._change_indent(-1)
-        cls_str += self.indent + "else:\n"
+        cls_str += self.indent + "try:\n"
+        self._change_indent(1)
+        cls_str += self.indent + "encoder = _ENCODERS[performative_id.value]\n"
+        self._change_indent(-1)
+        cls_str += self.indent + "except (AttributeError, KeyError):\n"
         self._change_indent(1)
         cls_str += (
             self.indent
-            + 'raise ValueError("Performative not valid: {}".format(performative_id))\n\n'
+            + 'raise ValueError("Performative not valid: {}".format(performative_id))\n'
         )
         self._change_indent(-1)
+        cls_str += self.indent + "encoder(msg, {}_msg)\n\n".format(
+            self.protocol_specification.name
+        )
 
         cls_str += self.indent + "{}_bytes = {}_msg.SerializeToString()\n".format(
             self.protocol_specification.name, self.protocol_specification.name
@@ -1676,41 +1944,20 @@ class ProtocolGenerator:
                 self.protocol_specification.name
             )
         )
-        cls_str += (
-            self.indent
-            + "performative_id = {}Message.Performative(str(performative))\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        cls_str += (
-            self.indent + "performative_content = dict()  # type: Dict[str, Any]\n"
-        )
-        counter = 1
-        for performative, contents in self.spec.speech_acts.items():
-            if counter == 1:
-                cls_str += self.indent + "if "
-            else:
-                cls_str += self.indent + "elif "
-            cls_str += "performative_id == {}Message.Performative.{}:\n".format(
-                self.protocol_specification_in_camel_case, performative.upper()
-            )
-            self._change_indent(1)
-            if len(contents.keys()) == 0:
-                cls_str += self.indent + "pass\n"
-            else:
-                for content_name, content_type in contents.items():
-                    cls_str += self._decoding_message_content_from_protobuf_to_python(
-                        performative, content_name, content_type
-                    )
-            counter += 1
-            self._change_indent(-1)
-        cls_str += self.indent + "else:\n"
+        cls_str += self.indent + "try:\n"
+        self._change_indent(1)
+        cls_str += self.indent + "decoder = _DECODERS[performative]\n"
+        self._change_indent(-1)
+        cls_str += self.indent + "except KeyError:\n"
         self._change_indent(1)
         cls_str += (
             self.indent
-            + 'raise ValueError("Performative not valid: {}.".format(performative_id))\n\n'
+            + 'raise ValueError("Performative not valid: {}.".format(performative))\n'
         )
         self._change_indent(-1)
+        cls_str += self.indent + "performative_content = decoder({}_pb)\n\n".format(
+            self.protocol_specification.name
+        )
 
         cls_str += self.indent + "return {}Message(\n".format(
             self.protocol_specification_in_camel_case,
@@ -38,6 +38,7 @@ SPECIFICATION_COMPOSITIONAL_TYPES = [
 ]
 
 MESSAGE_IMPORT = "from aea.protocols.base import Message"
+SLOTTED_MESSAGE_IMPORT = "from aea.protocols.base import SlottedMessage"
 SERIALIZER_IMPORT = "from aea.protocols.base import Serializer"
 
 PATH_TO_PACKAGES = "packages"
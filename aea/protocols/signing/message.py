@@ -21,10 +21,10 @@
 
 import logging
 from enum import Enum
-from typing import Dict, Set, Tuple, cast
+from typing import Dict, Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 from aea.protocols.signing.custom_types import ErrorCode as CustomErrorCode
 from aea.protocols.signing.custom_types import RawMessage as CustomRawMessage
 from aea.protocols.signing.custom_types import RawTransaction as CustomRawTransaction
@@ -39,7 +39,7 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.signing.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class SigningMessage(Message):
+class SigningMessage(SlottedMessage):
     """A protocol for communication between skills and decision maker."""
 
     protocol_id = ProtocolId("fetchai", "signing", "0.1.0")
@@ -69,6 +69,42 @@ class SigningMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_error_code",
+        "_raw_message",
+        "_raw_transaction",
+        "_signed_message",
+        "_signed_transaction",
+        "_skill_callback_ids",
+        "_skill_callback_info",
+        "_terms",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _error_code: CustomErrorCode
+    _raw_message: CustomRawMessage
+    _raw_transaction: CustomRawTransaction
+    _signed_message: CustomSignedMessage
+    _signed_transaction: CustomSignedTransaction
+    _skill_callback_ids: Tuple[str, ...]
+    _skill_callback_info: Dict[str, str]
+    _terms: CustomTerms
+
+    _performatives = {
+        "error",
+        "sign_message",
+        "sign_transaction",
+        "signed_message",
+        "signed_transaction",
+    }
+
     def __init__(
         self,
         performative: Performative,
@@ -85,20 +121,11 @@ class SigningMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=SigningMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {
-            "error",
-            "sign_message",
-            "sign_transaction",
-            "signed_message",
-            "signed_transaction",
-        }
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = SigningMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -108,80 +135,98 @@ class SigningMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(SigningMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def error_code(self) -> CustomErrorCode:
         """Get the 'error_code' content from the message."""
-        assert self.is_set("error_code"), "'error_code' content is not set."
-        return cast(CustomErrorCode, self.get("error_code"))
+        try:
+            return self._error_code
+        except AttributeError:
+            raise AssertionError("'error_code' content is not set.")
 
     @property
     def raw_message(self) -> CustomRawMessage:
         """Get the 'raw_message' content from the message."""
-        assert self.is_set("raw_message"), "'raw_message' content is not set."
-        return cast(CustomRawMessage, self.get("raw_message"))
+        try:
+            return self._raw_message
+        except AttributeError:
+            raise AssertionError("'raw_message' content is not set.")
 
     @property
     def raw_transaction(self) -> CustomRawTransaction:
         """Get the 'raw_transaction' content from the message."""
-        assert self.is_set("raw_transaction"), "'raw_transaction' content is not set."
-        return cast(CustomRawTransaction, self.get("raw_transaction"))
+        try:
+            return self._raw_transaction
+        except AttributeError:
+            raise AssertionError("'raw_transaction' content is not set.")
 
     @property
     def signed_message(self) -> CustomSignedMessage:
         """Get the 'signed_message' content from the message."""
-        assert self.is_set("signed_message"), "'signed_message' content is not set."
-        return cast(CustomSignedMessage, self.get("signed_message"))
+        try:
+            return self._signed_message
+        except AttributeError:
+            raise AssertionError("'signed_message' content is not set.")
 
     @property
     def signed_transaction(self) -> CustomSignedTransaction:
         """Get the 'signed_transaction' content from the message."""
-        assert self.is_set(
-            "signed_transaction"
-        ), "'signed_transaction' content is not set."
-        return cast(CustomSignedTransaction, self.get("signed_transaction"))
+        try:
+            return self._signed_transaction
+        except AttributeError:
+            raise AssertionError("'signed_transaction' content is not set.")
 
     @property
     def skill_callback_ids(self) -> Tuple[str, ...]:
         """Get the 'skill_callback_ids' content from the message."""
-        assert self.is_set(
-            "skill_callback_ids"
-        ), "'skill_callback_ids' content is not set."
-        return cast(Tuple[str, ...], self.get("skill_callback_ids"))
+        try:
+            return self._skill_callback_ids
+        except AttributeError:
+            raise AssertionError("'skill_callback_ids' content is not set.")
 
     @property
     def skill_callback_info(self) -> Dict[str, str]:
         """Get the 'skill_callback_info' content from the message."""
-        assert self.is_set(
-            "skill_callback_info"
-        ), "'skill_callback_info' content is not set."
-        return cast(Dict[str, str], self.get("skill_callback_info"))
+        try:
+            return self._skill_callback_info
+        except AttributeError:
+            raise AssertionError("'skill_callback_info' content is not set.")
 
     @property
     def terms(self) -> CustomTerms:
         """Get the 'terms' content from the message."""
-        assert self.is_set("terms"), "'terms' content is not set."
-        return cast(CustomTerms, self.get("terms"))
+        try:
+            return self._terms
+        except AttributeError:
+            raise AssertionError("'terms' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the signing protocol."""
@@ -221,7 +266,7 @@ class SigningMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == SigningMessage.Performative.SIGN_TRANSACTION:
                 expected_nb_of_contents = 4
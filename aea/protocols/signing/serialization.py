@@ -19,7 +19,7 @@
 
 """Serialization module for signing protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -33,6 +33,168 @@ from aea.protocols.signing.custom_types import Terms
 from aea.protocols.signing.message import SigningMessage
 
 
+def _encode_sign_transaction(msg: SigningMessage, signing_msg: Any) -> None:
+    """Encode the contents of the 'sign_transaction' performative."""
+    performative = signing_msg.sign_transaction
+    performative.SetInParent()
+    skill_callback_ids = msg.skill_callback_ids
+    performative.skill_callback_ids.extend(skill_callback_ids)
+    skill_callback_info = msg.skill_callback_info
+    performative.skill_callback_info.update(skill_callback_info)
+    terms = msg.terms
+    Terms.encode(performative.terms, terms)
+    raw_transaction = msg.raw_transaction
+    RawTransaction.encode(performative.raw_transaction, raw_transaction)
+
+
+def _encode_sign_message(msg: SigningMessage, signing_msg: Any) -> None:
+    """Encode the contents of the 'sign_message' performative."""
+    performative = signing_msg.sign_message
+    performative.SetInParent()
+    skill_callback_ids = msg.skill_callback_ids
+    performative.skill_callback_ids.extend(skill_callback_ids)
+    skill_callback_info = msg.skill_callback_info
+    performative.skill_callback_info.update(skill_callback_info)
+    terms = msg.terms
+    Terms.encode(performative.terms, terms)
+    raw_message = msg.raw_message
+    RawMessage.encode(performative.raw_message, raw_message)
+
+
+def _encode_signed_transaction(msg: SigningMessage, signing_msg: Any) -> None:
+    """Encode the contents of the 'signed_transaction' performative."""
+    performative = signing_msg.signed_transaction
+    performative.SetInParent()
+    skill_callback_ids = msg.skill_callback_ids
+    performative.skill_callback_ids.extend(skill_callback_ids)
+    skill_callback_info = msg.skill_callback_info
+    performative.skill_callback_info.update(skill_callback_info)
+    signed_transaction = msg.signed_transaction
+    SignedTransaction.encode(performative.signed_transaction, signed_transaction)
+
+
+def _encode_signed_message(msg: SigningMessage, signing_msg: Any) -> None:
+    """Encode the contents of the 'signed_message' performative."""
+    performative = signing_msg.signed_message
+    performative.SetInParent()
+    skill_callback_ids = msg.skill_callback_ids
+    performative.skill_callback_ids.extend(skill_callback_ids)
+    skill_callback_info = msg.skill_callback_info
+    performative.skill_callback_info.update(skill_callback_info)
+    signed_message = msg.signed_message
+    SignedMessage.encode(performative.signed_message, signed_message)
+
+
+def _encode_error(msg: SigningMessage, signing_msg: Any) -> None:
+    """Encode the contents of the 'error' performative."""
+    performative = signing_msg.error
+    performative.SetInParent()
+    skill_callback_ids = msg.skill_callback_ids
+    performative.skill_callback_ids.extend(skill_callback_ids)
+    skill_callback_info = msg.skill_callback_info
+    performative.skill_callback_info.update(skill_callback_info)
+    error_code = msg.error_code
+    ErrorCode.encode(performative.error_code, error_code)
+
+
+def _decode_sign_transaction(signing_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'sign_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    skill_callback_ids = signing_pb.sign_transaction.skill_callback_ids
+    skill_callback_ids_tuple = tuple(skill_callback_ids)
+    performative_content["skill_callback_ids"] = skill_callback_ids_tuple
+    skill_callback_info = signing_pb.sign_transaction.skill_callback_info
+    skill_callback_info_dict = dict(skill_callback_info)
+    performative_content["skill_callback_info"] = skill_callback_info_dict
+    pb2_terms = signing_pb.sign_transaction.terms
+    terms = Terms.decode(pb2_terms)
+    performative_content["terms"] = terms
+    pb2_raw_transaction = signing_pb.sign_transaction.raw_transaction
+    raw_transaction = RawTransaction.decode(pb2_raw_transaction)
+    performative_content["raw_transaction"] = raw_transaction
+    return performative_content
+
+
+def _decode_sign_message(signing_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'sign_message' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    skill_callback_ids = signing_pb.sign_message.skill_callback_ids
+    skill_callback_ids_tuple = tuple(skill_callback_ids)
+    performative_content["skill_callback_ids"] = skill_callback_ids_tuple
+    skill_callback_info = signing_pb.sign_message.skill_callback_info
+    skill_callback_info_dict = dict(skill_callback_info)
+    performative_content["skill_callback_info"] = skill_callback_info_dict
+    pb2_terms = signing_pb.sign_message.terms
+    terms = Terms.decode(pb2_terms)
+    performative_content["terms"] = terms
+    pb2_raw_message = signing_pb.sign_message.raw_message
+    raw_message = RawMessage.decode(pb2_raw_message)
+    performative_content["raw_message"] = raw_message
+    return performative_content
+
+
+def _decode_signed_transaction(signing_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'signed_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    skill_callback_ids = signing_pb.signed_transaction.skill_callback_ids
+    skill_callback_ids_tuple = tuple(skill_callback_ids)
+    performative_content["skill_callback_ids"] = skill_callback_ids_tuple
+    skill_callback_info = signing_pb.signed_transaction.skill_callback_info
+    skill_callback_info_dict = dict(skill_callback_info)
+    performative_content["skill_callback_info"] = skill_callback_info_dict
+    pb2_signed_transaction = signing_pb.signed_transaction.signed_transaction
+    signed_transaction = SignedTransaction.decode(pb2_signed_transaction)
+    performative_content["signed_transaction"] = signed_transaction
+    return performative_content
+
+
+def _decode_signed_message(signing_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'signed_message' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    skill_callback_ids = signing_pb.signed_message.skill_callback_ids
+    skill_callback_ids_tuple = tuple(skill_callback_ids)
+    performative_content["skill_callback_ids"] = skill_callback_ids_tuple
+    skill_callback_info = signing_pb.signed_message.skill_callback_info
+    skill_callback_info_dict = dict(skill_callback_info)
+    performative_content["skill_callback_info"] = skill_callback_info_dict
+    pb2_signed_message = signing_pb.signed_message.signed_message
+    signed_message = SignedMessage.decode(pb2_signed_message)
+    performative_content["signed_message"] = signed_message
+    return performative_content
+
+
+def _decode_error(signing_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'error' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    skill_callback_ids = signing_pb.error.skill_callback_ids
+    skill_callback_ids_tuple = tuple(skill_callback_ids)
+    performative_content["skill_callback_ids"] = skill_callback_ids_tuple
+    skill_callback_info = signing_pb.error.skill_callback_info
+    skill_callback_info_dict = dict(skill_callback_info)
+    performative_content["skill_callback_info"] = skill_callback_info_dict
+    pb2_error_code = signing_pb.error.error_code
+    error_code = ErrorCode.decode(pb2_error_code)
+    performative_content["error_code"] = error_code
+    return performative_content
+
+
+_ENCODERS = {
+    "sign_transaction": _encode_sign_transaction,
+    "sign_message": _encode_sign_message,
+    "signed_transaction": _encode_signed_transaction,
+    "signed_message": _encode_signed_message,
+    "error": _encode_error,
+}  # type: Dict[str, Callable[[SigningMessage, Any], None]]
+
+_DECODERS = {
+    "sign_transaction": _decode_sign_transaction,
+    "sign_message": _decode_sign_message,
+    "signed_transaction": _decode_signed_transaction,
+    "signed_message": _decode_signed_message,
+    "error": _decode_error,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class SigningSerializer(Serializer):
     """Serialization for the 'signing' protocol."""
 
@@ -53,59 +215,11 @@ class SigningSerializer(Serializer):
         signing_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == SigningMessage.Performative.SIGN_TRANSACTION:
-            performative = signing_pb2.SigningMessage.Sign_Transaction_Performative()  # type: ignore
-            skill_callback_ids = msg.skill_callback_ids
-            performative.skill_callback_ids.extend(skill_callback_ids)
-            skill_callback_info = msg.skill_callback_info
-            performative.skill_callback_info.update(skill_callback_info)
-            terms = msg.terms
-            Terms.encode(performative.terms, terms)
-            raw_transaction = msg.raw_transaction
-            RawTransaction.encode(performative.raw_transaction, raw_transaction)
-            signing_msg.sign_transaction.CopyFrom(performative)
-        elif performative_id == SigningMessage.Performative.SIGN_MESSAGE:
-            performative = signing_pb2.SigningMessage.Sign_Message_Performative()  # type: ignore
-            skill_callback_ids = msg.skill_callback_ids
-            performative.skill_callback_ids.extend(skill_callback_ids)
-            skill_callback_info = msg.skill_callback_info
-            performative.skill_callback_info.update(skill_callback_info)
-            terms = msg.terms
-            Terms.encode(performative.terms, terms)
-            raw_message = msg.raw_message
-            RawMessage.encode(performative.raw_message, raw_message)
-            signing_msg.sign_message.CopyFrom(performative)
-        elif performative_id == SigningMessage.Performative.SIGNED_TRANSACTION:
-            performative = signing_pb2.SigningMessage.Signed_Transaction_Performative()  # type: ignore
-            skill_callback_ids = msg.skill_callback_ids
-            performative.skill_callback_ids.extend(skill_callback_ids)
-            skill_callback_info = msg.skill_callback_info
-            performative.skill_callback_info.update(skill_callback_info)
-            signed_transaction = msg.signed_transaction
-            SignedTransaction.encode(
-                performative.signed_transaction, signed_transaction
-            )
-            signing_msg.signed_transaction.CopyFrom(performative)
-        elif performative_id == SigningMessage.Performative.SIGNED_MESSAGE:
-            performative = signing_pb2.SigningMessage.Signed_Message_Performative()  # type: ignore
-            skill_callback_ids = msg.skill_callback_ids
-            performative.skill_callback_ids.extend(skill_callback_ids)
-            skill_callback_info = msg.skill_callback_info
-            performative.skill_callback_info.update(skill_callback_info)
-            signed_message = msg.signed_message
-            SignedMessage.encode(performative.signed_message, signed_message)
-            signing_msg.signed_message.CopyFrom(performative)
-        elif performative_id == SigningMessage.Performative.ERROR:
-            performative = signing_pb2.SigningMessage.Error_Performative()  # type: ignore
-            skill_callback_ids = msg.skill_callback_ids
-            performative.skill_callback_ids.extend(skill_callback_ids)
-            skill_callback_info = msg.skill_callback_info
-            performative.skill_callback_info.update(skill_callback_info)
-            error_code = msg.error_code
-            ErrorCode.encode(performative.error_code, error_code)
-            signing_msg.error.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, signing_msg)
 
         signing_bytes = signing_msg.SerializeToString()
         return signing_bytes
@@ -128,66 +242,11 @@ class SigningSerializer(Serializer):
         target = signing_pb.target
 
         performative = signing_pb.WhichOneof("performative")
-        performative_id = SigningMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == SigningMessage.Performative.SIGN_TRANSACTION:
-            skill_callback_ids = signing_pb.sign_transaction.skill_callback_ids
-            skill_callback_ids_tuple = tuple(skill_callback_ids)
-            performative_content["skill_callback_ids"] = skill_callback_ids_tuple
-            skill_callback_info = signing_pb.sign_transaction.skill_callback_info
-            skill_callback_info_dict = dict(skill_callback_info)
-            performative_content["skill_callback_info"] = skill_callback_info_dict
-            pb2_terms = signing_pb.sign_transaction.terms
-            terms = Terms.decode(pb2_terms)
-            performative_content["terms"] = terms
-            pb2_raw_transaction = signing_pb.sign_transaction.raw_transaction
-            raw_transaction = RawTransaction.decode(pb2_raw_transaction)
-            performative_content["raw_transaction"] = raw_transaction
-        elif performative_id == SigningMessage.Performative.SIGN_MESSAGE:
-            skill_callback_ids = signing_pb.sign_message.skill_callback_ids
-            skill_callback_ids_tuple = tuple(skill_callback_ids)
-            performative_content["skill_callback_ids"] = skill_callback_ids_tuple
-            skill_callback_info = signing_pb.sign_message.skill_callback_info
-            skill_callback_info_dict = dict(skill_callback_info)
-            performative_content["skill_callback_info"] = skill_callback_info_dict
-            pb2_terms = signing_pb.sign_message.terms
-            terms = Terms.decode(pb2_terms)
-            performative_content["terms"] = terms
-            pb2_raw_message = signing_pb.sign_message.raw_message
-            raw_message = RawMessage.decode(pb2_raw_message)
-            performative_content["raw_message"] = raw_message
-        elif performative_id == SigningMessage.Performative.SIGNED_TRANSACTION:
-            skill_callback_ids = signing_pb.signed_transaction.skill_callback_ids
-            skill_callback_ids_tuple = tuple(skill_callback_ids)
-            performative_content["skill_callback_ids"] = skill_callback_ids_tuple
-            skill_callback_info = signing_pb.signed_transaction.skill_callback_info
-            skill_callback_info_dict = dict(skill_callback_info)
-            performative_content["skill_callback_info"] = skill_callback_info_dict
-            pb2_signed_transaction = signing_pb.signed_transaction.signed_transaction
-            signed_transaction = SignedTransaction.decode(pb2_signed_transaction)
-            performative_content["signed_transaction"] = signed_transaction
-        elif performative_id == SigningMessage.Performative.SIGNED_MESSAGE:
-            skill_callback_ids = signing_pb.signed_message.skill_callback_ids
-            skill_callback_ids_tuple = tuple(skill_callback_ids)
-            performative_content["skill_callback_ids"] = skill_callback_ids_tuple
-            skill_callback_info = signing_pb.signed_message.skill_callback_info
-            skill_callback_info_dict = dict(skill_callback_info)
-            performative_content["skill_callback_info"] = skill_callback_info_dict
-            pb2_signed_message = signing_pb.signed_message.signed_message
-            signed_message = SignedMessage.decode(pb2_signed_message)
-            performative_content["signed_message"] = signed_message
-        elif performative_id == SigningMessage.Performative.ERROR:
-            skill_callback_ids = signing_pb.error.skill_callback_ids
-            skill_callback_ids_tuple = tuple(skill_callback_ids)
-            performative_content["skill_callback_ids"] = skill_callback_ids_tuple
-            skill_callback_info = signing_pb.error.skill_callback_info
-            skill_callback_info_dict = dict(skill_callback_info)
-            performative_content["skill_callback_info"] = skill_callback_info_dict
-            pb2_error_code = signing_pb.error.error_code
-            error_code = ErrorCode.decode(pb2_error_code)
-            performative_content["error_code"] = error_code
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(signing_pb)
 
         return SigningMessage(
             message_id=message_id,
@@ -21,17 +21,17 @@
 
 import logging
 from enum import Enum
-from typing import Dict, Set, Tuple, cast
+from typing import Dict, Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
-logger = logging.getLogger("aea.packages.fetchai.protocols.state_update.message")
+logger = logging.getLogger("aea.protocols.state_update.message")
 
 DEFAULT_BODY_SIZE = 4
 
 
-class StateUpdateMessage(Message):
+class StateUpdateMessage(SlottedMessage):
     """A protocol for state updates to the decision maker state."""
 
     protocol_id = ProtocolId("fetchai", "state_update", "0.1.0")
@@ -46,6 +46,28 @@ class StateUpdateMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_amount_by_currency_id",
+        "_exchange_params_by_currency_id",
+        "_quantities_by_good_id",
+        "_utility_params_by_good_id",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _amount_by_currency_id: Dict[str, int]
+    _exchange_params_by_currency_id: Dict[str, float]
+    _quantities_by_good_id: Dict[str, int]
+    _utility_params_by_good_id: Dict[str, float]
+
+    _performatives = {"apply", "initialize"}
+
     def __init__(
         self,
         performative: Performative,
@@ -62,14 +84,11 @@ class StateUpdateMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=StateUpdateMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {"apply", "initialize"}
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = StateUpdateMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -79,58 +98,66 @@ class StateUpdateMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(StateUpdateMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def amount_by_currency_id(self) -> Dict[str, int]:
         """Get the 'amount_by_currency_id' content from the message."""
-        assert self.is_set(
-            "amount_by_currency_id"
-        ), "'amount_by_currency_id' content is not set."
-        return cast(Dict[str, int], self.get("amount_by_currency_id"))
+        try:
+            return self._amount_by_currency_id
+        except AttributeError:
+            raise AssertionError("'amount_by_currency_id' content is not set.")
 
     @property
     def exchange_params_by_currency_id(self) -> Dict[str, float]:
         """Get the 'exchange_params_by_currency_id' content from the message."""
-        assert self.is_set(
-            "exchange_params_by_currency_id"
-        ), "'exchange_params_by_currency_id' content is not set."
-        return cast(Dict[str, float], self.get("exchange_params_by_currency_id"))
+        try:
+            return self._exchange_params_by_currency_id
+        except AttributeError:
+            raise AssertionError("'exchange_params_by_currency_id' content is not set.")
 
     @property
     def quantities_by_good_id(self) -> Dict[str, int]:
         """Get the 'quantities_by_good_id' content from the message."""
-        assert self.is_set(
-            "quantities_by_good_id"
-        ), "'quantities_by_good_id' content is not set."
-        return cast(Dict[str, int], self.get("quantities_by_good_id"))
+        try:
+            return self._quantities_by_good_id
+        except AttributeError:
+            raise AssertionError("'quantities_by_good_id' content is not set.")
 
     @property
     def utility_params_by_good_id(self) -> Dict[str, float]:
         """Get the 'utility_params_by_good_id' content from the message."""
-        assert self.is_set(
-            "utility_params_by_good_id"
-        ), "'utility_params_by_good_id' content is not set."
-        return cast(Dict[str, float], self.get("utility_params_by_good_id"))
+        try:
+            return self._utility_params_by_good_id
+        except AttributeError:
+            raise AssertionError("'utility_params_by_good_id' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the state_update protocol."""
@@ -170,7 +197,7 @@ class StateUpdateMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == StateUpdateMessage.Performative.INITIALIZE:
                 expected_nb_of_contents = 4
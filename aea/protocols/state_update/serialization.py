@@ -19,7 +19,7 @@
 
 """Serialization module for state_update protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -27,6 +27,75 @@ from aea.protocols.state_update import state_update_pb2
 from aea.protocols.state_update.message import StateUpdateMessage
 
 
+def _encode_initialize(msg: StateUpdateMessage, state_update_msg: Any) -> None:
+    """Encode the contents of the 'initialize' performative."""
+    performative = state_update_msg.initialize
+    performative.SetInParent()
+    exchange_params_by_currency_id = msg.exchange_params_by_currency_id
+    performative.exchange_params_by_currency_id.update(exchange_params_by_currency_id)
+    utility_params_by_good_id = msg.utility_params_by_good_id
+    performative.utility_params_by_good_id.update(utility_params_by_good_id)
+    amount_by_currency_id = msg.amount_by_currency_id
+    performative.amount_by_currency_id.update(amount_by_currency_id)
+    quantities_by_good_id = msg.quantities_by_good_id
+    performative.quantities_by_good_id.update(quantities_by_good_id)
+
+
+def _encode_apply(msg: StateUpdateMessage, state_update_msg: Any) -> None:
+    """Encode the contents of the 'apply' performative."""
+    performative = state_update_msg.apply
+    performative.SetInParent()
+    amount_by_currency_id = msg.amount_by_currency_id
+    performative.amount_by_currency_id.update(amount_by_currency_id)
+    quantities_by_good_id = msg.quantities_by_good_id
+    performative.quantities_by_good_id.update(quantities_by_good_id)
+
+
+def _decode_initialize(state_update_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'initialize' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    exchange_params_by_currency_id = (
+        state_update_pb.initialize.exchange_params_by_currency_id
+    )
+    exchange_params_by_currency_id_dict = dict(exchange_params_by_currency_id)
+    performative_content[
+        "exchange_params_by_currency_id"
+    ] = exchange_params_by_currency_id_dict
+    utility_params_by_good_id = state_update_pb.initialize.utility_params_by_good_id
+    utility_params_by_good_id_dict = dict(utility_params_by_good_id)
+    performative_content["utility_params_by_good_id"] = utility_params_by_good_id_dict
+    amount_by_currency_id = state_update_pb.initialize.amount_by_currency_id
+    amount_by_currency_id_dict = dict(amount_by_currency_id)
+    performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
+    quantities_by_good_id = state_update_pb.initialize.quantities_by_good_id
+    quantities_by_good_id_dict = dict(quantities_by_good_id)
+    performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
+    return performative_content
+
+
+def _decode_apply(state_update_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'apply' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    amount_by_currency_id = state_update_pb.apply.amount_by_currency_id
+    amount_by_currency_id_dict = dict(amount_by_currency_id)
+    performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
+    quantities_by_good_id = state_update_pb.apply.quantities_by_good_id
+    quantities_by_good_id_dict = dict(quantities_by_good_id)
+    performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
+    return performative_content
+
+
+_ENCODERS = {
+    "initialize": _encode_initialize,
+    "apply": _encode_apply,
+}  # type: Dict[str, Callable[[StateUpdateMessage, Any], None]]
+
+_DECODERS = {
+    "initialize": _decode_initialize,
+    "apply": _decode_apply,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class StateUpdateSerializer(Serializer):
     """Serialization for the 'state_update' protocol."""
 
@@ -47,28 +116,11 @@ class StateUpdateSerializer(Serializer):
         state_update_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == StateUpdateMessage.Performative.INITIALIZE:
-            performative = state_update_pb2.StateUpdateMessage.Initialize_Performative()  # type: ignore
-            exchange_params_by_currency_id = msg.exchange_params_by_currency_id
-            performative.exchange_params_by_currency_id.update(
-                exchange_params_by_currency_id
-            )
-            utility_params_by_good_id = msg.utility_params_by_good_id
-            performative.utility_params_by_good_id.update(utility_params_by_good_id)
-            amount_by_currency_id = msg.amount_by_currency_id
-            performative.amount_by_currency_id.update(amount_by_currency_id)
-            quantities_by_good_id = msg.quantities_by_good_id
-            performative.quantities_by_good_id.update(quantities_by_good_id)
-            state_update_msg.initialize.CopyFrom(performative)
-        elif performative_id == StateUpdateMessage.Performative.APPLY:
-            performative = state_update_pb2.StateUpdateMessage.Apply_Performative()  # type: ignore
-            amount_by_currency_id = msg.amount_by_currency_id
-            performative.amount_by_currency_id.update(amount_by_currency_id)
-            quantities_by_good_id = msg.quantities_by_good_id
-            performative.quantities_by_good_id.update(quantities_by_good_id)
-            state_update_msg.apply.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, state_update_msg)
 
         state_update_bytes = state_update_msg.SerializeToString()
         return state_update_bytes
@@ -91,38 +143,11 @@ class StateUpdateSerializer(Serializer):
         target = state_update_pb.target
 
         performative = state_update_pb.WhichOneof("performative")
-        performative_id = StateUpdateMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == StateUpdateMessage.Performative.INITIALIZE:
-            exchange_params_by_currency_id = (
-                state_update_pb.initialize.exchange_params_by_currency_id
-            )
-            exchange_params_by_currency_id_dict = dict(exchange_params_by_currency_id)
-            performative_content[
-                "exchange_params_by_currency_id"
-            ] = exchange_params_by_currency_id_dict
-            utility_params_by_good_id = (
-                state_update_pb.initialize.utility_params_by_good_id
-            )
-            utility_params_by_good_id_dict = dict(utility_params_by_good_id)
-            performative_content[
-                "utility_params_by_good_id"
-            ] = utility_params_by_good_id_dict
-            amount_by_currency_id = state_update_pb.initialize.amount_by_currency_id
-            amount_by_currency_id_dict = dict(amount_by_currency_id)
-            performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
-            quantities_by_good_id = state_update_pb.initialize.quantities_by_good_id
-            quantities_by_good_id_dict = dict(quantities_by_good_id)
-            performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
-        elif performative_id == StateUpdateMessage.Performative.APPLY:
-            amount_by_currency_id = state_update_pb.apply.amount_by_currency_id
-            amount_by_currency_id_dict = dict(amount_by_currency_id)
-            performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
-            quantities_by_good_id = state_update_pb.apply.quantities_by_good_id
-            quantities_by_good_id_dict = dict(quantities_by_good_id)
-            performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(state_update_pb)
 
         return StateUpdateMessage(
             message_id=message_id,
@@ -18,17 +18,28 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the classes for tasks."""
+import asyncio
 import logging
 import signal
+import sys
 import threading
 from abc import abstractmethod
+from asyncio import AbstractEventLoop
 from multiprocessing.pool import AsyncResult, Pool
-from typing import Any, Callable, Dict, Optional, Sequence, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
 
 from aea.helpers.logging import WithLogger
 
+try:
+    from multiprocessing.resource_tracker import unregister  # type: ignore
+    from multiprocessing.shared_memory import SharedMemory  # type: ignore
+except ImportError:  # pragma: nocover  # python < 3.8
+    SharedMemory = None
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
 
 class Task:
     """This class implements an abstract task."""
@@ -122,25 +133,131 @@ def init_worker() -> None:
     # signal.signal(signal.CTRL_C_EVENT, signal.SIG_IGN)
 
 
+class SharedArgument:
+    """
+    A bytes or numpy array argument of a task, passed to the worker through shared memory.
+
+    Only the name of the shared memory block and the layout of the data are pickled.
+    """
+
+    __slots__ = ("name", "size", "dtype", "shape")
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        dtype: Optional[str] = None,
+        shape: Optional[Tuple[int, ...]] = None,
+    ):
+        """
+        Initialize the shared argument.
+
+        :param name: the name of the shared memory block.
+        :param size: the size of the data in bytes.
+        :param dtype: the numpy data type, or None for a bytes argument.
+        :param shape: the shape of the numpy array, or None for a bytes argument.
+        """
+        self.name = name
+        self.size = size
+        self.dtype = dtype
+        self.shape = shape
+
+    def __getstate__(self) -> Tuple:
+        """Get the state for pickling."""
+        return self.name, self.size, self.dtype, self.shape
+
+    def __setstate__(self, state: Tuple) -> None:
+        """Set the state from unpickling."""
+        self.name, self.size, self.dtype, self.shape = state
+
+    def load(self, block: Any) -> Any:
+        """
+        Get the argument from the shared memory block.
+
+        Bytes are copied, numpy arrays are views on the block.
+
+        :param block: the shared memory block, attached.
+        :return: the argument.
+        """
+        if self.dtype is None:
+            return bytes(block.buf[: self.size])
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=block.buf)
+
+
+def _run_with_shared_arguments(
+    func: Callable, args: Sequence, kwds: Dict[str, Any]
+) -> Any:
+    """
+    Run a task in a worker, loading its shared arguments.
+
+    :param func: the task.
+    :param args: the positional arguments, some of them shared.
+    :param kwds: the keyword arguments, some of them shared.
+    :return: the result of the task.
+    """
+    blocks = []  # type: List[Any]
+
+    def _load(arg: Any) -> Any:
+        if not isinstance(arg, SharedArgument):
+            return arg
+        block = SharedMemory(name=arg.name)
+        # the block is owned (and unlinked) by the task manager.
+        unregister(block._name, "shared_memory")  # pylint: disable=protected-access
+        blocks.append(block)
+        return arg.load(block)
+
+    try:
+        return func(
+            *[_load(arg) for arg in args],
+            **{key: _load(value) for key, value in kwds.items()},
+        )
+    finally:
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                # a view on the block is still alive: the block is closed when collected.
+                pass
+
+
 class TaskManager(WithLogger):
-    """A Task manager."""
+    """
+    A Task manager.
+
+    The result of a task enqueued with 'enqueue_task' is kept until it is discarded
+    with 'discard_task_result'. The result of a task enqueued with 'enqueue_task_future'
+    is not kept: it is handed over to the future when the task is done.
+    """
 
-    def __init__(self, nb_workers: int = 1, is_lazy_pool_start: bool = True):
+    def __init__(
+        self,
+        nb_workers: int = 1,
+        is_lazy_pool_start: bool = True,
+        shared_memory_threshold: Optional[int] = DEFAULT_SHARED_MEMORY_THRESHOLD,
+    ):
         """
         Initialize the task manager.
 
         :param nb_workers: the number of worker processes.
         :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
+        :param shared_memory_threshold: the size in bytes from which bytes and numpy array arguments
+            are passed through shared memory instead of being pickled. If None, they are always pickled.
         """
         WithLogger.__init__(self, logger)
         self._nb_workers = nb_workers
         self._is_lazy_pool_start = is_lazy_pool_start
+        self._shared_memory_threshold = (
+            shared_memory_threshold if SharedMemory is not None else None
+        )
         self._pool = None  # type: Optional[Pool]
         self._stopped = True
         self._lock = threading.Lock()
 
         self._task_enqueued_counter = 0
         self._results_by_task_id = {}  # type: Dict[int, Any]
+        self._shared_blocks_by_task_id = {}  # type: Dict[int, List[Any]]
 
     @property
     def is_started(self) -> bool:
@@ -173,25 +290,59 @@ class TaskManager(WithLogger):
         :raises ValueError: if the task manager is not running.
         """
         with self._lock:
-            if self._stopped:
-                raise ValueError("Task manager not running.")
+            task_id, async_result = self._apply_async(func, args, kwds)
+            self._results_by_task_id[task_id] = async_result
+            return task_id
 
-            if not self._pool and self._is_lazy_pool_start:
-                self._start_pool()
+    def enqueue_task_future(
+        self,
+        func: Callable,
+        args: Sequence = (),
+        kwds: Optional[Dict[str, Any]] = None,
+        loop: Optional[AbstractEventLoop] = None,
+    ) -> asyncio.Future:
+        """
+        Enqueue a task with the executor, and get a future of its result.
 
-            self._pool = cast(Pool, self._pool)
-            task_id = self._task_enqueued_counter
-            self._task_enqueued_counter += 1
-            async_result = self._pool.apply_async(
-                func, args=args, kwds=kwds if kwds is not None else {}
+        The future is resolved on the event loop as soon as the task is done,
+        so its result can be awaited, or handled with a done callback, without polling.
+
+        :param func: the callable instance to be enqueued
+        :param args: the positional arguments to be passed to the function.
+        :param kwds: the keyword arguments to be passed to the function.
+        :param loop: the event loop of the future. If None, the current event loop (e.g. the agent loop, from a skill).
+        :return: the future of the result.
+        :raises ValueError: if the task manager is not running.
+        """
+        loop = loop if loop is not None else asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def _resolve(set_outcome: Callable, outcome: Any) -> None:
+            def _set_outcome() -> None:
+                if not future.done():
+                    set_outcome(outcome)
+
+            try:
+                loop.call_soon_threadsafe(_set_outcome)  # type: ignore
+            except RuntimeError:  # pragma: nocover
+                self.logger.debug("Event loop closed, task result discarded.")
+
+        with self._lock:
+            self._apply_async(
+                func,
+                args,
+                kwds,
+                callback=lambda result: _resolve(future.set_result, result),
+                error_callback=lambda error: _resolve(future.set_exception, error),
             )
-            self._results_by_task_id[task_id] = async_result
-            return task_id
+        return future
 
     def get_task_result(self, task_id: int) -> AsyncResult:
         """
         Get the result from a task.
 
+        The result is kept by the task manager until it is discarded with 'discard_task_result'.
+
         :return: async result for task_id
         """
         task_result = self._results_by_task_id.get(
@@ -202,6 +353,121 @@ class TaskManager(WithLogger):
 
         return task_result
 
+    def discard_task_result(self, task_id: int) -> None:
+        """
+        Discard the result of a task, e.g. once it has been got.
+
+        The AsyncResult already got with 'get_task_result' can still be used.
+
+        :param task_id: the task id.
+        :return: None
+        """
+        if self._results_by_task_id.pop(task_id, None) is None:
+            raise ValueError("Task id {} not present.".format(task_id))
+
+    def _apply_async(
+        self,
+        func: Callable,
+        args: Sequence,
+        kwds: Optional[Dict[str, Any]],
+        callback: Optional[Callable[[Any], None]] = None,
+        error_callback: Optional[Callable[[BaseException], None]] = None,
+    ) -> Tuple[int, AsyncResult]:
+        """
+        Submit a task to the pool. Must be called with the lock held.
+
+        :param func: the callable instance to be enqueued
+        :param args: the positional arguments to be passed to the function.
+        :param kwds: the keyword arguments to be passed to the function.
+        :param callback: called with the result when the task succeeds, in the result handler thread of the pool.
+        :param error_callback: called with the exception when the task fails, in the result handler thread of the pool.
+        :return: the task id and the async result.
+        :raises ValueError: if the task manager is not running.
+        """
+        if self._stopped:
+            raise ValueError("Task manager not running.")
+
+        if not self._pool and self._is_lazy_pool_start:
+            self._start_pool()
+
+        self._pool = cast(Pool, self._pool)
+        task_id = self._task_enqueued_counter
+        self._task_enqueued_counter += 1
+        kwds = kwds if kwds is not None else {}
+
+        blocks = []  # type: List[Any]
+        if self._shared_memory_threshold is not None:
+            args = [self._share(arg, blocks) for arg in args]
+            kwds = {key: self._share(value, blocks) for key, value in kwds.items()}
+        if blocks:
+            self._shared_blocks_by_task_id[task_id] = blocks
+            callback = self._release_blocks_callback(task_id, callback)
+            error_callback = self._release_blocks_callback(task_id, error_callback)
+            async_result = self._pool.apply_async(
+                _run_with_shared_arguments,
+                args=(func, args, kwds),
+                callback=callback,
+                error_callback=error_callback,
+            )
+        else:
+            async_result = self._pool.apply_async(
+                func,
+                args=args,
+                kwds=kwds,
+                callback=callback,
+                error_callback=error_callback,
+            )
+        return task_id, async_result
+
+    def _share(self, arg: Any, blocks: List[Any]) -> Any:
+        """
+        Copy an argument to shared memory, if it is a large bytes object or numpy array.
+
+        :param arg: the argument.
+        :param blocks: the list where to add the shared memory block.
+        :return: the shared argument, or the argument itself.
+        """
+        # shared memory blocks cannot be empty.
+        threshold = max(cast(int, self._shared_memory_threshold), 1)
+        if isinstance(arg, (bytes, bytearray)):
+            if len(arg) < threshold:
+                return arg
+            block = SharedMemory(create=True, size=len(arg))
+            block.buf[: len(arg)] = arg
+            blocks.append(block)
+            return SharedArgument(block.name, len(arg))
+        # numpy is an optional dependency: if it is not imported, arg is not an array.
+        np = sys.modules.get("numpy")  # type: Any
+        if (
+            np is None
+            or not isinstance(arg, np.ndarray)
+            or arg.nbytes < threshold
+            or arg.dtype.hasobject
+        ):
+            return arg
+        block = SharedMemory(create=True, size=arg.nbytes)
+        np.ndarray(arg.shape, dtype=arg.dtype, buffer=block.buf)[...] = arg
+        blocks.append(block)
+        return SharedArgument(block.name, arg.nbytes, arg.dtype.str, arg.shape)
+
+    def _release_blocks_callback(
+        self, task_id: int, callback: Optional[Callable[[Any], None]]
+    ) -> Callable[[Any], None]:
+        """Wrap a pool callback to release the shared memory blocks of a task first."""
+
+        def _callback(outcome: Any) -> None:
+            self._release_blocks(task_id)
+            if callback is not None:
+                callback(outcome)
+
+        return _callback
+
+    def _release_blocks(self, task_id: int) -> None:
+        """Close and unlink the shared memory blocks of a task."""
+        for block in self._shared_blocks_by_task_id.pop(task_id, []):
+            block.close()
+            block.unlink()
+
     def start(self) -> None:
         """
         Start the task manager.
@@ -258,3 +524,6 @@ class TaskManager(WithLogger):
         self._pool.terminate()
         self._pool.join()
         self._pool = None
+        self._results_by_task_id.clear()
+        for task_id in list(self._shared_blocks_by_task_id):
+            self._release_blocks(task_id)
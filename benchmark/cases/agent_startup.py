@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Startup time of an agent built from an AEA project.
+
+Use `warm=False` to construct the builder from the configuration files (cold start)
+and `warm=True` to construct it from the agent image (see `aea build`).
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from click.testing import CliRunner
+
+from aea.aea_builder import AEABuilder
+from aea.cli import cli
+from aea.configurations.image import AgentImage
+
+ROOT_DIR = Path(__file__).absolute().parent.parent.parent
+
+
+def _fetch_agent(working_dir: Path, public_id: str) -> Path:
+    """
+    Fetch an agent from the local registry.
+
+    :param working_dir: the directory where to fetch the agent.
+    :param public_id: the public id of the agent.
+
+    :return: the path of the AEA project.
+    """
+    os.symlink(str(ROOT_DIR / "packages"), str(working_dir / "packages"))
+    old_cwd = os.getcwd()
+    os.chdir(str(working_dir))
+    try:
+        result = CliRunner().invoke(
+            cli, ["-v", "OFF", "fetch", "--local", public_id], standalone_mode=False
+        )
+        if result.exit_code != 0:
+            raise RuntimeError(
+                "Cannot fetch {}: {}".format(public_id, result.exception)
+            )
+    finally:
+        os.chdir(old_cwd)
+    return working_dir / public_id.split("/")[1].split(":")[0]
+
+
+def agent_startup(
+    benchmark: BenchmarkControl,
+    warm: bool = True,
+    starts: int = 50,
+    agent: str = "fetchai/tac_participant:0.5.0",
+) -> None:
+    """
+    Construct the builder of an AEA project and build the agent several times.
+
+    Startup time of the agent is the time passed divided by the number of starts.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param warm: whether to start from the agent image or from the configuration files
+    :param starts: number of agent startups
+    :param agent: public id of the agent to start
+
+    :return: None
+    """
+    old_cwd = os.getcwd()
+    working_dir = Path(tempfile.mkdtemp())
+    try:
+        aea_project_path = _fetch_agent(working_dir, agent)
+        # as in 'aea run', the agent is built from the project directory
+        os.chdir(str(aea_project_path))
+        # the first startup generates the private keys
+        AEABuilder.from_aea_project(aea_project_path).build()
+        if warm:
+            AEABuilder.build_agent_image(aea_project_path)
+        else:
+            AgentImage.remove(aea_project_path)
+
+        benchmark.start()
+        for _ in range(starts):
+            AEABuilder.from_aea_project(aea_project_path).build()
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(str(working_dir), ignore_errors=True)
+
+
+if __name__ == "__main__":
+    TestCli(agent_startup).run()
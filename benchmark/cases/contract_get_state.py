@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Throughput of 'get_state' requests of the ledger connection to the ERC1155 contract.
+
+The contract is deployed on an in-process chain (web3's EthereumTesterProvider,
+which requires the 'eth-tester[py-evm]' package). Use `cached=True` for the
+contracts and contract instances cached by the dispatcher, and `cached=False`
+to invalidate them before each request, as if the contract was made and the
+contract instance built from the ABI on every request.
+"""
+import json
+import time
+from pathlib import Path
+from typing import cast
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from eth_tester import EthereumTester, PyEVMBackend
+
+from web3 import EthereumTesterProvider, Web3
+from web3.providers.eth_tester.middleware import ethereum_tester_middleware
+
+from aea.configurations.base import (
+    ComponentConfiguration,
+    ComponentType,
+    ContractConfig,
+)
+from aea.connections.base import ConnectionStatus
+from aea.contracts import contract_registry
+from aea.contracts.base import Contract
+from aea.crypto.ethereum import EthereumApi
+
+from packages.fetchai.connections.ledger.contract_dispatcher import (
+    ContractApiDialogues,
+    ContractApiRequestDispatcher,
+)
+from packages.fetchai.protocols.contract_api.dialogues import ContractApiDialogue
+from packages.fetchai.protocols.contract_api.message import ContractApiMessage
+
+ERC1155_DIR = Path(__file__).parent.parent.parent / Path(
+    "packages", "fetchai", "contracts", "erc1155"
+)
+TOKEN_ID = 1
+# the default block gas limit of the tester chain is too low to deploy the contract.
+GAS_LIMIT = 8000000
+
+
+class _TesterProvider(EthereumTesterProvider):
+    """
+    A tester provider which does not fill in default transaction fields.
+
+    By default, the tester provider estimates the gas of each 'eth_call', which
+    Ethereum nodes do not do and which would dominate the time of the requests.
+    """
+
+    middlewares = [ethereum_tester_middleware]
+
+
+def _register_erc1155() -> str:
+    """Register the ERC1155 contract, and get its contract id."""
+    configuration = cast(
+        ContractConfig, ComponentConfiguration.load(ComponentType.CONTRACT, ERC1155_DIR)
+    )
+    configuration.directory = ERC1155_DIR
+    contract_id = str(configuration.public_id)
+    if contract_id not in contract_registry.specs:
+        Contract.from_config(configuration)
+        path = ERC1155_DIR / configuration.path_to_contract_interface
+        with open(path, "r") as interface_file:
+            contract_interface = json.load(interface_file)
+        contract_registry.register(
+            id_=contract_id,
+            entry_point="{}.contract:{}".format(
+                configuration.prefix_import_path, configuration.class_name
+            ),
+            class_kwargs={"contract_interface": contract_interface},
+            contract_config=configuration,
+        )
+    return contract_id
+
+
+def _deploy(api: EthereumApi, contract_id: str) -> str:
+    """Deploy the contract on the in-process chain, and get its address."""
+    contract = contract_registry.make(contract_id)
+    web3 = cast(Web3, api.api)
+    factory = web3.eth.contract(  # pylint: disable=no-member
+        abi=contract.contract_interface["abi"],
+        bytecode=contract.contract_interface["bytecode"],
+    )
+    tx_hash = factory.constructor().transact(
+        {
+            "from": web3.eth.accounts[0],
+            "gas": GAS_LIMIT // 2,
+        }  # pylint: disable=no-member
+    )
+    receipt = web3.eth.waitForTransactionReceipt(tx_hash)  # pylint: disable=no-member
+    return receipt.contractAddress
+
+
+def contract_get_state(
+    benchmark: BenchmarkControl, cached: bool = True, requests: int = 10000
+) -> None:
+    """
+    Send 'get_state' requests for the balance of an account to the contract dispatcher.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param cached: whether to keep the cached contracts and contract instances
+    :param requests: number of requests
+
+    :return: None
+    """
+    contract_id = _register_erc1155()
+    dispatcher = ContractApiRequestDispatcher(
+        ConnectionStatus(),
+        api_configs={EthereumApi.identifier: {"address": "http://127.0.0.1:8545"}},
+    )
+    api = cast(EthereumApi, dispatcher.ledger_api(EthereumApi.identifier))
+    # the chain runs in the process, instead of behind the HTTP endpoint.
+    backend = PyEVMBackend(
+        genesis_parameters=PyEVMBackend._generate_genesis_params(  # pylint: disable=protected-access
+            overrides={"gas_limit": GAS_LIMIT}
+        )
+    )
+    api._api = Web3(  # pylint: disable=protected-access
+        _TesterProvider(EthereumTester(backend))
+    )
+    contract_address = _deploy(api, contract_id)
+    agent_address = api.api.eth.accounts[0]  # pylint: disable=no-member
+    api.api.eth.defaultAccount = agent_address  # pylint: disable=no-member
+
+    contract_api_dialogues = ContractApiDialogues()
+
+    benchmark.start()
+    start_time = time.time()
+    for _ in range(requests):
+        if not cached:
+            dispatcher.invalidate_contracts()
+        request = ContractApiMessage(
+            performative=ContractApiMessage.Performative.GET_STATE,
+            dialogue_reference=contract_api_dialogues.new_self_initiated_dialogue_reference(),
+            ledger_id=EthereumApi.identifier,
+            contract_id=contract_id,
+            contract_address=contract_address,
+            callable="get_balance",
+            kwargs=ContractApiMessage.Kwargs(
+                {"agent_address": agent_address, "token_id": TOKEN_ID}
+            ),
+        )
+        request.counterparty = "agent"
+        request.is_incoming = True
+        dialogue = cast(ContractApiDialogue, dispatcher.dialogues.update(request))
+        response = dispatcher.get_state(api, request, dialogue)
+        assert (
+            response.performative == ContractApiMessage.Performative.STATE
+        ), response.message
+    elapsed = time.time() - start_time
+
+    print(
+        "{} get_state requests in {:.3f}s ({:.0f} requests/s)".format(
+            requests, elapsed, requests / elapsed
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(contract_get_state).run()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Latency of the REST calls of the Cosmos ledger API to a stub server on localhost.
+
+Use `pooled=True` for the HTTP session of the ledger API, which keeps its
+connections alive, and `pooled=False` for a new connection on each call, as
+with the module-level functions of 'requests'. The stub server is plain HTTP:
+with TLS, each new connection would also cost a handshake.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+import requests
+
+from aea.crypto.cosmos import CosmosApi, CosmosCrypto
+
+
+class _StubServer(ThreadingMixIn, HTTPServer):
+    """A stub of the balance endpoint of the Cosmos REST API."""
+
+    daemon_threads = True
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answer all the requests with a balance."""
+
+    protocol_version = "HTTP/1.1"
+    # as REST servers do, so that the body is not delayed on kept alive connections.
+    disable_nagle_algorithm = True
+    content = json.dumps(
+        {"height": "0", "result": [{"denom": "atestfet", "amount": "1000"}]}
+    ).encode("utf-8")
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Send the balance."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.content)))
+        self.end_headers()
+        self.wfile.write(self.content)
+
+    def log_message(self, *args):
+        """Do not log the requests."""
+
+
+def cosmos_rest_calls(
+    benchmark: BenchmarkControl, pooled: bool = True, calls: int = 2000
+) -> None:
+    """
+    Get the balance of an account from the stub server.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param pooled: whether to use the HTTP session of the ledger API
+    :param calls: number of calls
+
+    :return: None
+    """
+    server = _StubServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        api = CosmosApi(address="http://{}:{}".format(*server.server_address))
+        if not pooled:
+            api._session = requests  # pylint: disable=protected-access
+        address = CosmosCrypto().address
+
+        benchmark.start()
+        start_time = time.time()
+        for _ in range(calls):
+            assert api.get_balance(address) == 1000
+        elapsed = time.time() - start_time
+        print(
+            "{} calls in {:.3f}s ({:.3f}ms per call)".format(
+                calls, elapsed, elapsed / calls * 1000
+            )
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    TestCli(cosmos_rest_calls).run()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Throughput of the decision maker for queued 'sign_message' requests.
+
+The requests, for transactions which the agent can afford and which improve
+its utility, are all put on the in queue before the decision maker is started.
+Use `max_batch_size=1` for the decision maker to take and handle the messages
+one at a time, and a larger size to take and handle them in batches.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.configurations.base import PublicId
+from aea.crypto.registries import make_crypto
+from aea.crypto.wallet import Wallet
+from aea.decision_maker.base import DecisionMaker
+from aea.decision_maker.default import DecisionMakerHandler
+from aea.helpers.transaction.base import RawMessage, Terms
+from aea.identity.base import Identity
+from aea.protocols.signing.dialogues import SigningDialogues
+from aea.protocols.signing.message import SigningMessage
+from aea.protocols.state_update.dialogues import StateUpdateDialogues
+from aea.protocols.state_update.message import StateUpdateMessage
+
+MESSAGE = b"0x11f3f9487724404e3a1fb7252a322656b90ba0455a2ca5fcdcbe6eeee5f8126d"
+SKILL_CALLBACK_IDS = (str(PublicId("author", "a_skill", "0.1.0")),)
+
+
+def _make_wallet(directory: str, ledger_id: str) -> Wallet:
+    """Make a wallet with a new key."""
+    private_key_path = os.path.join(directory, "{}_private_key.txt".format(ledger_id))
+    with open(private_key_path, "wb") as fp:
+        make_crypto(ledger_id).dump(fp)
+    return Wallet({ledger_id: private_key_path})
+
+
+def decision_maker_signing(
+    benchmark: BenchmarkControl,
+    max_batch_size: int = DecisionMaker.DEFAULT_MAX_BATCH_SIZE,
+    ledger_id: str = "ethereum",
+    requests: int = 1000,
+) -> None:
+    """
+    Sign queued messages with the decision maker.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param max_batch_size: the maximum number of messages handled at once
+    :param ledger_id: the ledger of the key signing the messages
+    :param requests: number of sign_message requests
+
+    :return: None
+    """
+    directory = tempfile.mkdtemp()
+    try:
+        wallet = _make_wallet(directory, ledger_id)
+        identity = Identity(
+            "agent", addresses=wallet.addresses, default_address_key=ledger_id
+        )
+        decision_maker = DecisionMaker(
+            DecisionMakerHandler(identity=identity, wallet=wallet),
+            max_batch_size=max_batch_size,
+        )
+        state_update_msg = StateUpdateMessage(
+            performative=StateUpdateMessage.Performative.INITIALIZE,
+            dialogue_reference=StateUpdateDialogues(
+                "agent"
+            ).new_self_initiated_dialogue_reference(),
+            amount_by_currency_id={"FET": 100},
+            quantities_by_good_id={"good_id": 10},
+            exchange_params_by_currency_id={"FET": 0.01},
+            utility_params_by_good_id={"good_id": 10.0},
+        )
+        state_update_msg.counterparty = "decision_maker"
+        decision_maker.message_in_queue.put_nowait(state_update_msg)
+        signing_dialogues = SigningDialogues("agent")
+        for _ in range(requests):
+            signing_msg = SigningMessage(
+                performative=SigningMessage.Performative.SIGN_MESSAGE,
+                dialogue_reference=signing_dialogues.new_self_initiated_dialogue_reference(),
+                skill_callback_ids=SKILL_CALLBACK_IDS,
+                skill_callback_info={},
+                terms=Terms(
+                    ledger_id=ledger_id,
+                    sender_address="pk1",
+                    counterparty_address="pk2",
+                    amount_by_currency_id={"FET": -1},
+                    is_sender_payable_tx_fee=True,
+                    quantities_by_good_id={"good_id": 10},
+                    nonce="transaction nonce",
+                ),
+                raw_message=RawMessage(ledger_id, MESSAGE),
+            )
+            signing_msg.counterparty = "decision_maker"
+            decision_maker.message_in_queue.put_nowait(signing_msg)
+
+        benchmark.start()
+        start_time = time.time()
+        decision_maker.start()
+        try:
+            for _ in range(requests):
+                response = decision_maker.message_out_queue.get(timeout=60)
+                assert (
+                    response.performative == SigningMessage.Performative.SIGNED_MESSAGE
+                )
+            elapsed = time.time() - start_time
+        finally:
+            decision_maker.stop()
+
+        print(
+            "{} signatures in {:.3f}s ({:.0f} signatures/s)".format(
+                requests, elapsed, requests / elapsed
+            )
+        )
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    TestCli(decision_maker_signing).run()
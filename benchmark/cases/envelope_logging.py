@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Envelope throughput of the multiplexer depending on the log level.
+
+The multiplexer logs through an AgentLoggerAdapter, as in an AEA, to a handler
+that writes to the null device. Use `level=DEBUG` and `level=INFO` to compare
+the cost of the debug logging on the envelope path.
+"""
+import logging
+import os
+
+from benchmark.framework.aea_test_wrapper import AEATestWrapper
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.configurations.base import ConnectionConfig
+from aea.helpers.logging import AgentLoggerAdapter
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.multiplexer import InBox, Multiplexer, OutBox
+
+from packages.fetchai.connections.in_process.connection import InProcessConnection
+
+LOGGER_NAME = "aea.benchmark.envelope_logging"
+
+
+def _make_multiplexer(address: str, logger: logging.Logger) -> Multiplexer:
+    """Make a multiplexer with an in-process connection and an agent logger."""
+    connection = InProcessConnection(
+        configuration=ConnectionConfig(connection_id=InProcessConnection.connection_id),
+        identity=Identity(address, address),
+    )
+    multiplexer = Multiplexer([connection])
+    multiplexer.logger = AgentLoggerAdapter(logger, agent_name=address)
+    return multiplexer
+
+
+def envelope_logging(
+    benchmark: BenchmarkControl, level: str = "INFO", envelopes: int = 5000
+) -> None:
+    """
+    Send envelopes from the outbox of an agent to the inbox of another agent.
+
+    Throughput is the number of envelopes divided by the time passed.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param level: log level of the multiplexer logger, e.g. 'DEBUG' or 'INFO'
+    :param envelopes: number of envelopes to send
+
+    :return: None
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.propagate = False
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+
+        multiplexer_1 = _make_multiplexer("agent_1", logger)
+        multiplexer_2 = _make_multiplexer("agent_2", logger)
+        multiplexer_1.connect()
+        multiplexer_2.connect()
+        outbox = OutBox(multiplexer_1, "agent_1")
+        inbox = InBox(multiplexer_2)
+
+        message = AEATestWrapper.dummy_default_message()
+        envelope = Envelope(
+            to="agent_2",
+            sender="agent_1",
+            protocol_id=message.protocol_id,
+            message=message,
+        )
+
+        benchmark.start()
+        try:
+            for _ in range(envelopes):
+                outbox.put(envelope)
+                inbox.get(block=True)
+        finally:
+            multiplexer_1.disconnect()
+            multiplexer_2.disconnect()
+            logger.removeHandler(handler)
+
+
+if __name__ == "__main__":
+    TestCli(envelope_logging).run()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Envelope round trip latency between two co-located agents.
+
+The multiplexers of the two agents share the same event loop, as they do when run by AEARunner in async mode.
+Use `connection=in_process` or `connection=local` to compare the in-process connection with the local OEF node.
+"""
+import asyncio
+from typing import Optional
+
+from benchmark.framework.aea_test_wrapper import AEATestWrapper
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.configurations.base import ConnectionConfig
+from aea.connections.base import Connection
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.multiplexer import AsyncMultiplexer
+
+from packages.fetchai.connections.in_process.connection import InProcessConnection
+from packages.fetchai.connections.local.connection import LocalNode, OEFLocalConnection
+
+
+def _make_connection(
+    address: str, connection: str, local_node: Optional[LocalNode]
+) -> Connection:
+    """
+    Make a connection for the agent.
+
+    :param address: the agent address
+    :param connection: the connection type, 'in_process' or 'local'
+    :param local_node: the local node, used by the 'local' connection
+
+    :return: the connection
+    """
+    if connection == "in_process":
+        return InProcessConnection(
+            configuration=ConnectionConfig(
+                connection_id=InProcessConnection.connection_id
+            ),
+            identity=Identity(address, address),
+        )
+    if connection == "local":
+        return OEFLocalConnection(
+            configuration=ConnectionConfig(
+                connection_id=OEFLocalConnection.connection_id
+            ),
+            identity=Identity(address, address),
+            local_node=local_node,
+        )
+    raise ValueError("Unsupported connection: {}".format(connection))
+
+
+async def _round_trips(
+    benchmark: BenchmarkControl,
+    loop: asyncio.AbstractEventLoop,
+    connection: str,
+    local_node: Optional[LocalNode],
+    rounds: int,
+) -> None:
+    """Connect two multiplexers and bounce an envelope between them."""
+    multiplexer_1 = AsyncMultiplexer(
+        [_make_connection("agent_1", connection, local_node)], loop=loop
+    )
+    multiplexer_2 = AsyncMultiplexer(
+        [_make_connection("agent_2", connection, local_node)], loop=loop
+    )
+    await multiplexer_1.connect()
+    await multiplexer_2.connect()
+
+    message = AEATestWrapper.dummy_default_message()
+    request = Envelope(
+        to="agent_2",
+        sender="agent_1",
+        protocol_id=message.protocol_id,
+        message=message,
+    )
+    response = Envelope(
+        to="agent_1",
+        sender="agent_2",
+        protocol_id=message.protocol_id,
+        message=message,
+    )
+
+    benchmark.start()
+    try:
+        for _ in range(rounds):
+            multiplexer_1.put(request)
+            await multiplexer_2.async_get()
+            multiplexer_2.put(response)
+            await multiplexer_1.async_get()
+    finally:
+        await multiplexer_1.disconnect()
+        await multiplexer_2.disconnect()
+
+
+def envelope_round_trip(
+    benchmark: BenchmarkControl, connection: str = "in_process", rounds: int = 10000,
+) -> None:
+    """
+    Send an envelope back and forth between two co-located agents.
+
+    Latency of one round trip is the time passed divided by the number of rounds.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param connection: connection to use, 'in_process' or 'local'
+    :param rounds: number of round trips
+
+    :return: None
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    local_node = LocalNode() if connection == "local" else None
+    if local_node is not None:
+        local_node.start()
+    try:
+        loop.run_until_complete(
+            _round_trips(benchmark, loop, connection, local_node, rounds)
+        )
+    finally:
+        if local_node is not None:
+            local_node.stop()
+        loop.close()
+
+
+if __name__ == "__main__":
+    TestCli(envelope_round_trip).run()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Fingerprinting of all the packages of the local registry.
+
+Use `workers=1` to hash the files sequentially, and `warm=True`
+to hash only the files that are not in the file hash cache.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.configurations.base import DEFAULT_FINGERPRINT_IGNORE_PATTERNS
+from aea.helpers.fingerprint import FileHashCache, FingerprintEngine, PackageSpec
+
+ROOT_DIR = Path(__file__).absolute().parent.parent.parent
+PACKAGE_TYPES = ["protocols", "connections", "contracts", "skills"]
+
+
+def _list_packages(registry_path: Path) -> List[PackageSpec]:
+    """List the package directories of a registry."""
+    return [
+        (package_dir, DEFAULT_FINGERPRINT_IGNORE_PATTERNS)
+        for package_type in PACKAGE_TYPES
+        for package_dir in sorted(registry_path.glob("*/{}/*".format(package_type)))
+        if package_dir.is_dir()
+    ]
+
+
+def fingerprint_packages(
+    benchmark: BenchmarkControl, workers: int = 0, warm: bool = False, runs: int = 10
+) -> None:
+    """
+    Fingerprint all the packages of the local registry several times.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param workers: number of hashing threads, 0 for the default
+    :param warm: whether the file hash cache is populated before the runs
+    :param runs: number of fingerprints of the whole registry
+
+    :return: None
+    """
+    packages = _list_packages(ROOT_DIR / "packages")
+    cache_dir = tempfile.mkdtemp()
+    cache_path = os.path.join(cache_dir, "fingerprint_cache.json")
+    try:
+        if warm:
+            FingerprintEngine(cache=FileHashCache(cache_path)).compute_many(packages)
+
+        benchmark.start()
+        for _ in range(runs):
+            engine = FingerprintEngine(
+                max_workers=workers or None,
+                cache=FileHashCache(cache_path) if warm else None,
+            )
+            engine.compute_many(packages)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    TestCli(fingerprint_packages).run()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Steps per second of the gym connection, on the bandit environment of the gym example.
+
+Use `nb_envs=1` to send one 'act' message per step, and a larger `nb_envs` to send
+'act_batch' messages stepping that many copies of the environment at once. Each
+message is serialized and deserialized, as it would be in an envelope.
+"""
+import asyncio
+import os
+import sys
+import time
+from typing import cast
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+import gym
+
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+
+from packages.fetchai.connections.gym.connection import GymConnection
+from packages.fetchai.protocols.gym.message import GymMessage
+
+GYM_EXAMPLE_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "examples", "gym_ex"
+)
+ADDRESS = "agent"
+
+
+def _make_env() -> gym.Env:
+    """Make the bandit environment of the gym example."""
+    if GYM_EXAMPLE_DIR not in sys.path:
+        sys.path.insert(0, GYM_EXAMPLE_DIR)
+    from gyms.env import (  # type: ignore  # pylint: disable=import-outside-toplevel,import-error
+        BanditNArmedRandom,
+    )
+
+    return BanditNArmedRandom()
+
+
+def _round_trip(msg: GymMessage) -> GymMessage:
+    """Serialize and deserialize a message."""
+    return cast(
+        GymMessage, GymMessage.serializer.decode(GymMessage.serializer.encode(msg))
+    )
+
+
+async def _run(connection: GymConnection, nb_envs: int, steps: int) -> None:
+    """Step the environment until the number of steps is reached."""
+    step_id = 0
+    done_steps = 0
+    while done_steps < steps:
+        step_id += 1
+        if nb_envs > 1:
+            actions = [(step_id % 10, 50)] * nb_envs
+            msg = GymMessage(
+                performative=GymMessage.Performative.ACT_BATCH,
+                actions=GymMessage.AnyObject(actions),
+                step_id=step_id,
+            )
+        else:
+            msg = GymMessage(
+                performative=GymMessage.Performative.ACT,
+                action=GymMessage.AnyObject((step_id % 10, 50)),
+                step_id=step_id,
+            )
+        msg = _round_trip(msg)
+        msg.counterparty = "gym"
+        await connection.send(
+            Envelope(
+                to="gym",
+                sender=ADDRESS,
+                protocol_id=GymMessage.protocol_id,
+                message=msg,
+            )
+        )
+        envelope = await connection.receive()
+        _round_trip(envelope.message)  # type: ignore
+        done_steps += nb_envs
+
+
+def gym_steps(
+    benchmark: BenchmarkControl,
+    nb_envs: int = 1,
+    steps: int = 20000,
+    nb_workers: int = 2,
+) -> None:
+    """
+    Step the bandit environment through the gym connection.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param nb_envs: number of copies of the environment stepped by a message
+    :param steps: number of environment steps
+    :param nb_workers: number of subprocesses stepping the copies
+
+    :return: None
+    """
+    configuration = ConnectionConfig(
+        connection_id=GymConnection.connection_id,
+        nb_envs=nb_envs,
+        nb_workers=nb_workers,
+    )
+    connection = GymConnection(
+        gym_env=_make_env(),
+        identity=Identity("agent", address=ADDRESS),
+        configuration=configuration,
+    )
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(connection.connect())
+    try:
+        benchmark.start()
+        start_time = time.time()
+        loop.run_until_complete(_run(connection, nb_envs, steps))
+        elapsed = time.time() - start_time
+        print(
+            "{} steps with {} environment(s): {:.0f} steps/s".format(
+                steps, nb_envs, steps / elapsed
+            )
+        )
+    finally:
+        loop.run_until_complete(connection.disconnect())
+        loop.close()
+
+
+if __name__ == "__main__":
+    TestCli(gym_steps).run()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Import time of the framework modules, measured in fresh interpreters with `-X importtime`.
+
+The benchmark fails if the import time exceeds the budget of the module,
+or if a ledger backend is imported eagerly.
+"""
+import re
+import subprocess  # nosec
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+# budgets in seconds for the cumulative import time of the module.
+IMPORT_TIME_BUDGETS = {
+    "aea": 0.3,
+    "aea.cli": 0.4,
+    "aea.aea_builder": 0.5,
+}  # type: Dict[str, float]
+DEFAULT_BUDGET = 0.5
+
+# modules that must be imported only on first use.
+LAZY_MODULES = ["aea.crypto.fetchai", "aea.crypto.ethereum", "aea.crypto.cosmos"]
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _import_time(module: str) -> List[Tuple[int, int, int, str]]:
+    """
+    Import a module in a fresh interpreter.
+
+    :param module: the dotted path of the module.
+
+    :return: list of (self time in us, cumulative time in us, nesting level, module name).
+    """
+    process = subprocess.run(  # nosec
+        [sys.executable, "-X", "importtime", "-c", "import {}".format(module)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+    records = []
+    for line in process.stderr.decode("utf-8").splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(
+                (int(self_us), int(cumulative_us), len(indent) // 2, name.strip())
+            )
+    return records
+
+
+def _print_breakdown(records: List[Tuple[int, int, int, str]], top: int) -> None:
+    """Print the self import time, grouped by top-level package."""
+    by_package = defaultdict(int)  # type: Dict[str, int]
+    for self_us, _, _, name in records:
+        by_package[name.split(".")[0]] += self_us
+    print("Import time breakdown by top-level package (ms):")
+    for package, self_us in sorted(by_package.items(), key=lambda x: -x[1])[:top]:
+        print("  {:<30} {:>8.1f}".format(package, self_us / 1000))
+
+
+def import_time(
+    benchmark: BenchmarkControl, module: str = "aea.cli", runs: int = 5, top: int = 10
+) -> None:
+    """
+    Measure the import time of a module and check it against its budget.
+
+    The time passed is the time of all the runs, including interpreter startup.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param module: module to import, e.g. 'aea', 'aea.cli' or 'aea.aea_builder'
+    :param runs: number of fresh interpreters
+    :param top: number of packages to show in the breakdown
+
+    :return: None
+    """
+    benchmark.start()
+    timings = []
+    records = []  # type: List[Tuple[int, int, int, str]]
+    for _ in range(runs):
+        records = _import_time(module)
+        timings.append(
+            next(
+                cumulative_us
+                for _, cumulative_us, level, name in records
+                if level == 0 and name == module
+            )
+        )
+
+    best = min(timings) / 1000000
+    budget = IMPORT_TIME_BUDGETS.get(module, DEFAULT_BUDGET)
+    print("Import time of {}: {:.3f}s (budget {:.3f}s)".format(module, best, budget))
+    _print_breakdown(records, top)
+
+    imported = {name for _, _, _, name in records}
+    eager = [name for name in LAZY_MODULES if name in imported]
+    if eager:
+        raise AssertionError("Modules imported eagerly: {}".format(eager))
+    if best > budget:
+        raise AssertionError(
+            "Import time of {} exceeds the budget: {:.3f}s > {:.3f}s".format(
+                module, best, budget
+            )
+        )
+
+
+if __name__ == "__main__":
+    TestCli(import_time).run()
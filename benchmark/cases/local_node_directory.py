@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Register and search traffic of many agents on the local OEF node.
+
+The local node runs in its own thread, as in the tests, and the connections of
+all the agents share another event loop. Each agent registers a service, then
+in each round registers its service again with a new description, so that the
+directory keeps changing, and searches for the services of a data model.
+"""
+import asyncio
+import random
+import time
+from typing import List
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.configurations.base import ConnectionConfig
+from aea.helpers.search.models import (
+    Attribute,
+    Constraint,
+    ConstraintType,
+    DataModel,
+    Description,
+    Query,
+)
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+
+from packages.fetchai.connections.local.connection import (
+    DEFAULT_OEF,
+    LocalNode,
+    OEFLocalConnection,
+)
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
+
+
+def _make_data_models(models: int) -> List[DataModel]:
+    """Make the data models of the services."""
+    return [
+        DataModel("service_{}".format(i), [Attribute("price", int, True, "The price.")])
+        for i in range(models)
+    ]
+
+
+def _envelope(address: str, message: OefSearchMessage) -> Envelope:
+    """Make an envelope to the node."""
+    return Envelope(
+        to=DEFAULT_OEF,
+        sender=address,
+        protocol_id=OefSearchMessage.protocol_id,
+        message=message,
+    )
+
+
+async def _agent(
+    connection: OEFLocalConnection,
+    data_models: List[DataModel],
+    rounds: int,
+    searches: int,
+) -> int:
+    """Register, search and register again, and count the agents found."""
+    address = connection.address
+    rng = random.Random(address)
+    data_model = data_models[rng.randrange(len(data_models))]
+    description = Description({"price": 0}, data_model=data_model)
+    await connection.send(
+        _envelope(
+            address,
+            OefSearchMessage(
+                performative=OefSearchMessage.Performative.REGISTER_SERVICE,
+                dialogue_reference=(address, ""),
+                service_description=description,
+            ),
+        )
+    )
+    found = 0
+    for round_ in range(rounds):
+        await connection.send(
+            _envelope(
+                address,
+                OefSearchMessage(
+                    performative=OefSearchMessage.Performative.UNREGISTER_SERVICE,
+                    dialogue_reference=(address, ""),
+                    service_description=description,
+                ),
+            )
+        )
+        description = Description({"price": round_ + 1}, data_model=data_model)
+        await connection.send(
+            _envelope(
+                address,
+                OefSearchMessage(
+                    performative=OefSearchMessage.Performative.REGISTER_SERVICE,
+                    dialogue_reference=(address, ""),
+                    service_description=description,
+                ),
+            )
+        )
+        for _ in range(searches):
+            query = Query(
+                [Constraint("price", ConstraintType(">=", 0))],
+                model=data_models[rng.randrange(len(data_models))],
+            )
+            await connection.send(
+                _envelope(
+                    address,
+                    OefSearchMessage(
+                        performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+                        dialogue_reference=(address, ""),
+                        query=query,
+                    ),
+                )
+            )
+            response = await connection.receive()
+            assert (
+                response is not None
+                and response.message.performative  # type: ignore
+                == OefSearchMessage.Performative.SEARCH_RESULT
+            )
+            found += len(response.message.agents)  # type: ignore
+    return found
+
+
+def local_node_directory(
+    benchmark: BenchmarkControl,
+    agents: int = 500,
+    models: int = 20,
+    rounds: int = 10,
+    searches: int = 2,
+) -> None:
+    """
+    Run the register and search traffic of many agents through the local node.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param agents: number of agents
+    :param models: number of data models of the services
+    :param rounds: number of rounds of each agent
+    :param searches: number of searches of each agent in each round
+
+    :return: None
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    data_models = _make_data_models(models)
+    with LocalNode() as local_node:
+        connections = [
+            OEFLocalConnection(
+                configuration=ConnectionConfig(
+                    connection_id=OEFLocalConnection.connection_id
+                ),
+                identity=Identity("agent_{}".format(i), "agent_{}".format(i)),
+                local_node=local_node,
+            )
+            for i in range(agents)
+        ]
+        for connection in connections:
+            loop.run_until_complete(connection.connect())
+
+        benchmark.start()
+        start_time = time.time()
+        found = loop.run_until_complete(
+            asyncio.gather(
+                *[
+                    _agent(connection, data_models, rounds, searches)
+                    for connection in connections
+                ]
+            )
+        )
+        elapsed = time.time() - start_time
+
+        for connection in connections:
+            loop.run_until_complete(connection.disconnect())
+    loop.close()
+
+    requests = agents * (1 + rounds * (searches + 2))
+    print(
+        "{} agents, {} requests in {:.3f}s ({:.0f} requests/s), {} agents found".format(
+            agents, requests, elapsed, requests / elapsed, sum(found)
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(local_node_directory).run()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Local search and package lookups on a synthetic local registry.
+
+Use `indexed=True` for the registry index, and `indexed=False` for the previous
+approach, which loads the configuration file of every package on each search
+and the configuration file of the package on each lookup. The first indexed
+search builds the index, the following ones only check modification times.
+"""
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.cli.search import _get_details_from_dir
+from aea.cli.utils.registry_index import RegistryIndex
+from aea.configurations.base import PackageType
+from aea.configurations.loader import ConfigLoader
+
+AUTHORS = 50
+PROTOCOL_CONFIG = """name: {name}
+author: {author}
+version: 0.1.0
+description: Synthetic protocol number {number}.
+license: Apache-2.0
+aea_version: '>=0.5.0, <0.6.0'
+fingerprint:
+  __init__.py: QmXZMVdsBXUJxLZvwwhWBx58xfxMSyoGxdYp5Aeqmzqhzt
+  message.py: QmRgAsNvAMFAko5z3rHaLxX2xJEvtsUzV67EcuYX7ibLzy
+  serialization.py: QmaNL5BJyAQiNv1cLHcdZqUoaFkiZzVrxBSDgBkerT1jdX
+fingerprint_ignore_patterns: []
+dependencies:
+  protobuf: {{}}
+"""
+
+
+def _make_registry(registry: str, packages: int) -> List[Dict[str, str]]:
+    """Write a registry of protocols, spread among a few authors."""
+    public_ids = []
+    for i in range(packages):
+        author, name = "author_{}".format(i % AUTHORS), "protocol_{}".format(i)
+        package_path = os.path.join(registry, author, "protocols", name)
+        os.makedirs(package_path)
+        with open(os.path.join(package_path, "protocol.yaml"), "w") as fp:
+            fp.write(PROTOCOL_CONFIG.format(name=name, author=author, number=i))
+        public_ids.append({"author": author, "name": name})
+    return public_ids
+
+
+def _legacy_lookup(
+    loader: ConfigLoader, registry: str, author: str, name: str
+) -> Dict[str, str]:
+    """Load the configuration file of a package, as local lookups used to."""
+    with open(os.path.join(registry, author, "protocols", name, "protocol.yaml")) as fp:
+        config = loader.load(fp)
+    return {"author": config.author, "version": config.version}
+
+
+def local_registry_search(
+    benchmark: BenchmarkControl,
+    indexed: bool = True,
+    packages: int = 5000,
+    searches: int = 5,
+    lookups: int = 500,
+) -> None:
+    """
+    Search all the protocols of a local registry, then look packages up.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param indexed: whether to use the registry index or the previous approach
+    :param packages: number of packages in the registry
+    :param searches: number of searches
+    :param lookups: number of package lookups
+
+    :return: None
+    """
+    working_dir = tempfile.mkdtemp()
+    registry = os.path.join(working_dir, "packages")
+    index_directory = os.path.join(working_dir, "index")
+    loader = ConfigLoader.from_configuration_type(PackageType.PROTOCOL)
+    try:
+        public_ids = _make_registry(registry, packages)
+
+        benchmark.start()
+        search_times = []
+        for _ in range(searches):
+            start_time = time.time()
+            if indexed:
+                results = RegistryIndex(registry, index_directory).items("protocols")
+            else:
+                results = []
+                _get_details_from_dir(
+                    loader, registry, "*/protocols", "protocol.yaml", results
+                )
+            search_times.append(time.time() - start_time)
+            assert len(results) == packages, "Wrong number of packages found."
+
+        start_time = time.time()
+        for i in range(lookups):
+            public_id = public_ids[i * 7919 % packages]
+            if indexed:
+                details = RegistryIndex(registry, index_directory).get(
+                    "protocols", public_id["author"], public_id["name"]
+                )
+            else:
+                details = _legacy_lookup(
+                    loader, registry, public_id["author"], public_id["name"]
+                )
+            assert details is not None and details["author"] == public_id["author"]
+        lookup_time = time.time() - start_time
+
+        print(
+            "{} packages: first search {:.3f}s, next searches {:.3f}s on average, {} lookups {:.3f}s".format(
+                packages,
+                search_times[0],
+                sum(search_times[1:]) / max(len(search_times) - 1, 1),
+                lookups,
+                lookup_time,
+            )
+        )
+    finally:
+        shutil.rmtree(working_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    TestCli(local_registry_search).run()
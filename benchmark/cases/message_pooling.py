@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Garbage collector pressure of an agent handling many incoming messages.
+
+Encoded 'oef_search' search results are decoded into envelopes, as a connection
+does, and handled by an agent whose handler does not keep the messages. Use
+`pooled=True` to enable the pool of envelopes, and `pooled=False` for fresh
+envelopes. The agent releases the envelopes once handled.
+
+Each round decodes the envelopes into the inbox before handling them, as when
+the inbox fills up between reactions: the pools then serve the objects of the
+next round. The report gives the number of collections of each generation,
+which are triggered by the GC-tracked allocations (a generation 0 collection
+after each 700 objects allocated and not freed yet), and the time spent in
+the collector.
+"""
+import gc
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmark.framework.aea_test_wrapper import AEATestWrapper
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.mail.base import Envelope, EnvelopePool
+from aea.protocols.base import Message, Protocol
+from aea.skills.base import Handler
+
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
+
+OEF_SEARCH_DIR = Path(__file__).parent.parent.parent / Path(
+    "packages", "fetchai", "protocols", "oef_search"
+)
+
+
+class SearchResultHandler(Handler):
+    """Count the agents found, without keeping the messages."""
+
+    SUPPORTED_PROTOCOL = OefSearchMessage.protocol_id
+
+    def setup(self) -> None:
+        """Noop setup."""
+        self.agents_found = 0
+
+    def teardown(self) -> None:
+        """Noop teardown."""
+
+    def handle(self, message: Message) -> None:
+        """Count the agents of the search result."""
+        self.agents_found += len(message.get("agents") or ())
+
+
+def _encoded_envelopes(address: str, count: int) -> List[bytes]:
+    """Encode search results for the agent."""
+    encoded = []
+    for i in range(count):
+        message = OefSearchMessage(
+            performative=OefSearchMessage.Performative.SEARCH_RESULT,
+            dialogue_reference=(str(i), str(i)),
+            message_id=2,
+            target=1,
+            agents=tuple("agent_{}".format(j) for j in range(i % 5)),
+        )
+        encoded.append(
+            Envelope(
+                to=address,
+                sender="default_oef",
+                protocol_id=OefSearchMessage.protocol_id,
+                message=message,
+            ).encode()
+        )
+    return encoded
+
+
+def _handle(aea_test_wrapper: AEATestWrapper, encoded: List[bytes], rounds: int):
+    """Decode the envelopes into the inbox, then handle them, in each round."""
+    aea = aea_test_wrapper.aea
+    for _ in range(rounds):
+        for envelope_bytes in encoded:
+            aea_test_wrapper.put_inbox(Envelope.decode(envelope_bytes))
+        for _ in range(len(encoded)):
+            aea._react_one()  # pylint: disable=protected-access
+
+
+class _CollectorTimer:
+    """Measure the time spent in the garbage collector."""
+
+    def __init__(self):
+        """Initialize the timer."""
+        self.elapsed = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, int]) -> None:
+        """Record the start or the end of a collection."""
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.elapsed += time.perf_counter() - self._start
+
+
+def _collections() -> Tuple[int, ...]:
+    """Get the number of collections of each generation."""
+    return tuple(stats["collections"] for stats in gc.get_stats())
+
+
+def message_pooling(
+    benchmark: BenchmarkControl,
+    pooled: bool = True,
+    messages: int = 1000,
+    rounds: int = 20,
+) -> None:
+    """
+    Handle search results, and count the collections of the garbage collector.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param pooled: whether to enable the pool of envelopes
+    :param messages: number of different messages
+    :param rounds: number of times each message is handled
+
+    :return: None
+    """
+    oef_search = Protocol.from_dir(str(OEF_SEARCH_DIR))
+    aea_test_wrapper = AEATestWrapper(
+        name="dummy agent",
+        components=[
+            oef_search,
+            AEATestWrapper.make_skill(handlers={"search_result": SearchResultHandler}),
+        ],
+    )
+    aea_test_wrapper.setup()
+    encoded = _encoded_envelopes(aea_test_wrapper.aea.identity.address, messages)
+    if pooled:
+        Envelope.pool = EnvelopePool()
+    try:
+        # warm the pools and the caches up.
+        _handle(aea_test_wrapper, encoded, 1)
+        gc.collect()
+
+        benchmark.start()
+        timer = _CollectorTimer()
+        gc.callbacks.append(timer)
+        collections = _collections()
+        start_time = time.time()
+        _handle(aea_test_wrapper, encoded, rounds)
+        elapsed = time.time() - start_time
+        collections = tuple(
+            after - before for before, after in zip(collections, _collections())
+        )
+        gc.callbacks.remove(timer)
+    finally:
+        Envelope.pool = None
+        aea_test_wrapper.stop()
+
+    handled = messages * rounds
+    print(
+        "{} messages in {:.3f}s ({:.0f} messages/s), collections by generation {}, {:.3f}s in the collector".format(
+            handled, elapsed, handled / elapsed, collections, timer.elapsed
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(message_pooling).run()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Construction, field access and serialization of generated protocol messages.
+
+Use `slots=True` for the bundled message classes, generated in 'slots' mode, and
+`slots=False` for the same classes generated without slots, which keep their
+fields in a dictionary. The latter are generated on the fly, so the protocol
+generator prerequisites (black and protoc) must be installed.
+"""
+import os
+import time
+from types import ModuleType
+from typing import Callable, Dict, Tuple, Type
+from unittest import mock
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.helpers.search.models import Description
+from aea.protocols.base import Message
+from aea.protocols.default import serialization as default_serialization
+from aea.protocols.default.message import DefaultMessage
+from aea.protocols.generator.base import ProtocolGenerator
+
+from packages.fetchai.protocols.fipa import serialization as fipa_serialization
+from packages.fetchai.protocols.fipa.message import FipaMessage
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
+
+PROTOCOLS = {
+    "default": (
+        DefaultMessage,
+        default_serialization,
+        "default.yaml",
+        "aea.protocols.",
+    ),
+    "fipa": (
+        FipaMessage,
+        fipa_serialization,
+        "fipa.yaml",
+        "packages.fetchai.protocols.",
+    ),
+}  # type: Dict[str, Tuple[Type[Message], ModuleType, str, str]]
+
+
+def _dictionary_message_class(specification: str, package: str) -> Type[Message]:
+    """Generate the message class of a protocol without slots."""
+    generator = ProtocolGenerator(
+        os.path.join(ROOT_DIR, "examples", "protocol_specification_ex", specification),
+        path_to_protocol_package=package,
+    )
+    module = ModuleType("dictionary_message")
+    exec(generator._message_class_str(), module.__dict__)  # nosec
+    name = generator.protocol_specification_in_camel_case + "Message"
+    return getattr(module, name)
+
+
+def _make_default(message_class: Type[Message], i: int) -> Message:
+    """Make a default message."""
+    return message_class(  # type: ignore
+        performative=message_class.Performative.BYTES,  # type: ignore
+        message_id=i + 1,
+        target=i,
+        content=b"hello",
+    )
+
+
+def _read_default(message: Message) -> int:
+    """Read the fields of a default message."""
+    return message.message_id + message.target + len(message.content)  # type: ignore
+
+
+def _make_fipa(message_class: Type[Message], i: int) -> Message:
+    """Make a fipa propose message."""
+    return message_class(  # type: ignore
+        performative=message_class.Performative.PROPOSE,  # type: ignore
+        dialogue_reference=(str(i), ""),
+        message_id=i + 1,
+        target=i,
+        proposal=Description({"price": i, "quantity": 1}),
+    )
+
+
+def _read_fipa(message: Message) -> int:
+    """Read the fields of a fipa propose message."""
+    return (
+        message.message_id  # type: ignore
+        + message.target  # type: ignore
+        + len(message.dialogue_reference[0])  # type: ignore
+        + message.proposal.values["price"]  # type: ignore
+    )
+
+
+MAKE = {
+    "default": _make_default,
+    "fipa": _make_fipa,
+}  # type: Dict[str, Callable[[Type[Message], int], Message]]
+READ = {
+    "default": _read_default,
+    "fipa": _read_fipa,
+}  # type: Dict[str, Callable[[Message], int]]
+
+
+def message_slots(
+    benchmark: BenchmarkControl,
+    slots: bool = True,
+    protocol: str = "fipa",
+    messages: int = 20000,
+    reads: int = 10,
+) -> None:
+    """
+    Create messages, read their fields and serialize them.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param slots: whether to use the message classes generated in 'slots' mode
+    :param protocol: the protocol, 'fipa' or 'default'
+    :param messages: number of messages
+    :param reads: number of times the fields of each message are read
+
+    :return: None
+    """
+    message_class, serialization, specification, package = PROTOCOLS[protocol]
+    if not slots:
+        message_class = _dictionary_message_class(specification, package)
+    make, read = MAKE[protocol], READ[protocol]
+    serializer = PROTOCOLS[protocol][0].serializer
+
+    benchmark.start()
+    start_time = time.time()
+    created = [make(message_class, i) for i in range(messages)]
+    construction_time = time.time() - start_time
+
+    start_time = time.time()
+    checksum = 0
+    for message in created:
+        for _ in range(reads):
+            checksum += read(message)
+    access_time = time.time() - start_time
+
+    start_time = time.time()
+    # the serializer decodes into the class it is patched with.
+    with mock.patch.object(serialization, message_class.__name__, message_class):
+        for message in created:
+            decoded = serializer.decode(serializer.encode(message))
+            assert decoded == message, "Round trip failed."
+    serialization_time = time.time() - start_time
+
+    print(
+        "{} messages ({}): construction {:.3f}s, access {:.3f}s, serialization {:.3f}s (checksum {})".format(
+            messages,
+            "slots" if slots else "dictionary",
+            construction_time,
+            access_time,
+            serialization_time,
+            checksum,
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(message_slots).run()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Round trips of training batches in 'data' messages of the ml_trade protocol.
+
+Use `encoding=tensor` for the typed tensor encoding of the payload and
+`encoding=pickle` for the previous pickled payload. A round trip encodes the
+batch, serializes the message, deserializes it and decodes the batch.
+"""
+import pickle  # nosec
+import time
+from typing import Any, Callable, Dict, Tuple, cast
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+import numpy as np
+
+from aea.helpers.search.models import Description
+
+from packages.fetchai.protocols.ml_trade.message import MlTradeMessage
+from packages.fetchai.protocols.ml_trade.tensors import decode_tensors, encode_tensors
+
+ROW_SIZE = 28 * 28 * 4
+
+
+def _make_batch(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Make a batch of 28x28 float32 images and their labels, of about 'size' bytes."""
+    rows = max(size // ROW_SIZE, 1)
+    x = np.random.rand(rows, 28, 28).astype(np.float32)
+    y = np.random.randint(0, 10, size=rows).astype(np.uint8)
+    return x, y
+
+
+def ml_tensor_transport(
+    benchmark: BenchmarkControl,
+    encoding: str = "tensor",
+    size: int = 10 * 1024 * 1024,
+    round_trips: int = 50,
+) -> None:
+    """
+    Send batches through the ml_trade serializer and decode them.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param encoding: the payload encoding, 'tensor' or 'pickle'
+    :param size: the size in bytes of a batch
+    :param round_trips: number of round trips
+
+    :return: None
+    """
+    codecs = {
+        "tensor": (encode_tensors, decode_tensors),
+        "pickle": (pickle.dumps, pickle.loads),
+    }  # type: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]
+    encode, decode = codecs[encoding]
+    batch = _make_batch(size)
+    terms = Description({"batch_size": batch[0].shape[0], "price": 10})
+    checksum = 0.0
+
+    benchmark.start()
+    start_time = time.time()
+    for _ in range(round_trips):
+        msg = MlTradeMessage(
+            performative=MlTradeMessage.Performative.DATA,
+            terms=terms,
+            payload=encode(batch),
+        )
+        msg_bytes = MlTradeMessage.serializer.encode(msg)
+        recovered_msg = cast(
+            MlTradeMessage, MlTradeMessage.serializer.decode(msg_bytes)
+        )
+        x, y = decode(recovered_msg.payload)
+        checksum += float(x[-1, -1, -1]) + float(y[-1])
+    elapsed = time.time() - start_time
+
+    print(
+        "{} round trips of {:.1f} MB batches: {:.2f} ms each (checksum {:.3f})".format(
+            round_trips,
+            (batch[0].nbytes + batch[1].nbytes) / 1024 / 1024,
+            elapsed / round_trips * 1000,
+            checksum,
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(ml_tensor_transport).run()
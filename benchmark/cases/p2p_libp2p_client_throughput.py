@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Envelope throughput of the libp2p client connection.
+
+The delegate node is replaced by an asyncio stand-in in the same process,
+which replies to the agent address as the node does, then echoes back every
+envelope. Up to `window` envelopes are sent before waiting for their echoes.
+"""
+import asyncio
+import socket
+import struct
+import time
+from typing import List, cast
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.configurations.base import ConnectionConfig
+from aea.crypto.fetchai import FetchAICrypto
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.protocols.default.message import DefaultMessage
+
+from packages.fetchai.connections.p2p_libp2p_client.connection import (
+    P2PLibp2pClientConnection,
+)
+
+
+def _frame(data: bytes) -> bytes:
+    """Prefix data with its length."""
+    return struct.pack("!I", len(data)) + data
+
+
+async def _echo_node(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Handle a client connection, as a delegate node echoing the envelopes."""
+    try:
+        size = struct.unpack("!I", await reader.readexactly(4))[0]
+        await reader.readexactly(size)
+        writer.write(_frame(b"DONE"))
+        # the frames are echoed as they are read, so that the node costs little.
+        while True:
+            data = await reader.read(2 ** 16)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    writer.close()
+
+
+async def _run(
+    benchmark: BenchmarkControl, envelopes: int, window: int, size: int
+) -> float:
+    """Send the envelopes through the connection, and get the elapsed time."""
+    server = await asyncio.start_server(_echo_node, "127.0.0.1", 0)
+    port = cast(List[socket.socket], server.sockets)[0].getsockname()[1]
+    address = FetchAICrypto().address
+    connection = P2PLibp2pClientConnection(
+        configuration=ConnectionConfig(
+            nodes=[{"uri": "127.0.0.1:{}".format(port)}],
+            connection_id=P2PLibp2pClientConnection.connection_id,
+        ),
+        identity=Identity("", address=address),
+    )
+    await connection.connect()
+    message = DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES, content=b"x" * size
+    )
+    envelope = Envelope(
+        to=address, sender=address, protocol_id=message.protocol_id, message=message
+    )
+
+    benchmark.start()
+    start_time = time.time()
+    sent = 0
+    while sent < envelopes:
+        batch = min(window, envelopes - sent)
+        for _ in range(batch):
+            await connection.send(envelope)
+        for _ in range(batch):
+            assert await connection.receive() is not None
+        sent += batch
+    elapsed = time.time() - start_time
+
+    await connection.disconnect()
+    server.close()
+    await server.wait_closed()
+    return elapsed
+
+
+def p2p_libp2p_client_throughput(
+    benchmark: BenchmarkControl,
+    envelopes: int = 20000,
+    window: int = 100,
+    size: int = 100,
+) -> None:
+    """
+    Send envelopes to a stand-in delegate node, and receive them back.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param envelopes: number of envelopes
+    :param window: number of envelopes sent before waiting for the echoes
+    :param size: size of the content of the envelopes, in bytes
+
+    :return: None
+    """
+    elapsed = asyncio.new_event_loop().run_until_complete(
+        _run(benchmark, envelopes, window, size)
+    )
+    print(
+        "{} envelopes in {:.3f}s ({:.0f} envelopes/s)".format(
+            envelopes, elapsed, envelopes / elapsed
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(p2p_libp2p_client_throughput).run()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Latency of urgent envelopes while the agent is flooded with low-priority envelopes.
+
+The urgent envelopes use their own protocol. Use `lanes=True` to put it in a
+high-priority lane and `lanes=False` to process all the envelopes in FIFO order.
+"""
+import time
+from threading import Thread
+from typing import List
+
+from benchmark.framework.aea_test_wrapper import AEATestWrapper
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.aea import AEA
+from aea.aea_builder import AEABuilder
+from aea.configurations.base import ProtocolConfig, PublicId
+from aea.crypto.fetchai import FetchAICrypto
+from aea.mail.base import Envelope
+from aea.multiplexer import PriorityLane
+from aea.protocols.base import Message, Protocol
+from aea.protocols.default.message import DefaultMessage
+from aea.skills.base import Handler
+
+URGENT_PROTOCOL_ID = PublicId("fetchai", "urgent", "0.1.0")
+
+
+class BusyHandler(Handler):
+    """Handle the low-priority envelopes, spending some time on each of them."""
+
+    SUPPORTED_PROTOCOL = DefaultMessage.protocol_id
+    WORK = 0.0002
+
+    def setup(self) -> None:
+        """Noop setup."""
+
+    def teardown(self) -> None:
+        """Noop teardown."""
+
+    def handle(self, message: Message) -> None:
+        """Busy wait."""
+        deadline = time.perf_counter() + self.WORK
+        while time.perf_counter() < deadline:
+            pass
+
+
+class UrgentHandler(Handler):
+    """Handle the urgent envelopes, recording their latency."""
+
+    SUPPORTED_PROTOCOL = URGENT_PROTOCOL_ID
+    latencies = []  # type: List[float]
+
+    def setup(self) -> None:
+        """Noop setup."""
+
+    def teardown(self) -> None:
+        """Noop teardown."""
+
+    def handle(self, message: Message) -> None:
+        """Record the time passed since the envelope was put in the inbox."""
+        sent = float(message.content.decode("utf-8"))  # type: ignore
+        self.latencies.append(time.perf_counter() - sent)
+
+
+def _make_aea(lanes: bool, weight: int) -> AEA:
+    """Make an agent handling the default and the urgent protocol."""
+    builder = AEABuilder()
+    builder.set_name("priority_agent")
+    builder.add_private_key(FetchAICrypto.identifier, private_key_path=None)
+    builder.add_component_instance(
+        Protocol(
+            ProtocolConfig(
+                URGENT_PROTOCOL_ID.name,
+                URGENT_PROTOCOL_ID.author,
+                str(URGENT_PROTOCOL_ID.version),
+            ),
+            DefaultMessage,
+        )
+    )
+    builder.add_component_instance(
+        AEATestWrapper.make_skill(
+            handlers={"busy_handler": BusyHandler, "urgent_handler": UrgentHandler}
+        )
+    )
+    if lanes:
+        builder.set_priority_lanes(
+            [PriorityLane("urgent", weight, [URGENT_PROTOCOL_ID])]
+        )
+    return builder.build()
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Get a percentile (nearest rank) of a list of values."""
+    ordered = sorted(values)
+    index = max(0, int(round(percentile / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+
+def priority_latency(
+    benchmark: BenchmarkControl,
+    lanes: bool = True,
+    flood: int = 5000,
+    urgent: int = 50,
+    weight: int = 8,
+) -> None:
+    """
+    Flood the inbox of an agent, then put urgent envelopes while the agent is processing it.
+
+    The time passed is the time to process all the envelopes. The latency of the
+    urgent envelopes (time from the inbox to the handler) is printed.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param lanes: whether the urgent protocol has its own priority lane
+    :param flood: number of low-priority envelopes
+    :param urgent: number of urgent envelopes
+    :param weight: weight of the urgent lane (the default lane has weight 1)
+
+    :return: None
+    """
+    UrgentHandler.latencies = []
+    aea = _make_aea(lanes, weight)
+    aea._timeout = 0.0  # pylint: disable=protected-access
+    in_queue = aea.multiplexer.in_queue
+    for _ in range(flood):
+        in_queue.put(AEATestWrapper.dummy_envelope())
+
+    thread = Thread(target=aea.start)
+    benchmark.start()
+    thread.start()
+    try:
+        for _ in range(urgent):
+            message = AEATestWrapper.dummy_default_message(
+                content=str(time.perf_counter())
+            )
+            in_queue.put(
+                Envelope(
+                    to="test",
+                    sender="test",
+                    protocol_id=URGENT_PROTOCOL_ID,
+                    message=message,
+                )
+            )
+            time.sleep(0.005)
+        while len(UrgentHandler.latencies) < urgent or not in_queue.empty():
+            time.sleep(0.01)
+    finally:
+        aea.stop()
+        thread.join()
+
+    latencies = UrgentHandler.latencies
+    print(
+        "Urgent envelope latency (ms): p50 {:.2f}, p99 {:.2f}, max {:.2f}".format(
+            _percentile(latencies, 50) * 1000,
+            _percentile(latencies, 99) * 1000,
+            max(latencies) * 1000,
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(priority_latency).run()
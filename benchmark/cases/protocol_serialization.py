@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Encode and decode throughput of the serializers of the bundled protocols.
+
+Each protocol is measured on a typical message.
+"""
+import time
+from typing import Callable, Dict
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.helpers.search.models import Constraint, ConstraintType, Description, Query
+from aea.protocols.base import Message
+from aea.protocols.default.message import DefaultMessage
+from aea.protocols.signing.message import SigningMessage
+from aea.protocols.state_update.message import StateUpdateMessage
+
+from packages.fetchai.protocols.contract_api.message import ContractApiMessage
+from packages.fetchai.protocols.fipa.message import FipaMessage
+from packages.fetchai.protocols.gym.message import GymMessage
+from packages.fetchai.protocols.http.message import HttpMessage
+from packages.fetchai.protocols.ledger_api.message import LedgerApiMessage
+from packages.fetchai.protocols.ml_trade.message import MlTradeMessage
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
+from packages.fetchai.protocols.tac.message import TacMessage
+
+QUERY = Query([Constraint("price", ConstraintType("<", 10))])
+DESCRIPTION = Description({"price": 5, "quantity": 1})
+MESSAGES = {
+    "contract_api": lambda: ContractApiMessage(
+        performative=ContractApiMessage.Performative.ERROR,
+        code=1,
+        message="contract call failed",
+        data=b"{}",
+    ),
+    "default": lambda: DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES, content=b"hello"
+    ),
+    "fipa": lambda: FipaMessage(
+        performative=FipaMessage.Performative.PROPOSE,
+        dialogue_reference=("1", ""),
+        message_id=2,
+        target=1,
+        proposal=DESCRIPTION,
+    ),
+    "gym": lambda: GymMessage(
+        performative=GymMessage.Performative.PERCEPT,
+        step_id=1,
+        observation=GymMessage.AnyObject((1, 2)),
+        reward=1.0,
+        done=False,
+        info=GymMessage.AnyObject({}),
+    ),
+    "http": lambda: HttpMessage(
+        performative=HttpMessage.Performative.REQUEST,
+        method="GET",
+        url="http://localhost:8000/",
+        version="1.1",
+        headers="Content-Type: application/json",
+        bodyy=b"{}",
+    ),
+    "ledger_api": lambda: LedgerApiMessage(
+        performative=LedgerApiMessage.Performative.GET_BALANCE,
+        ledger_id="fetchai",
+        address="address1",
+    ),
+    "ml_trade": lambda: MlTradeMessage(
+        performative=MlTradeMessage.Performative.TERMS, terms=DESCRIPTION
+    ),
+    "oef_search": lambda: OefSearchMessage(
+        performative=OefSearchMessage.Performative.SEARCH_SERVICES, query=QUERY
+    ),
+    "signing": lambda: SigningMessage(
+        performative=SigningMessage.Performative.ERROR,
+        skill_callback_ids=("fetchai/generic_buyer:0.6.0",),
+        skill_callback_info={"some_key": "some_value"},
+        error_code=SigningMessage.ErrorCode.UNSUCCESSFUL_MESSAGE_SIGNING,
+    ),
+    "state_update": lambda: StateUpdateMessage(
+        performative=StateUpdateMessage.Performative.APPLY,
+        amount_by_currency_id={"FET": 10},
+        quantities_by_good_id={"good_id": 1},
+    ),
+    "tac": lambda: TacMessage(
+        performative=TacMessage.Performative.TRANSACTION,
+        tx_id="transaction_id",
+        tx_sender_addr="address1",
+        tx_counterparty_addr="address2",
+        amount_by_currency_id={"FET": 10},
+        tx_sender_fee=1,
+        tx_counterparty_fee=1,
+        quantities_by_good_id={"good_1": -1, "good_2": -2},
+        tx_nonce=123,
+        tx_sender_signature="signature1",
+        tx_counterparty_signature="signature2",
+    ),
+}  # type: Dict[str, Callable[[], Message]]
+
+
+def protocol_serialization(
+    benchmark: BenchmarkControl, protocol: str = "all", messages: int = 10000,
+) -> None:
+    """
+    Encode messages and decode them, for each protocol.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param protocol: the name of a bundled protocol, or 'all'
+    :param messages: number of messages per protocol
+
+    :return: None
+    """
+    names = sorted(MESSAGES) if protocol == "all" else [protocol]
+
+    benchmark.start()
+    for name in names:
+        message = MESSAGES[name]()
+        serializer = message.serializer
+        decode = serializer.decode
+
+        start_time = time.time()
+        encoded = [serializer.encode(message) for _ in range(messages)]
+        encode_time = time.time() - start_time
+
+        start_time = time.time()
+        for obj in encoded:
+            decode(obj)
+        decode_time = time.time() - start_time
+
+        assert decode(encoded[0]) == message, "Round trip failed."
+        print(
+            "{}: encode {:.0f} msg/s, decode {:.0f} msg/s".format(
+                name, messages / encode_time, messages / decode_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    TestCli(protocol_serialization).run()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Throughput of the recovery of the addresses of signed messages.
+
+The recoveries are made of `distinct` signed messages, repeated as agents see
+the same signatures several times (e.g. a proposal, then its acceptance and the
+settlement of the transaction). Use `mode='plain'` for the uncached recovery of
+each message, `mode='cached'` for the cached 'recover_message' and
+`mode='batch'` for 'recover_messages' with worker processes.
+"""
+import time
+from typing import Any, cast
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.crypto.cosmos import CosmosApi, CosmosHelper
+from aea.crypto.ethereum import EthereumApi, EthereumHelper
+from aea.crypto.fetchai import FetchAIApi, FetchAIHelper
+from aea.crypto.registries import make_crypto
+
+HELPERS = {
+    CosmosApi.identifier: CosmosHelper,
+    EthereumApi.identifier: EthereumHelper,
+    FetchAIApi.identifier: FetchAIHelper,
+}
+
+
+def signature_recovery(
+    benchmark: BenchmarkControl,
+    mode: str = "cached",
+    ledger_id: str = "ethereum",
+    recoveries: int = 10000,
+    distinct: int = 2500,
+) -> None:
+    """
+    Recover the addresses of signed messages.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param mode: 'plain', 'cached' or 'batch'
+    :param ledger_id: the ledger of the signatures
+    :param recoveries: number of recoveries
+    :param distinct: number of distinct signed messages
+
+    :return: None
+    """
+    crypto = make_crypto(ledger_id)
+    helper = HELPERS[ledger_id]
+    signed = []
+    for i in range(distinct):
+        message = "message {}".format(i).encode("utf-8")
+        signed.append((message, crypto.sign_message(message), False))
+    requests = [signed[i % distinct] for i in range(recoveries)]
+    cast(Any, helper.recover_message).cache.clear()
+
+    benchmark.start()
+    start_time = time.time()
+    if mode == "batch":
+        results = helper.recover_messages(requests)
+    elif mode == "cached":
+        results = [helper.recover_message(*request) for request in requests]
+    else:
+        recover_message = cast(Any, helper.recover_message).__wrapped__
+        results = [recover_message(*request) for request in requests]
+    elapsed = time.time() - start_time
+
+    assert all(crypto.address in addresses for addresses in results)
+    print(
+        "{} recoveries in {:.3f}s ({:.0f} recoveries/s)".format(
+            recoveries, elapsed, recoveries / elapsed
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(signature_recovery).run()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Insert and time-range query throughput of the SQLite storage of the data-serving skills.
+
+Use `pooled=True` for the pooled WAL-mode access layer, with batched inserts and
+an index on the time column, and `pooled=False` for the previous access pattern:
+a new connection and a commit for each statement, and no index.
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from typing import Any, List, Sequence, Tuple
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.helpers.sqlite import SQLiteDatabase
+
+CREATE_TABLE = "CREATE TABLE IF NOT EXISTS images (epoch INTEGER, raw_image_path TEXT, total_count INTEGER, free_spaces INTEGER)"
+CREATE_INDEX = "CREATE INDEX IF NOT EXISTS images_epoch ON images (epoch)"
+INSERT = "INSERT INTO images VALUES (?, ?, ?, ?)"
+SELECT_RANGE = "SELECT * FROM images WHERE epoch BETWEEN ? AND ?"
+
+BATCH_SIZE = 1000
+QUERY_SPAN = 100
+
+
+def _legacy_execute(path: str, command: str, variables: Sequence[Any] = ()) -> List:
+    """Execute a statement as the skills used to: one connection and one commit per statement."""
+    connection = sqlite3.connect(path, timeout=300)
+    try:
+        cursor = connection.cursor()
+        cursor.execute(command, variables)
+        result = cursor.fetchall()
+        connection.commit()
+        return result
+    finally:
+        connection.close()
+
+
+def _rows(start: int, count: int) -> List[Tuple[int, str, int, int]]:
+    """Make rows of detection data, one per second."""
+    return [
+        (epoch, "{:012d}_raw_image.png".format(epoch), epoch % 50, epoch % 20)
+        for epoch in range(start, start + count)
+    ]
+
+
+def sqlite_storage(
+    benchmark: BenchmarkControl,
+    pooled: bool = True,
+    rows: int = 100000,
+    queries: int = 1000,
+) -> None:
+    """
+    Insert rows in a table, then run time-range queries on it.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param pooled: whether to use the pooled access layer or the previous access pattern
+    :param rows: number of rows to insert
+    :param queries: number of time-range queries
+
+    :return: None
+    """
+    working_dir = tempfile.mkdtemp()
+    path = os.path.join(working_dir, "detection_results.db")
+    db = SQLiteDatabase(path)
+    step = max((rows - QUERY_SPAN) // max(queries, 1), 1)
+    try:
+        benchmark.start()
+        start_time = time.time()
+        if pooled:
+            db.execute(CREATE_TABLE)
+            db.execute(CREATE_INDEX)
+            for start in range(0, rows, BATCH_SIZE):
+                db.execute_many(INSERT, _rows(start, min(BATCH_SIZE, rows - start)))
+        else:
+            _legacy_execute(path, CREATE_TABLE)
+            for row in _rows(0, rows):
+                _legacy_execute(path, INSERT, row)
+        insert_time = time.time() - start_time
+
+        start_time = time.time()
+        found = 0
+        for i in range(queries):
+            variables = (i * step, i * step + QUERY_SPAN - 1)
+            if pooled:
+                found += len(db.execute(SELECT_RANGE, variables))
+            else:
+                found += len(_legacy_execute(path, SELECT_RANGE, variables))
+        query_time = time.time() - start_time
+
+        print(
+            "Inserted {} rows in {:.3f}s, {} range queries ({} rows found) in {:.3f}s".format(
+                rows, insert_time, queries, found, query_time
+            )
+        )
+    finally:
+        db.close()
+        shutil.rmtree(working_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    TestCli(sqlite_storage).run()
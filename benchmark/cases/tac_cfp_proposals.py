@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Throughput of the proposals of the tac_negotiation strategy in answer to CFPs.
+
+One agent of a TAC game receives CFPs from all the other agents, each looking
+for a few of the goods as a buyer or as a seller, and its holdings change every
+`cfps_per_trade` CFPs as if a trade was settled. Use `cached=True` for the
+candidate proposals kept until the holdings or the locks change, and
+`cached=False` to generate them again for each CFP.
+"""
+import logging
+import random
+import time
+from types import SimpleNamespace
+from typing import cast
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.decision_maker.default import OwnershipState, Preferences
+from aea.skills.base import SkillContext
+
+from packages.fetchai.skills.tac_negotiation.dialogues import Dialogue
+from packages.fetchai.skills.tac_negotiation.helpers import build_goods_query
+from packages.fetchai.skills.tac_negotiation.strategy import Strategy
+from packages.fetchai.skills.tac_negotiation.transactions import Transactions
+
+CURRENCY_ID = "FET"
+TX_FEE = 1
+GOODS_PER_CFP = 3
+
+
+def _make_context(goods: int) -> SimpleNamespace:
+    """Make the context of the skill, with the preferences and the holdings of a TAC agent."""
+    good_ids = [str(i) for i in range(goods)]
+    preferences = Preferences()
+    preferences.set(
+        exchange_params_by_currency_id={CURRENCY_ID: 1.0},
+        utility_params_by_good_id={
+            good_id: random.uniform(1000.0, 5000.0) for good_id in good_ids  # nosec
+        },
+    )
+    # the transaction fees are read by the strategy, but not set by the decision maker.
+    preferences.seller_transaction_fee = TX_FEE  # type: ignore
+    preferences.buyer_transaction_fee = TX_FEE  # type: ignore
+    ownership_state = OwnershipState()
+    ownership_state.set(
+        amount_by_currency_id={CURRENCY_ID: 10000},
+        quantities_by_good_id={
+            good_id: random.randint(0, 10) for good_id in good_ids  # nosec
+        },
+    )
+    return SimpleNamespace(
+        agent_name="agent",
+        logger=logging.getLogger("tac_cfp_proposals"),
+        decision_maker_handler_context=SimpleNamespace(
+            preferences=preferences, ownership_state=ownership_state
+        ),
+    )
+
+
+def tac_cfp_proposals(
+    benchmark: BenchmarkControl,
+    cached: bool = True,
+    goods: int = 50,
+    agents: int = 100,
+    cfps: int = 5000,
+    cfps_per_trade: int = 50,
+) -> None:
+    """
+    Answer CFPs with the tac_negotiation strategy.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param cached: whether to keep the candidate proposals between CFPs
+    :param goods: number of goods in the game
+    :param agents: number of agents in the game
+    :param cfps: number of CFPs
+    :param cfps_per_trade: number of CFPs between changes of the holdings
+
+    :return: None
+    """
+    random.seed(0)
+    context = _make_context(goods)
+    skill_context = cast(SkillContext, context)
+    context.transactions = Transactions(
+        name="transactions", skill_context=skill_context
+    )
+    strategy = Strategy(name="strategy", skill_context=skill_context)
+    good_ids = list(
+        context.decision_maker_handler_context.ownership_state.quantities_by_good_id
+    )
+    queries = []
+    for _ in range(agents - 1):
+        is_searching_for_sellers = random.random() < 0.5  # nosec
+        query = build_goods_query(
+            good_ids=random.sample(good_ids, GOODS_PER_CFP),
+            currency_id=CURRENCY_ID,
+            is_searching_for_sellers=is_searching_for_sellers,
+            is_search_query=False,
+        )
+        role = Dialogue.Role.SELLER if is_searching_for_sellers else Dialogue.Role.BUYER
+        queries.append((query, role))
+
+    benchmark.start()
+    proposals = 0
+    start_time = time.time()
+    for i in range(cfps):
+        if i % cfps_per_trade == 0:
+            good_id = random.choice(good_ids)  # nosec
+            context.decision_maker_handler_context.ownership_state.apply_delta(
+                delta_amount_by_currency_id={CURRENCY_ID: -10},
+                delta_quantities_by_good_id={
+                    other_good_id: 1 if other_good_id == good_id else 0
+                    for other_good_id in good_ids
+                },
+            )
+        if not cached:
+            strategy._candidate_proposals.clear()  # pylint: disable=protected-access
+        query, role = queries[i % len(queries)]
+        if strategy.get_proposal_for_query(query, role) is not None:
+            proposals += 1
+    elapsed = time.time() - start_time
+
+    print(
+        "{} CFPs in {:.3f}s ({:.0f} CFPs/s), {} proposals".format(
+            cfps, elapsed, cfps / elapsed, proposals
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(tac_cfp_proposals).run()
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Messages of the registrations and searches of the tac_negotiation skill.
+
+The register and search behaviours and the search handlers of the agents of a
+TAC game run against a local OEF node, on a simulated clock with one tick per
+second. Every `seconds_per_trade` seconds, a trade settles and a good moves
+between two agents. Use `delta=True` for registrations sent only when the
+descriptions change and searches backing off while their results are stable,
+and `delta=False` for the previous approach, which registers again and
+searches at fixed intervals. The CFPs are counted, but not answered. As the local node only matches
+the data model of a query, and the search queries of the skill use prefixed
+attribute names, the searches find no agents.
+"""
+import asyncio
+import datetime
+import logging
+import random
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any, List, cast
+from unittest import mock
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from aea.decision_maker.default import OwnershipState, Preferences
+from aea.mail.base import Envelope
+from aea.protocols.base import Message
+from aea.skills.base import SkillContext
+
+from packages.fetchai.connections.local.connection import DEFAULT_OEF, LocalNode
+from packages.fetchai.skills.tac_negotiation import registration, search
+from packages.fetchai.skills.tac_negotiation.behaviours import (
+    GoodsRegisterAndSearchBehaviour,
+)
+from packages.fetchai.skills.tac_negotiation.dialogues import Dialogues
+from packages.fetchai.skills.tac_negotiation.handlers import OEFSearchHandler
+from packages.fetchai.skills.tac_negotiation.registration import Registration
+from packages.fetchai.skills.tac_negotiation.search import Search
+from packages.fetchai.skills.tac_negotiation.strategy import Strategy
+from packages.fetchai.skills.tac_negotiation.transactions import Transactions
+
+CURRENCY_ID = "FET"
+UPDATE_INTERVAL = 5
+SEARCH_INTERVAL = 5
+MAX_SEARCH_INTERVAL = 60
+
+
+class _Clock:
+    """A simulated clock, in place of the 'datetime' module of the skill."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.start = datetime.datetime.now()
+        self.seconds = 0
+        self.datetime = SimpleNamespace(now=self.now)
+
+    def now(self) -> datetime.datetime:
+        """Get the simulated time."""
+        return self.start + datetime.timedelta(seconds=self.seconds)
+
+
+class _Outbox:
+    """An outbox which keeps the envelopes sent by an agent."""
+
+    def __init__(self, address: str) -> None:
+        """Initialize the outbox."""
+        self.address = address
+        self.envelopes = []  # type: List[Envelope]
+
+    def put_message(self, message: Message) -> None:
+        """Put a message in the outbox."""
+        self.envelopes.append(
+            Envelope(
+                to=message.counterparty,
+                sender=self.address,
+                protocol_id=message.protocol_id,
+                message=message,
+            )
+        )
+
+
+class _Agent:
+    """The tac_negotiation components of an agent."""
+
+    def __init__(self, address: str, goods: int, delta: bool) -> None:
+        """Initialize the agent, with random holdings."""
+        good_ids = [str(i) for i in range(goods)]
+        preferences = Preferences()
+        preferences.set(
+            exchange_params_by_currency_id={CURRENCY_ID: 1.0},
+            utility_params_by_good_id={good_id: 1.0 for good_id in good_ids},
+        )
+        self.ownership_state = OwnershipState()
+        self.ownership_state.set(
+            amount_by_currency_id={CURRENCY_ID: 1000},
+            quantities_by_good_id={
+                good_id: random.randint(1, 3) for good_id in good_ids  # nosec
+            },
+        )
+        self.outbox = _Outbox(address)
+        context = SimpleNamespace(
+            agent_name=address,
+            agent_address=address,
+            logger=logging.getLogger("tac_registration_messages"),
+            shared_state={},
+            is_active=True,
+            search_service_address=DEFAULT_OEF,
+            outbox=self.outbox,
+            decision_maker_handler_context=SimpleNamespace(
+                preferences=preferences,
+                ownership_state=self.ownership_state,
+                goal_pursuit_readiness=SimpleNamespace(is_ready=True),
+            ),
+        )
+        skill_context = cast(SkillContext, context)
+        context.strategy = Strategy(name="strategy", skill_context=skill_context)
+        context.transactions = Transactions(
+            name="transactions", skill_context=skill_context
+        )
+        context.dialogues = Dialogues(name="dialogues", skill_context=skill_context)
+        context.registration = Registration(
+            name="registration",
+            skill_context=skill_context,
+            update_interval=UPDATE_INTERVAL,
+        )
+        context.search = Search(
+            name="search",
+            skill_context=skill_context,
+            search_interval=SEARCH_INTERVAL,
+            max_search_interval=MAX_SEARCH_INTERVAL if delta else SEARCH_INTERVAL,
+        )
+        if not delta:
+            # register again on each update, as if the descriptions always changed.
+            context.registration.is_registered = (  # type: ignore
+                lambda *args, **kwargs: False
+            )
+        self.behaviour = GoodsRegisterAndSearchBehaviour(
+            name="tac_negotiation", skill_context=skill_context
+        )
+        self.handler = OEFSearchHandler(name="oef", skill_context=skill_context)
+
+
+async def _make_queue() -> asyncio.Queue:
+    """Make a queue in the running event loop."""
+    return asyncio.Queue()
+
+
+def _deliver(node: LocalNode, loop: Any, queue: asyncio.Queue, envelope: Envelope):
+    """Hand an envelope to the node, and get the envelopes it sent back."""
+    loop.run_until_complete(node._handle_envelope(envelope))
+    # the node puts the envelopes in the queues with 'call_soon_threadsafe'.
+    loop.run_until_complete(asyncio.sleep(0))
+    responses = []
+    while not queue.empty():
+        responses.append(queue.get_nowait())
+    return responses
+
+
+def tac_registration_messages(
+    benchmark: BenchmarkControl,
+    delta: bool = True,
+    agents: int = 20,
+    goods: int = 10,
+    seconds: int = 600,
+    seconds_per_trade: int = 30,
+) -> None:
+    """
+    Run the registrations and searches of a TAC game on a local OEF node, and count the messages.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param delta: whether to register only changed descriptions and back off stable searches
+    :param agents: number of agents
+    :param goods: number of goods
+    :param seconds: simulated duration of the game, in seconds
+    :param seconds_per_trade: simulated seconds between trades
+
+    :return: None
+    """
+    random.seed(0)
+    clock = _Clock()
+    loop = asyncio.new_event_loop()
+    node = LocalNode(loop=loop)
+    counts = Counter()  # type: Counter
+    with mock.patch.object(registration, "datetime", clock), mock.patch.object(
+        search, "datetime", clock
+    ):
+        addresses = ["agent_{}".format(i) for i in range(agents)]
+        participants = [_Agent(address, goods, delta) for address in addresses]
+        queues = {}
+        for address in addresses:
+            queues[address] = loop.run_until_complete(_make_queue())
+            loop.run_until_complete(node.connect(address, queues[address]))
+
+        benchmark.start()
+        start_time = time.time()
+        for clock.seconds in range(1, seconds + 1):
+            if clock.seconds % seconds_per_trade == 0:
+                seller, buyer = random.sample(participants, 2)  # nosec
+                good_id = str(random.randrange(goods))  # nosec
+                for participant, quantity in ((seller, -1), (buyer, 1)):
+                    participant.ownership_state.apply_delta(
+                        delta_amount_by_currency_id={CURRENCY_ID: 0},
+                        delta_quantities_by_good_id={
+                            str(i): quantity if str(i) == good_id else 0
+                            for i in range(goods)
+                        },
+                    )
+            for participant in participants:
+                participant.behaviour.act()
+                envelopes = participant.outbox.envelopes
+                participant.outbox.envelopes = []
+                for envelope in envelopes:
+                    counts[cast(Message, envelope.message).performative] += 1
+                    if envelope.to != DEFAULT_OEF:
+                        continue
+                    for response in _deliver(
+                        node, loop, queues[envelope.sender], envelope
+                    ):
+                        counts[cast(Message, response.message).performative] += 1
+                        response.message.counterparty = response.sender
+                        participant.handler.handle(response.message)
+                # the CFPs sent by the search handler
+                for envelope in participant.outbox.envelopes:
+                    counts[cast(Message, envelope.message).performative] += 1
+                participant.outbox.envelopes = []
+        elapsed = time.time() - start_time
+    loop.close()
+
+    print(
+        "{} agents, {} simulated seconds in {:.3f}s: {} messages ({})".format(
+            agents,
+            seconds,
+            elapsed,
+            sum(counts.values()),
+            ", ".join(
+                "{}={}".format(performative, count)
+                for performative, count in sorted(
+                    counts.items(), key=lambda item: str(item[0])
+                )
+            ),
+        )
+    )
+
+
+if __name__ == "__main__":
+    TestCli(tac_registration_messages).run()
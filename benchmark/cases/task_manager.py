@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Per-task overhead and memory of the task manager.
+
+Use `mode=poll` to get the results with `get_task_result` (then discard them)
+and `mode=future` to await them with `enqueue_task_future`. Use `payload` to pass
+a bytes argument of that size to each task, and `shared=False` to pickle it even
+if it is large.
+"""
+import asyncio
+import os
+
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+import psutil  # type: ignore
+
+from aea.skills.tasks import DEFAULT_SHARED_MEMORY_THRESHOLD, TaskManager
+
+SAMPLES = 5
+
+
+def _checksum(data: bytes) -> int:
+    """Read the payload in the worker."""
+    return len(data) + data[-1] if data else 0
+
+
+def _run_polling(task_manager: TaskManager, tasks: int, data: bytes) -> None:
+    """Enqueue the tasks one at a time and get their result."""
+    for _ in range(tasks):
+        task_id = task_manager.enqueue_task(_checksum, args=(data,))
+        task_manager.get_task_result(task_id).get()
+        task_manager.discard_task_result(task_id)
+
+
+def _run_futures(task_manager: TaskManager, tasks: int, data: bytes) -> None:
+    """Enqueue the tasks one at a time and await their future."""
+    loop = asyncio.new_event_loop()
+
+    async def run() -> None:
+        for _ in range(tasks):
+            await task_manager.enqueue_task_future(_checksum, args=(data,), loop=loop)
+
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def task_manager(
+    benchmark: BenchmarkControl,
+    mode: str = "poll",
+    tasks: int = 2000,
+    payload: int = 0,
+    shared: bool = True,
+) -> None:
+    """
+    Run small tasks in the task manager and print the memory after each batch.
+
+    The per-task overhead is the time passed divided by the number of tasks.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param mode: how to get the results, 'poll' or 'future'
+    :param tasks: number of tasks
+    :param payload: size in bytes of the argument of each task
+    :param shared: whether large arguments are passed through shared memory
+
+    :return: None
+    """
+    run = {"poll": _run_polling, "future": _run_futures}[mode]
+    manager = TaskManager(
+        nb_workers=2,
+        is_lazy_pool_start=False,
+        shared_memory_threshold=DEFAULT_SHARED_MEMORY_THRESHOLD if shared else None,
+    )
+    manager.start()
+    data = b"\x01" * payload
+    process = psutil.Process(os.getpid())
+    batch = max(tasks // SAMPLES, 1)
+
+    benchmark.start()
+    try:
+        for done in range(batch, tasks + 1, batch):
+            run(manager, batch, data)
+            results = manager._results_by_task_id  # pylint: disable=protected-access
+            print(
+                "{} tasks: rss {:.1f} MB, results kept {}".format(
+                    done, process.memory_info().rss / 1024 / 1024, len(results)
+                )
+            )
+    finally:
+        manager.stop()
+
+
+if __name__ == "__main__":
+    TestCli(task_manager).run()
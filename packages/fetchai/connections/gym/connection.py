@@ -33,6 +33,10 @@ from aea.connections.base import Connection
 from aea.helpers.base import locate
 from aea.mail.base import Address, Envelope
 
+from packages.fetchai.connections.gym.vector_env import (
+    DEFAULT_START_METHOD,
+    SubprocessVectorEnv,
+)
 from packages.fetchai.protocols.gym.message import GymMessage
 
 logger = logging.getLogger("aea.packages.fetchai.connections.gym")
@@ -48,10 +52,32 @@ class GymChannel:
 
     THREAD_POOL_SIZE = 3
 
-    def __init__(self, address: Address, gym_env: gym.Env):
-        """Initialize a gym channel."""
+    def __init__(
+        self,
+        address: Address,
+        gym_env: gym.Env,
+        nb_envs: int = 1,
+        nb_workers: Optional[int] = None,
+        env_entry_point: Optional[str] = None,
+        start_method: str = DEFAULT_START_METHOD,
+    ):
+        """
+        Initialize a gym channel.
+
+        :param address: the address of the agent.
+        :param gym_env: the gym environment.
+        :param nb_envs: the number of environment copies stepped by 'act_batch' messages; with 1, these are not supported.
+        :param nb_workers: the number of subprocesses stepping the copies.
+        :param env_entry_point: the dotted path of the environment class or factory, to create the copies in the subprocesses.
+        :param start_method: the start method of the subprocesses, 'spawn' or 'forkserver'.
+        """
         self.address = address
         self.gym_env = gym_env
+        self.nb_envs = nb_envs
+        self.nb_workers = nb_workers
+        self.env_entry_point = env_entry_point
+        self.start_method = start_method
+        self._vector_env = None  # type: Optional[SubprocessVectorEnv]
         self._loop: Optional[AbstractEventLoop] = None
         self._queue: Optional[asyncio.Queue] = None
         self._threaded_pool: ThreadPoolExecutor = ThreadPoolExecutor(
@@ -76,6 +102,18 @@ class GymChannel:
             return None
         self._loop = asyncio.get_event_loop()
         self._queue = asyncio.Queue()
+        if self.nb_envs > 1:
+            if self.env_entry_point is None:
+                raise ValueError(
+                    "The entry point of the environment ('env') must be set to step several copies."
+                )
+            self._vector_env = await self._run_in_executor(
+                SubprocessVectorEnv,
+                self.env_entry_point,
+                self.nb_envs,
+                self.nb_workers,
+                self.start_method,
+            )
 
     async def send(self, envelope: Envelope) -> None:
         """
@@ -126,9 +164,38 @@ class GymChannel:
                 message=msg,
             )
             await self._send(envelope)
+        elif gym_message.performative == GymMessage.Performative.ACT_BATCH:
+            if self._vector_env is None:
+                raise ValueError("Batches of actions need more than one environment.")
+            actions = gym_message.actions.any
+            step_id = gym_message.step_id
+
+            observations, rewards, dones, infos = await self._run_in_executor(
+                self._vector_env.step, actions
+            )
+
+            msg = GymMessage(
+                performative=GymMessage.Performative.PERCEPT_BATCH,
+                observations=GymMessage.AnyObject(observations),
+                rewards=tuple(rewards),
+                dones=tuple(dones),
+                infos=GymMessage.AnyObject(infos),
+                step_id=step_id,
+            )
+            envelope = Envelope(
+                to=envelope.sender,
+                sender=DEFAULT_GYM,
+                protocol_id=GymMessage.protocol_id,
+                message=msg,
+            )
+            await self._send(envelope)
         elif gym_message.performative == GymMessage.Performative.RESET:
+            if self._vector_env is not None:
+                await self._run_in_executor(self._vector_env.reset)
             await self._run_in_executor(self.gym_env.reset)
         elif gym_message.performative == GymMessage.Performative.CLOSE:
+            if self._vector_env is not None:
+                await self._run_in_executor(self._vector_env.close)
             await self._run_in_executor(self.gym_env.close)
 
     async def _send(self, envelope: Envelope) -> None:
@@ -146,6 +213,9 @@ class GymChannel:
 
         :return: None
         """
+        if self._vector_env is not None:
+            await self._run_in_executor(self._vector_env.stop)
+            self._vector_env = None
         if self._queue is not None:
             await self._queue.put(None)
             self._queue = None
@@ -168,12 +238,24 @@ class GymConnection(Connection):
         :param kwargs: the keyword arguments of the parent class.
         """
         super().__init__(**kwargs)
+        gym_env_package = cast(Optional[str], self.configuration.config.get("env"))
         if gym_env is None:
-            gym_env_package = cast(str, self.configuration.config.get("env"))
             assert gym_env_package is not None, "env must be set!"
             gym_env_class = locate(gym_env_package)
             gym_env = gym_env_class()
-        self.channel = GymChannel(self.address, gym_env)
+        nb_envs = cast(int, self.configuration.config.get("nb_envs", 1))
+        nb_workers = cast(Optional[int], self.configuration.config.get("nb_workers"))
+        start_method = cast(
+            str, self.configuration.config.get("start_method", DEFAULT_START_METHOD)
+        )
+        self.channel = GymChannel(
+            self.address,
+            gym_env,
+            nb_envs,
+            nb_workers,
+            env_entry_point=gym_env_package or None,
+            start_method=start_method,
+        )
         self._connection = None  # type: Optional[asyncio.Queue]
 
     async def connect(self) -> None:
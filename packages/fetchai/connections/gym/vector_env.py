@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Copies of a gym environment stepped in subprocesses.
+
+The workers are started with an explicit 'spawn' (or 'forkserver') context, as the
+multiplexer runs other threads. A new process does not have the agent's packages: this
+module only imports the framework and third-party libraries, and the workers run it
+with runpy. The environments are created in the workers from their entry point.
+"""
+
+import multiprocessing
+import os
+import runpy
+import threading
+from multiprocessing.connection import Connection as PipeConnection
+from typing import Any, List, Optional, Sequence, Tuple
+
+from aea.helpers.base import locate
+
+
+DEFAULT_START_METHOD = "spawn"
+
+_STEP = "step"
+_RESET = "reset"
+_CLOSE = "close"
+_STOP = "stop"
+
+_WORKER_RUN_NAME = "__gym_vector_env_worker__"
+
+
+def _vector_env_worker(
+    connection: PipeConnection, env_entry_point: str, nb_envs: int
+) -> None:
+    """
+    Run copies of a gym environment, on the commands received from a pipe.
+
+    An environment whose episode is done is reset: the observation returned for it
+    is the first of the next episode, the last one is in its info, if a dict.
+
+    :param connection: the worker end of the pipe.
+    :param env_entry_point: the dotted path of the environment class or factory.
+    :param nb_envs: the number of environment copies.
+    :return: None
+    """
+    env_fn = locate(env_entry_point)
+    envs = [env_fn() for _ in range(nb_envs)]
+    try:
+        while True:
+            command, data = connection.recv()
+            if command == _STOP:
+                break
+            try:
+                if command == _STEP:
+                    result = []  # type: Any
+                    for env, action in zip(envs, data):
+                        observation, reward, done, info = env.step(action)
+                        if done:
+                            if isinstance(info, dict):
+                                info = dict(info, terminal_observation=observation)
+                            observation = env.reset()
+                        result.append((observation, reward, done, info))
+                elif command == _RESET:
+                    result = [env.reset() for env in envs]
+                else:
+                    result = [env.close() for env in envs]
+            except Exception as e:  # pylint: disable=broad-except
+                result = e
+            connection.send(result)
+    except (EOFError, KeyboardInterrupt):  # pragma: nocover
+        pass
+    finally:
+        connection.close()
+
+
+class SubprocessVectorEnv:
+    """
+    Copies of a gym environment, stepped in a vector of local subprocesses.
+
+    The copies are split among the workers. A step of the vector sends each worker
+    the actions of its copies and gathers the feedback, in the order of the copies.
+    """
+
+    def __init__(
+        self,
+        env_entry_point: str,
+        nb_envs: int,
+        nb_workers: Optional[int] = None,
+        start_method: str = DEFAULT_START_METHOD,
+    ):
+        """
+        Initialize the vector and start its workers.
+
+        :param env_entry_point: the dotted path of the environment class or factory, located in the workers.
+        :param nb_envs: the number of environment copies.
+        :param nb_workers: the number of subprocesses. If None, it depends on the number of CPUs.
+        :param start_method: the start method of the subprocesses, 'spawn' or 'forkserver'.
+        """
+        assert nb_envs > 0, "The number of environments must be positive."
+        assert start_method in (
+            "spawn",
+            "forkserver",
+        ), "Workers cannot be forked from the threads of the agent."
+        self.nb_envs = nb_envs
+        nb_workers = min(nb_envs, nb_workers or os.cpu_count() or 1)
+        self._sizes = [
+            nb_envs // nb_workers + (1 if index < nb_envs % nb_workers else 0)
+            for index in range(nb_workers)
+        ]
+        self._lock = threading.Lock()
+        self._pipes = []  # type: List[PipeConnection]
+        self._processes = []  # type: List[multiprocessing.Process]
+        context = multiprocessing.get_context(start_method)
+        for size in self._sizes:
+            parent_end, worker_end = context.Pipe()
+            process = context.Process(  # type: ignore
+                target=runpy.run_path,
+                args=(os.path.abspath(__file__),),
+                kwargs=dict(
+                    init_globals=dict(_worker_args=(worker_end, env_entry_point, size)),
+                    run_name=_WORKER_RUN_NAME,
+                ),
+                daemon=True,
+            )
+            process.start()
+            worker_end.close()
+            self._pipes.append(parent_end)
+            self._processes.append(process)
+
+    def _request(self, command: str, data: Sequence[Any]) -> List[Any]:
+        """
+        Send a command to all the workers and gather the results.
+
+        :param command: the command.
+        :param data: the data of each worker.
+        :return: the results of all the copies.
+        """
+        with self._lock:
+            for pipe, worker_data in zip(self._pipes, data):
+                pipe.send((command, worker_data))
+            results = [pipe.recv() for pipe in self._pipes]
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return [item for result in results for item in result]
+
+    def step(
+        self, actions: Sequence[Any]
+    ) -> Tuple[List[Any], List[float], List[bool], List[Any]]:
+        """
+        Step all the copies.
+
+        :param actions: one action for each copy.
+        :return: the observations, rewards, done flags and infos of the copies.
+        """
+        if len(actions) != self.nb_envs:
+            raise ValueError(
+                "Expected {} actions, got {}.".format(self.nb_envs, len(actions))
+            )
+        data = []
+        start = 0
+        for size in self._sizes:
+            data.append(list(actions[start : start + size]))
+            start += size
+        feedback = self._request(_STEP, data)
+        observations = [observation for observation, _, _, _ in feedback]
+        rewards = [float(reward) for _, reward, _, _ in feedback]
+        dones = [bool(done) for _, _, done, _ in feedback]
+        infos = [info for _, _, _, info in feedback]
+        return observations, rewards, dones, infos
+
+    def reset(self) -> List[Any]:
+        """
+        Reset all the copies.
+
+        :return: the observations of the copies.
+        """
+        return self._request(_RESET, [None] * len(self._pipes))
+
+    def close(self) -> None:
+        """
+        Close all the copies. The workers keep running.
+
+        :return: None
+        """
+        self._request(_CLOSE, [None] * len(self._pipes))
+
+    def stop(self) -> None:
+        """
+        Stop the workers.
+
+        :return: None
+        """
+        with self._lock:
+            for pipe in self._pipes:
+                try:
+                    pipe.send((_STOP, None))
+                except (BrokenPipeError, EOFError):  # pragma: nocover
+                    pass
+                pipe.close()
+            for process in self._processes:
+                process.join()
+            self._pipes, self._processes = [], []
+
+
+if __name__ == _WORKER_RUN_NAME:  # pragma: nocover
+    _vector_env_worker(*_worker_args)  # type: ignore # noqa: F821 # pylint: disable=undefined-variable
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""In-process connection for agents running in the same Python process."""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+
+from aea.configurations.base import PublicId
+from aea.connections.base import Connection
+from aea.helpers.async_utils import cancel_and_wait
+from aea.mail.base import AEAConnectionError, Address, Envelope
+from aea.protocols.default.message import DefaultMessage
+
+logger = logging.getLogger("aea.packages.fetchai.connections.in_process")
+
+TARGET = 0
+MESSAGE_ID = 1
+IN_PROCESS_NODE = "in_process_node"
+PUBLIC_ID = PublicId.from_str("fetchai/in_process:0.1.0")
+
+
+class InProcessRegistry:
+    """
+    Directory of the in-process connections, keyed by agent address.
+
+    Lookups are lock-free (a single dictionary read),
+    registrations and removals are serialised by a thread lock.
+    """
+
+    def __init__(self):
+        """Initialize the registry."""
+        self._connections = {}  # type: Dict[Address, InProcessConnection]
+        self._lock = threading.Lock()
+
+    def register(self, address: Address, connection: "InProcessConnection") -> None:
+        """
+        Register a connection for an address.
+
+        :param address: the address of the agent.
+        :param connection: the connection owned by the agent.
+        :return: None
+        :raises AEAConnectionError: if another connection is registered with the same address.
+        """
+        with self._lock:
+            registered = self._connections.get(address)
+            if registered is not None and registered is not connection:
+                raise AEAConnectionError(
+                    "Address {} already registered in the in-process registry.".format(
+                        address
+                    )
+                )
+            self._connections[address] = connection
+
+    def unregister(self, address: Address, connection: "InProcessConnection") -> None:
+        """
+        Remove the connection registered for an address.
+
+        :param address: the address of the agent.
+        :param connection: the connection owned by the agent.
+        :return: None
+        """
+        with self._lock:
+            if self._connections.get(address) is connection:
+                self._connections.pop(address)
+
+    def get(self, address: Address) -> Optional["InProcessConnection"]:
+        """
+        Get the connection registered for an address.
+
+        :param address: the address of the agent.
+        :return: the connection, or None if the address is not in this process.
+        """
+        return self._connections.get(address)
+
+    def __contains__(self, address: Address) -> bool:
+        """Check whether an address is registered."""
+        return address in self._connections
+
+
+registry = InProcessRegistry()
+
+
+class InProcessConnection(Connection):
+    """
+    Proxy for agents running in the same process.
+
+    Envelopes addressed to an agent connected to the same registry are put
+    as they are (i.e. without serialization) in the receiving queue of the
+    recipient's connection. When sender and recipient share the event loop,
+    no thread hop is performed.
+
+    Envelopes addressed to other agents are forwarded to the fallback connection,
+    if any, otherwise an error message is sent back to the sender.
+    """
+
+    connection_id = PUBLIC_ID
+
+    def __init__(
+        self,
+        fallback_connection: Optional[Connection] = None,
+        in_process_registry: Optional[InProcessRegistry] = None,
+        **kwargs
+    ):
+        """
+        Initialize an in-process connection.
+
+        :param fallback_connection: the connection used for the addresses not in this process. (Note, AEA loader will not accept this argument.)
+        :param in_process_registry: the registry shared by the co-located agents. If None, the process-wide registry is used. (Note, AEA loader will not accept this argument.)
+        """
+        super().__init__(**kwargs)
+        self._fallback_connection = fallback_connection
+        self._registry = (
+            in_process_registry if in_process_registry is not None else registry
+        )
+        self._reader = None  # type: Optional[asyncio.Queue]
+        self._fallback_receiving_task = None  # type: Optional[asyncio.Task]
+
+    @property
+    def fallback_connection(self) -> Optional[Connection]:
+        """Get the fallback connection."""
+        return self._fallback_connection
+
+    async def connect(self) -> None:
+        """Register the connection in the in-process registry."""
+        if self.connection_status.is_connected:
+            return
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        self._reader = asyncio.Queue()
+        self._registry.register(self.address, self)
+        try:
+            if self._fallback_connection is not None:
+                self._fallback_connection.loop = self._loop
+                await self._fallback_connection.connect()
+                self._fallback_receiving_task = self._loop.create_task(
+                    self._fallback_receiving_loop()
+                )
+        except Exception:
+            self._registry.unregister(self.address, self)
+            self._reader = None
+            raise
+        self.connection_status.is_connected = True
+
+    async def disconnect(self) -> None:
+        """Unregister the connection from the in-process registry."""
+        if not self.connection_status.is_connected:
+            return
+        assert self._reader is not None
+        self.connection_status.is_connected = False
+        self._registry.unregister(self.address, self)
+        if self._fallback_connection is not None:
+            await cancel_and_wait(self._fallback_receiving_task)
+            self._fallback_receiving_task = None
+            await self._fallback_connection.disconnect()
+        self._reader.put_nowait(None)
+        self._reader = None
+
+    async def send(self, envelope: Envelope) -> None:
+        """
+        Send an envelope.
+
+        :param envelope: the envelope to send.
+        :return: None
+        """
+        if not self.connection_status.is_connected:
+            raise AEAConnectionError(
+                "Connection not established yet. Please use 'connect()'."
+            )
+        recipient = self._registry.get(envelope.to)
+        if recipient is not None and recipient.connection_status.is_connected:
+            recipient.deliver(envelope)
+        elif self._fallback_connection is not None:
+            await self._fallback_connection.send(envelope)
+        else:
+            self.deliver(self._destination_not_available(envelope))
+
+    def deliver(self, envelope: Envelope) -> None:
+        """
+        Put an envelope in the receiving queue of this connection.
+
+        The envelope is put directly if the caller runs in the loop of this connection,
+        otherwise it is scheduled in a thread-safe way.
+
+        :param envelope: the envelope to deliver.
+        :return: None
+        """
+        reader = self._reader
+        loop = self._loop
+        if reader is None or loop is None:
+            return
+        if asyncio._get_running_loop() is loop:  # pylint: disable=protected-access
+            reader.put_nowait(envelope)
+        else:
+            loop.call_soon_threadsafe(reader.put_nowait, envelope)
+
+    async def receive(self, *args, **kwargs) -> Optional[Envelope]:
+        """
+        Receive an envelope. Blocking.
+
+        :return: the envelope received, or None.
+        """
+        if not self.connection_status.is_connected:
+            raise AEAConnectionError(
+                "Connection not established yet. Please use 'connect()'."
+            )
+        try:
+            assert self._reader is not None
+            envelope = await self._reader.get()
+            if envelope is None:
+                self.logger.debug("Receiving task terminated.")
+            return envelope
+        except Exception:  # pragma: nocover # pylint: disable=broad-except
+            return None
+
+    async def _fallback_receiving_loop(self) -> None:
+        """Forward the envelopes received by the fallback connection."""
+        assert self._fallback_connection is not None
+        assert self._reader is not None
+        while self._fallback_connection.connection_status.is_connected:
+            envelope = await self._fallback_connection.receive()
+            if envelope is None:
+                break
+            self._reader.put_nowait(envelope)
+        self.logger.debug("Fallback receiving loop terminated.")
+
+    @staticmethod
+    def _destination_not_available(envelope: Envelope) -> Envelope:
+        """
+        Build the error envelope for an unknown destination.
+
+        :param envelope: the envelope that could not be delivered.
+        :return: the error envelope for the sender.
+        """
+        msg = DefaultMessage(
+            performative=DefaultMessage.Performative.ERROR,
+            dialogue_reference=("", ""),
+            target=TARGET,
+            message_id=MESSAGE_ID,
+            error_code=DefaultMessage.ErrorCode.INVALID_DIALOGUE,
+            error_msg="Destination not available",
+            error_data={},
+        )
+        return Envelope(
+            to=envelope.sender,
+            sender=IN_PROCESS_NODE,
+            protocol_id=DefaultMessage.protocol_id,
+            message=msg,
+        )
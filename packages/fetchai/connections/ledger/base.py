@@ -59,6 +59,7 @@ class RequestDispatcher(ABC):
         self.loop = loop if loop is not None else asyncio.get_event_loop()
         self.executor = executor
         self._api_configs = api_configs
+        self._ledger_apis = {}  # type: Dict[str, LedgerApi]
 
     def api_config(self, ledger_id: str) -> Dict[str, str]:
         """Get api config."""
@@ -67,6 +68,21 @@ class RequestDispatcher(ABC):
             config = self._api_configs[ledger_id]
         return config
 
+    def ledger_api(self, ledger_id: str) -> LedgerApi:
+        """
+        Get the ledger API for a ledger id.
+
+        The ledger APIs are created once, and kept for the lifetime of the dispatcher.
+
+        :param ledger_id: the ledger id.
+        :return: the ledger API.
+        """
+        api = self._ledger_apis.get(ledger_id)
+        if api is None:
+            api = self.ledger_api_registry.make(ledger_id, **self.api_config(ledger_id))
+            self._ledger_apis[ledger_id] = api
+        return api
+
     async def run_async(
         self,
         func: Callable[[Any], Task],
@@ -99,7 +115,7 @@ class RequestDispatcher(ABC):
         assert isinstance(envelope.message, Message)
         message = envelope.message
         ledger_id = self.get_ledger_id(message)
-        api = self.ledger_api_registry.make(ledger_id, **self.api_config(ledger_id))
+        api = self.ledger_api(ledger_id)
         message.is_incoming = True
         dialogue = self.dialogues.update(message)
         assert dialogue is not None, "No dialogue created."
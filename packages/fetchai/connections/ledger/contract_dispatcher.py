@@ -18,9 +18,9 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the implementation of the contract API request dispatcher."""
-from typing import cast
+from typing import Dict, Optional, cast
 
-from aea.contracts import contract_registry
+from aea.contracts import Contract, contract_registry
 from aea.crypto.base import LedgerApi
 from aea.crypto.registries import Registry
 from aea.helpers.dialogue.base import (
@@ -87,6 +87,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         """Initialize the dispatcher."""
         super().__init__(*args, **kwargs)
         self._contract_api_dialogues = ContractApiDialogues()
+        self._contracts = {}  # type: Dict[str, Contract]
 
     @property
     def dialogues(self) -> BaseDialogues:
@@ -98,6 +99,56 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         """Get the contract registry."""
         return contract_registry
 
+    def get_contract(self, contract_id: str) -> Contract:
+        """
+        Get a contract from the contract registry.
+
+        The contracts are made once, and kept until they are invalidated. Together with
+        the contract instances cached by the ledger APIs, this caches the contract
+        instances by contract id, ledger id and contract address.
+
+        :param contract_id: the contract id.
+        :return: the contract.
+        """
+        contract = self._contracts.get(contract_id)
+        if contract is None:
+            contract = self.contract_registry.make(contract_id)
+            self._contracts[contract_id] = contract
+        return contract
+
+    def invalidate_contracts(
+        self,
+        contract_id: Optional[str] = None,
+        ledger_id: Optional[str] = None,
+        contract_address: Optional[str] = None,
+    ) -> None:
+        """
+        Invalidate the cached contracts and contract instances.
+
+        Only the cache entries matching all the provided arguments are invalidated,
+        e.g. all of them if no argument is provided. The contracts themselves are
+        invalidated only if neither the ledger id nor the contract address is provided.
+
+        :param contract_id: the contract id.
+        :param ledger_id: the ledger id.
+        :param contract_address: the contract address.
+        :return: None
+        """
+        contract_interface = None
+        if contract_id is not None:
+            contract = self._contracts.get(contract_id)
+            if contract is None:
+                return
+            contract_interface = contract.contract_interface
+        for api_ledger_id, api in self._ledger_apis.items():
+            if ledger_id is None or ledger_id == api_ledger_id:
+                api.clear_contract_instances(contract_interface, contract_address)
+        if ledger_id is None and contract_address is None:
+            if contract_id is None:
+                self._contracts.clear()
+            else:
+                self._contracts.pop(contract_id, None)
+
     def get_ledger_id(self, message: Message) -> str:
         """Get the ledger id."""
         assert isinstance(
@@ -144,7 +195,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         :param dialogue: the contract API dialogue
         :return: None
         """
-        contract = self.contract_registry.make(message.contract_id)
+        contract = self.get_contract(message.contract_id)
         method_to_call = getattr(contract, message.callable)
         try:
             data = method_to_call(api, message.contract_address, **message.kwargs.body)
@@ -175,7 +226,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         :param dialogue: the contract API dialogue
         :return: None
         """
-        contract = self.contract_registry.make(message.contract_id)
+        contract = self.get_contract(message.contract_id)
         method_to_call = getattr(contract, message.callable)
         try:
             tx = method_to_call(api, **message.kwargs.body)
@@ -206,7 +257,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         :param dialogue: the contract API dialogue
         :return: None
         """
-        contract = self.contract_registry.make(message.contract_id)
+        contract = self.get_contract(message.contract_id)
         method_to_call = getattr(contract, message.callable)
         try:
             tx = method_to_call(api, message.contract_address, **message.kwargs.body)
@@ -237,7 +288,7 @@ class ContractApiRequestDispatcher(RequestDispatcher):
         :param dialogue: the contract API dialogue
         :return: None
         """
-        contract = self.contract_registry.make(message.contract_id)
+        contract = self.get_contract(message.contract_id)
         method_to_call = getattr(contract, message.callable)
         try:
             rm = method_to_call(api, message.contract_address, **message.kwargs.body)
@@ -26,7 +26,7 @@ from collections import defaultdict
 from threading import Thread
 from typing import Dict, List, Optional, Tuple, cast
 
-from aea.configurations.base import ProtocolId, PublicId
+from aea.configurations.base import PublicId
 from aea.connections.base import Connection
 from aea.helpers.search.models import Description, Query
 from aea.mail.base import AEAConnectionError, Address, Envelope
@@ -43,10 +43,19 @@ RESPONSE_MESSAGE_ID = MESSAGE_ID + 1
 STUB_DIALOGUE_ID = 0
 DEFAULT_OEF = "default_oef"
 PUBLIC_ID = PublicId.from_str("fetchai/local:0.4.0")
+# the maximum number of envelopes handled before the responses are delivered
+ENVELOPE_BATCH_SIZE = 100
 
 
 class LocalNode:
-    """A light-weight local implementation of a OEF Node."""
+    """
+    A light-weight local implementation of a OEF Node.
+
+    The service directory is sharded by data model name, so that a search only
+    looks at the services of the data model of its query. The directory is only
+    read and changed on the loop of the node, by code which does not await:
+    searches never wait for one another, nor for a lock.
+    """
 
     def __init__(self, loop: AbstractEventLoop = None):
         """
@@ -55,12 +64,17 @@ class LocalNode:
         :param loop: the event loop. If None, a new event loop is instantiated.
         """
         self.services = defaultdict(lambda: [])  # type: Dict[str, List[Description]]
-        self._lock = asyncio.Lock()
+        # data model name -> agent address -> descriptions
+        self._services_by_model = defaultdict(
+            dict
+        )  # type: Dict[str, Dict[Address, List[Description]]]
         self._loop = loop if loop is not None else asyncio.new_event_loop()
         self._thread = Thread(target=self._run_loop)
 
         self._in_queue = asyncio.Queue(loop=self._loop)  # type: asyncio.Queue
         self._out_queues = {}  # type: Dict[str, asyncio.Queue]
+        # the envelopes to deliver at the end of the current batch, by destination queue
+        self._pending = {}  # type: Dict[asyncio.Queue, List[Envelope]]
 
         self._receiving_loop_task = None  # type: Optional[asyncio.Task]
 
@@ -123,14 +137,38 @@ class LocalNode:
             self._thread.join()
 
     async def receiving_loop(self):
-        """Process incoming messages."""
+        """
+        Process incoming messages.
+
+        The envelopes waiting in the queue are handled in batches, and the
+        envelopes sent to each agent while handling a batch are delivered together.
+        """
         while True:
-            envelope = await self._in_queue.get()
-            if envelope is None:
+            envelopes = [await self._in_queue.get()]
+            while len(envelopes) < ENVELOPE_BATCH_SIZE and not self._in_queue.empty():
+                envelopes.append(self._in_queue.get_nowait())
+            if None in envelopes:
+                await self._handle_envelopes(envelopes[: envelopes.index(None)])
                 logger.debug("Receiving loop terminated.")
                 return
-            logger.debug("Handling envelope: {}".format(envelope))
-            await self._handle_envelope(envelope)
+            await self._handle_envelopes(envelopes)
+
+    async def _handle_envelopes(self, envelopes: List[Envelope]) -> None:
+        """
+        Handle envelopes, then deliver the envelopes sent.
+
+        :param envelopes: the envelopes
+        :return: None
+        """
+        try:
+            for envelope in envelopes:
+                logger.debug("Handling envelope: {}".format(envelope))
+                if envelope.protocol_id == OefSearchMessage.protocol_id:
+                    await self._handle_oef_message(envelope)
+                else:
+                    await self._handle_agent_message(envelope)
+        finally:
+            self._deliver()
 
     async def _handle_envelope(self, envelope: Envelope) -> None:
         """Handle an envelope.
@@ -138,10 +176,7 @@ class LocalNode:
         :param envelope: the envelope
         :return: None
         """
-        if envelope.protocol_id == ProtocolId.from_str("fetchai/oef_search:0.3.0"):
-            await self._handle_oef_message(envelope)
-        else:
-            await self._handle_agent_message(envelope)
+        await self._handle_envelopes([envelope])
 
     async def _handle_oef_message(self, envelope: Envelope) -> None:
         """Handle oef messages.
@@ -210,8 +245,10 @@ class LocalNode:
         :param service_description: the description of the service agent to be registered.
         :return: None
         """
-        async with self._lock:
-            self.services[address].append(service_description)
+        self.services[address].append(service_description)
+        self._services_by_model[service_description.data_model.name].setdefault(
+            address, []
+        ).append(service_description)
 
     async def _unregister_service(
         self,
@@ -227,26 +264,45 @@ class LocalNode:
         :param service_description: the description of the service agent to be unregistered.
         :return: None
         """
-        async with self._lock:
-            if address not in self.services:
-                msg = OefSearchMessage(
-                    performative=OefSearchMessage.Performative.OEF_ERROR,
-                    dialogue_reference=(dialogue_reference[0], dialogue_reference[0]),
-                    target=RESPONSE_TARGET,
-                    message_id=RESPONSE_MESSAGE_ID,
-                    oef_error_operation=OefSearchMessage.OefErrorOperation.UNREGISTER_SERVICE,
-                )
-                envelope = Envelope(
-                    to=address,
-                    sender=DEFAULT_OEF,
-                    protocol_id=OefSearchMessage.protocol_id,
-                    message=msg,
-                )
-                await self._send(envelope)
-            else:
-                self.services[address].remove(service_description)
-                if len(self.services[address]) == 0:
-                    self.services.pop(address)
+        if address not in self.services:
+            msg = OefSearchMessage(
+                performative=OefSearchMessage.Performative.OEF_ERROR,
+                dialogue_reference=(dialogue_reference[0], dialogue_reference[0]),
+                target=RESPONSE_TARGET,
+                message_id=RESPONSE_MESSAGE_ID,
+                oef_error_operation=OefSearchMessage.OefErrorOperation.UNREGISTER_SERVICE,
+            )
+            envelope = Envelope(
+                to=address,
+                sender=DEFAULT_OEF,
+                protocol_id=OefSearchMessage.protocol_id,
+                message=msg,
+            )
+            await self._send(envelope)
+        else:
+            self.services[address].remove(service_description)
+            if len(self.services[address]) == 0:
+                self.services.pop(address)
+            self._remove_from_shard(address, [service_description])
+
+    def _remove_from_shard(
+        self, address: Address, service_descriptions: List[Description]
+    ) -> None:
+        """
+        Remove the descriptions of a service agent from the shards of their data models.
+
+        :param address: the address of the service agent.
+        :param service_descriptions: the descriptions to remove.
+        :return: None
+        """
+        for service_description in service_descriptions:
+            name = service_description.data_model.name
+            shard = self._services_by_model[name]
+            shard[address].remove(service_description)
+            if len(shard[address]) == 0:
+                shard.pop(address)
+                if len(shard) == 0:
+                    self._services_by_model.pop(name)
 
     async def _search_services(
         self, address: Address, dialogue_reference: Tuple[str, str], query: Query
@@ -266,7 +322,8 @@ class LocalNode:
         if query.model is None:
             result = list(set(self.services.keys()))
         else:
-            for agent_address, descriptions in self.services.items():
+            shard = self._services_by_model.get(query.model.name, {})
+            for agent_address, descriptions in shard.items():
                 for description in descriptions:
                     if description.data_model == query.model:
                         result.append(agent_address)
@@ -287,22 +344,46 @@ class LocalNode:
         await self._send(envelope)
 
     async def _send(self, envelope: Envelope):
-        """Send a message."""
-        destination = envelope.to
-        destination_queue = self._out_queues[destination]
-        destination_queue._loop.call_soon_threadsafe(destination_queue.put_nowait, envelope)  # type: ignore  # pylint: disable=protected-access
+        """Send a message, at the end of the current batch."""
+        destination_queue = self._out_queues.get(envelope.to)
+        if destination_queue is None:
+            logger.debug(
+                "Destination {} not connected, dropping envelope {}".format(
+                    envelope.to, envelope
+                )
+            )
+            return
+        self._pending.setdefault(destination_queue, []).append(envelope)
         logger.debug("Send envelope {}".format(envelope))
 
+    def _deliver(self) -> None:
+        """Put the envelopes sent during the batch in the destination queues, with one call per queue."""
+        pending, self._pending = self._pending, {}
+        for destination_queue, envelopes in pending.items():
+            destination_queue._loop.call_soon_threadsafe(self._put_all, destination_queue, envelopes)  # type: ignore  # pylint: disable=protected-access
+
+    @staticmethod
+    def _put_all(queue: asyncio.Queue, envelopes: List[Envelope]) -> None:
+        """Put envelopes in a queue."""
+        for envelope in envelopes:
+            queue.put_nowait(envelope)
+
     async def disconnect(self, address: Address) -> None:
         """
         Disconnect.
 
+        The services of the agent are removed on the loop of the node, as the
+        service directory is only changed there.
+
         :param address: the address of the agent
         :return: None
         """
-        async with self._lock:
-            self._out_queues.pop(address, None)
-            self.services.pop(address, None)
+        self._out_queues.pop(address, None)
+        self._loop.call_soon_threadsafe(self._remove_services, address)
+
+    def _remove_services(self, address: Address) -> None:
+        """Remove the services of an agent from the service directory."""
+        self._remove_from_shard(address, self.services.pop(address, []))
 
 
 class OEFLocalConnection(Connection):
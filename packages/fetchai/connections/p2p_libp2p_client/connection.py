@@ -24,8 +24,9 @@ import logging
 import random
 import struct
 from asyncio import AbstractEventLoop, CancelledError
+from collections import deque
 from random import randint
-from typing import List, Optional, Union, cast
+from typing import Deque, List, Optional, Union, cast
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection
@@ -36,6 +37,14 @@ logger = logging.getLogger("aea.packages.fetchai.connections.p2p_libp2p_client")
 
 PUBLIC_ID = PublicId.from_str("fetchai/p2p_libp2p_client:0.3.0")
 
+DEFAULT_RESEND_QUEUE_SIZE = 1000
+DEFAULT_RECONNECT_ATTEMPTS = 5
+RECONNECT_DELAY = 0.1
+MAX_RECONNECT_DELAY = 5.0
+READ_BUFFER_SIZE = 2 ** 16
+# the maximum size of the frames written before each drain
+WRITE_BATCH_SIZE = 2 ** 20
+
 
 class Uri:
     """
@@ -130,13 +139,37 @@ class P2PLibp2pClientConnection(Connection):
         # self.node_cert = self.delegate_certs[index]
         logger.debug("Node to use as delegate: {}".format(self.node_uri))
 
+        # reconnection
+        self.resend_queue_size = cast(
+            int,
+            self.configuration.config.get(
+                "resend_queue_size", DEFAULT_RESEND_QUEUE_SIZE
+            ),
+        )
+        self.reconnect_attempts = cast(
+            int,
+            self.configuration.config.get(
+                "reconnect_attempts", DEFAULT_RECONNECT_ATTEMPTS
+            ),
+        )
+
         # tcp connection
         self._reader = None  # type: Optional[asyncio.StreamReader]
         self._writer = None  # type: Optional[asyncio.StreamWriter]
+        # incremented on each (re)connection, to tell a lost connection from a renewed one.
+        self._connection_generation = 0
+        self._reconnect_lock = None  # type: Optional[asyncio.Lock]
+        self._is_reconnected = None  # type: Optional[asyncio.Event]
+
+        # the frames to send, kept until they are written (or resent after a reconnection)
+        self._out_frames = deque()  # type: Deque[bytes]
+        self._out_frames_event = None  # type: Optional[asyncio.Event]
+        self._out_frames_space = None  # type: Optional[asyncio.Event]
 
         self._loop = None  # type: Optional[AbstractEventLoop]
         self._in_queue = None  # type: Optional[asyncio.Queue]
         self._process_messages_task = None  # type: Union[asyncio.Future, None]
+        self._send_task = None  # type: Union[asyncio.Future, None]
 
     async def connect(self) -> None:
         """
@@ -152,15 +185,7 @@ class P2PLibp2pClientConnection(Connection):
             # connect libp2p client
             self.connection_status.is_connecting = True
 
-            # connect the tcp socket
-            self._reader, self._writer = await asyncio.open_connection(
-                self.node_uri.host,
-                self.node_uri._port,  # pylint: disable=protected-access
-                loop=self._loop,
-            )
-
-            # send agent address to node
-            await self._setup_connection()
+            await self._open_connection()
 
             self.connection_status.is_connecting = False
             self.connection_status.is_connected = True
@@ -169,18 +194,107 @@ class P2PLibp2pClientConnection(Connection):
                 "Successfully connected to libp2p node {}".format(str(self.node_uri))
             )
 
-            # start receiving msgs
+            # start receiving and sending msgs
             self._in_queue = asyncio.Queue()
+            self._reconnect_lock = asyncio.Lock()
+            self._is_reconnected = asyncio.Event()
+            self._is_reconnected.set()
+            self._out_frames_event = asyncio.Event()
+            self._out_frames_space = asyncio.Event()
+            self._out_frames_space.set()
+            if self._out_frames:
+                self._out_frames_event.set()
             self._process_messages_task = asyncio.ensure_future(
                 self._process_messages(), loop=self._loop
             )
+            self._send_task = asyncio.ensure_future(self._send_loop(), loop=self._loop)
         except (CancelledError, Exception) as e:
             self.connection_status.is_connected = False
             raise e
 
-    async def _setup_connection(self):
+    async def _open_connection(self) -> None:
+        """
+        Open the tcp connection to the node, and send the agent address.
+
+        :return: None
+        """
+        self._reader, self._writer = await asyncio.open_connection(
+            self.node_uri.host,
+            self.node_uri._port,  # pylint: disable=protected-access
+            loop=self._loop,
+        )
+        self._connection_generation += 1
+
+        # send agent address to node
+        if await self._setup_connection() is None:
+            raise ConnectionError("Connection closed by node during setup.")
+
+    async def _setup_connection(self) -> Optional[bytes]:
         await self._send(bytes(self.address, "utf-8"))
-        await self._receive()
+        return await self._receive()
+
+    async def _reconnect(self, generation: int) -> bool:
+        """
+        Reconnect to a node, after the connection of a generation was lost.
+
+        The nodes are tried in turn, starting with the current one, with an
+        increasing delay between the attempts.
+
+        :param generation: the generation of the connection which was lost.
+        :return: whether the connection is up, or False if the client is disconnecting or all attempts failed.
+        """
+        assert self._reconnect_lock is not None and self._is_reconnected is not None
+        async with self._reconnect_lock:
+            if not self.connection_status.is_connected:
+                return False
+            if generation != self._connection_generation:
+                # another task has already reconnected.
+                return True
+            self._is_reconnected.clear()
+            self._close_writer()
+            self.logger.info(
+                "Connection to libp2p node {} lost, reconnecting...".format(
+                    self.node_uri
+                )
+            )
+            delay = RECONNECT_DELAY
+            index = self.delegate_uris.index(self.node_uri)
+            for attempt in range(self.reconnect_attempts):
+                if not self.connection_status.is_connected:
+                    return False
+                self.node_uri = self.delegate_uris[
+                    (index + attempt) % len(self.delegate_uris)
+                ]
+                try:
+                    await self._open_connection()
+                except (ConnectionError, OSError, asyncio.IncompleteReadError) as e:
+                    self._close_writer()
+                    self.logger.debug(
+                        "Reconnection to libp2p node {} failed: {}".format(
+                            self.node_uri, e
+                        )
+                    )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, MAX_RECONNECT_DELAY)
+                    continue
+                self.logger.info(
+                    "Reconnected to libp2p node {}, resending {} envelopes.".format(
+                        self.node_uri, len(self._out_frames)
+                    )
+                )
+                self._is_reconnected.set()
+                return True
+            self.logger.error(
+                "Could not reconnect to a libp2p node after {} attempts.".format(
+                    self.reconnect_attempts
+                )
+            )
+            return False
+
+    def _close_writer(self) -> None:
+        """Close the current tcp connection, if any."""
+        if self._writer is not None:
+            self._writer.close()
 
     async def disconnect(self) -> None:
         """
@@ -191,6 +305,9 @@ class P2PLibp2pClientConnection(Connection):
         assert (
             self.connection_status.is_connected or self.connection_status.is_connecting
         ), "Call connect before disconnect."
+        is_reconnecting = (
+            self._is_reconnected is not None and not self._is_reconnected.is_set()
+        )
         self.connection_status.is_connected = False
         self.connection_status.is_connecting = False
 
@@ -201,10 +318,20 @@ class P2PLibp2pClientConnection(Connection):
             self._process_messages_task.cancel()
             # TOFIX(LR) mypy issue https://github.com/python/mypy/issues/8546
             # self._process_messages_task = None
+        if self._send_task is not None:
+            self._send_task.cancel()
 
         self.logger.debug("disconnecting libp2p client connection...")
-        self._writer.write_eof()
-        await self._writer.drain()
+        if not is_reconnecting:
+            try:
+                # flush the envelopes not sent yet
+                self._write_frames(len(self._out_frames))
+                self._writer.write_eof()
+                await self._writer.drain()
+            except (ConnectionError, OSError) as e:
+                self.logger.debug(
+                    "Error while flushing libp2p client connection: {}".format(e)
+                )
         self._writer.close()
         # TOFIX(LR) requires python 3.7 minimum
         # await self._writer.wait_closed()
@@ -231,7 +358,6 @@ class P2PLibp2pClientConnection(Connection):
                 ):
                     await self.disconnect()
                 return None
-                # TOFIX(LR) attempt restarting the node?
             self.logger.debug("Received data: {}".format(data))
             return Envelope.decode(data)
         except CancelledError:  # pragma: no cover
@@ -245,22 +371,149 @@ class P2PLibp2pClientConnection(Connection):
         """
         Send messages.
 
+        The envelope is queued, and written to the node with the other queued
+        envelopes. While the connection is being reestablished, the envelopes
+        are kept to be sent after the reconnection; if there are more than the
+        resend queue size, the oldest ones are dropped.
+
+        :return: None
+        """
+        assert (
+            self._out_frames_event is not None
+            and self._out_frames_space is not None
+            and self._is_reconnected is not None
+        ), "Call connect before send."
+        while (
+            len(self._out_frames) >= self.resend_queue_size
+            and self._is_reconnected.is_set()
+        ):
+            self._out_frames_space.clear()
+            await self._out_frames_space.wait()
+        if len(self._out_frames) >= self.resend_queue_size:
+            self._out_frames.popleft()
+            self.logger.warning(
+                "Resend queue full while reconnecting, dropping the oldest envelope."
+            )
+        self._out_frames.append(envelope.encode())
+        self._out_frames_event.set()
+
+    async def _send_loop(self) -> None:
+        """
+        Write the queued envelopes to the node, with one drain for many envelopes.
+
         :return: None
         """
-        await self._send(envelope.encode())
+        assert (
+            self._in_queue is not None
+            and self._out_frames_event is not None
+            and self._out_frames_space is not None
+            and self._is_reconnected is not None
+        )
+        while True:
+            await self._out_frames_event.wait()
+            self._out_frames_event.clear()
+            while self._out_frames:
+                await self._is_reconnected.wait()
+                generation = self._connection_generation
+                count = self._write_frames(self._count_batch_frames())
+                try:
+                    assert self._writer is not None
+                    await self._writer.drain()
+                except (ConnectionError, OSError) as e:
+                    self.logger.debug(
+                        "Error while writing to libp2p node: {}".format(e)
+                    )
+                    # the written envelopes may be lost, but not those still queued.
+                    if not await self._reconnect(generation):
+                        # close the connection, as the reader does.
+                        self._in_queue.put_nowait(None)
+                        return
+                    continue
+                finally:
+                    self._out_frames_space.set()
+                self.logger.debug("Sent {} envelopes.".format(count))
+
+    def _count_batch_frames(self) -> int:
+        """Count the queued frames to write before the next drain."""
+        count = 0
+        size = 0
+        for data in self._out_frames:
+            if count > 0 and size + len(data) > WRITE_BATCH_SIZE:
+                break
+            count += 1
+            size += len(data) + 4
+        return count
+
+    def _write_frames(self, count: int) -> int:
+        """
+        Write the first queued frames, each prefixed by its length, and remove them from the queue.
+
+        :param count: the number of frames to write.
+        :return: the number of frames written.
+        """
+        assert self._writer is not None
+        if count == 0:
+            return 0
+        frames = []  # type: List[bytes]
+        for _ in range(count):
+            data = self._out_frames.popleft()
+            frames.append(struct.pack("!I", len(data)))
+            frames.append(data)
+        self._writer.write(b"".join(frames))
+        return count
 
     async def _process_messages(self) -> None:
         """
         Receive data from node.
 
+        Each read may hold several frames, and frames may span several reads.
+        If the connection is lost, the connection is reestablished.
+
         :return: None
         """
+        assert self._in_queue is not None, "Input queue not initialized."
+        buffer = bytearray()
         while True:
-            data = await self._receive()
-            assert self._in_queue is not None, "Input queue not initialized."
-            self._in_queue.put_nowait(data)
-            if data is None:
+            assert self._reader is not None
+            generation = self._connection_generation
+            try:
+                chunk = await self._reader.read(READ_BUFFER_SIZE)
+            except (ConnectionError, OSError) as e:
+                self.logger.debug("Error while reading from libp2p node: {}".format(e))
+                chunk = b""
+            if not chunk:
+                self.logger.info(
+                    "Connection disconnected while reading from node ({} bytes pending)".format(
+                        len(buffer)
+                    )
+                )
+                buffer.clear()
+                if not await self._reconnect(generation):
+                    self._in_queue.put_nowait(None)
+                    break
+                continue
+            buffer.extend(chunk)
+            for data in self._parse_frames(buffer):
+                self._in_queue.put_nowait(data)
+
+    @staticmethod
+    def _parse_frames(buffer: bytearray) -> List[bytes]:
+        """
+        Take the complete length-prefixed frames from the start of a buffer.
+
+        :param buffer: the buffer, from which the frames are removed.
+        :return: the data of the frames.
+        """
+        frames = []  # type: List[bytes]
+        offset = 0
+        while len(buffer) - offset >= 4:
+            size = struct.unpack_from("!I", buffer, offset)[0]
+            if len(buffer) - offset - 4 < size:
                 break
+            frames.append(bytes(buffer[offset + 4 : offset + 4 + size]))
+            offset += 4 + size
+        del buffer[:offset]
+        return frames
 
     async def _send(self, data: bytes) -> None:
         assert self._writer is not None
@@ -21,12 +21,13 @@
 
 import logging
 import random
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 from vyper.utils import keccak256
 
 from aea.contracts.ethereum import Contract
 from aea.crypto.base import LedgerApi
+from aea.crypto.ethereum import EthereumApi
 from aea.mail.base import Address
 
 logger = logging.getLogger("aea.packages.fetchai.contracts.erc1155.contract")
@@ -85,7 +86,7 @@ class ERC1155Contract(Contract):
         :returns tx: the transaction dictionary.
         """
         # create the transaction dict
-        nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+        nonce = cls._allocate_nonce(ledger_api, deployer_address)
         instance = cls.get_instance(ledger_api)
         data = instance.constructor().__dict__.get("data_in_transaction")
         tx = {
@@ -121,7 +122,7 @@ class ERC1155Contract(Contract):
         :return: the transaction object
         """
         # create the transaction dict
-        nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+        nonce = cls._allocate_nonce(ledger_api, deployer_address)
         instance = cls.get_instance(ledger_api, contract_address)
         tx = instance.functions.createBatch(
             deployer_address, token_ids
@@ -157,7 +158,7 @@ class ERC1155Contract(Contract):
         :return: the transaction object
         """
         # create the transaction dict
-        nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+        nonce = cls._allocate_nonce(ledger_api, deployer_address)
         instance = cls.get_instance(ledger_api, contract_address)
         tx = instance.functions.createSingle(
             deployer_address, token_id, data
@@ -198,7 +199,7 @@ class ERC1155Contract(Contract):
         """
         cls.validate_mint_quantities(token_ids, mint_quantities)
         # create the transaction dict
-        nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+        nonce = cls._allocate_nonce(ledger_api, deployer_address)
         instance = cls.get_instance(ledger_api, contract_address)
         tx = instance.functions.mintBatch(
             recipient_address, token_ids, mint_quantities, data
@@ -269,7 +270,7 @@ class ERC1155Contract(Contract):
         :return: the transaction object
         """
         # create the transaction dict
-        nonce = ledger_api.api.eth.getTransactionCount(deployer_address)
+        nonce = cls._allocate_nonce(ledger_api, deployer_address)
         instance = cls.get_instance(ledger_api, contract_address)
         tx = instance.functions.mint(
             recipient_address, token_id, mint_quantity, data
@@ -339,7 +340,7 @@ class ERC1155Contract(Contract):
         :return: a ledger transaction object
         """
         # create the transaction dict
-        nonce = ledger_api.api.eth.getTransactionCount(from_address)
+        nonce = cls._allocate_nonce(ledger_api, from_address)
         instance = cls.get_instance(ledger_api, contract_address)
         value_eth_wei = ledger_api.api.toWei(value, "ether")
         tx = instance.functions.trade(
@@ -421,7 +422,7 @@ class ERC1155Contract(Contract):
         :param gas: the gas to be used
         :return: a ledger transaction object
         """
-        nonce = ledger_api.api.eth.getTransactionCount(from_address)
+        nonce = cls._allocate_nonce(ledger_api, from_address)
         instance = cls.get_instance(ledger_api, contract_address)
         value_eth_wei = ledger_api.api.toWei(value, "ether")
         tx = instance.functions.tradeBatch(
@@ -659,6 +660,20 @@ class ERC1155Contract(Contract):
             trade_nonce = random.randrange(0, MAX_UINT_256)  # nosec
         return {"trade_nonce": trade_nonce}
 
+    @staticmethod
+    def _allocate_nonce(ledger_api: LedgerApi, address: Address) -> Optional[int]:
+        """
+        Allocate the nonce of the next transaction of an address.
+
+        The nonce is allocated by the ledger API, along with the nonces of the
+        other transactions of the address, so that they do not collide.
+
+        :param ledger_api: the ledger API
+        :param address: the address
+        :return: the nonce
+        """
+        return cast(EthereumApi, ledger_api).allocate_nonce(address)
+
     @staticmethod
     def _try_estimate_gas(ledger_api: LedgerApi, tx: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -24,7 +24,7 @@ from enum import Enum
 from typing import Optional, Set, Tuple, cast
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 from packages.fetchai.protocols.contract_api.custom_types import Kwargs as CustomKwargs
 from packages.fetchai.protocols.contract_api.custom_types import (
@@ -40,7 +40,7 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.contract_api.message"
 DEFAULT_BODY_SIZE = 4
 
 
-class ContractApiMessage(Message):
+class ContractApiMessage(SlottedMessage):
     """A protocol for contract APIs requests and responses."""
 
     protocol_id = ProtocolId("fetchai", "contract_api", "0.1.0")
@@ -69,6 +69,51 @@ class ContractApiMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_callable",
+        "_code",
+        "_contract_address",
+        "_contract_id",
+        "_data",
+        "_kwargs",
+        "_ledger_id",
+        "_message",
+        "_raw_message",
+        "_raw_transaction",
+        "_state",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _callable: str
+    _code: int
+    _contract_address: str
+    _contract_id: str
+    _data: bytes
+    _kwargs: CustomKwargs
+    _ledger_id: str
+    _message: str
+    _raw_message: CustomRawMessage
+    _raw_transaction: CustomRawTransaction
+    _state: CustomState
+
+    _performatives = {
+        "error",
+        "get_deploy_transaction",
+        "get_raw_message",
+        "get_raw_transaction",
+        "get_state",
+        "raw_message",
+        "raw_transaction",
+        "state",
+    }
+
     def __init__(
         self,
         performative: Performative,
@@ -85,23 +130,11 @@ class ContractApiMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=ContractApiMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {
-            "error",
-            "get_deploy_transaction",
-            "get_raw_message",
-            "get_raw_transaction",
-            "get_state",
-            "raw_message",
-            "raw_transaction",
-            "state",
-        }
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = ContractApiMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -111,90 +144,116 @@ class ContractApiMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(ContractApiMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def callable(self) -> str:
         """Get the 'callable' content from the message."""
-        assert self.is_set("callable"), "'callable' content is not set."
-        return cast(str, self.get("callable"))
+        try:
+            return self._callable
+        except AttributeError:
+            raise AssertionError("'callable' content is not set.")
 
     @property
     def code(self) -> Optional[int]:
         """Get the 'code' content from the message."""
-        return cast(Optional[int], self.get("code"))
+        return getattr(self, "_code", None)
 
     @property
     def contract_address(self) -> str:
         """Get the 'contract_address' content from the message."""
-        assert self.is_set("contract_address"), "'contract_address' content is not set."
-        return cast(str, self.get("contract_address"))
+        try:
+            return self._contract_address
+        except AttributeError:
+            raise AssertionError("'contract_address' content is not set.")
 
     @property
     def contract_id(self) -> str:
         """Get the 'contract_id' content from the message."""
-        assert self.is_set("contract_id"), "'contract_id' content is not set."
-        return cast(str, self.get("contract_id"))
+        try:
+            return self._contract_id
+        except AttributeError:
+            raise AssertionError("'contract_id' content is not set.")
 
     @property
     def data(self) -> bytes:
         """Get the 'data' content from the message."""
-        assert self.is_set("data"), "'data' content is not set."
-        return cast(bytes, self.get("data"))
+        try:
+            return self._data
+        except AttributeError:
+            raise AssertionError("'data' content is not set.")
 
     @property
     def kwargs(self) -> CustomKwargs:
         """Get the 'kwargs' content from the message."""
-        assert self.is_set("kwargs"), "'kwargs' content is not set."
-        return cast(CustomKwargs, self.get("kwargs"))
+        try:
+            return self._kwargs
+        except AttributeError:
+            raise AssertionError("'kwargs' content is not set.")
 
     @property
     def ledger_id(self) -> str:
         """Get the 'ledger_id' content from the message."""
-        assert self.is_set("ledger_id"), "'ledger_id' content is not set."
-        return cast(str, self.get("ledger_id"))
+        try:
+            return self._ledger_id
+        except AttributeError:
+            raise AssertionError("'ledger_id' content is not set.")
 
     @property
     def message(self) -> Optional[str]:
         """Get the 'message' content from the message."""
-        return cast(Optional[str], self.get("message"))
+        return getattr(self, "_message", None)
 
     @property
     def raw_message(self) -> CustomRawMessage:
         """Get the 'raw_message' content from the message."""
-        assert self.is_set("raw_message"), "'raw_message' content is not set."
-        return cast(CustomRawMessage, self.get("raw_message"))
+        try:
+            return self._raw_message
+        except AttributeError:
+            raise AssertionError("'raw_message' content is not set.")
 
     @property
     def raw_transaction(self) -> CustomRawTransaction:
         """Get the 'raw_transaction' content from the message."""
-        assert self.is_set("raw_transaction"), "'raw_transaction' content is not set."
-        return cast(CustomRawTransaction, self.get("raw_transaction"))
+        try:
+            return self._raw_transaction
+        except AttributeError:
+            raise AssertionError("'raw_transaction' content is not set.")
 
     @property
     def state(self) -> CustomState:
         """Get the 'state' content from the message."""
-        assert self.is_set("state"), "'state' content is not set."
-        return cast(CustomState, self.get("state"))
+        try:
+            return self._state
+        except AttributeError:
+            raise AssertionError("'state' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the contract_api protocol."""
@@ -234,7 +293,7 @@ class ContractApiMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if (
                 self.performative
@@ -19,7 +19,7 @@
 
 """Serialization module for contract_api protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -32,6 +32,240 @@ from packages.fetchai.protocols.contract_api.custom_types import State
 from packages.fetchai.protocols.contract_api.message import ContractApiMessage
 
 
+def _encode_get_deploy_transaction(
+    msg: ContractApiMessage, contract_api_msg: Any
+) -> None:
+    """Encode the contents of the 'get_deploy_transaction' performative."""
+    performative = contract_api_msg.get_deploy_transaction
+    performative.SetInParent()
+    ledger_id = msg.ledger_id
+    performative.ledger_id = ledger_id
+    contract_id = msg.contract_id
+    performative.contract_id = contract_id
+    callable = msg.callable
+    performative.callable = callable
+    kwargs = msg.kwargs
+    Kwargs.encode(performative.kwargs, kwargs)
+
+
+def _encode_get_raw_transaction(msg: ContractApiMessage, contract_api_msg: Any) -> None:
+    """Encode the contents of the 'get_raw_transaction' performative."""
+    performative = contract_api_msg.get_raw_transaction
+    performative.SetInParent()
+    ledger_id = msg.ledger_id
+    performative.ledger_id = ledger_id
+    contract_id = msg.contract_id
+    performative.contract_id = contract_id
+    contract_address = msg.contract_address
+    performative.contract_address = contract_address
+    callable = msg.callable
+    performative.callable = callable
+    kwargs = msg.kwargs
+    Kwargs.encode(performative.kwargs, kwargs)
+
+
+def _encode_get_raw_message(msg: ContractApiMessage, contract_api_msg: Any) -> None:
+    """Encode the contents of the 'get_raw_message' performative."""
+    performative = contract_api_msg.get_raw_message
+    performative.SetInParent()
+    ledger_id = msg.ledger_id
+    performative.ledger_id = ledger_id
+    contract_id = msg.contract_id
+    performative.contract_id = contract_id
+    contract_address = msg.contract_address
+    performative.contract_address = contract_address
+    callable = msg.callable
+    performative.callable = callable
+    kwargs = msg.kwargs
+    Kwargs.encode(performative.kwargs, kwargs)
+
+
+def _encode_get_state(msg: ContractApiMessage, contract_api_msg: Any) -> None:
+    """Encode the contents of the 'get_state' performative."""
+    performative = contract_api_msg.get_state
+    performative.SetInParent()
+    ledger_id = msg.ledger_id
+    performative.ledger_id = ledger_id
+    contract_id = msg.contract_id
+    performative.contract_id = contract_id
+    contract_address = msg.contract_address
+    performative.contract_address = contract_address
+    callable = msg.callable
+    performative.callable = callable
+    kwargs = msg.kwargs
+    Kwargs.encode(performative.kwargs, kwargs)
+
+
+def _encode_state(msg: ContractApiMessage, contract_api_msg: Any) -> None:
+    """Encode the contents of the 'state' performative."""
+    performative = contract_api_msg.state
+    performative.SetInParent()
+    state = msg.state
+    State.encode(performative.state, state)
+
+
+def _encode_raw_transaction(msg: ContractApiMessage, contract_api_msg: Any) -> None:
+    """Encode the contents of the 'raw_transaction' performative."""
+    performative = contract_api_msg.raw_transaction
+    performative.SetInParent()
+    raw_transaction = msg.raw_transaction
+    RawTransaction.encode(performative.raw_transaction, raw_transaction)
+
+
+def _encode_raw_message(msg: ContractApiMessage, contract_api_msg: Any) -> None:
+    """Encode the contents of the 'raw_message' performative."""
+    performative = contract_api_msg.raw_message
+    performative.SetInParent()
+    raw_message = msg.raw_message
+    RawMessage.encode(performative.raw_message, raw_message)
+
+
+def _encode_error(msg: ContractApiMessage, contract_api_msg: Any) -> None:
+    """Encode the contents of the 'error' performative."""
+    performative = contract_api_msg.error
+    performative.SetInParent()
+    if msg.is_set("code"):
+        performative.code_is_set = True
+        code = msg.code
+        performative.code = code
+    if msg.is_set("message"):
+        performative.message_is_set = True
+        message = msg.message
+        performative.message = message
+    data = msg.data
+    performative.data = data
+
+
+def _decode_get_deploy_transaction(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'get_deploy_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    ledger_id = contract_api_pb.get_deploy_transaction.ledger_id
+    performative_content["ledger_id"] = ledger_id
+    contract_id = contract_api_pb.get_deploy_transaction.contract_id
+    performative_content["contract_id"] = contract_id
+    callable = contract_api_pb.get_deploy_transaction.callable
+    performative_content["callable"] = callable
+    pb2_kwargs = contract_api_pb.get_deploy_transaction.kwargs
+    kwargs = Kwargs.decode(pb2_kwargs)
+    performative_content["kwargs"] = kwargs
+    return performative_content
+
+
+def _decode_get_raw_transaction(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'get_raw_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    ledger_id = contract_api_pb.get_raw_transaction.ledger_id
+    performative_content["ledger_id"] = ledger_id
+    contract_id = contract_api_pb.get_raw_transaction.contract_id
+    performative_content["contract_id"] = contract_id
+    contract_address = contract_api_pb.get_raw_transaction.contract_address
+    performative_content["contract_address"] = contract_address
+    callable = contract_api_pb.get_raw_transaction.callable
+    performative_content["callable"] = callable
+    pb2_kwargs = contract_api_pb.get_raw_transaction.kwargs
+    kwargs = Kwargs.decode(pb2_kwargs)
+    performative_content["kwargs"] = kwargs
+    return performative_content
+
+
+def _decode_get_raw_message(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'get_raw_message' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    ledger_id = contract_api_pb.get_raw_message.ledger_id
+    performative_content["ledger_id"] = ledger_id
+    contract_id = contract_api_pb.get_raw_message.contract_id
+    performative_content["contract_id"] = contract_id
+    contract_address = contract_api_pb.get_raw_message.contract_address
+    performative_content["contract_address"] = contract_address
+    callable = contract_api_pb.get_raw_message.callable
+    performative_content["callable"] = callable
+    pb2_kwargs = contract_api_pb.get_raw_message.kwargs
+    kwargs = Kwargs.decode(pb2_kwargs)
+    performative_content["kwargs"] = kwargs
+    return performative_content
+
+
+def _decode_get_state(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'get_state' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    ledger_id = contract_api_pb.get_state.ledger_id
+    performative_content["ledger_id"] = ledger_id
+    contract_id = contract_api_pb.get_state.contract_id
+    performative_content["contract_id"] = contract_id
+    contract_address = contract_api_pb.get_state.contract_address
+    performative_content["contract_address"] = contract_address
+    callable = contract_api_pb.get_state.callable
+    performative_content["callable"] = callable
+    pb2_kwargs = contract_api_pb.get_state.kwargs
+    kwargs = Kwargs.decode(pb2_kwargs)
+    performative_content["kwargs"] = kwargs
+    return performative_content
+
+
+def _decode_state(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'state' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_state = contract_api_pb.state.state
+    state = State.decode(pb2_state)
+    performative_content["state"] = state
+    return performative_content
+
+
+def _decode_raw_transaction(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'raw_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_raw_transaction = contract_api_pb.raw_transaction.raw_transaction
+    raw_transaction = RawTransaction.decode(pb2_raw_transaction)
+    performative_content["raw_transaction"] = raw_transaction
+    return performative_content
+
+
+def _decode_raw_message(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'raw_message' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_raw_message = contract_api_pb.raw_message.raw_message
+    raw_message = RawMessage.decode(pb2_raw_message)
+    performative_content["raw_message"] = raw_message
+    return performative_content
+
+
+def _decode_error(contract_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'error' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    if contract_api_pb.error.code_is_set:
+        code = contract_api_pb.error.code
+        performative_content["code"] = code
+    if contract_api_pb.error.message_is_set:
+        message = contract_api_pb.error.message
+        performative_content["message"] = message
+    data = contract_api_pb.error.data
+    performative_content["data"] = data
+    return performative_content
+
+
+_ENCODERS = {
+    "get_deploy_transaction": _encode_get_deploy_transaction,
+    "get_raw_transaction": _encode_get_raw_transaction,
+    "get_raw_message": _encode_get_raw_message,
+    "get_state": _encode_get_state,
+    "state": _encode_state,
+    "raw_transaction": _encode_raw_transaction,
+    "raw_message": _encode_raw_message,
+    "error": _encode_error,
+}  # type: Dict[str, Callable[[ContractApiMessage, Any], None]]
+
+_DECODERS = {
+    "get_deploy_transaction": _decode_get_deploy_transaction,
+    "get_raw_transaction": _decode_get_raw_transaction,
+    "get_raw_message": _decode_get_raw_message,
+    "get_state": _decode_get_state,
+    "state": _decode_state,
+    "raw_transaction": _decode_raw_transaction,
+    "raw_message": _decode_raw_message,
+    "error": _decode_error,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class ContractApiSerializer(Serializer):
     """Serialization for the 'contract_api' protocol."""
 
@@ -52,86 +286,11 @@ class ContractApiSerializer(Serializer):
         contract_api_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION:
-            performative = contract_api_pb2.ContractApiMessage.Get_Deploy_Transaction_Performative()  # type: ignore
-            ledger_id = msg.ledger_id
-            performative.ledger_id = ledger_id
-            contract_id = msg.contract_id
-            performative.contract_id = contract_id
-            callable = msg.callable
-            performative.callable = callable
-            kwargs = msg.kwargs
-            Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_deploy_transaction.CopyFrom(performative)
-        elif performative_id == ContractApiMessage.Performative.GET_RAW_TRANSACTION:
-            performative = contract_api_pb2.ContractApiMessage.Get_Raw_Transaction_Performative()  # type: ignore
-            ledger_id = msg.ledger_id
-            performative.ledger_id = ledger_id
-            contract_id = msg.contract_id
-            performative.contract_id = contract_id
-            contract_address = msg.contract_address
-            performative.contract_address = contract_address
-            callable = msg.callable
-            performative.callable = callable
-            kwargs = msg.kwargs
-            Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_raw_transaction.CopyFrom(performative)
-        elif performative_id == ContractApiMessage.Performative.GET_RAW_MESSAGE:
-            performative = contract_api_pb2.ContractApiMessage.Get_Raw_Message_Performative()  # type: ignore
-            ledger_id = msg.ledger_id
-            performative.ledger_id = ledger_id
-            contract_id = msg.contract_id
-            performative.contract_id = contract_id
-            contract_address = msg.contract_address
-            performative.contract_address = contract_address
-            callable = msg.callable
-            performative.callable = callable
-            kwargs = msg.kwargs
-            Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_raw_message.CopyFrom(performative)
-        elif performative_id == ContractApiMessage.Performative.GET_STATE:
-            performative = contract_api_pb2.ContractApiMessage.Get_State_Performative()  # type: ignore
-            ledger_id = msg.ledger_id
-            performative.ledger_id = ledger_id
-            contract_id = msg.contract_id
-            performative.contract_id = contract_id
-            contract_address = msg.contract_address
-            performative.contract_address = contract_address
-            callable = msg.callable
-            performative.callable = callable
-            kwargs = msg.kwargs
-            Kwargs.encode(performative.kwargs, kwargs)
-            contract_api_msg.get_state.CopyFrom(performative)
-        elif performative_id == ContractApiMessage.Performative.STATE:
-            performative = contract_api_pb2.ContractApiMessage.State_Performative()  # type: ignore
-            state = msg.state
-            State.encode(performative.state, state)
-            contract_api_msg.state.CopyFrom(performative)
-        elif performative_id == ContractApiMessage.Performative.RAW_TRANSACTION:
-            performative = contract_api_pb2.ContractApiMessage.Raw_Transaction_Performative()  # type: ignore
-            raw_transaction = msg.raw_transaction
-            RawTransaction.encode(performative.raw_transaction, raw_transaction)
-            contract_api_msg.raw_transaction.CopyFrom(performative)
-        elif performative_id == ContractApiMessage.Performative.RAW_MESSAGE:
-            performative = contract_api_pb2.ContractApiMessage.Raw_Message_Performative()  # type: ignore
-            raw_message = msg.raw_message
-            RawMessage.encode(performative.raw_message, raw_message)
-            contract_api_msg.raw_message.CopyFrom(performative)
-        elif performative_id == ContractApiMessage.Performative.ERROR:
-            performative = contract_api_pb2.ContractApiMessage.Error_Performative()  # type: ignore
-            if msg.is_set("code"):
-                performative.code_is_set = True
-                code = msg.code
-                performative.code = code
-            if msg.is_set("message"):
-                performative.message_is_set = True
-                message = msg.message
-                performative.message = message
-            data = msg.data
-            performative.data = data
-            contract_api_msg.error.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, contract_api_msg)
 
         contract_api_bytes = contract_api_msg.SerializeToString()
         return contract_api_bytes
@@ -154,77 +313,11 @@ class ContractApiSerializer(Serializer):
         target = contract_api_pb.target
 
         performative = contract_api_pb.WhichOneof("performative")
-        performative_id = ContractApiMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == ContractApiMessage.Performative.GET_DEPLOY_TRANSACTION:
-            ledger_id = contract_api_pb.get_deploy_transaction.ledger_id
-            performative_content["ledger_id"] = ledger_id
-            contract_id = contract_api_pb.get_deploy_transaction.contract_id
-            performative_content["contract_id"] = contract_id
-            callable = contract_api_pb.get_deploy_transaction.callable
-            performative_content["callable"] = callable
-            pb2_kwargs = contract_api_pb.get_deploy_transaction.kwargs
-            kwargs = Kwargs.decode(pb2_kwargs)
-            performative_content["kwargs"] = kwargs
-        elif performative_id == ContractApiMessage.Performative.GET_RAW_TRANSACTION:
-            ledger_id = contract_api_pb.get_raw_transaction.ledger_id
-            performative_content["ledger_id"] = ledger_id
-            contract_id = contract_api_pb.get_raw_transaction.contract_id
-            performative_content["contract_id"] = contract_id
-            contract_address = contract_api_pb.get_raw_transaction.contract_address
-            performative_content["contract_address"] = contract_address
-            callable = contract_api_pb.get_raw_transaction.callable
-            performative_content["callable"] = callable
-            pb2_kwargs = contract_api_pb.get_raw_transaction.kwargs
-            kwargs = Kwargs.decode(pb2_kwargs)
-            performative_content["kwargs"] = kwargs
-        elif performative_id == ContractApiMessage.Performative.GET_RAW_MESSAGE:
-            ledger_id = contract_api_pb.get_raw_message.ledger_id
-            performative_content["ledger_id"] = ledger_id
-            contract_id = contract_api_pb.get_raw_message.contract_id
-            performative_content["contract_id"] = contract_id
-            contract_address = contract_api_pb.get_raw_message.contract_address
-            performative_content["contract_address"] = contract_address
-            callable = contract_api_pb.get_raw_message.callable
-            performative_content["callable"] = callable
-            pb2_kwargs = contract_api_pb.get_raw_message.kwargs
-            kwargs = Kwargs.decode(pb2_kwargs)
-            performative_content["kwargs"] = kwargs
-        elif performative_id == ContractApiMessage.Performative.GET_STATE:
-            ledger_id = contract_api_pb.get_state.ledger_id
-            performative_content["ledger_id"] = ledger_id
-            contract_id = contract_api_pb.get_state.contract_id
-            performative_content["contract_id"] = contract_id
-            contract_address = contract_api_pb.get_state.contract_address
-            performative_content["contract_address"] = contract_address
-            callable = contract_api_pb.get_state.callable
-            performative_content["callable"] = callable
-            pb2_kwargs = contract_api_pb.get_state.kwargs
-            kwargs = Kwargs.decode(pb2_kwargs)
-            performative_content["kwargs"] = kwargs
-        elif performative_id == ContractApiMessage.Performative.STATE:
-            pb2_state = contract_api_pb.state.state
-            state = State.decode(pb2_state)
-            performative_content["state"] = state
-        elif performative_id == ContractApiMessage.Performative.RAW_TRANSACTION:
-            pb2_raw_transaction = contract_api_pb.raw_transaction.raw_transaction
-            raw_transaction = RawTransaction.decode(pb2_raw_transaction)
-            performative_content["raw_transaction"] = raw_transaction
-        elif performative_id == ContractApiMessage.Performative.RAW_MESSAGE:
-            pb2_raw_message = contract_api_pb.raw_message.raw_message
-            raw_message = RawMessage.decode(pb2_raw_message)
-            performative_content["raw_message"] = raw_message
-        elif performative_id == ContractApiMessage.Performative.ERROR:
-            if contract_api_pb.error.code_is_set:
-                code = contract_api_pb.error.code
-                performative_content["code"] = code
-            if contract_api_pb.error.message_is_set:
-                message = contract_api_pb.error.message
-                performative_content["message"] = message
-            data = contract_api_pb.error.data
-            performative_content["data"] = data
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(contract_api_pb)
 
         return ContractApiMessage(
             message_id=message_id,
@@ -21,10 +21,10 @@
 
 import logging
 from enum import Enum
-from typing import Dict, Set, Tuple, cast
+from typing import Dict, Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 from packages.fetchai.protocols.fipa.custom_types import (
     Description as CustomDescription,
@@ -36,7 +36,7 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.fipa.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class FipaMessage(Message):
+class FipaMessage(SlottedMessage):
     """A protocol for FIPA ACL."""
 
     protocol_id = ProtocolId("fetchai", "fipa", "0.4.0")
@@ -61,6 +61,35 @@ class FipaMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_info",
+        "_proposal",
+        "_query",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _info: Dict[str, str]
+    _proposal: CustomDescription
+    _query: CustomQuery
+
+    _performatives = {
+        "accept",
+        "accept_w_inform",
+        "cfp",
+        "decline",
+        "inform",
+        "match_accept",
+        "match_accept_w_inform",
+        "propose",
+    }
+
     def __init__(
         self,
         performative: Performative,
@@ -77,23 +106,11 @@ class FipaMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=FipaMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {
-            "accept",
-            "accept_w_inform",
-            "cfp",
-            "decline",
-            "inform",
-            "match_accept",
-            "match_accept_w_inform",
-            "propose",
-        }
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = FipaMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -103,44 +120,58 @@ class FipaMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(FipaMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def info(self) -> Dict[str, str]:
         """Get the 'info' content from the message."""
-        assert self.is_set("info"), "'info' content is not set."
-        return cast(Dict[str, str], self.get("info"))
+        try:
+            return self._info
+        except AttributeError:
+            raise AssertionError("'info' content is not set.")
 
     @property
     def proposal(self) -> CustomDescription:
         """Get the 'proposal' content from the message."""
-        assert self.is_set("proposal"), "'proposal' content is not set."
-        return cast(CustomDescription, self.get("proposal"))
+        try:
+            return self._proposal
+        except AttributeError:
+            raise AssertionError("'proposal' content is not set.")
 
     @property
     def query(self) -> CustomQuery:
         """Get the 'query' content from the message."""
-        assert self.is_set("query"), "'query' content is not set."
-        return cast(CustomQuery, self.get("query"))
+        try:
+            return self._query
+        except AttributeError:
+            raise AssertionError("'query' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the fipa protocol."""
@@ -180,7 +211,7 @@ class FipaMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == FipaMessage.Performative.CFP:
                 expected_nb_of_contents = 1
@@ -19,7 +19,7 @@
 
 """Serialization module for fipa protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -30,6 +30,150 @@ from packages.fetchai.protocols.fipa.custom_types import Query
 from packages.fetchai.protocols.fipa.message import FipaMessage
 
 
+def _encode_cfp(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'cfp' performative."""
+    performative = fipa_msg.cfp
+    performative.SetInParent()
+    query = msg.query
+    Query.encode(performative.query, query)
+
+
+def _encode_propose(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'propose' performative."""
+    performative = fipa_msg.propose
+    performative.SetInParent()
+    proposal = msg.proposal
+    Description.encode(performative.proposal, proposal)
+
+
+def _encode_accept_w_inform(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'accept_w_inform' performative."""
+    performative = fipa_msg.accept_w_inform
+    performative.SetInParent()
+    info = msg.info
+    performative.info.update(info)
+
+
+def _encode_match_accept_w_inform(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'match_accept_w_inform' performative."""
+    performative = fipa_msg.match_accept_w_inform
+    performative.SetInParent()
+    info = msg.info
+    performative.info.update(info)
+
+
+def _encode_inform(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'inform' performative."""
+    performative = fipa_msg.inform
+    performative.SetInParent()
+    info = msg.info
+    performative.info.update(info)
+
+
+def _encode_accept(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'accept' performative."""
+    performative = fipa_msg.accept
+    performative.SetInParent()
+
+
+def _encode_decline(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'decline' performative."""
+    performative = fipa_msg.decline
+    performative.SetInParent()
+
+
+def _encode_match_accept(msg: FipaMessage, fipa_msg: Any) -> None:
+    """Encode the contents of the 'match_accept' performative."""
+    performative = fipa_msg.match_accept
+    performative.SetInParent()
+
+
+def _decode_cfp(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'cfp' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_query = fipa_pb.cfp.query
+    query = Query.decode(pb2_query)
+    performative_content["query"] = query
+    return performative_content
+
+
+def _decode_propose(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'propose' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_proposal = fipa_pb.propose.proposal
+    proposal = Description.decode(pb2_proposal)
+    performative_content["proposal"] = proposal
+    return performative_content
+
+
+def _decode_accept_w_inform(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'accept_w_inform' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    info = fipa_pb.accept_w_inform.info
+    info_dict = dict(info)
+    performative_content["info"] = info_dict
+    return performative_content
+
+
+def _decode_match_accept_w_inform(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'match_accept_w_inform' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    info = fipa_pb.match_accept_w_inform.info
+    info_dict = dict(info)
+    performative_content["info"] = info_dict
+    return performative_content
+
+
+def _decode_inform(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'inform' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    info = fipa_pb.inform.info
+    info_dict = dict(info)
+    performative_content["info"] = info_dict
+    return performative_content
+
+
+def _decode_accept(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'accept' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    return performative_content
+
+
+def _decode_decline(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'decline' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    return performative_content
+
+
+def _decode_match_accept(fipa_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'match_accept' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    return performative_content
+
+
+_ENCODERS = {
+    "cfp": _encode_cfp,
+    "propose": _encode_propose,
+    "accept_w_inform": _encode_accept_w_inform,
+    "match_accept_w_inform": _encode_match_accept_w_inform,
+    "inform": _encode_inform,
+    "accept": _encode_accept,
+    "decline": _encode_decline,
+    "match_accept": _encode_match_accept,
+}  # type: Dict[str, Callable[[FipaMessage, Any], None]]
+
+_DECODERS = {
+    "cfp": _decode_cfp,
+    "propose": _decode_propose,
+    "accept_w_inform": _decode_accept_w_inform,
+    "match_accept_w_inform": _decode_match_accept_w_inform,
+    "inform": _decode_inform,
+    "accept": _decode_accept,
+    "decline": _decode_decline,
+    "match_accept": _decode_match_accept,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class FipaSerializer(Serializer):
     """Serialization for the 'fipa' protocol."""
 
@@ -50,42 +194,11 @@ class FipaSerializer(Serializer):
         fipa_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == FipaMessage.Performative.CFP:
-            performative = fipa_pb2.FipaMessage.Cfp_Performative()  # type: ignore
-            query = msg.query
-            Query.encode(performative.query, query)
-            fipa_msg.cfp.CopyFrom(performative)
-        elif performative_id == FipaMessage.Performative.PROPOSE:
-            performative = fipa_pb2.FipaMessage.Propose_Performative()  # type: ignore
-            proposal = msg.proposal
-            Description.encode(performative.proposal, proposal)
-            fipa_msg.propose.CopyFrom(performative)
-        elif performative_id == FipaMessage.Performative.ACCEPT_W_INFORM:
-            performative = fipa_pb2.FipaMessage.Accept_W_Inform_Performative()  # type: ignore
-            info = msg.info
-            performative.info.update(info)
-            fipa_msg.accept_w_inform.CopyFrom(performative)
-        elif performative_id == FipaMessage.Performative.MATCH_ACCEPT_W_INFORM:
-            performative = fipa_pb2.FipaMessage.Match_Accept_W_Inform_Performative()  # type: ignore
-            info = msg.info
-            performative.info.update(info)
-            fipa_msg.match_accept_w_inform.CopyFrom(performative)
-        elif performative_id == FipaMessage.Performative.INFORM:
-            performative = fipa_pb2.FipaMessage.Inform_Performative()  # type: ignore
-            info = msg.info
-            performative.info.update(info)
-            fipa_msg.inform.CopyFrom(performative)
-        elif performative_id == FipaMessage.Performative.ACCEPT:
-            performative = fipa_pb2.FipaMessage.Accept_Performative()  # type: ignore
-            fipa_msg.accept.CopyFrom(performative)
-        elif performative_id == FipaMessage.Performative.DECLINE:
-            performative = fipa_pb2.FipaMessage.Decline_Performative()  # type: ignore
-            fipa_msg.decline.CopyFrom(performative)
-        elif performative_id == FipaMessage.Performative.MATCH_ACCEPT:
-            performative = fipa_pb2.FipaMessage.Match_Accept_Performative()  # type: ignore
-            fipa_msg.match_accept.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, fipa_msg)
 
         fipa_bytes = fipa_msg.SerializeToString()
         return fipa_bytes
@@ -108,36 +221,11 @@ class FipaSerializer(Serializer):
         target = fipa_pb.target
 
         performative = fipa_pb.WhichOneof("performative")
-        performative_id = FipaMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == FipaMessage.Performative.CFP:
-            pb2_query = fipa_pb.cfp.query
-            query = Query.decode(pb2_query)
-            performative_content["query"] = query
-        elif performative_id == FipaMessage.Performative.PROPOSE:
-            pb2_proposal = fipa_pb.propose.proposal
-            proposal = Description.decode(pb2_proposal)
-            performative_content["proposal"] = proposal
-        elif performative_id == FipaMessage.Performative.ACCEPT_W_INFORM:
-            info = fipa_pb.accept_w_inform.info
-            info_dict = dict(info)
-            performative_content["info"] = info_dict
-        elif performative_id == FipaMessage.Performative.MATCH_ACCEPT_W_INFORM:
-            info = fipa_pb.match_accept_w_inform.info
-            info_dict = dict(info)
-            performative_content["info"] = info_dict
-        elif performative_id == FipaMessage.Performative.INFORM:
-            info = fipa_pb.inform.info
-            info_dict = dict(info)
-            performative_content["info"] = info_dict
-        elif performative_id == FipaMessage.Performative.ACCEPT:
-            pass
-        elif performative_id == FipaMessage.Performative.DECLINE:
-            pass
-        elif performative_id == FipaMessage.Performative.MATCH_ACCEPT:
-            pass
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(fipa_pb)
 
         return FipaMessage(
             message_id=message_id,
@@ -41,6 +41,9 @@ class GymDialogue(Dialogue):
     TERMINAL_PERFORMATIVES = frozenset({GymMessage.Performative.CLOSE})
     VALID_REPLIES = {
         GymMessage.Performative.ACT: frozenset({GymMessage.Performative.PERCEPT}),
+        GymMessage.Performative.ACT_BATCH: frozenset(
+            {GymMessage.Performative.PERCEPT_BATCH}
+        ),
         GymMessage.Performative.CLOSE: frozenset(),
         GymMessage.Performative.PERCEPT: frozenset(
             {
@@ -49,10 +52,18 @@ class GymDialogue(Dialogue):
                 GymMessage.Performative.RESET,
             }
         ),
+        GymMessage.Performative.PERCEPT_BATCH: frozenset(
+            {
+                GymMessage.Performative.ACT_BATCH,
+                GymMessage.Performative.CLOSE,
+                GymMessage.Performative.RESET,
+            }
+        ),
         GymMessage.Performative.RESET: frozenset({GymMessage.Performative.STATUS}),
         GymMessage.Performative.STATUS: frozenset(
             {
                 GymMessage.Performative.ACT,
+                GymMessage.Performative.ACT_BATCH,
                 GymMessage.Performative.CLOSE,
                 GymMessage.Performative.RESET,
             }
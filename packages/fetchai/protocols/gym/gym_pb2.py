@@ -17,7 +17,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     package="fetch.aea.Gym",
     syntax="proto3",
     serialized_options=None,
-    serialized_pb=b'\n\tgym.proto\x12\rfetch.aea.Gym"\xb1\x07\n\nGymMessage\x12\x12\n\nmessage_id\x18\x01 \x01(\x05\x12"\n\x1a\x64ialogue_starter_reference\x18\x02 \x01(\t\x12$\n\x1c\x64ialogue_responder_reference\x18\x03 \x01(\t\x12\x0e\n\x06target\x18\x04 \x01(\x05\x12\x39\n\x03\x61\x63t\x18\x05 \x01(\x0b\x32*.fetch.aea.Gym.GymMessage.Act_PerformativeH\x00\x12=\n\x05\x63lose\x18\x06 \x01(\x0b\x32,.fetch.aea.Gym.GymMessage.Close_PerformativeH\x00\x12\x41\n\x07percept\x18\x07 \x01(\x0b\x32..fetch.aea.Gym.GymMessage.Percept_PerformativeH\x00\x12=\n\x05reset\x18\x08 \x01(\x0b\x32,.fetch.aea.Gym.GymMessage.Reset_PerformativeH\x00\x12?\n\x06status\x18\t \x01(\x0b\x32-.fetch.aea.Gym.GymMessage.Status_PerformativeH\x00\x1a\x18\n\tAnyObject\x12\x0b\n\x03\x61ny\x18\x01 \x01(\x0c\x1aX\n\x10\x41\x63t_Performative\x12\x33\n\x06\x61\x63tion\x18\x01 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x12\x0f\n\x07step_id\x18\x02 \x01(\x05\x1a\xb2\x01\n\x14Percept_Performative\x12\x0f\n\x07step_id\x18\x01 \x01(\x05\x12\x38\n\x0bobservation\x18\x02 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x12\x0e\n\x06reward\x18\x03 \x01(\x02\x12\x0c\n\x04\x64one\x18\x04 \x01(\x08\x12\x31\n\x04info\x18\x05 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x1a\x92\x01\n\x13Status_Performative\x12K\n\x07\x63ontent\x18\x01 \x03(\x0b\x32:.fetch.aea.Gym.GymMessage.Status_Performative.ContentEntry\x1a.\n\x0c\x43ontentEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x14\n\x12Reset_Performative\x1a\x14\n\x12\x43lose_PerformativeB\x0e\n\x0cperformativeb\x06proto3',
+    serialized_pb=b'\n\tgym.proto\x12\rfetch.aea.Gym"\xe7\n\n\nGymMessage\x12\x12\n\nmessage_id\x18\x01 \x01(\x05\x12"\n\x1a\x64ialogue_starter_reference\x18\x02 \x01(\t\x12$\n\x1c\x64ialogue_responder_reference\x18\x03 \x01(\t\x12\x0e\n\x06target\x18\x04 \x01(\x05\x12\x39\n\x03\x61\x63t\x18\x05 \x01(\x0b\x32*.fetch.aea.Gym.GymMessage.Act_PerformativeH\x00\x12\x45\n\tact_batch\x18\x06 \x01(\x0b\x32\x30.fetch.aea.Gym.GymMessage.Act_Batch_PerformativeH\x00\x12=\n\x05\x63lose\x18\x07 \x01(\x0b\x32,.fetch.aea.Gym.GymMessage.Close_PerformativeH\x00\x12\x41\n\x07percept\x18\x08 \x01(\x0b\x32..fetch.aea.Gym.GymMessage.Percept_PerformativeH\x00\x12M\n\rpercept_batch\x18\t \x01(\x0b\x32\x34.fetch.aea.Gym.GymMessage.Percept_Batch_PerformativeH\x00\x12=\n\x05reset\x18\n \x01(\x0b\x32,.fetch.aea.Gym.GymMessage.Reset_PerformativeH\x00\x12?\n\x06status\x18\x0b \x01(\x0b\x32-.fetch.aea.Gym.GymMessage.Status_PerformativeH\x00\x1a\x18\n\tAnyObject\x12\x0b\n\x03\x61ny\x18\x01 \x01(\x0c\x1aX\n\x10\x41\x63t_Performative\x12\x33\n\x06\x61\x63tion\x18\x01 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x12\x0f\n\x07step_id\x18\x02 \x01(\x05\x1a_\n\x16\x41\x63t_Batch_Performative\x12\x34\n\x07\x61\x63tions\x18\x01 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x12\x0f\n\x07step_id\x18\x02 \x01(\x05\x1a\xb2\x01\n\x14Percept_Performative\x12\x0f\n\x07step_id\x18\x01 \x01(\x05\x12\x38\n\x0bobservation\x18\x02 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x12\x0e\n\x06reward\x18\x03 \x01(\x02\x12\x0c\n\x04\x64one\x18\x04 \x01(\x08\x12\x31\n\x04info\x18\x05 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x1a\xbc\x01\n\x1aPercept_Batch_Performative\x12\x0f\n\x07step_id\x18\x01 \x01(\x05\x12\x39\n\x0cobservations\x18\x02 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x12\x0f\n\x07rewards\x18\x03 \x03(\x02\x12\r\n\x05\x64ones\x18\x04 \x03(\x08\x12\x32\n\x05infos\x18\x05 \x01(\x0b\x32#.fetch.aea.Gym.GymMessage.AnyObject\x1a\x92\x01\n\x13Status_Performative\x12K\n\x07\x63ontent\x18\x01 \x03(\x0b\x32:.fetch.aea.Gym.GymMessage.Status_Performative.ContentEntry\x1a.\n\x0c\x43ontentEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x14\n\x12Reset_Performative\x1a\x14\n\x12\x43lose_PerformativeB\x0e\n\x0cperformativeb\x06proto3',
 )
 
 
@@ -55,8 +55,8 @@ _GYMMESSAGE_ANYOBJECT = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=470,
-    serialized_end=494,
+    serialized_start=620,
+    serialized_end=644,
 )
 
 _GYMMESSAGE_ACT_PERFORMATIVE = _descriptor.Descriptor(
@@ -111,8 +111,64 @@ _GYMMESSAGE_ACT_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=496,
-    serialized_end=584,
+    serialized_start=646,
+    serialized_end=734,
+)
+
+_GYMMESSAGE_ACT_BATCH_PERFORMATIVE = _descriptor.Descriptor(
+    name="Act_Batch_Performative",
+    full_name="fetch.aea.Gym.GymMessage.Act_Batch_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="actions",
+            full_name="fetch.aea.Gym.GymMessage.Act_Batch_Performative.actions",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="step_id",
+            full_name="fetch.aea.Gym.GymMessage.Act_Batch_Performative.step_id",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=736,
+    serialized_end=831,
 )
 
 _GYMMESSAGE_PERCEPT_PERFORMATIVE = _descriptor.Descriptor(
@@ -221,8 +277,118 @@ _GYMMESSAGE_PERCEPT_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=587,
-    serialized_end=765,
+    serialized_start=834,
+    serialized_end=1012,
+)
+
+_GYMMESSAGE_PERCEPT_BATCH_PERFORMATIVE = _descriptor.Descriptor(
+    name="Percept_Batch_Performative",
+    full_name="fetch.aea.Gym.GymMessage.Percept_Batch_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="step_id",
+            full_name="fetch.aea.Gym.GymMessage.Percept_Batch_Performative.step_id",
+            index=0,
+            number=1,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="observations",
+            full_name="fetch.aea.Gym.GymMessage.Percept_Batch_Performative.observations",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="rewards",
+            full_name="fetch.aea.Gym.GymMessage.Percept_Batch_Performative.rewards",
+            index=2,
+            number=3,
+            type=2,
+            cpp_type=6,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="dones",
+            full_name="fetch.aea.Gym.GymMessage.Percept_Batch_Performative.dones",
+            index=3,
+            number=4,
+            type=8,
+            cpp_type=7,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="infos",
+            full_name="fetch.aea.Gym.GymMessage.Percept_Batch_Performative.infos",
+            index=4,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1015,
+    serialized_end=1203,
 )
 
 _GYMMESSAGE_STATUS_PERFORMATIVE_CONTENTENTRY = _descriptor.Descriptor(
@@ -277,8 +443,8 @@ _GYMMESSAGE_STATUS_PERFORMATIVE_CONTENTENTRY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=868,
-    serialized_end=914,
+    serialized_start=1306,
+    serialized_end=1352,
 )
 
 _GYMMESSAGE_STATUS_PERFORMATIVE = _descriptor.Descriptor(
@@ -315,8 +481,8 @@ _GYMMESSAGE_STATUS_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=768,
-    serialized_end=914,
+    serialized_start=1206,
+    serialized_end=1352,
 )
 
 _GYMMESSAGE_RESET_PERFORMATIVE = _descriptor.Descriptor(
@@ -334,8 +500,8 @@ _GYMMESSAGE_RESET_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=916,
-    serialized_end=936,
+    serialized_start=1354,
+    serialized_end=1374,
 )
 
 _GYMMESSAGE_CLOSE_PERFORMATIVE = _descriptor.Descriptor(
@@ -353,8 +519,8 @@ _GYMMESSAGE_CLOSE_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=938,
-    serialized_end=958,
+    serialized_start=1376,
+    serialized_end=1396,
 )
 
 _GYMMESSAGE = _descriptor.Descriptor(
@@ -455,8 +621,8 @@ _GYMMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="close",
-            full_name="fetch.aea.Gym.GymMessage.close",
+            name="act_batch",
+            full_name="fetch.aea.Gym.GymMessage.act_batch",
             index=5,
             number=6,
             type=11,
@@ -473,8 +639,8 @@ _GYMMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="percept",
-            full_name="fetch.aea.Gym.GymMessage.percept",
+            name="close",
+            full_name="fetch.aea.Gym.GymMessage.close",
             index=6,
             number=7,
             type=11,
@@ -491,8 +657,8 @@ _GYMMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="reset",
-            full_name="fetch.aea.Gym.GymMessage.reset",
+            name="percept",
+            full_name="fetch.aea.Gym.GymMessage.percept",
             index=7,
             number=8,
             type=11,
@@ -509,8 +675,8 @@ _GYMMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="status",
-            full_name="fetch.aea.Gym.GymMessage.status",
+            name="percept_batch",
+            full_name="fetch.aea.Gym.GymMessage.percept_batch",
             index=8,
             number=9,
             type=11,
@@ -526,12 +692,50 @@ _GYMMESSAGE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="reset",
+            full_name="fetch.aea.Gym.GymMessage.reset",
+            index=9,
+            number=10,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="status",
+            full_name="fetch.aea.Gym.GymMessage.status",
+            index=10,
+            number=11,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
     ],
     extensions=[],
     nested_types=[
         _GYMMESSAGE_ANYOBJECT,
         _GYMMESSAGE_ACT_PERFORMATIVE,
+        _GYMMESSAGE_ACT_BATCH_PERFORMATIVE,
         _GYMMESSAGE_PERCEPT_PERFORMATIVE,
+        _GYMMESSAGE_PERCEPT_BATCH_PERFORMATIVE,
         _GYMMESSAGE_STATUS_PERFORMATIVE,
         _GYMMESSAGE_RESET_PERFORMATIVE,
         _GYMMESSAGE_CLOSE_PERFORMATIVE,
@@ -551,7 +755,7 @@ _GYMMESSAGE = _descriptor.Descriptor(
         ),
     ],
     serialized_start=29,
-    serialized_end=974,
+    serialized_end=1412,
 )
 
 _GYMMESSAGE_ANYOBJECT.containing_type = _GYMMESSAGE
@@ -559,6 +763,10 @@ _GYMMESSAGE_ACT_PERFORMATIVE.fields_by_name[
     "action"
 ].message_type = _GYMMESSAGE_ANYOBJECT
 _GYMMESSAGE_ACT_PERFORMATIVE.containing_type = _GYMMESSAGE
+_GYMMESSAGE_ACT_BATCH_PERFORMATIVE.fields_by_name[
+    "actions"
+].message_type = _GYMMESSAGE_ANYOBJECT
+_GYMMESSAGE_ACT_BATCH_PERFORMATIVE.containing_type = _GYMMESSAGE
 _GYMMESSAGE_PERCEPT_PERFORMATIVE.fields_by_name[
     "observation"
 ].message_type = _GYMMESSAGE_ANYOBJECT
@@ -566,6 +774,13 @@ _GYMMESSAGE_PERCEPT_PERFORMATIVE.fields_by_name[
     "info"
 ].message_type = _GYMMESSAGE_ANYOBJECT
 _GYMMESSAGE_PERCEPT_PERFORMATIVE.containing_type = _GYMMESSAGE
+_GYMMESSAGE_PERCEPT_BATCH_PERFORMATIVE.fields_by_name[
+    "observations"
+].message_type = _GYMMESSAGE_ANYOBJECT
+_GYMMESSAGE_PERCEPT_BATCH_PERFORMATIVE.fields_by_name[
+    "infos"
+].message_type = _GYMMESSAGE_ANYOBJECT
+_GYMMESSAGE_PERCEPT_BATCH_PERFORMATIVE.containing_type = _GYMMESSAGE
 _GYMMESSAGE_STATUS_PERFORMATIVE_CONTENTENTRY.containing_type = (
     _GYMMESSAGE_STATUS_PERFORMATIVE
 )
@@ -576,8 +791,14 @@ _GYMMESSAGE_STATUS_PERFORMATIVE.containing_type = _GYMMESSAGE
 _GYMMESSAGE_RESET_PERFORMATIVE.containing_type = _GYMMESSAGE
 _GYMMESSAGE_CLOSE_PERFORMATIVE.containing_type = _GYMMESSAGE
 _GYMMESSAGE.fields_by_name["act"].message_type = _GYMMESSAGE_ACT_PERFORMATIVE
+_GYMMESSAGE.fields_by_name[
+    "act_batch"
+].message_type = _GYMMESSAGE_ACT_BATCH_PERFORMATIVE
 _GYMMESSAGE.fields_by_name["close"].message_type = _GYMMESSAGE_CLOSE_PERFORMATIVE
 _GYMMESSAGE.fields_by_name["percept"].message_type = _GYMMESSAGE_PERCEPT_PERFORMATIVE
+_GYMMESSAGE.fields_by_name[
+    "percept_batch"
+].message_type = _GYMMESSAGE_PERCEPT_BATCH_PERFORMATIVE
 _GYMMESSAGE.fields_by_name["reset"].message_type = _GYMMESSAGE_RESET_PERFORMATIVE
 _GYMMESSAGE.fields_by_name["status"].message_type = _GYMMESSAGE_STATUS_PERFORMATIVE
 _GYMMESSAGE.oneofs_by_name["performative"].fields.append(
@@ -586,6 +807,12 @@ _GYMMESSAGE.oneofs_by_name["performative"].fields.append(
 _GYMMESSAGE.fields_by_name["act"].containing_oneof = _GYMMESSAGE.oneofs_by_name[
     "performative"
 ]
+_GYMMESSAGE.oneofs_by_name["performative"].fields.append(
+    _GYMMESSAGE.fields_by_name["act_batch"]
+)
+_GYMMESSAGE.fields_by_name["act_batch"].containing_oneof = _GYMMESSAGE.oneofs_by_name[
+    "performative"
+]
 _GYMMESSAGE.oneofs_by_name["performative"].fields.append(
     _GYMMESSAGE.fields_by_name["close"]
 )
@@ -598,6 +825,12 @@ _GYMMESSAGE.oneofs_by_name["performative"].fields.append(
 _GYMMESSAGE.fields_by_name["percept"].containing_oneof = _GYMMESSAGE.oneofs_by_name[
     "performative"
 ]
+_GYMMESSAGE.oneofs_by_name["performative"].fields.append(
+    _GYMMESSAGE.fields_by_name["percept_batch"]
+)
+_GYMMESSAGE.fields_by_name[
+    "percept_batch"
+].containing_oneof = _GYMMESSAGE.oneofs_by_name["performative"]
 _GYMMESSAGE.oneofs_by_name["performative"].fields.append(
     _GYMMESSAGE.fields_by_name["reset"]
 )
@@ -635,6 +868,15 @@ GymMessage = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:fetch.aea.Gym.GymMessage.Act_Performative)
             },
         ),
+        "Act_Batch_Performative": _reflection.GeneratedProtocolMessageType(
+            "Act_Batch_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _GYMMESSAGE_ACT_BATCH_PERFORMATIVE,
+                "__module__": "gym_pb2"
+                # @@protoc_insertion_point(class_scope:fetch.aea.Gym.GymMessage.Act_Batch_Performative)
+            },
+        ),
         "Percept_Performative": _reflection.GeneratedProtocolMessageType(
             "Percept_Performative",
             (_message.Message,),
@@ -644,6 +886,15 @@ GymMessage = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:fetch.aea.Gym.GymMessage.Percept_Performative)
             },
         ),
+        "Percept_Batch_Performative": _reflection.GeneratedProtocolMessageType(
+            "Percept_Batch_Performative",
+            (_message.Message,),
+            {
+                "DESCRIPTOR": _GYMMESSAGE_PERCEPT_BATCH_PERFORMATIVE,
+                "__module__": "gym_pb2"
+                # @@protoc_insertion_point(class_scope:fetch.aea.Gym.GymMessage.Percept_Batch_Performative)
+            },
+        ),
         "Status_Performative": _reflection.GeneratedProtocolMessageType(
             "Status_Performative",
             (_message.Message,),
@@ -688,7 +939,9 @@ GymMessage = _reflection.GeneratedProtocolMessageType(
 _sym_db.RegisterMessage(GymMessage)
 _sym_db.RegisterMessage(GymMessage.AnyObject)
 _sym_db.RegisterMessage(GymMessage.Act_Performative)
+_sym_db.RegisterMessage(GymMessage.Act_Batch_Performative)
 _sym_db.RegisterMessage(GymMessage.Percept_Performative)
+_sym_db.RegisterMessage(GymMessage.Percept_Batch_Performative)
 _sym_db.RegisterMessage(GymMessage.Status_Performative)
 _sym_db.RegisterMessage(GymMessage.Status_Performative.ContentEntry)
 _sym_db.RegisterMessage(GymMessage.Reset_Performative)
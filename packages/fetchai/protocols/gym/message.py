@@ -21,10 +21,10 @@
 
 import logging
 from enum import Enum
-from typing import Dict, Set, Tuple, cast
+from typing import Dict, Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 from packages.fetchai.protocols.gym.custom_types import AnyObject as CustomAnyObject
 
@@ -33,10 +33,10 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.gym.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class GymMessage(Message):
+class GymMessage(SlottedMessage):
     """A protocol for interacting with a gym connection."""
 
-    protocol_id = ProtocolId("fetchai", "gym", "0.3.0")
+    protocol_id = ProtocolId("fetchai", "gym", "0.4.0")
 
     AnyObject = CustomAnyObject
 
@@ -44,8 +44,10 @@ class GymMessage(Message):
         """Performatives for the gym protocol."""
 
         ACT = "act"
+        ACT_BATCH = "act_batch"
         CLOSE = "close"
         PERCEPT = "percept"
+        PERCEPT_BATCH = "percept_batch"
         RESET = "reset"
         STATUS = "status"
 
@@ -53,6 +55,52 @@ class GymMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_action",
+        "_actions",
+        "_content",
+        "_done",
+        "_dones",
+        "_info",
+        "_infos",
+        "_observation",
+        "_observations",
+        "_reward",
+        "_rewards",
+        "_step_id",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _action: CustomAnyObject
+    _actions: CustomAnyObject
+    _content: Dict[str, str]
+    _done: bool
+    _dones: Tuple[bool, ...]
+    _info: CustomAnyObject
+    _infos: CustomAnyObject
+    _observation: CustomAnyObject
+    _observations: CustomAnyObject
+    _reward: float
+    _rewards: Tuple[float, ...]
+    _step_id: int
+
+    _performatives = {
+        "act",
+        "act_batch",
+        "close",
+        "percept",
+        "percept_batch",
+        "reset",
+        "status",
+    }
+
     def __init__(
         self,
         performative: Performative,
@@ -69,14 +117,11 @@ class GymMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=GymMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {"act", "close", "percept", "reset", "status"}
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = GymMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -86,68 +131,130 @@ class GymMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(GymMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def action(self) -> CustomAnyObject:
         """Get the 'action' content from the message."""
-        assert self.is_set("action"), "'action' content is not set."
-        return cast(CustomAnyObject, self.get("action"))
+        try:
+            return self._action
+        except AttributeError:
+            raise AssertionError("'action' content is not set.")
+
+    @property
+    def actions(self) -> CustomAnyObject:
+        """Get the 'actions' content from the message."""
+        try:
+            return self._actions
+        except AttributeError:
+            raise AssertionError("'actions' content is not set.")
 
     @property
     def content(self) -> Dict[str, str]:
         """Get the 'content' content from the message."""
-        assert self.is_set("content"), "'content' content is not set."
-        return cast(Dict[str, str], self.get("content"))
+        try:
+            return self._content
+        except AttributeError:
+            raise AssertionError("'content' content is not set.")
 
     @property
     def done(self) -> bool:
         """Get the 'done' content from the message."""
-        assert self.is_set("done"), "'done' content is not set."
-        return cast(bool, self.get("done"))
+        try:
+            return self._done
+        except AttributeError:
+            raise AssertionError("'done' content is not set.")
+
+    @property
+    def dones(self) -> Tuple[bool, ...]:
+        """Get the 'dones' content from the message."""
+        try:
+            return self._dones
+        except AttributeError:
+            raise AssertionError("'dones' content is not set.")
 
     @property
     def info(self) -> CustomAnyObject:
         """Get the 'info' content from the message."""
-        assert self.is_set("info"), "'info' content is not set."
-        return cast(CustomAnyObject, self.get("info"))
+        try:
+            return self._info
+        except AttributeError:
+            raise AssertionError("'info' content is not set.")
+
+    @property
+    def infos(self) -> CustomAnyObject:
+        """Get the 'infos' content from the message."""
+        try:
+            return self._infos
+        except AttributeError:
+            raise AssertionError("'infos' content is not set.")
 
     @property
     def observation(self) -> CustomAnyObject:
         """Get the 'observation' content from the message."""
-        assert self.is_set("observation"), "'observation' content is not set."
-        return cast(CustomAnyObject, self.get("observation"))
+        try:
+            return self._observation
+        except AttributeError:
+            raise AssertionError("'observation' content is not set.")
+
+    @property
+    def observations(self) -> CustomAnyObject:
+        """Get the 'observations' content from the message."""
+        try:
+            return self._observations
+        except AttributeError:
+            raise AssertionError("'observations' content is not set.")
 
     @property
     def reward(self) -> float:
         """Get the 'reward' content from the message."""
-        assert self.is_set("reward"), "'reward' content is not set."
-        return cast(float, self.get("reward"))
+        try:
+            return self._reward
+        except AttributeError:
+            raise AssertionError("'reward' content is not set.")
+
+    @property
+    def rewards(self) -> Tuple[float, ...]:
+        """Get the 'rewards' content from the message."""
+        try:
+            return self._rewards
+        except AttributeError:
+            raise AssertionError("'rewards' content is not set.")
 
     @property
     def step_id(self) -> int:
         """Get the 'step_id' content from the message."""
-        assert self.is_set("step_id"), "'step_id' content is not set."
-        return cast(int, self.get("step_id"))
+        try:
+            return self._step_id
+        except AttributeError:
+            raise AssertionError("'step_id' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the gym protocol."""
@@ -187,7 +294,7 @@ class GymMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == GymMessage.Performative.ACT:
                 expected_nb_of_contents = 2
@@ -201,6 +308,18 @@ class GymMessage(Message):
                 ), "Invalid type for content 'step_id'. Expected 'int'. Found '{}'.".format(
                     type(self.step_id)
                 )
+            elif self.performative == GymMessage.Performative.ACT_BATCH:
+                expected_nb_of_contents = 2
+                assert (
+                    type(self.actions) == CustomAnyObject
+                ), "Invalid type for content 'actions'. Expected 'AnyObject'. Found '{}'.".format(
+                    type(self.actions)
+                )
+                assert (
+                    type(self.step_id) == int
+                ), "Invalid type for content 'step_id'. Expected 'int'. Found '{}'.".format(
+                    type(self.step_id)
+                )
             elif self.performative == GymMessage.Performative.PERCEPT:
                 expected_nb_of_contents = 5
                 assert (
@@ -228,6 +347,39 @@ class GymMessage(Message):
                 ), "Invalid type for content 'info'. Expected 'AnyObject'. Found '{}'.".format(
                     type(self.info)
                 )
+            elif self.performative == GymMessage.Performative.PERCEPT_BATCH:
+                expected_nb_of_contents = 5
+                assert (
+                    type(self.step_id) == int
+                ), "Invalid type for content 'step_id'. Expected 'int'. Found '{}'.".format(
+                    type(self.step_id)
+                )
+                assert (
+                    type(self.observations) == CustomAnyObject
+                ), "Invalid type for content 'observations'. Expected 'AnyObject'. Found '{}'.".format(
+                    type(self.observations)
+                )
+                assert (
+                    type(self.rewards) == tuple
+                ), "Invalid type for content 'rewards'. Expected 'tuple'. Found '{}'.".format(
+                    type(self.rewards)
+                )
+                assert all(
+                    type(element) == float for element in self.rewards
+                ), "Invalid type for tuple elements in content 'rewards'. Expected 'float'."
+                assert (
+                    type(self.dones) == tuple
+                ), "Invalid type for content 'dones'. Expected 'tuple'. Found '{}'.".format(
+                    type(self.dones)
+                )
+                assert all(
+                    type(element) == bool for element in self.dones
+                ), "Invalid type for tuple elements in content 'dones'. Expected 'bool'."
+                assert (
+                    type(self.infos) == CustomAnyObject
+                ), "Invalid type for content 'infos'. Expected 'AnyObject'. Found '{}'.".format(
+                    type(self.infos)
+                )
             elif self.performative == GymMessage.Performative.STATUS:
                 expected_nb_of_contents = 1
                 assert (
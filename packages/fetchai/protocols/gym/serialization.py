@@ -19,7 +19,7 @@
 
 """Serialization module for gym protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -29,6 +29,180 @@ from packages.fetchai.protocols.gym.custom_types import AnyObject
 from packages.fetchai.protocols.gym.message import GymMessage
 
 
+def _encode_act(msg: GymMessage, gym_msg: Any) -> None:
+    """Encode the contents of the 'act' performative."""
+    performative = gym_msg.act
+    performative.SetInParent()
+    action = msg.action
+    AnyObject.encode(performative.action, action)
+    step_id = msg.step_id
+    performative.step_id = step_id
+
+
+def _encode_act_batch(msg: GymMessage, gym_msg: Any) -> None:
+    """Encode the contents of the 'act_batch' performative."""
+    performative = gym_msg.act_batch
+    performative.SetInParent()
+    actions = msg.actions
+    AnyObject.encode(performative.actions, actions)
+    step_id = msg.step_id
+    performative.step_id = step_id
+
+
+def _encode_percept(msg: GymMessage, gym_msg: Any) -> None:
+    """Encode the contents of the 'percept' performative."""
+    performative = gym_msg.percept
+    performative.SetInParent()
+    step_id = msg.step_id
+    performative.step_id = step_id
+    observation = msg.observation
+    AnyObject.encode(performative.observation, observation)
+    reward = msg.reward
+    performative.reward = reward
+    done = msg.done
+    performative.done = done
+    info = msg.info
+    AnyObject.encode(performative.info, info)
+
+
+def _encode_percept_batch(msg: GymMessage, gym_msg: Any) -> None:
+    """Encode the contents of the 'percept_batch' performative."""
+    performative = gym_msg.percept_batch
+    performative.SetInParent()
+    step_id = msg.step_id
+    performative.step_id = step_id
+    observations = msg.observations
+    AnyObject.encode(performative.observations, observations)
+    rewards = msg.rewards
+    performative.rewards.extend(rewards)
+    dones = msg.dones
+    performative.dones.extend(dones)
+    infos = msg.infos
+    AnyObject.encode(performative.infos, infos)
+
+
+def _encode_status(msg: GymMessage, gym_msg: Any) -> None:
+    """Encode the contents of the 'status' performative."""
+    performative = gym_msg.status
+    performative.SetInParent()
+    content = msg.content
+    performative.content.update(content)
+
+
+def _encode_reset(msg: GymMessage, gym_msg: Any) -> None:
+    """Encode the contents of the 'reset' performative."""
+    performative = gym_msg.reset
+    performative.SetInParent()
+
+
+def _encode_close(msg: GymMessage, gym_msg: Any) -> None:
+    """Encode the contents of the 'close' performative."""
+    performative = gym_msg.close
+    performative.SetInParent()
+
+
+def _decode_act(gym_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'act' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_action = gym_pb.act.action
+    action = AnyObject.decode(pb2_action)
+    performative_content["action"] = action
+    step_id = gym_pb.act.step_id
+    performative_content["step_id"] = step_id
+    return performative_content
+
+
+def _decode_act_batch(gym_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'act_batch' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_actions = gym_pb.act_batch.actions
+    actions = AnyObject.decode(pb2_actions)
+    performative_content["actions"] = actions
+    step_id = gym_pb.act_batch.step_id
+    performative_content["step_id"] = step_id
+    return performative_content
+
+
+def _decode_percept(gym_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'percept' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    step_id = gym_pb.percept.step_id
+    performative_content["step_id"] = step_id
+    pb2_observation = gym_pb.percept.observation
+    observation = AnyObject.decode(pb2_observation)
+    performative_content["observation"] = observation
+    reward = gym_pb.percept.reward
+    performative_content["reward"] = reward
+    done = gym_pb.percept.done
+    performative_content["done"] = done
+    pb2_info = gym_pb.percept.info
+    info = AnyObject.decode(pb2_info)
+    performative_content["info"] = info
+    return performative_content
+
+
+def _decode_percept_batch(gym_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'percept_batch' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    step_id = gym_pb.percept_batch.step_id
+    performative_content["step_id"] = step_id
+    pb2_observations = gym_pb.percept_batch.observations
+    observations = AnyObject.decode(pb2_observations)
+    performative_content["observations"] = observations
+    rewards = gym_pb.percept_batch.rewards
+    rewards_tuple = tuple(rewards)
+    performative_content["rewards"] = rewards_tuple
+    dones = gym_pb.percept_batch.dones
+    dones_tuple = tuple(dones)
+    performative_content["dones"] = dones_tuple
+    pb2_infos = gym_pb.percept_batch.infos
+    infos = AnyObject.decode(pb2_infos)
+    performative_content["infos"] = infos
+    return performative_content
+
+
+def _decode_status(gym_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'status' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    content = gym_pb.status.content
+    content_dict = dict(content)
+    performative_content["content"] = content_dict
+    return performative_content
+
+
+def _decode_reset(gym_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'reset' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    return performative_content
+
+
+def _decode_close(gym_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'close' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    return performative_content
+
+
+_ENCODERS = {
+    "act": _encode_act,
+    "act_batch": _encode_act_batch,
+    "percept": _encode_percept,
+    "percept_batch": _encode_percept_batch,
+    "status": _encode_status,
+    "reset": _encode_reset,
+    "close": _encode_close,
+}  # type: Dict[str, Callable[[GymMessage, Any], None]]
+
+_DECODERS = {
+    "act": _decode_act,
+    "act_batch": _decode_act_batch,
+    "percept": _decode_percept,
+    "percept_batch": _decode_percept_batch,
+    "status": _decode_status,
+    "reset": _decode_reset,
+    "close": _decode_close,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class GymSerializer(Serializer):
     """Serialization for the 'gym' protocol."""
 
@@ -49,39 +223,11 @@ class GymSerializer(Serializer):
         gym_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == GymMessage.Performative.ACT:
-            performative = gym_pb2.GymMessage.Act_Performative()  # type: ignore
-            action = msg.action
-            AnyObject.encode(performative.action, action)
-            step_id = msg.step_id
-            performative.step_id = step_id
-            gym_msg.act.CopyFrom(performative)
-        elif performative_id == GymMessage.Performative.PERCEPT:
-            performative = gym_pb2.GymMessage.Percept_Performative()  # type: ignore
-            step_id = msg.step_id
-            performative.step_id = step_id
-            observation = msg.observation
-            AnyObject.encode(performative.observation, observation)
-            reward = msg.reward
-            performative.reward = reward
-            done = msg.done
-            performative.done = done
-            info = msg.info
-            AnyObject.encode(performative.info, info)
-            gym_msg.percept.CopyFrom(performative)
-        elif performative_id == GymMessage.Performative.STATUS:
-            performative = gym_pb2.GymMessage.Status_Performative()  # type: ignore
-            content = msg.content
-            performative.content.update(content)
-            gym_msg.status.CopyFrom(performative)
-        elif performative_id == GymMessage.Performative.RESET:
-            performative = gym_pb2.GymMessage.Reset_Performative()  # type: ignore
-            gym_msg.reset.CopyFrom(performative)
-        elif performative_id == GymMessage.Performative.CLOSE:
-            performative = gym_pb2.GymMessage.Close_Performative()  # type: ignore
-            gym_msg.close.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, gym_msg)
 
         gym_bytes = gym_msg.SerializeToString()
         return gym_bytes
@@ -104,37 +250,11 @@ class GymSerializer(Serializer):
         target = gym_pb.target
 
         performative = gym_pb.WhichOneof("performative")
-        performative_id = GymMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == GymMessage.Performative.ACT:
-            pb2_action = gym_pb.act.action
-            action = AnyObject.decode(pb2_action)
-            performative_content["action"] = action
-            step_id = gym_pb.act.step_id
-            performative_content["step_id"] = step_id
-        elif performative_id == GymMessage.Performative.PERCEPT:
-            step_id = gym_pb.percept.step_id
-            performative_content["step_id"] = step_id
-            pb2_observation = gym_pb.percept.observation
-            observation = AnyObject.decode(pb2_observation)
-            performative_content["observation"] = observation
-            reward = gym_pb.percept.reward
-            performative_content["reward"] = reward
-            done = gym_pb.percept.done
-            performative_content["done"] = done
-            pb2_info = gym_pb.percept.info
-            info = AnyObject.decode(pb2_info)
-            performative_content["info"] = info
-        elif performative_id == GymMessage.Performative.STATUS:
-            content = gym_pb.status.content
-            content_dict = dict(content)
-            performative_content["content"] = content_dict
-        elif performative_id == GymMessage.Performative.RESET:
-            pass
-        elif performative_id == GymMessage.Performative.CLOSE:
-            pass
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(gym_pb)
 
         return GymMessage(
             message_id=message_id,
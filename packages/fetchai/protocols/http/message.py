@@ -21,17 +21,17 @@
 
 import logging
 from enum import Enum
-from typing import Set, Tuple, cast
+from typing import Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 logger = logging.getLogger("aea.packages.fetchai.protocols.http.message")
 
 DEFAULT_BODY_SIZE = 4
 
 
-class HttpMessage(Message):
+class HttpMessage(SlottedMessage):
     """A protocol for HTTP requests and responses."""
 
     protocol_id = ProtocolId("fetchai", "http", "0.3.0")
@@ -46,6 +46,34 @@ class HttpMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_bodyy",
+        "_headers",
+        "_method",
+        "_status_code",
+        "_status_text",
+        "_url",
+        "_version",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _bodyy: bytes
+    _headers: str
+    _method: str
+    _status_code: int
+    _status_text: str
+    _url: str
+    _version: str
+
+    _performatives = {"request", "response"}
+
     def __init__(
         self,
         performative: Performative,
@@ -62,14 +90,11 @@ class HttpMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=HttpMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {"request", "response"}
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = HttpMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -79,68 +104,90 @@ class HttpMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(HttpMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def bodyy(self) -> bytes:
         """Get the 'bodyy' content from the message."""
-        assert self.is_set("bodyy"), "'bodyy' content is not set."
-        return cast(bytes, self.get("bodyy"))
+        try:
+            return self._bodyy
+        except AttributeError:
+            raise AssertionError("'bodyy' content is not set.")
 
     @property
     def headers(self) -> str:
         """Get the 'headers' content from the message."""
-        assert self.is_set("headers"), "'headers' content is not set."
-        return cast(str, self.get("headers"))
+        try:
+            return self._headers
+        except AttributeError:
+            raise AssertionError("'headers' content is not set.")
 
     @property
     def method(self) -> str:
         """Get the 'method' content from the message."""
-        assert self.is_set("method"), "'method' content is not set."
-        return cast(str, self.get("method"))
+        try:
+            return self._method
+        except AttributeError:
+            raise AssertionError("'method' content is not set.")
 
     @property
     def status_code(self) -> int:
         """Get the 'status_code' content from the message."""
-        assert self.is_set("status_code"), "'status_code' content is not set."
-        return cast(int, self.get("status_code"))
+        try:
+            return self._status_code
+        except AttributeError:
+            raise AssertionError("'status_code' content is not set.")
 
     @property
     def status_text(self) -> str:
         """Get the 'status_text' content from the message."""
-        assert self.is_set("status_text"), "'status_text' content is not set."
-        return cast(str, self.get("status_text"))
+        try:
+            return self._status_text
+        except AttributeError:
+            raise AssertionError("'status_text' content is not set.")
 
     @property
     def url(self) -> str:
         """Get the 'url' content from the message."""
-        assert self.is_set("url"), "'url' content is not set."
-        return cast(str, self.get("url"))
+        try:
+            return self._url
+        except AttributeError:
+            raise AssertionError("'url' content is not set.")
 
     @property
     def version(self) -> str:
         """Get the 'version' content from the message."""
-        assert self.is_set("version"), "'version' content is not set."
-        return cast(str, self.get("version"))
+        try:
+            return self._version
+        except AttributeError:
+            raise AssertionError("'version' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the http protocol."""
@@ -180,7 +227,7 @@ class HttpMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == HttpMessage.Performative.REQUEST:
                 expected_nb_of_contents = 5
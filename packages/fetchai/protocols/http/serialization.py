@@ -19,7 +19,7 @@
 
 """Serialization module for http protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -28,6 +28,81 @@ from packages.fetchai.protocols.http import http_pb2
 from packages.fetchai.protocols.http.message import HttpMessage
 
 
+def _encode_request(msg: HttpMessage, http_msg: Any) -> None:
+    """Encode the contents of the 'request' performative."""
+    performative = http_msg.request
+    performative.SetInParent()
+    method = msg.method
+    performative.method = method
+    url = msg.url
+    performative.url = url
+    version = msg.version
+    performative.version = version
+    headers = msg.headers
+    performative.headers = headers
+    bodyy = msg.bodyy
+    performative.bodyy = bodyy
+
+
+def _encode_response(msg: HttpMessage, http_msg: Any) -> None:
+    """Encode the contents of the 'response' performative."""
+    performative = http_msg.response
+    performative.SetInParent()
+    version = msg.version
+    performative.version = version
+    status_code = msg.status_code
+    performative.status_code = status_code
+    status_text = msg.status_text
+    performative.status_text = status_text
+    headers = msg.headers
+    performative.headers = headers
+    bodyy = msg.bodyy
+    performative.bodyy = bodyy
+
+
+def _decode_request(http_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'request' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    method = http_pb.request.method
+    performative_content["method"] = method
+    url = http_pb.request.url
+    performative_content["url"] = url
+    version = http_pb.request.version
+    performative_content["version"] = version
+    headers = http_pb.request.headers
+    performative_content["headers"] = headers
+    bodyy = http_pb.request.bodyy
+    performative_content["bodyy"] = bodyy
+    return performative_content
+
+
+def _decode_response(http_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'response' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    version = http_pb.response.version
+    performative_content["version"] = version
+    status_code = http_pb.response.status_code
+    performative_content["status_code"] = status_code
+    status_text = http_pb.response.status_text
+    performative_content["status_text"] = status_text
+    headers = http_pb.response.headers
+    performative_content["headers"] = headers
+    bodyy = http_pb.response.bodyy
+    performative_content["bodyy"] = bodyy
+    return performative_content
+
+
+_ENCODERS = {
+    "request": _encode_request,
+    "response": _encode_response,
+}  # type: Dict[str, Callable[[HttpMessage, Any], None]]
+
+_DECODERS = {
+    "request": _decode_request,
+    "response": _decode_response,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class HttpSerializer(Serializer):
     """Serialization for the 'http' protocol."""
 
@@ -48,34 +123,11 @@ class HttpSerializer(Serializer):
         http_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == HttpMessage.Performative.REQUEST:
-            performative = http_pb2.HttpMessage.Request_Performative()  # type: ignore
-            method = msg.method
-            performative.method = method
-            url = msg.url
-            performative.url = url
-            version = msg.version
-            performative.version = version
-            headers = msg.headers
-            performative.headers = headers
-            bodyy = msg.bodyy
-            performative.bodyy = bodyy
-            http_msg.request.CopyFrom(performative)
-        elif performative_id == HttpMessage.Performative.RESPONSE:
-            performative = http_pb2.HttpMessage.Response_Performative()  # type: ignore
-            version = msg.version
-            performative.version = version
-            status_code = msg.status_code
-            performative.status_code = status_code
-            status_text = msg.status_text
-            performative.status_text = status_text
-            headers = msg.headers
-            performative.headers = headers
-            bodyy = msg.bodyy
-            performative.bodyy = bodyy
-            http_msg.response.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, http_msg)
 
         http_bytes = http_msg.SerializeToString()
         return http_bytes
@@ -98,32 +150,11 @@ class HttpSerializer(Serializer):
         target = http_pb.target
 
         performative = http_pb.WhichOneof("performative")
-        performative_id = HttpMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == HttpMessage.Performative.REQUEST:
-            method = http_pb.request.method
-            performative_content["method"] = method
-            url = http_pb.request.url
-            performative_content["url"] = url
-            version = http_pb.request.version
-            performative_content["version"] = version
-            headers = http_pb.request.headers
-            performative_content["headers"] = headers
-            bodyy = http_pb.request.bodyy
-            performative_content["bodyy"] = bodyy
-        elif performative_id == HttpMessage.Performative.RESPONSE:
-            version = http_pb.response.version
-            performative_content["version"] = version
-            status_code = http_pb.response.status_code
-            performative_content["status_code"] = status_code
-            status_text = http_pb.response.status_text
-            performative_content["status_text"] = status_text
-            headers = http_pb.response.headers
-            performative_content["headers"] = headers
-            bodyy = http_pb.response.bodyy
-            performative_content["bodyy"] = bodyy
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(http_pb)
 
         return HttpMessage(
             message_id=message_id,
@@ -24,7 +24,7 @@ from enum import Enum
 from typing import Optional, Set, Tuple, cast
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 from packages.fetchai.protocols.ledger_api.custom_types import (
     RawTransaction as CustomRawTransaction,
@@ -45,7 +45,7 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.ledger_api.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class LedgerApiMessage(Message):
+class LedgerApiMessage(SlottedMessage):
     """A protocol for ledger APIs requests and responses."""
 
     protocol_id = ProtocolId("fetchai", "ledger_api", "0.1.0")
@@ -77,6 +77,52 @@ class LedgerApiMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_address",
+        "_balance",
+        "_code",
+        "_data",
+        "_ledger_id",
+        "_message",
+        "_raw_transaction",
+        "_signed_transaction",
+        "_terms",
+        "_transaction_digest",
+        "_transaction_receipt",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _address: str
+    _balance: int
+    _code: int
+    _data: bytes
+    _ledger_id: str
+    _message: str
+    _raw_transaction: CustomRawTransaction
+    _signed_transaction: CustomSignedTransaction
+    _terms: CustomTerms
+    _transaction_digest: CustomTransactionDigest
+    _transaction_receipt: CustomTransactionReceipt
+
+    _performatives = {
+        "balance",
+        "error",
+        "get_balance",
+        "get_raw_transaction",
+        "get_transaction_receipt",
+        "raw_transaction",
+        "send_signed_transaction",
+        "transaction_digest",
+        "transaction_receipt",
+    }
+
     def __init__(
         self,
         performative: Performative,
@@ -93,24 +139,11 @@ class LedgerApiMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=LedgerApiMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {
-            "balance",
-            "error",
-            "get_balance",
-            "get_raw_transaction",
-            "get_transaction_receipt",
-            "raw_transaction",
-            "send_signed_transaction",
-            "transaction_digest",
-            "transaction_receipt",
-        }
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = LedgerApiMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -120,96 +153,116 @@ class LedgerApiMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(LedgerApiMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def address(self) -> str:
         """Get the 'address' content from the message."""
-        assert self.is_set("address"), "'address' content is not set."
-        return cast(str, self.get("address"))
+        try:
+            return self._address
+        except AttributeError:
+            raise AssertionError("'address' content is not set.")
 
     @property
     def balance(self) -> int:
         """Get the 'balance' content from the message."""
-        assert self.is_set("balance"), "'balance' content is not set."
-        return cast(int, self.get("balance"))
+        try:
+            return self._balance
+        except AttributeError:
+            raise AssertionError("'balance' content is not set.")
 
     @property
     def code(self) -> int:
         """Get the 'code' content from the message."""
-        assert self.is_set("code"), "'code' content is not set."
-        return cast(int, self.get("code"))
+        try:
+            return self._code
+        except AttributeError:
+            raise AssertionError("'code' content is not set.")
 
     @property
     def data(self) -> Optional[bytes]:
         """Get the 'data' content from the message."""
-        return cast(Optional[bytes], self.get("data"))
+        return getattr(self, "_data", None)
 
     @property
     def ledger_id(self) -> str:
         """Get the 'ledger_id' content from the message."""
-        assert self.is_set("ledger_id"), "'ledger_id' content is not set."
-        return cast(str, self.get("ledger_id"))
+        try:
+            return self._ledger_id
+        except AttributeError:
+            raise AssertionError("'ledger_id' content is not set.")
 
     @property
     def message(self) -> Optional[str]:
         """Get the 'message' content from the message."""
-        return cast(Optional[str], self.get("message"))
+        return getattr(self, "_message", None)
 
     @property
     def raw_transaction(self) -> CustomRawTransaction:
         """Get the 'raw_transaction' content from the message."""
-        assert self.is_set("raw_transaction"), "'raw_transaction' content is not set."
-        return cast(CustomRawTransaction, self.get("raw_transaction"))
+        try:
+            return self._raw_transaction
+        except AttributeError:
+            raise AssertionError("'raw_transaction' content is not set.")
 
     @property
     def signed_transaction(self) -> CustomSignedTransaction:
         """Get the 'signed_transaction' content from the message."""
-        assert self.is_set(
-            "signed_transaction"
-        ), "'signed_transaction' content is not set."
-        return cast(CustomSignedTransaction, self.get("signed_transaction"))
+        try:
+            return self._signed_transaction
+        except AttributeError:
+            raise AssertionError("'signed_transaction' content is not set.")
 
     @property
     def terms(self) -> CustomTerms:
         """Get the 'terms' content from the message."""
-        assert self.is_set("terms"), "'terms' content is not set."
-        return cast(CustomTerms, self.get("terms"))
+        try:
+            return self._terms
+        except AttributeError:
+            raise AssertionError("'terms' content is not set.")
 
     @property
     def transaction_digest(self) -> CustomTransactionDigest:
         """Get the 'transaction_digest' content from the message."""
-        assert self.is_set(
-            "transaction_digest"
-        ), "'transaction_digest' content is not set."
-        return cast(CustomTransactionDigest, self.get("transaction_digest"))
+        try:
+            return self._transaction_digest
+        except AttributeError:
+            raise AssertionError("'transaction_digest' content is not set.")
 
     @property
     def transaction_receipt(self) -> CustomTransactionReceipt:
         """Get the 'transaction_receipt' content from the message."""
-        assert self.is_set(
-            "transaction_receipt"
-        ), "'transaction_receipt' content is not set."
-        return cast(CustomTransactionReceipt, self.get("transaction_receipt"))
+        try:
+            return self._transaction_receipt
+        except AttributeError:
+            raise AssertionError("'transaction_receipt' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the ledger_api protocol."""
@@ -249,7 +302,7 @@ class LedgerApiMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == LedgerApiMessage.Performative.GET_BALANCE:
                 expected_nb_of_contents = 2
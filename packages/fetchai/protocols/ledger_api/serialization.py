@@ -19,7 +19,7 @@
 
 """Serialization module for ledger_api protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -33,6 +33,203 @@ from packages.fetchai.protocols.ledger_api.custom_types import TransactionReceip
 from packages.fetchai.protocols.ledger_api.message import LedgerApiMessage
 
 
+def _encode_get_balance(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'get_balance' performative."""
+    performative = ledger_api_msg.get_balance
+    performative.SetInParent()
+    ledger_id = msg.ledger_id
+    performative.ledger_id = ledger_id
+    address = msg.address
+    performative.address = address
+
+
+def _encode_get_raw_transaction(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'get_raw_transaction' performative."""
+    performative = ledger_api_msg.get_raw_transaction
+    performative.SetInParent()
+    terms = msg.terms
+    Terms.encode(performative.terms, terms)
+
+
+def _encode_send_signed_transaction(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'send_signed_transaction' performative."""
+    performative = ledger_api_msg.send_signed_transaction
+    performative.SetInParent()
+    signed_transaction = msg.signed_transaction
+    SignedTransaction.encode(performative.signed_transaction, signed_transaction)
+
+
+def _encode_get_transaction_receipt(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'get_transaction_receipt' performative."""
+    performative = ledger_api_msg.get_transaction_receipt
+    performative.SetInParent()
+    transaction_digest = msg.transaction_digest
+    TransactionDigest.encode(performative.transaction_digest, transaction_digest)
+
+
+def _encode_balance(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'balance' performative."""
+    performative = ledger_api_msg.balance
+    performative.SetInParent()
+    ledger_id = msg.ledger_id
+    performative.ledger_id = ledger_id
+    balance = msg.balance
+    performative.balance = balance
+
+
+def _encode_raw_transaction(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'raw_transaction' performative."""
+    performative = ledger_api_msg.raw_transaction
+    performative.SetInParent()
+    raw_transaction = msg.raw_transaction
+    RawTransaction.encode(performative.raw_transaction, raw_transaction)
+
+
+def _encode_transaction_digest(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'transaction_digest' performative."""
+    performative = ledger_api_msg.transaction_digest
+    performative.SetInParent()
+    transaction_digest = msg.transaction_digest
+    TransactionDigest.encode(performative.transaction_digest, transaction_digest)
+
+
+def _encode_transaction_receipt(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'transaction_receipt' performative."""
+    performative = ledger_api_msg.transaction_receipt
+    performative.SetInParent()
+    transaction_receipt = msg.transaction_receipt
+    TransactionReceipt.encode(performative.transaction_receipt, transaction_receipt)
+
+
+def _encode_error(msg: LedgerApiMessage, ledger_api_msg: Any) -> None:
+    """Encode the contents of the 'error' performative."""
+    performative = ledger_api_msg.error
+    performative.SetInParent()
+    code = msg.code
+    performative.code = code
+    if msg.is_set("message"):
+        performative.message_is_set = True
+        message = msg.message
+        performative.message = message
+    if msg.is_set("data"):
+        performative.data_is_set = True
+        data = msg.data
+        performative.data = data
+
+
+def _decode_get_balance(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'get_balance' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    ledger_id = ledger_api_pb.get_balance.ledger_id
+    performative_content["ledger_id"] = ledger_id
+    address = ledger_api_pb.get_balance.address
+    performative_content["address"] = address
+    return performative_content
+
+
+def _decode_get_raw_transaction(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'get_raw_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_terms = ledger_api_pb.get_raw_transaction.terms
+    terms = Terms.decode(pb2_terms)
+    performative_content["terms"] = terms
+    return performative_content
+
+
+def _decode_send_signed_transaction(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'send_signed_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_signed_transaction = ledger_api_pb.send_signed_transaction.signed_transaction
+    signed_transaction = SignedTransaction.decode(pb2_signed_transaction)
+    performative_content["signed_transaction"] = signed_transaction
+    return performative_content
+
+
+def _decode_get_transaction_receipt(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'get_transaction_receipt' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_transaction_digest = ledger_api_pb.get_transaction_receipt.transaction_digest
+    transaction_digest = TransactionDigest.decode(pb2_transaction_digest)
+    performative_content["transaction_digest"] = transaction_digest
+    return performative_content
+
+
+def _decode_balance(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'balance' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    ledger_id = ledger_api_pb.balance.ledger_id
+    performative_content["ledger_id"] = ledger_id
+    balance = ledger_api_pb.balance.balance
+    performative_content["balance"] = balance
+    return performative_content
+
+
+def _decode_raw_transaction(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'raw_transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_raw_transaction = ledger_api_pb.raw_transaction.raw_transaction
+    raw_transaction = RawTransaction.decode(pb2_raw_transaction)
+    performative_content["raw_transaction"] = raw_transaction
+    return performative_content
+
+
+def _decode_transaction_digest(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'transaction_digest' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_transaction_digest = ledger_api_pb.transaction_digest.transaction_digest
+    transaction_digest = TransactionDigest.decode(pb2_transaction_digest)
+    performative_content["transaction_digest"] = transaction_digest
+    return performative_content
+
+
+def _decode_transaction_receipt(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'transaction_receipt' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_transaction_receipt = ledger_api_pb.transaction_receipt.transaction_receipt
+    transaction_receipt = TransactionReceipt.decode(pb2_transaction_receipt)
+    performative_content["transaction_receipt"] = transaction_receipt
+    return performative_content
+
+
+def _decode_error(ledger_api_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'error' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    code = ledger_api_pb.error.code
+    performative_content["code"] = code
+    if ledger_api_pb.error.message_is_set:
+        message = ledger_api_pb.error.message
+        performative_content["message"] = message
+    if ledger_api_pb.error.data_is_set:
+        data = ledger_api_pb.error.data
+        performative_content["data"] = data
+    return performative_content
+
+
+_ENCODERS = {
+    "get_balance": _encode_get_balance,
+    "get_raw_transaction": _encode_get_raw_transaction,
+    "send_signed_transaction": _encode_send_signed_transaction,
+    "get_transaction_receipt": _encode_get_transaction_receipt,
+    "balance": _encode_balance,
+    "raw_transaction": _encode_raw_transaction,
+    "transaction_digest": _encode_transaction_digest,
+    "transaction_receipt": _encode_transaction_receipt,
+    "error": _encode_error,
+}  # type: Dict[str, Callable[[LedgerApiMessage, Any], None]]
+
+_DECODERS = {
+    "get_balance": _decode_get_balance,
+    "get_raw_transaction": _decode_get_raw_transaction,
+    "send_signed_transaction": _decode_send_signed_transaction,
+    "get_transaction_receipt": _decode_get_transaction_receipt,
+    "balance": _decode_balance,
+    "raw_transaction": _decode_raw_transaction,
+    "transaction_digest": _decode_transaction_digest,
+    "transaction_receipt": _decode_transaction_receipt,
+    "error": _decode_error,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class LedgerApiSerializer(Serializer):
     """Serialization for the 'ledger_api' protocol."""
 
@@ -53,73 +250,11 @@ class LedgerApiSerializer(Serializer):
         ledger_api_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == LedgerApiMessage.Performative.GET_BALANCE:
-            performative = ledger_api_pb2.LedgerApiMessage.Get_Balance_Performative()  # type: ignore
-            ledger_id = msg.ledger_id
-            performative.ledger_id = ledger_id
-            address = msg.address
-            performative.address = address
-            ledger_api_msg.get_balance.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.GET_RAW_TRANSACTION:
-            performative = ledger_api_pb2.LedgerApiMessage.Get_Raw_Transaction_Performative()  # type: ignore
-            terms = msg.terms
-            Terms.encode(performative.terms, terms)
-            ledger_api_msg.get_raw_transaction.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION:
-            performative = ledger_api_pb2.LedgerApiMessage.Send_Signed_Transaction_Performative()  # type: ignore
-            signed_transaction = msg.signed_transaction
-            SignedTransaction.encode(
-                performative.signed_transaction, signed_transaction
-            )
-            ledger_api_msg.send_signed_transaction.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT:
-            performative = ledger_api_pb2.LedgerApiMessage.Get_Transaction_Receipt_Performative()  # type: ignore
-            transaction_digest = msg.transaction_digest
-            TransactionDigest.encode(
-                performative.transaction_digest, transaction_digest
-            )
-            ledger_api_msg.get_transaction_receipt.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.BALANCE:
-            performative = ledger_api_pb2.LedgerApiMessage.Balance_Performative()  # type: ignore
-            ledger_id = msg.ledger_id
-            performative.ledger_id = ledger_id
-            balance = msg.balance
-            performative.balance = balance
-            ledger_api_msg.balance.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.RAW_TRANSACTION:
-            performative = ledger_api_pb2.LedgerApiMessage.Raw_Transaction_Performative()  # type: ignore
-            raw_transaction = msg.raw_transaction
-            RawTransaction.encode(performative.raw_transaction, raw_transaction)
-            ledger_api_msg.raw_transaction.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.TRANSACTION_DIGEST:
-            performative = ledger_api_pb2.LedgerApiMessage.Transaction_Digest_Performative()  # type: ignore
-            transaction_digest = msg.transaction_digest
-            TransactionDigest.encode(
-                performative.transaction_digest, transaction_digest
-            )
-            ledger_api_msg.transaction_digest.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.TRANSACTION_RECEIPT:
-            performative = ledger_api_pb2.LedgerApiMessage.Transaction_Receipt_Performative()  # type: ignore
-            transaction_receipt = msg.transaction_receipt
-            TransactionReceipt.encode(
-                performative.transaction_receipt, transaction_receipt
-            )
-            ledger_api_msg.transaction_receipt.CopyFrom(performative)
-        elif performative_id == LedgerApiMessage.Performative.ERROR:
-            performative = ledger_api_pb2.LedgerApiMessage.Error_Performative()  # type: ignore
-            code = msg.code
-            performative.code = code
-            if msg.is_set("message"):
-                performative.message_is_set = True
-                message = msg.message
-                performative.message = message
-            if msg.is_set("data"):
-                performative.data_is_set = True
-                data = msg.data
-                performative.data = data
-            ledger_api_msg.error.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, ledger_api_msg)
 
         ledger_api_bytes = ledger_api_msg.SerializeToString()
         return ledger_api_bytes
@@ -142,59 +277,11 @@ class LedgerApiSerializer(Serializer):
         target = ledger_api_pb.target
 
         performative = ledger_api_pb.WhichOneof("performative")
-        performative_id = LedgerApiMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == LedgerApiMessage.Performative.GET_BALANCE:
-            ledger_id = ledger_api_pb.get_balance.ledger_id
-            performative_content["ledger_id"] = ledger_id
-            address = ledger_api_pb.get_balance.address
-            performative_content["address"] = address
-        elif performative_id == LedgerApiMessage.Performative.GET_RAW_TRANSACTION:
-            pb2_terms = ledger_api_pb.get_raw_transaction.terms
-            terms = Terms.decode(pb2_terms)
-            performative_content["terms"] = terms
-        elif performative_id == LedgerApiMessage.Performative.SEND_SIGNED_TRANSACTION:
-            pb2_signed_transaction = (
-                ledger_api_pb.send_signed_transaction.signed_transaction
-            )
-            signed_transaction = SignedTransaction.decode(pb2_signed_transaction)
-            performative_content["signed_transaction"] = signed_transaction
-        elif performative_id == LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT:
-            pb2_transaction_digest = (
-                ledger_api_pb.get_transaction_receipt.transaction_digest
-            )
-            transaction_digest = TransactionDigest.decode(pb2_transaction_digest)
-            performative_content["transaction_digest"] = transaction_digest
-        elif performative_id == LedgerApiMessage.Performative.BALANCE:
-            ledger_id = ledger_api_pb.balance.ledger_id
-            performative_content["ledger_id"] = ledger_id
-            balance = ledger_api_pb.balance.balance
-            performative_content["balance"] = balance
-        elif performative_id == LedgerApiMessage.Performative.RAW_TRANSACTION:
-            pb2_raw_transaction = ledger_api_pb.raw_transaction.raw_transaction
-            raw_transaction = RawTransaction.decode(pb2_raw_transaction)
-            performative_content["raw_transaction"] = raw_transaction
-        elif performative_id == LedgerApiMessage.Performative.TRANSACTION_DIGEST:
-            pb2_transaction_digest = ledger_api_pb.transaction_digest.transaction_digest
-            transaction_digest = TransactionDigest.decode(pb2_transaction_digest)
-            performative_content["transaction_digest"] = transaction_digest
-        elif performative_id == LedgerApiMessage.Performative.TRANSACTION_RECEIPT:
-            pb2_transaction_receipt = (
-                ledger_api_pb.transaction_receipt.transaction_receipt
-            )
-            transaction_receipt = TransactionReceipt.decode(pb2_transaction_receipt)
-            performative_content["transaction_receipt"] = transaction_receipt
-        elif performative_id == LedgerApiMessage.Performative.ERROR:
-            code = ledger_api_pb.error.code
-            performative_content["code"] = code
-            if ledger_api_pb.error.message_is_set:
-                message = ledger_api_pb.error.message
-                performative_content["message"] = message
-            if ledger_api_pb.error.data_is_set:
-                data = ledger_api_pb.error.data
-                performative_content["data"] = data
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(ledger_api_pb)
 
         return LedgerApiMessage(
             message_id=message_id,
@@ -21,10 +21,10 @@
 
 import logging
 from enum import Enum
-from typing import Set, Tuple, cast
+from typing import Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 from packages.fetchai.protocols.ml_trade.custom_types import (
     Description as CustomDescription,
@@ -36,10 +36,10 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.ml_trade.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class MlTradeMessage(Message):
+class MlTradeMessage(SlottedMessage):
     """A protocol for trading data for training and prediction purposes."""
 
-    protocol_id = ProtocolId("fetchai", "ml_trade", "0.3.0")
+    protocol_id = ProtocolId("fetchai", "ml_trade", "0.4.0")
 
     Description = CustomDescription
 
@@ -57,6 +57,28 @@ class MlTradeMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_payload",
+        "_query",
+        "_terms",
+        "_tx_digest",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _payload: bytes
+    _query: CustomQuery
+    _terms: CustomDescription
+    _tx_digest: str
+
+    _performatives = {"accept", "cfp", "data", "terms"}
+
     def __init__(
         self,
         performative: Performative,
@@ -73,14 +95,11 @@ class MlTradeMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=MlTradeMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {"accept", "cfp", "data", "terms"}
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = MlTradeMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -90,50 +109,66 @@ class MlTradeMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(MlTradeMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def payload(self) -> bytes:
         """Get the 'payload' content from the message."""
-        assert self.is_set("payload"), "'payload' content is not set."
-        return cast(bytes, self.get("payload"))
+        try:
+            return self._payload
+        except AttributeError:
+            raise AssertionError("'payload' content is not set.")
 
     @property
     def query(self) -> CustomQuery:
         """Get the 'query' content from the message."""
-        assert self.is_set("query"), "'query' content is not set."
-        return cast(CustomQuery, self.get("query"))
+        try:
+            return self._query
+        except AttributeError:
+            raise AssertionError("'query' content is not set.")
 
     @property
     def terms(self) -> CustomDescription:
         """Get the 'terms' content from the message."""
-        assert self.is_set("terms"), "'terms' content is not set."
-        return cast(CustomDescription, self.get("terms"))
+        try:
+            return self._terms
+        except AttributeError:
+            raise AssertionError("'terms' content is not set.")
 
     @property
     def tx_digest(self) -> str:
         """Get the 'tx_digest' content from the message."""
-        assert self.is_set("tx_digest"), "'tx_digest' content is not set."
-        return cast(str, self.get("tx_digest"))
+        try:
+            return self._tx_digest
+        except AttributeError:
+            raise AssertionError("'tx_digest' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the ml_trade protocol."""
@@ -173,7 +208,7 @@ class MlTradeMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == MlTradeMessage.Performative.CFP:
                 expected_nb_of_contents = 1
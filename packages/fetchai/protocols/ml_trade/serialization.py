@@ -19,7 +19,7 @@
 
 """Serialization module for ml_trade protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -30,6 +30,97 @@ from packages.fetchai.protocols.ml_trade.custom_types import Query
 from packages.fetchai.protocols.ml_trade.message import MlTradeMessage
 
 
+def _encode_cfp(msg: MlTradeMessage, ml_trade_msg: Any) -> None:
+    """Encode the contents of the 'cfp' performative."""
+    performative = ml_trade_msg.cfp
+    performative.SetInParent()
+    query = msg.query
+    Query.encode(performative.query, query)
+
+
+def _encode_terms(msg: MlTradeMessage, ml_trade_msg: Any) -> None:
+    """Encode the contents of the 'terms' performative."""
+    performative = ml_trade_msg.terms
+    performative.SetInParent()
+    terms = msg.terms
+    Description.encode(performative.terms, terms)
+
+
+def _encode_accept(msg: MlTradeMessage, ml_trade_msg: Any) -> None:
+    """Encode the contents of the 'accept' performative."""
+    performative = ml_trade_msg.accept
+    performative.SetInParent()
+    terms = msg.terms
+    Description.encode(performative.terms, terms)
+    tx_digest = msg.tx_digest
+    performative.tx_digest = tx_digest
+
+
+def _encode_data(msg: MlTradeMessage, ml_trade_msg: Any) -> None:
+    """Encode the contents of the 'data' performative."""
+    performative = ml_trade_msg.data
+    performative.SetInParent()
+    terms = msg.terms
+    Description.encode(performative.terms, terms)
+    payload = msg.payload
+    performative.payload = payload
+
+
+def _decode_cfp(ml_trade_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'cfp' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_query = ml_trade_pb.cfp.query
+    query = Query.decode(pb2_query)
+    performative_content["query"] = query
+    return performative_content
+
+
+def _decode_terms(ml_trade_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'terms' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_terms = ml_trade_pb.terms.terms
+    terms = Description.decode(pb2_terms)
+    performative_content["terms"] = terms
+    return performative_content
+
+
+def _decode_accept(ml_trade_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'accept' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_terms = ml_trade_pb.accept.terms
+    terms = Description.decode(pb2_terms)
+    performative_content["terms"] = terms
+    tx_digest = ml_trade_pb.accept.tx_digest
+    performative_content["tx_digest"] = tx_digest
+    return performative_content
+
+
+def _decode_data(ml_trade_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'data' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_terms = ml_trade_pb.data.terms
+    terms = Description.decode(pb2_terms)
+    performative_content["terms"] = terms
+    payload = ml_trade_pb.data.payload
+    performative_content["payload"] = payload
+    return performative_content
+
+
+_ENCODERS = {
+    "cfp": _encode_cfp,
+    "terms": _encode_terms,
+    "accept": _encode_accept,
+    "data": _encode_data,
+}  # type: Dict[str, Callable[[MlTradeMessage, Any], None]]
+
+_DECODERS = {
+    "cfp": _decode_cfp,
+    "terms": _decode_terms,
+    "accept": _decode_accept,
+    "data": _decode_data,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class MlTradeSerializer(Serializer):
     """Serialization for the 'ml_trade' protocol."""
 
@@ -50,32 +141,11 @@ class MlTradeSerializer(Serializer):
         ml_trade_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == MlTradeMessage.Performative.CFP:
-            performative = ml_trade_pb2.MlTradeMessage.Cfp_Performative()  # type: ignore
-            query = msg.query
-            Query.encode(performative.query, query)
-            ml_trade_msg.cfp.CopyFrom(performative)
-        elif performative_id == MlTradeMessage.Performative.TERMS:
-            performative = ml_trade_pb2.MlTradeMessage.Terms_Performative()  # type: ignore
-            terms = msg.terms
-            Description.encode(performative.terms, terms)
-            ml_trade_msg.terms.CopyFrom(performative)
-        elif performative_id == MlTradeMessage.Performative.ACCEPT:
-            performative = ml_trade_pb2.MlTradeMessage.Accept_Performative()  # type: ignore
-            terms = msg.terms
-            Description.encode(performative.terms, terms)
-            tx_digest = msg.tx_digest
-            performative.tx_digest = tx_digest
-            ml_trade_msg.accept.CopyFrom(performative)
-        elif performative_id == MlTradeMessage.Performative.DATA:
-            performative = ml_trade_pb2.MlTradeMessage.Data_Performative()  # type: ignore
-            terms = msg.terms
-            Description.encode(performative.terms, terms)
-            payload = msg.payload
-            performative.payload = payload
-            ml_trade_msg.data.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, ml_trade_msg)
 
         ml_trade_bytes = ml_trade_msg.SerializeToString()
         return ml_trade_bytes
@@ -98,30 +168,11 @@ class MlTradeSerializer(Serializer):
         target = ml_trade_pb.target
 
         performative = ml_trade_pb.WhichOneof("performative")
-        performative_id = MlTradeMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == MlTradeMessage.Performative.CFP:
-            pb2_query = ml_trade_pb.cfp.query
-            query = Query.decode(pb2_query)
-            performative_content["query"] = query
-        elif performative_id == MlTradeMessage.Performative.TERMS:
-            pb2_terms = ml_trade_pb.terms.terms
-            terms = Description.decode(pb2_terms)
-            performative_content["terms"] = terms
-        elif performative_id == MlTradeMessage.Performative.ACCEPT:
-            pb2_terms = ml_trade_pb.accept.terms
-            terms = Description.decode(pb2_terms)
-            performative_content["terms"] = terms
-            tx_digest = ml_trade_pb.accept.tx_digest
-            performative_content["tx_digest"] = tx_digest
-        elif performative_id == MlTradeMessage.Performative.DATA:
-            pb2_terms = ml_trade_pb.data.terms
-            terms = Description.decode(pb2_terms)
-            performative_content["terms"] = terms
-            payload = ml_trade_pb.data.payload
-            performative_content["payload"] = payload
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(ml_trade_pb)
 
         return MlTradeMessage(
             message_id=message_id,
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains the tensor encoding of the payload of the 'data' performative.
+
+A payload holds a sequence of numpy arrays. It starts with the MAGIC bytes and
+the FORMAT_VERSION of the encoding, and a header describing each array (dtype, shape and offset of its buffer), followed by the raw
+little-endian buffers, each aligned to ALIGNMENT bytes. Decoding does not copy
+the buffers: the arrays are read-only views on the payload.
+"""
+
+import struct
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+MAGIC = b"AEAT"
+FORMAT_VERSION = 1
+ALIGNMENT = 16
+
+_HEADER = struct.Struct("<4sBI")
+_DTYPE_LENGTH = struct.Struct("<B")
+_NDIM = struct.Struct("<B")
+_DIMENSION = struct.Struct("<Q")
+_OFFSET = struct.Struct("<Q")
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the alignment."""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _to_little_endian(array: np.ndarray) -> np.ndarray:
+    """
+    Get a C-contiguous, little-endian version of an array.
+
+    :param array: the array.
+    :return: the array itself, if it is already C-contiguous and little-endian.
+    :raises ValueError: if the dtype has no raw buffer representation.
+    """
+    dtype = array.dtype
+    if dtype.hasobject or dtype.fields is not None:
+        raise ValueError("Cannot encode tensors of dtype {}.".format(dtype))
+    little_endian = dtype.newbyteorder("<")
+    if little_endian != dtype:
+        return array.astype(little_endian, order="C")
+    # unlike 'np.ascontiguousarray', this keeps the shape of 0-d arrays.
+    return array if array.flags.c_contiguous else array.copy(order="C")
+
+
+def encode_tensors(tensors: Sequence[np.ndarray]) -> bytes:
+    """
+    Encode a sequence of arrays in a payload.
+
+    The buffers of the arrays are copied once, into the payload.
+
+    :param tensors: the arrays.
+    :return: the payload.
+    :raises ValueError: if an array has an object or a structured dtype.
+    """
+    arrays = [_to_little_endian(np.asarray(tensor)) for tensor in tensors]
+    descriptions = []  # type: List[bytes]
+    for array in arrays:
+        dtype = array.dtype.str.encode("ascii")
+        descriptions.append(
+            _DTYPE_LENGTH.pack(len(dtype))
+            + dtype
+            + _NDIM.pack(array.ndim)
+            + b"".join(_DIMENSION.pack(dimension) for dimension in array.shape)
+        )
+    header_size = _HEADER.size + sum(
+        len(description) + _OFFSET.size for description in descriptions
+    )
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(arrays))]
+    buffers = []  # type: List[bytes]
+    end = header_size
+    for description, array in zip(descriptions, arrays):
+        offset = _align(end)
+        parts.append(description + _OFFSET.pack(offset))
+        buffers.append(b"\x00" * (offset - end))
+        # a flat byte view exposes the buffer of any dtype, without copying it.
+        buffers.append(array.reshape(-1).view(np.uint8))  # type: ignore
+        end = offset + array.nbytes
+    return b"".join(parts + buffers)
+
+
+def decode_tensors(payload: bytes) -> Tuple[np.ndarray, ...]:
+    """
+    Decode the arrays of a payload.
+
+    :param payload: the payload.
+    :return: the arrays, read-only views on the payload (if it is immutable).
+    :raises ValueError: if the payload is not a valid tensor encoding.
+    """
+    try:
+        magic, version, count = _HEADER.unpack_from(payload, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a tensor payload.")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported tensor payload version {}, expected {}.".format(
+                    version, FORMAT_VERSION
+                )
+            )
+        position = _HEADER.size
+        tensors = []  # type: List[np.ndarray]
+        for _ in range(count):
+            (dtype_length,) = _DTYPE_LENGTH.unpack_from(payload, position)
+            position += _DTYPE_LENGTH.size
+            dtype = np.dtype(
+                bytes(payload[position : position + dtype_length]).decode("ascii")
+            )
+            position += dtype_length
+            (ndim,) = _NDIM.unpack_from(payload, position)
+            position += _NDIM.size
+            shape = struct.unpack_from("<{}Q".format(ndim), payload, position)
+            position += ndim * _DIMENSION.size
+            (offset,) = _OFFSET.unpack_from(payload, position)
+            position += _OFFSET.size
+
+            size = int(np.prod(shape, dtype=np.int64))
+            if size == 0 or dtype.itemsize == 0:
+                tensors.append(np.empty(shape, dtype=dtype))
+                continue
+            if offset + size * dtype.itemsize > len(payload):
+                raise ValueError("Truncated tensor payload.")
+            tensor = np.frombuffer(payload, dtype=dtype, count=size, offset=offset)
+            tensors.append(tensor.reshape(shape))
+        return tuple(tensors)
+    except (struct.error, TypeError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid tensor payload: {}".format(e))
@@ -21,10 +21,10 @@
 
 import logging
 from enum import Enum
-from typing import Set, Tuple, cast
+from typing import Set, Tuple
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 from packages.fetchai.protocols.oef_search.custom_types import (
     Description as CustomDescription,
@@ -39,7 +39,7 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.oef_search.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class OefSearchMessage(Message):
+class OefSearchMessage(SlottedMessage):
     """A protocol for interacting with an OEF search service."""
 
     protocol_id = ProtocolId("fetchai", "oef_search", "0.3.0")
@@ -63,6 +63,34 @@ class OefSearchMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_agents",
+        "_oef_error_operation",
+        "_query",
+        "_service_description",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _agents: Tuple[str, ...]
+    _oef_error_operation: CustomOefErrorOperation
+    _query: CustomQuery
+    _service_description: CustomDescription
+
+    _performatives = {
+        "oef_error",
+        "register_service",
+        "search_result",
+        "search_services",
+        "unregister_service",
+    }
+
     def __init__(
         self,
         performative: Performative,
@@ -79,20 +107,11 @@ class OefSearchMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=OefSearchMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {
-            "oef_error",
-            "register_service",
-            "search_result",
-            "search_services",
-            "unregister_service",
-        }
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = OefSearchMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -102,54 +121,66 @@ class OefSearchMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(OefSearchMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def agents(self) -> Tuple[str, ...]:
         """Get the 'agents' content from the message."""
-        assert self.is_set("agents"), "'agents' content is not set."
-        return cast(Tuple[str, ...], self.get("agents"))
+        try:
+            return self._agents
+        except AttributeError:
+            raise AssertionError("'agents' content is not set.")
 
     @property
     def oef_error_operation(self) -> CustomOefErrorOperation:
         """Get the 'oef_error_operation' content from the message."""
-        assert self.is_set(
-            "oef_error_operation"
-        ), "'oef_error_operation' content is not set."
-        return cast(CustomOefErrorOperation, self.get("oef_error_operation"))
+        try:
+            return self._oef_error_operation
+        except AttributeError:
+            raise AssertionError("'oef_error_operation' content is not set.")
 
     @property
     def query(self) -> CustomQuery:
         """Get the 'query' content from the message."""
-        assert self.is_set("query"), "'query' content is not set."
-        return cast(CustomQuery, self.get("query"))
+        try:
+            return self._query
+        except AttributeError:
+            raise AssertionError("'query' content is not set.")
 
     @property
     def service_description(self) -> CustomDescription:
         """Get the 'service_description' content from the message."""
-        assert self.is_set(
-            "service_description"
-        ), "'service_description' content is not set."
-        return cast(CustomDescription, self.get("service_description"))
+        try:
+            return self._service_description
+        except AttributeError:
+            raise AssertionError("'service_description' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the oef_search protocol."""
@@ -189,7 +220,7 @@ class OefSearchMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == OefSearchMessage.Performative.REGISTER_SERVICE:
                 expected_nb_of_contents = 1
@@ -19,7 +19,7 @@
 
 """Serialization module for oef_search protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -31,6 +31,108 @@ from packages.fetchai.protocols.oef_search.custom_types import Query
 from packages.fetchai.protocols.oef_search.message import OefSearchMessage
 
 
+def _encode_register_service(msg: OefSearchMessage, oef_search_msg: Any) -> None:
+    """Encode the contents of the 'register_service' performative."""
+    performative = oef_search_msg.register_service
+    performative.SetInParent()
+    service_description = msg.service_description
+    Description.encode(performative.service_description, service_description)
+
+
+def _encode_unregister_service(msg: OefSearchMessage, oef_search_msg: Any) -> None:
+    """Encode the contents of the 'unregister_service' performative."""
+    performative = oef_search_msg.unregister_service
+    performative.SetInParent()
+    service_description = msg.service_description
+    Description.encode(performative.service_description, service_description)
+
+
+def _encode_search_services(msg: OefSearchMessage, oef_search_msg: Any) -> None:
+    """Encode the contents of the 'search_services' performative."""
+    performative = oef_search_msg.search_services
+    performative.SetInParent()
+    query = msg.query
+    Query.encode(performative.query, query)
+
+
+def _encode_search_result(msg: OefSearchMessage, oef_search_msg: Any) -> None:
+    """Encode the contents of the 'search_result' performative."""
+    performative = oef_search_msg.search_result
+    performative.SetInParent()
+    agents = msg.agents
+    performative.agents.extend(agents)
+
+
+def _encode_oef_error(msg: OefSearchMessage, oef_search_msg: Any) -> None:
+    """Encode the contents of the 'oef_error' performative."""
+    performative = oef_search_msg.oef_error
+    performative.SetInParent()
+    oef_error_operation = msg.oef_error_operation
+    OefErrorOperation.encode(performative.oef_error_operation, oef_error_operation)
+
+
+def _decode_register_service(oef_search_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'register_service' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_service_description = oef_search_pb.register_service.service_description
+    service_description = Description.decode(pb2_service_description)
+    performative_content["service_description"] = service_description
+    return performative_content
+
+
+def _decode_unregister_service(oef_search_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'unregister_service' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_service_description = oef_search_pb.unregister_service.service_description
+    service_description = Description.decode(pb2_service_description)
+    performative_content["service_description"] = service_description
+    return performative_content
+
+
+def _decode_search_services(oef_search_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'search_services' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_query = oef_search_pb.search_services.query
+    query = Query.decode(pb2_query)
+    performative_content["query"] = query
+    return performative_content
+
+
+def _decode_search_result(oef_search_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'search_result' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    agents = oef_search_pb.search_result.agents
+    agents_tuple = tuple(agents)
+    performative_content["agents"] = agents_tuple
+    return performative_content
+
+
+def _decode_oef_error(oef_search_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'oef_error' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_oef_error_operation = oef_search_pb.oef_error.oef_error_operation
+    oef_error_operation = OefErrorOperation.decode(pb2_oef_error_operation)
+    performative_content["oef_error_operation"] = oef_error_operation
+    return performative_content
+
+
+_ENCODERS = {
+    "register_service": _encode_register_service,
+    "unregister_service": _encode_unregister_service,
+    "search_services": _encode_search_services,
+    "search_result": _encode_search_result,
+    "oef_error": _encode_oef_error,
+}  # type: Dict[str, Callable[[OefSearchMessage, Any], None]]
+
+_DECODERS = {
+    "register_service": _decode_register_service,
+    "unregister_service": _decode_unregister_service,
+    "search_services": _decode_search_services,
+    "search_result": _decode_search_result,
+    "oef_error": _decode_oef_error,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class OefSearchSerializer(Serializer):
     """Serialization for the 'oef_search' protocol."""
 
@@ -51,35 +153,11 @@ class OefSearchSerializer(Serializer):
         oef_search_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == OefSearchMessage.Performative.REGISTER_SERVICE:
-            performative = oef_search_pb2.OefSearchMessage.Register_Service_Performative()  # type: ignore
-            service_description = msg.service_description
-            Description.encode(performative.service_description, service_description)
-            oef_search_msg.register_service.CopyFrom(performative)
-        elif performative_id == OefSearchMessage.Performative.UNREGISTER_SERVICE:
-            performative = oef_search_pb2.OefSearchMessage.Unregister_Service_Performative()  # type: ignore
-            service_description = msg.service_description
-            Description.encode(performative.service_description, service_description)
-            oef_search_msg.unregister_service.CopyFrom(performative)
-        elif performative_id == OefSearchMessage.Performative.SEARCH_SERVICES:
-            performative = oef_search_pb2.OefSearchMessage.Search_Services_Performative()  # type: ignore
-            query = msg.query
-            Query.encode(performative.query, query)
-            oef_search_msg.search_services.CopyFrom(performative)
-        elif performative_id == OefSearchMessage.Performative.SEARCH_RESULT:
-            performative = oef_search_pb2.OefSearchMessage.Search_Result_Performative()  # type: ignore
-            agents = msg.agents
-            performative.agents.extend(agents)
-            oef_search_msg.search_result.CopyFrom(performative)
-        elif performative_id == OefSearchMessage.Performative.OEF_ERROR:
-            performative = oef_search_pb2.OefSearchMessage.Oef_Error_Performative()  # type: ignore
-            oef_error_operation = msg.oef_error_operation
-            OefErrorOperation.encode(
-                performative.oef_error_operation, oef_error_operation
-            )
-            oef_search_msg.oef_error.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, oef_search_msg)
 
         oef_search_bytes = oef_search_msg.SerializeToString()
         return oef_search_bytes
@@ -102,32 +180,11 @@ class OefSearchSerializer(Serializer):
         target = oef_search_pb.target
 
         performative = oef_search_pb.WhichOneof("performative")
-        performative_id = OefSearchMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == OefSearchMessage.Performative.REGISTER_SERVICE:
-            pb2_service_description = oef_search_pb.register_service.service_description
-            service_description = Description.decode(pb2_service_description)
-            performative_content["service_description"] = service_description
-        elif performative_id == OefSearchMessage.Performative.UNREGISTER_SERVICE:
-            pb2_service_description = (
-                oef_search_pb.unregister_service.service_description
-            )
-            service_description = Description.decode(pb2_service_description)
-            performative_content["service_description"] = service_description
-        elif performative_id == OefSearchMessage.Performative.SEARCH_SERVICES:
-            pb2_query = oef_search_pb.search_services.query
-            query = Query.decode(pb2_query)
-            performative_content["query"] = query
-        elif performative_id == OefSearchMessage.Performative.SEARCH_RESULT:
-            agents = oef_search_pb.search_result.agents
-            agents_tuple = tuple(agents)
-            performative_content["agents"] = agents_tuple
-        elif performative_id == OefSearchMessage.Performative.OEF_ERROR:
-            pb2_oef_error_operation = oef_search_pb.oef_error.oef_error_operation
-            oef_error_operation = OefErrorOperation.decode(pb2_oef_error_operation)
-            performative_content["oef_error_operation"] = oef_error_operation
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(oef_search_pb)
 
         return OefSearchMessage(
             message_id=message_id,
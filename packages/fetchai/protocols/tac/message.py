@@ -24,7 +24,7 @@ from enum import Enum
 from typing import Dict, Optional, Set, Tuple, cast
 
 from aea.configurations.base import ProtocolId
-from aea.protocols.base import Message
+from aea.protocols.base import SlottedMessage
 
 from packages.fetchai.protocols.tac.custom_types import ErrorCode as CustomErrorCode
 
@@ -33,7 +33,7 @@ logger = logging.getLogger("aea.packages.fetchai.protocols.tac.message")
 DEFAULT_BODY_SIZE = 4
 
 
-class TacMessage(Message):
+class TacMessage(SlottedMessage):
     """The tac protocol implements the messages an AEA needs to participate in the TAC."""
 
     protocol_id = ProtocolId("fetchai", "tac", "0.3.0")
@@ -55,6 +55,68 @@ class TacMessage(Message):
             """Get the string representation."""
             return str(self.value)
 
+    __slots__ = (
+        "_dialogue_reference",
+        "_message_id",
+        "_target",
+        "_performative",
+        "_agent_addr_to_name",
+        "_agent_name",
+        "_amount_by_currency_id",
+        "_currency_id_to_name",
+        "_error_code",
+        "_exchange_params_by_currency_id",
+        "_good_id_to_name",
+        "_info",
+        "_quantities_by_good_id",
+        "_tx_counterparty_addr",
+        "_tx_counterparty_fee",
+        "_tx_counterparty_signature",
+        "_tx_fee",
+        "_tx_id",
+        "_tx_nonce",
+        "_tx_sender_addr",
+        "_tx_sender_fee",
+        "_tx_sender_signature",
+        "_utility_params_by_good_id",
+        "_version_id",
+    )
+
+    _dialogue_reference: Tuple[str, str]
+    _message_id: int
+    _target: int
+    _performative: Performative
+    _agent_addr_to_name: Dict[str, str]
+    _agent_name: str
+    _amount_by_currency_id: Dict[str, int]
+    _currency_id_to_name: Dict[str, str]
+    _error_code: CustomErrorCode
+    _exchange_params_by_currency_id: Dict[str, float]
+    _good_id_to_name: Dict[str, str]
+    _info: Dict[str, str]
+    _quantities_by_good_id: Dict[str, int]
+    _tx_counterparty_addr: str
+    _tx_counterparty_fee: int
+    _tx_counterparty_signature: str
+    _tx_fee: int
+    _tx_id: str
+    _tx_nonce: int
+    _tx_sender_addr: str
+    _tx_sender_fee: int
+    _tx_sender_signature: str
+    _utility_params_by_good_id: Dict[str, float]
+    _version_id: str
+
+    _performatives = {
+        "cancelled",
+        "game_data",
+        "register",
+        "tac_error",
+        "transaction",
+        "transaction_confirmation",
+        "unregister",
+    }
+
     def __init__(
         self,
         performative: Performative,
@@ -71,22 +133,11 @@ class TacMessage(Message):
         :param target: the message target.
         :param performative: the message performative.
         """
-        super().__init__(
-            dialogue_reference=dialogue_reference,
-            message_id=message_id,
-            target=target,
-            performative=TacMessage.Performative(performative),
-            **kwargs,
-        )
-        self._performatives = {
-            "cancelled",
-            "game_data",
-            "register",
-            "tac_error",
-            "transaction",
-            "transaction_confirmation",
-            "unregister",
-        }
+        self._dialogue_reference = dialogue_reference
+        self._message_id = message_id
+        self._target = target
+        self._performative = TacMessage.Performative(performative)
+        super().__init__(**kwargs)
 
     @property
     def valid_performatives(self) -> Set[str]:
@@ -96,165 +147,191 @@ class TacMessage(Message):
     @property
     def dialogue_reference(self) -> Tuple[str, str]:
         """Get the dialogue_reference of the message."""
-        assert self.is_set("dialogue_reference"), "dialogue_reference is not set."
-        return cast(Tuple[str, str], self.get("dialogue_reference"))
+        try:
+            return self._dialogue_reference
+        except AttributeError:
+            raise AssertionError("dialogue_reference is not set.")
 
     @property
     def message_id(self) -> int:
         """Get the message_id of the message."""
-        assert self.is_set("message_id"), "message_id is not set."
-        return cast(int, self.get("message_id"))
+        try:
+            return self._message_id
+        except AttributeError:
+            raise AssertionError("message_id is not set.")
 
     @property
     def performative(self) -> Performative:  # type: ignore # noqa: F821
         """Get the performative of the message."""
-        assert self.is_set("performative"), "performative is not set."
-        return cast(TacMessage.Performative, self.get("performative"))
+        try:
+            return self._performative
+        except AttributeError:
+            raise AssertionError("performative is not set.")
 
     @property
     def target(self) -> int:
         """Get the target of the message."""
-        assert self.is_set("target"), "target is not set."
-        return cast(int, self.get("target"))
+        try:
+            return self._target
+        except AttributeError:
+            raise AssertionError("target is not set.")
 
     @property
     def agent_addr_to_name(self) -> Dict[str, str]:
         """Get the 'agent_addr_to_name' content from the message."""
-        assert self.is_set(
-            "agent_addr_to_name"
-        ), "'agent_addr_to_name' content is not set."
-        return cast(Dict[str, str], self.get("agent_addr_to_name"))
+        try:
+            return self._agent_addr_to_name
+        except AttributeError:
+            raise AssertionError("'agent_addr_to_name' content is not set.")
 
     @property
     def agent_name(self) -> str:
         """Get the 'agent_name' content from the message."""
-        assert self.is_set("agent_name"), "'agent_name' content is not set."
-        return cast(str, self.get("agent_name"))
+        try:
+            return self._agent_name
+        except AttributeError:
+            raise AssertionError("'agent_name' content is not set.")
 
     @property
     def amount_by_currency_id(self) -> Dict[str, int]:
         """Get the 'amount_by_currency_id' content from the message."""
-        assert self.is_set(
-            "amount_by_currency_id"
-        ), "'amount_by_currency_id' content is not set."
-        return cast(Dict[str, int], self.get("amount_by_currency_id"))
+        try:
+            return self._amount_by_currency_id
+        except AttributeError:
+            raise AssertionError("'amount_by_currency_id' content is not set.")
 
     @property
     def currency_id_to_name(self) -> Dict[str, str]:
         """Get the 'currency_id_to_name' content from the message."""
-        assert self.is_set(
-            "currency_id_to_name"
-        ), "'currency_id_to_name' content is not set."
-        return cast(Dict[str, str], self.get("currency_id_to_name"))
+        try:
+            return self._currency_id_to_name
+        except AttributeError:
+            raise AssertionError("'currency_id_to_name' content is not set.")
 
     @property
     def error_code(self) -> CustomErrorCode:
         """Get the 'error_code' content from the message."""
-        assert self.is_set("error_code"), "'error_code' content is not set."
-        return cast(CustomErrorCode, self.get("error_code"))
+        try:
+            return self._error_code
+        except AttributeError:
+            raise AssertionError("'error_code' content is not set.")
 
     @property
     def exchange_params_by_currency_id(self) -> Dict[str, float]:
         """Get the 'exchange_params_by_currency_id' content from the message."""
-        assert self.is_set(
-            "exchange_params_by_currency_id"
-        ), "'exchange_params_by_currency_id' content is not set."
-        return cast(Dict[str, float], self.get("exchange_params_by_currency_id"))
+        try:
+            return self._exchange_params_by_currency_id
+        except AttributeError:
+            raise AssertionError("'exchange_params_by_currency_id' content is not set.")
 
     @property
     def good_id_to_name(self) -> Dict[str, str]:
         """Get the 'good_id_to_name' content from the message."""
-        assert self.is_set("good_id_to_name"), "'good_id_to_name' content is not set."
-        return cast(Dict[str, str], self.get("good_id_to_name"))
+        try:
+            return self._good_id_to_name
+        except AttributeError:
+            raise AssertionError("'good_id_to_name' content is not set.")
 
     @property
     def info(self) -> Optional[Dict[str, str]]:
         """Get the 'info' content from the message."""
-        return cast(Optional[Dict[str, str]], self.get("info"))
+        return getattr(self, "_info", None)
 
     @property
     def quantities_by_good_id(self) -> Dict[str, int]:
         """Get the 'quantities_by_good_id' content from the message."""
-        assert self.is_set(
-            "quantities_by_good_id"
-        ), "'quantities_by_good_id' content is not set."
-        return cast(Dict[str, int], self.get("quantities_by_good_id"))
+        try:
+            return self._quantities_by_good_id
+        except AttributeError:
+            raise AssertionError("'quantities_by_good_id' content is not set.")
 
     @property
     def tx_counterparty_addr(self) -> str:
         """Get the 'tx_counterparty_addr' content from the message."""
-        assert self.is_set(
-            "tx_counterparty_addr"
-        ), "'tx_counterparty_addr' content is not set."
-        return cast(str, self.get("tx_counterparty_addr"))
+        try:
+            return self._tx_counterparty_addr
+        except AttributeError:
+            raise AssertionError("'tx_counterparty_addr' content is not set.")
 
     @property
     def tx_counterparty_fee(self) -> int:
         """Get the 'tx_counterparty_fee' content from the message."""
-        assert self.is_set(
-            "tx_counterparty_fee"
-        ), "'tx_counterparty_fee' content is not set."
-        return cast(int, self.get("tx_counterparty_fee"))
+        try:
+            return self._tx_counterparty_fee
+        except AttributeError:
+            raise AssertionError("'tx_counterparty_fee' content is not set.")
 
     @property
     def tx_counterparty_signature(self) -> str:
         """Get the 'tx_counterparty_signature' content from the message."""
-        assert self.is_set(
-            "tx_counterparty_signature"
-        ), "'tx_counterparty_signature' content is not set."
-        return cast(str, self.get("tx_counterparty_signature"))
+        try:
+            return self._tx_counterparty_signature
+        except AttributeError:
+            raise AssertionError("'tx_counterparty_signature' content is not set.")
 
     @property
     def tx_fee(self) -> int:
         """Get the 'tx_fee' content from the message."""
-        assert self.is_set("tx_fee"), "'tx_fee' content is not set."
-        return cast(int, self.get("tx_fee"))
+        try:
+            return self._tx_fee
+        except AttributeError:
+            raise AssertionError("'tx_fee' content is not set.")
 
     @property
     def tx_id(self) -> str:
         """Get the 'tx_id' content from the message."""
-        assert self.is_set("tx_id"), "'tx_id' content is not set."
-        return cast(str, self.get("tx_id"))
+        try:
+            return self._tx_id
+        except AttributeError:
+            raise AssertionError("'tx_id' content is not set.")
 
     @property
     def tx_nonce(self) -> int:
         """Get the 'tx_nonce' content from the message."""
-        assert self.is_set("tx_nonce"), "'tx_nonce' content is not set."
-        return cast(int, self.get("tx_nonce"))
+        try:
+            return self._tx_nonce
+        except AttributeError:
+            raise AssertionError("'tx_nonce' content is not set.")
 
     @property
     def tx_sender_addr(self) -> str:
         """Get the 'tx_sender_addr' content from the message."""
-        assert self.is_set("tx_sender_addr"), "'tx_sender_addr' content is not set."
-        return cast(str, self.get("tx_sender_addr"))
+        try:
+            return self._tx_sender_addr
+        except AttributeError:
+            raise AssertionError("'tx_sender_addr' content is not set.")
 
     @property
     def tx_sender_fee(self) -> int:
         """Get the 'tx_sender_fee' content from the message."""
-        assert self.is_set("tx_sender_fee"), "'tx_sender_fee' content is not set."
-        return cast(int, self.get("tx_sender_fee"))
+        try:
+            return self._tx_sender_fee
+        except AttributeError:
+            raise AssertionError("'tx_sender_fee' content is not set.")
 
     @property
     def tx_sender_signature(self) -> str:
         """Get the 'tx_sender_signature' content from the message."""
-        assert self.is_set(
-            "tx_sender_signature"
-        ), "'tx_sender_signature' content is not set."
-        return cast(str, self.get("tx_sender_signature"))
+        try:
+            return self._tx_sender_signature
+        except AttributeError:
+            raise AssertionError("'tx_sender_signature' content is not set.")
 
     @property
     def utility_params_by_good_id(self) -> Dict[str, float]:
         """Get the 'utility_params_by_good_id' content from the message."""
-        assert self.is_set(
-            "utility_params_by_good_id"
-        ), "'utility_params_by_good_id' content is not set."
-        return cast(Dict[str, float], self.get("utility_params_by_good_id"))
+        try:
+            return self._utility_params_by_good_id
+        except AttributeError:
+            raise AssertionError("'utility_params_by_good_id' content is not set.")
 
     @property
     def version_id(self) -> str:
         """Get the 'version_id' content from the message."""
-        assert self.is_set("version_id"), "'version_id' content is not set."
-        return cast(str, self.get("version_id"))
+        try:
+            return self._version_id
+        except AttributeError:
+            raise AssertionError("'version_id' content is not set.")
 
     def _is_consistent(self) -> bool:
         """Check that the message follows the tac protocol."""
@@ -294,7 +371,7 @@ class TacMessage(Message):
             )
 
             # Check correct contents
-            actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE
+            actual_nb_of_contents = self._body_size() - DEFAULT_BODY_SIZE
             expected_nb_of_contents = 0
             if self.performative == TacMessage.Performative.REGISTER:
                 expected_nb_of_contents = 1
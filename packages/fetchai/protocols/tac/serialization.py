@@ -19,7 +19,7 @@
 
 """Serialization module for tac protocol."""
 
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, cast
 
 from aea.protocols.base import Message
 from aea.protocols.base import Serializer
@@ -29,6 +29,237 @@ from packages.fetchai.protocols.tac.custom_types import ErrorCode
 from packages.fetchai.protocols.tac.message import TacMessage
 
 
+def _encode_register(msg: TacMessage, tac_msg: Any) -> None:
+    """Encode the contents of the 'register' performative."""
+    performative = tac_msg.register
+    performative.SetInParent()
+    agent_name = msg.agent_name
+    performative.agent_name = agent_name
+
+
+def _encode_unregister(msg: TacMessage, tac_msg: Any) -> None:
+    """Encode the contents of the 'unregister' performative."""
+    performative = tac_msg.unregister
+    performative.SetInParent()
+
+
+def _encode_transaction(msg: TacMessage, tac_msg: Any) -> None:
+    """Encode the contents of the 'transaction' performative."""
+    performative = tac_msg.transaction
+    performative.SetInParent()
+    tx_id = msg.tx_id
+    performative.tx_id = tx_id
+    tx_sender_addr = msg.tx_sender_addr
+    performative.tx_sender_addr = tx_sender_addr
+    tx_counterparty_addr = msg.tx_counterparty_addr
+    performative.tx_counterparty_addr = tx_counterparty_addr
+    amount_by_currency_id = msg.amount_by_currency_id
+    performative.amount_by_currency_id.update(amount_by_currency_id)
+    tx_sender_fee = msg.tx_sender_fee
+    performative.tx_sender_fee = tx_sender_fee
+    tx_counterparty_fee = msg.tx_counterparty_fee
+    performative.tx_counterparty_fee = tx_counterparty_fee
+    quantities_by_good_id = msg.quantities_by_good_id
+    performative.quantities_by_good_id.update(quantities_by_good_id)
+    tx_nonce = msg.tx_nonce
+    performative.tx_nonce = tx_nonce
+    tx_sender_signature = msg.tx_sender_signature
+    performative.tx_sender_signature = tx_sender_signature
+    tx_counterparty_signature = msg.tx_counterparty_signature
+    performative.tx_counterparty_signature = tx_counterparty_signature
+
+
+def _encode_cancelled(msg: TacMessage, tac_msg: Any) -> None:
+    """Encode the contents of the 'cancelled' performative."""
+    performative = tac_msg.cancelled
+    performative.SetInParent()
+
+
+def _encode_game_data(msg: TacMessage, tac_msg: Any) -> None:
+    """Encode the contents of the 'game_data' performative."""
+    performative = tac_msg.game_data
+    performative.SetInParent()
+    amount_by_currency_id = msg.amount_by_currency_id
+    performative.amount_by_currency_id.update(amount_by_currency_id)
+    exchange_params_by_currency_id = msg.exchange_params_by_currency_id
+    performative.exchange_params_by_currency_id.update(exchange_params_by_currency_id)
+    quantities_by_good_id = msg.quantities_by_good_id
+    performative.quantities_by_good_id.update(quantities_by_good_id)
+    utility_params_by_good_id = msg.utility_params_by_good_id
+    performative.utility_params_by_good_id.update(utility_params_by_good_id)
+    tx_fee = msg.tx_fee
+    performative.tx_fee = tx_fee
+    agent_addr_to_name = msg.agent_addr_to_name
+    performative.agent_addr_to_name.update(agent_addr_to_name)
+    currency_id_to_name = msg.currency_id_to_name
+    performative.currency_id_to_name.update(currency_id_to_name)
+    good_id_to_name = msg.good_id_to_name
+    performative.good_id_to_name.update(good_id_to_name)
+    version_id = msg.version_id
+    performative.version_id = version_id
+    if msg.is_set("info"):
+        performative.info_is_set = True
+        info = msg.info
+        performative.info.update(info)
+
+
+def _encode_transaction_confirmation(msg: TacMessage, tac_msg: Any) -> None:
+    """Encode the contents of the 'transaction_confirmation' performative."""
+    performative = tac_msg.transaction_confirmation
+    performative.SetInParent()
+    tx_id = msg.tx_id
+    performative.tx_id = tx_id
+    amount_by_currency_id = msg.amount_by_currency_id
+    performative.amount_by_currency_id.update(amount_by_currency_id)
+    quantities_by_good_id = msg.quantities_by_good_id
+    performative.quantities_by_good_id.update(quantities_by_good_id)
+
+
+def _encode_tac_error(msg: TacMessage, tac_msg: Any) -> None:
+    """Encode the contents of the 'tac_error' performative."""
+    performative = tac_msg.tac_error
+    performative.SetInParent()
+    error_code = msg.error_code
+    ErrorCode.encode(performative.error_code, error_code)
+    if msg.is_set("info"):
+        performative.info_is_set = True
+        info = msg.info
+        performative.info.update(info)
+
+
+def _decode_register(tac_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'register' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    agent_name = tac_pb.register.agent_name
+    performative_content["agent_name"] = agent_name
+    return performative_content
+
+
+def _decode_unregister(tac_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'unregister' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    return performative_content
+
+
+def _decode_transaction(tac_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'transaction' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    tx_id = tac_pb.transaction.tx_id
+    performative_content["tx_id"] = tx_id
+    tx_sender_addr = tac_pb.transaction.tx_sender_addr
+    performative_content["tx_sender_addr"] = tx_sender_addr
+    tx_counterparty_addr = tac_pb.transaction.tx_counterparty_addr
+    performative_content["tx_counterparty_addr"] = tx_counterparty_addr
+    amount_by_currency_id = tac_pb.transaction.amount_by_currency_id
+    amount_by_currency_id_dict = dict(amount_by_currency_id)
+    performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
+    tx_sender_fee = tac_pb.transaction.tx_sender_fee
+    performative_content["tx_sender_fee"] = tx_sender_fee
+    tx_counterparty_fee = tac_pb.transaction.tx_counterparty_fee
+    performative_content["tx_counterparty_fee"] = tx_counterparty_fee
+    quantities_by_good_id = tac_pb.transaction.quantities_by_good_id
+    quantities_by_good_id_dict = dict(quantities_by_good_id)
+    performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
+    tx_nonce = tac_pb.transaction.tx_nonce
+    performative_content["tx_nonce"] = tx_nonce
+    tx_sender_signature = tac_pb.transaction.tx_sender_signature
+    performative_content["tx_sender_signature"] = tx_sender_signature
+    tx_counterparty_signature = tac_pb.transaction.tx_counterparty_signature
+    performative_content["tx_counterparty_signature"] = tx_counterparty_signature
+    return performative_content
+
+
+def _decode_cancelled(tac_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'cancelled' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    return performative_content
+
+
+def _decode_game_data(tac_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'game_data' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    amount_by_currency_id = tac_pb.game_data.amount_by_currency_id
+    amount_by_currency_id_dict = dict(amount_by_currency_id)
+    performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
+    exchange_params_by_currency_id = tac_pb.game_data.exchange_params_by_currency_id
+    exchange_params_by_currency_id_dict = dict(exchange_params_by_currency_id)
+    performative_content[
+        "exchange_params_by_currency_id"
+    ] = exchange_params_by_currency_id_dict
+    quantities_by_good_id = tac_pb.game_data.quantities_by_good_id
+    quantities_by_good_id_dict = dict(quantities_by_good_id)
+    performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
+    utility_params_by_good_id = tac_pb.game_data.utility_params_by_good_id
+    utility_params_by_good_id_dict = dict(utility_params_by_good_id)
+    performative_content["utility_params_by_good_id"] = utility_params_by_good_id_dict
+    tx_fee = tac_pb.game_data.tx_fee
+    performative_content["tx_fee"] = tx_fee
+    agent_addr_to_name = tac_pb.game_data.agent_addr_to_name
+    agent_addr_to_name_dict = dict(agent_addr_to_name)
+    performative_content["agent_addr_to_name"] = agent_addr_to_name_dict
+    currency_id_to_name = tac_pb.game_data.currency_id_to_name
+    currency_id_to_name_dict = dict(currency_id_to_name)
+    performative_content["currency_id_to_name"] = currency_id_to_name_dict
+    good_id_to_name = tac_pb.game_data.good_id_to_name
+    good_id_to_name_dict = dict(good_id_to_name)
+    performative_content["good_id_to_name"] = good_id_to_name_dict
+    version_id = tac_pb.game_data.version_id
+    performative_content["version_id"] = version_id
+    if tac_pb.game_data.info_is_set:
+        info = tac_pb.game_data.info
+        info_dict = dict(info)
+        performative_content["info"] = info_dict
+    return performative_content
+
+
+def _decode_transaction_confirmation(tac_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'transaction_confirmation' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    tx_id = tac_pb.transaction_confirmation.tx_id
+    performative_content["tx_id"] = tx_id
+    amount_by_currency_id = tac_pb.transaction_confirmation.amount_by_currency_id
+    amount_by_currency_id_dict = dict(amount_by_currency_id)
+    performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
+    quantities_by_good_id = tac_pb.transaction_confirmation.quantities_by_good_id
+    quantities_by_good_id_dict = dict(quantities_by_good_id)
+    performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
+    return performative_content
+
+
+def _decode_tac_error(tac_pb: Any) -> Dict[str, Any]:
+    """Decode the contents of the 'tac_error' performative."""
+    performative_content = dict()  # type: Dict[str, Any]
+    pb2_error_code = tac_pb.tac_error.error_code
+    error_code = ErrorCode.decode(pb2_error_code)
+    performative_content["error_code"] = error_code
+    if tac_pb.tac_error.info_is_set:
+        info = tac_pb.tac_error.info
+        info_dict = dict(info)
+        performative_content["info"] = info_dict
+    return performative_content
+
+
+_ENCODERS = {
+    "register": _encode_register,
+    "unregister": _encode_unregister,
+    "transaction": _encode_transaction,
+    "cancelled": _encode_cancelled,
+    "game_data": _encode_game_data,
+    "transaction_confirmation": _encode_transaction_confirmation,
+    "tac_error": _encode_tac_error,
+}  # type: Dict[str, Callable[[TacMessage, Any], None]]
+
+_DECODERS = {
+    "register": _decode_register,
+    "unregister": _decode_unregister,
+    "transaction": _decode_transaction,
+    "cancelled": _decode_cancelled,
+    "game_data": _decode_game_data,
+    "transaction_confirmation": _decode_transaction_confirmation,
+    "tac_error": _decode_tac_error,
+}  # type: Dict[str, Callable[[Any], Dict[str, Any]]]
+
+
 class TacSerializer(Serializer):
     """Serialization for the 'tac' protocol."""
 
@@ -49,87 +280,11 @@ class TacSerializer(Serializer):
         tac_msg.target = msg.target
 
         performative_id = msg.performative
-        if performative_id == TacMessage.Performative.REGISTER:
-            performative = tac_pb2.TacMessage.Register_Performative()  # type: ignore
-            agent_name = msg.agent_name
-            performative.agent_name = agent_name
-            tac_msg.register.CopyFrom(performative)
-        elif performative_id == TacMessage.Performative.UNREGISTER:
-            performative = tac_pb2.TacMessage.Unregister_Performative()  # type: ignore
-            tac_msg.unregister.CopyFrom(performative)
-        elif performative_id == TacMessage.Performative.TRANSACTION:
-            performative = tac_pb2.TacMessage.Transaction_Performative()  # type: ignore
-            tx_id = msg.tx_id
-            performative.tx_id = tx_id
-            tx_sender_addr = msg.tx_sender_addr
-            performative.tx_sender_addr = tx_sender_addr
-            tx_counterparty_addr = msg.tx_counterparty_addr
-            performative.tx_counterparty_addr = tx_counterparty_addr
-            amount_by_currency_id = msg.amount_by_currency_id
-            performative.amount_by_currency_id.update(amount_by_currency_id)
-            tx_sender_fee = msg.tx_sender_fee
-            performative.tx_sender_fee = tx_sender_fee
-            tx_counterparty_fee = msg.tx_counterparty_fee
-            performative.tx_counterparty_fee = tx_counterparty_fee
-            quantities_by_good_id = msg.quantities_by_good_id
-            performative.quantities_by_good_id.update(quantities_by_good_id)
-            tx_nonce = msg.tx_nonce
-            performative.tx_nonce = tx_nonce
-            tx_sender_signature = msg.tx_sender_signature
-            performative.tx_sender_signature = tx_sender_signature
-            tx_counterparty_signature = msg.tx_counterparty_signature
-            performative.tx_counterparty_signature = tx_counterparty_signature
-            tac_msg.transaction.CopyFrom(performative)
-        elif performative_id == TacMessage.Performative.CANCELLED:
-            performative = tac_pb2.TacMessage.Cancelled_Performative()  # type: ignore
-            tac_msg.cancelled.CopyFrom(performative)
-        elif performative_id == TacMessage.Performative.GAME_DATA:
-            performative = tac_pb2.TacMessage.Game_Data_Performative()  # type: ignore
-            amount_by_currency_id = msg.amount_by_currency_id
-            performative.amount_by_currency_id.update(amount_by_currency_id)
-            exchange_params_by_currency_id = msg.exchange_params_by_currency_id
-            performative.exchange_params_by_currency_id.update(
-                exchange_params_by_currency_id
-            )
-            quantities_by_good_id = msg.quantities_by_good_id
-            performative.quantities_by_good_id.update(quantities_by_good_id)
-            utility_params_by_good_id = msg.utility_params_by_good_id
-            performative.utility_params_by_good_id.update(utility_params_by_good_id)
-            tx_fee = msg.tx_fee
-            performative.tx_fee = tx_fee
-            agent_addr_to_name = msg.agent_addr_to_name
-            performative.agent_addr_to_name.update(agent_addr_to_name)
-            currency_id_to_name = msg.currency_id_to_name
-            performative.currency_id_to_name.update(currency_id_to_name)
-            good_id_to_name = msg.good_id_to_name
-            performative.good_id_to_name.update(good_id_to_name)
-            version_id = msg.version_id
-            performative.version_id = version_id
-            if msg.is_set("info"):
-                performative.info_is_set = True
-                info = msg.info
-                performative.info.update(info)
-            tac_msg.game_data.CopyFrom(performative)
-        elif performative_id == TacMessage.Performative.TRANSACTION_CONFIRMATION:
-            performative = tac_pb2.TacMessage.Transaction_Confirmation_Performative()  # type: ignore
-            tx_id = msg.tx_id
-            performative.tx_id = tx_id
-            amount_by_currency_id = msg.amount_by_currency_id
-            performative.amount_by_currency_id.update(amount_by_currency_id)
-            quantities_by_good_id = msg.quantities_by_good_id
-            performative.quantities_by_good_id.update(quantities_by_good_id)
-            tac_msg.transaction_confirmation.CopyFrom(performative)
-        elif performative_id == TacMessage.Performative.TAC_ERROR:
-            performative = tac_pb2.TacMessage.Tac_Error_Performative()  # type: ignore
-            error_code = msg.error_code
-            ErrorCode.encode(performative.error_code, error_code)
-            if msg.is_set("info"):
-                performative.info_is_set = True
-                info = msg.info
-                performative.info.update(info)
-            tac_msg.tac_error.CopyFrom(performative)
-        else:
+        try:
+            encoder = _ENCODERS[performative_id.value]
+        except (AttributeError, KeyError):
             raise ValueError("Performative not valid: {}".format(performative_id))
+        encoder(msg, tac_msg)
 
         tac_bytes = tac_msg.SerializeToString()
         return tac_bytes
@@ -152,99 +307,11 @@ class TacSerializer(Serializer):
         target = tac_pb.target
 
         performative = tac_pb.WhichOneof("performative")
-        performative_id = TacMessage.Performative(str(performative))
-        performative_content = dict()  # type: Dict[str, Any]
-        if performative_id == TacMessage.Performative.REGISTER:
-            agent_name = tac_pb.register.agent_name
-            performative_content["agent_name"] = agent_name
-        elif performative_id == TacMessage.Performative.UNREGISTER:
-            pass
-        elif performative_id == TacMessage.Performative.TRANSACTION:
-            tx_id = tac_pb.transaction.tx_id
-            performative_content["tx_id"] = tx_id
-            tx_sender_addr = tac_pb.transaction.tx_sender_addr
-            performative_content["tx_sender_addr"] = tx_sender_addr
-            tx_counterparty_addr = tac_pb.transaction.tx_counterparty_addr
-            performative_content["tx_counterparty_addr"] = tx_counterparty_addr
-            amount_by_currency_id = tac_pb.transaction.amount_by_currency_id
-            amount_by_currency_id_dict = dict(amount_by_currency_id)
-            performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
-            tx_sender_fee = tac_pb.transaction.tx_sender_fee
-            performative_content["tx_sender_fee"] = tx_sender_fee
-            tx_counterparty_fee = tac_pb.transaction.tx_counterparty_fee
-            performative_content["tx_counterparty_fee"] = tx_counterparty_fee
-            quantities_by_good_id = tac_pb.transaction.quantities_by_good_id
-            quantities_by_good_id_dict = dict(quantities_by_good_id)
-            performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
-            tx_nonce = tac_pb.transaction.tx_nonce
-            performative_content["tx_nonce"] = tx_nonce
-            tx_sender_signature = tac_pb.transaction.tx_sender_signature
-            performative_content["tx_sender_signature"] = tx_sender_signature
-            tx_counterparty_signature = tac_pb.transaction.tx_counterparty_signature
-            performative_content[
-                "tx_counterparty_signature"
-            ] = tx_counterparty_signature
-        elif performative_id == TacMessage.Performative.CANCELLED:
-            pass
-        elif performative_id == TacMessage.Performative.GAME_DATA:
-            amount_by_currency_id = tac_pb.game_data.amount_by_currency_id
-            amount_by_currency_id_dict = dict(amount_by_currency_id)
-            performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
-            exchange_params_by_currency_id = (
-                tac_pb.game_data.exchange_params_by_currency_id
-            )
-            exchange_params_by_currency_id_dict = dict(exchange_params_by_currency_id)
-            performative_content[
-                "exchange_params_by_currency_id"
-            ] = exchange_params_by_currency_id_dict
-            quantities_by_good_id = tac_pb.game_data.quantities_by_good_id
-            quantities_by_good_id_dict = dict(quantities_by_good_id)
-            performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
-            utility_params_by_good_id = tac_pb.game_data.utility_params_by_good_id
-            utility_params_by_good_id_dict = dict(utility_params_by_good_id)
-            performative_content[
-                "utility_params_by_good_id"
-            ] = utility_params_by_good_id_dict
-            tx_fee = tac_pb.game_data.tx_fee
-            performative_content["tx_fee"] = tx_fee
-            agent_addr_to_name = tac_pb.game_data.agent_addr_to_name
-            agent_addr_to_name_dict = dict(agent_addr_to_name)
-            performative_content["agent_addr_to_name"] = agent_addr_to_name_dict
-            currency_id_to_name = tac_pb.game_data.currency_id_to_name
-            currency_id_to_name_dict = dict(currency_id_to_name)
-            performative_content["currency_id_to_name"] = currency_id_to_name_dict
-            good_id_to_name = tac_pb.game_data.good_id_to_name
-            good_id_to_name_dict = dict(good_id_to_name)
-            performative_content["good_id_to_name"] = good_id_to_name_dict
-            version_id = tac_pb.game_data.version_id
-            performative_content["version_id"] = version_id
-            if tac_pb.game_data.info_is_set:
-                info = tac_pb.game_data.info
-                info_dict = dict(info)
-                performative_content["info"] = info_dict
-        elif performative_id == TacMessage.Performative.TRANSACTION_CONFIRMATION:
-            tx_id = tac_pb.transaction_confirmation.tx_id
-            performative_content["tx_id"] = tx_id
-            amount_by_currency_id = (
-                tac_pb.transaction_confirmation.amount_by_currency_id
-            )
-            amount_by_currency_id_dict = dict(amount_by_currency_id)
-            performative_content["amount_by_currency_id"] = amount_by_currency_id_dict
-            quantities_by_good_id = (
-                tac_pb.transaction_confirmation.quantities_by_good_id
-            )
-            quantities_by_good_id_dict = dict(quantities_by_good_id)
-            performative_content["quantities_by_good_id"] = quantities_by_good_id_dict
-        elif performative_id == TacMessage.Performative.TAC_ERROR:
-            pb2_error_code = tac_pb.tac_error.error_code
-            error_code = ErrorCode.decode(pb2_error_code)
-            performative_content["error_code"] = error_code
-            if tac_pb.tac_error.info_is_set:
-                info = tac_pb.tac_error.info
-                info_dict = dict(info)
-                performative_content["info"] = info_dict
-        else:
-            raise ValueError("Performative not valid: {}.".format(performative_id))
+        try:
+            decoder = _DECODERS[performative]
+        except KeyError:
+            raise ValueError("Performative not valid: {}.".format(performative))
+        performative_content = decoder(tac_pb)
 
         return TacMessage(
             message_id=message_id,
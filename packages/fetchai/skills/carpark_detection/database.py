@@ -21,15 +21,18 @@
 import logging
 import os
 import shutil
-import sqlite3
 import time
 
 import skimage  # type: ignore
 
+from aea.helpers.sqlite import SQLiteDatabase
+
 logger = logging.getLogger(
     "aea.packages.fetchai.skills.carpark_detection.detection_database"
 )
 
+PRUNABLE_TABLES = ("images", "transaction_history")
+
 
 class DetectionDatabase:
     """Communicate between the database and the python objects."""
@@ -50,6 +53,7 @@ class DetectionDatabase:
         )
         self.image_file_ext = ".png"
         self.database_path = self.temp_dir + "/" + "detection_results.db"
+        self.db = SQLiteDatabase(self.database_path)
 
         if create_if_not_present:
             self.initialise_backend()
@@ -68,8 +72,10 @@ class DetectionDatabase:
         logger.info("Database being reset.")
 
         # Remove the actual database file
-        if os.path.isfile(self.database_path):
-            os.remove(self.database_path)
+        self.db.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.isfile(self.database_path + suffix):
+                os.remove(self.database_path + suffix)
 
         # Clear stored images
         shutil.rmtree(self.raw_image_dir)
@@ -100,6 +106,9 @@ class DetectionDatabase:
             "processed_image_path TEXT, total_count INTEGER, "
             "moving_count INTEGER, free_spaces INTEGER, lat TEXT, lon TEXT)"
         )
+        self.execute_single_sql(
+            "CREATE INDEX IF NOT EXISTS images_epoch ON images (epoch)"
+        )
 
         # self.execute_single_sql("DROP TABLE fet_table")
         self.execute_single_sql(
@@ -118,6 +127,9 @@ class DetectionDatabase:
         self.execute_single_sql(
             "CREATE TABLE IF NOT EXISTS transaction_history (tx TEXT PRIMARY KEY, epoch INT, oef_key_payer TEXT, oef_key_payee TEXT, amount BIGINT, status TEXT)"
         )
+        self.execute_single_sql(
+            "CREATE INDEX IF NOT EXISTS transaction_history_epoch ON transaction_history (epoch)"
+        )
 
         # self.execute_single_sql("DROP TABLE dialogue_statuses")
         self.execute_single_sql(
@@ -341,6 +353,23 @@ class DetectionDatabase:
         )
         self.execute_single_sql(command, variables)
 
+    def add_entries_no_save(self, entries, print_exceptions=True):
+        """
+        Add entries into the detection database, in one transaction, but do not save anything to disk.
+
+        Each entry is a tuple (raw_path, processed_path, total_count, moving_count, free_spaces, lat, lon).
+        """
+        command = "INSERT INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        rows = (
+            (self.extract_time_from_raw_path(entry[0]),) + tuple(entry)
+            for entry in entries
+        )
+        try:
+            self.db.execute_many(command, rows)
+        except Exception as e:  # pragma: nocover # pylint: disable=broad-except
+            if print_exceptions:
+                logger.warning("Exception in database: {}".format(e))
+
     def add_entry(
         self,
         raw_image,
@@ -373,20 +402,12 @@ class DetectionDatabase:
 
     def execute_single_sql(self, command, variables=(), print_exceptions=True):
         """Query the database - all the other functions use this under the hood."""
-        conn = None
         ret = []
         try:
-            conn = sqlite3.connect(self.database_path, timeout=300)  # 5 mins
-            c = conn.cursor()
-            c.execute(command, variables)
-            ret = c.fetchall()
-            conn.commit()
+            ret = self.db.execute(command, variables)
         except Exception as e:  # pragma: nocover # pylint: disable=broad-except
             if print_exceptions:
                 logger.warning("Exception in database: {}".format(e))
-        finally:
-            if conn is not None:
-                conn.close()
 
         return ret
 
@@ -398,6 +419,18 @@ class DetectionDatabase:
 
         if results is None:
             return None
+        return self._to_detection_data(results)
+
+    def get_detection_data_between(self, start_epoch, end_epoch):
+        """Return the detection data from start_epoch to end_epoch (included), oldest first."""
+        command = "SELECT * FROM images WHERE epoch BETWEEN ? AND ? ORDER BY epoch ASC"
+        variables = (int(start_epoch), int(end_epoch))
+        results = self.execute_single_sql(command, variables)
+        return self._to_detection_data(results)
+
+    @staticmethod
+    def _to_detection_data(results):
+        """Convert rows of the images table to dictionaries."""
         ret_data = []
         for r in results:
             this_data = {}
@@ -423,20 +456,20 @@ class DetectionDatabase:
 
     def prune_table(self, table_name, max_entries):
         """Remove any data if table longer than max_entries."""
-        command = "SELECT epoch FROM ? ORDER BY epoch DESC LIMIT 1 OFFSET ?"
-        variables = (
-            table_name,
-            max_entries - 1,
+        # table names cannot be statement parameters.
+        assert table_name in PRUNABLE_TABLES, "Cannot prune table {}.".format(
+            table_name
         )
+        command = "SELECT epoch FROM {} ORDER BY epoch DESC LIMIT 1 OFFSET ?".format(
+            table_name
+        )
+        variables = (max_entries - 1,)
         results = self.execute_single_sql(command=command, variables=variables)
 
         if len(results) != 0:
             last_epoch = results[0][0]
-            command = """DELETE FROM ? WHERE epoch<?"""
-            variables = (
-                table_name,
-                last_epoch,
-            )
+            command = "DELETE FROM {} WHERE epoch<?".format(table_name)
+            variables = (last_epoch,)
             self.execute_single_sql(command, variables)
 
     def ensure_dirs_exist(self):
@@ -37,8 +37,9 @@ class GymHandler(Handler):
     def __init__(self, **kwargs):
         """Initialize the handler."""
         nb_steps = kwargs.pop("nb_steps", DEFAULT_NB_STEPS)
+        nb_envs = kwargs.pop("nb_envs", 1)
         super().__init__(**kwargs)
-        self.task = GymTask(self.context, nb_steps)
+        self.task = GymTask(self.context, nb_steps, nb_envs)
 
     def setup(self) -> None:
         """Set up the handler."""
@@ -55,7 +56,10 @@ class GymHandler(Handler):
         :return: None
         """
         gym_msg = cast(GymMessage, message)
-        if gym_msg.performative == GymMessage.Performative.PERCEPT:
+        if gym_msg.performative in (
+            GymMessage.Performative.PERCEPT,
+            GymMessage.Performative.PERCEPT_BATCH,
+        ):
             self.task.proxy_env_queue.put(gym_msg)
         else:
             raise ValueError(
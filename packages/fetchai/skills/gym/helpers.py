@@ -21,7 +21,7 @@
 
 from abc import ABC, abstractmethod
 from queue import Queue
-from typing import Any, Tuple, cast
+from typing import Any, List, Sequence, Tuple, cast
 
 import gym
 
@@ -36,6 +36,7 @@ Reward = float
 Done = bool
 Info = dict
 Feedback = Tuple[Observation, Reward, Done, Info]
+BatchFeedback = Tuple[List[Observation], List[Reward], List[Done], List[Info]]
 
 DEFAULT_GYM = "gym"
 NB_STEPS = 500
@@ -101,6 +102,43 @@ class ProxyEnv(gym.Env):
 
         return observation, reward, done, info
 
+    def step_batch(self, actions: Sequence[Action]) -> BatchFeedback:
+        """
+        Run one time-step of each copy of the environment, in a single round trip.
+
+        The gym connection must own as many copies of the environment as actions.
+        A copy whose episode is done is reset by the connection.
+
+        :param actions: one action for each copy of the environment
+        :return: a Tuple containing the lists of Observation, Reward, Done and Info of the copies
+        """
+        self._step_count += 1
+        step_id = self._step_count
+
+        gym_msg = GymMessage(
+            performative=GymMessage.Performative.ACT_BATCH,
+            actions=GymMessage.AnyObject(list(actions)),
+            step_id=step_id,
+        )
+        gym_msg.counterparty = DEFAULT_GYM
+        self._skill_context.outbox.put_message(message=gym_msg)
+
+        # Wait (blocking!) for the response envelope from the environment
+        gym_msg = self._queue.get(block=True, timeout=None)
+
+        if gym_msg.step_id != step_id:
+            raise ValueError(
+                "Unexpected step id! expected={}, actual={}".format(
+                    step_id, gym_msg.step_id
+                )
+            )
+        return (
+            gym_msg.observations.any,
+            list(gym_msg.rewards),
+            list(gym_msg.dones),
+            gym_msg.infos.any,
+        )
+
     def render(self, mode="human") -> None:
         """
         Render the environment.
@@ -21,7 +21,7 @@
 
 import logging
 import random
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
@@ -108,16 +108,18 @@ class GoodPriceModel:
 class MyRLAgent(RLAgent):
     """This class is a reinforcement learning agent that interacts with the agent framework."""
 
-    def __init__(self, nb_goods: int) -> None:
+    def __init__(self, nb_goods: int, nb_envs: int = 1) -> None:
         """
         Instantiate the RL agent.
 
         :param nb_goods: number of goods
+        :param nb_envs: number of copies of the environment stepped at once
         :return: None
         """
         self.good_price_models = dict(
             (good_id, GoodPriceModel()) for good_id in range(nb_goods)
         )  # type: Dict[int, GoodPriceModel]
+        self.nb_envs = nb_envs
 
     def _pick_an_action(self) -> Any:
         """
@@ -173,14 +175,24 @@ class MyRLAgent(RLAgent):
 
         proxy_env.reset()
         while action_counter < nb_steps:
-            action = self._pick_an_action()
-            obs, reward, done, info = proxy_env.step(action)
-            self._update_model(obs, reward, done, info, action)
-            action_counter += 1
-            if action_counter % 10 == 0:
-                logger.info(
-                    "Action: step_id='{}' action='{}' reward='{}'".format(
-                        action_counter, action, reward
+            if self.nb_envs > 1:
+                # one round trip steps all the copies of the environment.
+                actions = [self._pick_an_action() for _ in range(self.nb_envs)]
+                observations, rewards, dones, infos = proxy_env.step_batch(actions)
+                feedback = list(
+                    zip(observations, rewards, dones, infos, actions)
+                )  # type: List[Tuple[Any, float, bool, Any, Any]]
+            else:
+                action = self._pick_an_action()
+                obs, reward, done, info = proxy_env.step(action)
+                feedback = [(obs, reward, done, info, action)]
+            for obs, reward, done, info, action in feedback:
+                self._update_model(obs, reward, done, info, action)
+                action_counter += 1
+                if action_counter % 10 == 0:
+                    logger.info(
+                        "Action: step_id='{}' action='{}' reward='{}'".format(
+                            action_counter, action, reward
+                        )
                     )
-                )
         proxy_env.close()
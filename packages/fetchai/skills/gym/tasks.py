@@ -35,11 +35,20 @@ logger = logging.getLogger("aea.packages.fetchai.skills.gym.tasks")
 class GymTask(Task):
     """Gym task."""
 
-    def __init__(self, skill_context: SkillContext, nb_steps: int = DEFAULT_NB_STEPS):
+    def __init__(
+        self,
+        skill_context: SkillContext,
+        nb_steps: int = DEFAULT_NB_STEPS,
+        nb_envs: int = 1,
+    ):
         """Initialize the task."""
-        logger.debug("GymTask.__init__: arguments: nb_steps={}".format(nb_steps))
+        logger.debug(
+            "GymTask.__init__: arguments: nb_steps={}, nb_envs={}".format(
+                nb_steps, nb_envs
+            )
+        )
         super().__init__()
-        self._rl_agent = MyRLAgent(NB_GOODS)
+        self._rl_agent = MyRLAgent(NB_GOODS, nb_envs)
         self._proxy_env = ProxyEnv(skill_context)
         self.nb_steps = nb_steps
         self._rl_agent_training_thread = Thread(
@@ -19,7 +19,6 @@
 
 """This module contains the handler for the 'ml_data_provider' skill."""
 
-import pickle  # nosec
 from typing import Optional, cast
 
 from aea.configurations.base import ProtocolId
@@ -29,6 +28,7 @@ from aea.skills.base import Handler
 
 from packages.fetchai.protocols.ledger_api.message import LedgerApiMessage
 from packages.fetchai.protocols.ml_trade.message import MlTradeMessage
+from packages.fetchai.protocols.ml_trade.tensors import encode_tensors
 from packages.fetchai.skills.ml_data_provider.dialogues import (
     DefaultDialogues,
     LedgerApiDialogue,
@@ -170,7 +170,7 @@ class MlTradeHandler(Handler):
                 self.context.agent_name, ml_trade_msg.counterparty[-5:], data[0].shape
             )
         )
-        payload = pickle.dumps(data)  # nosec
+        payload = encode_tensors(data)
         data_msg = MlTradeMessage(
             performative=MlTradeMessage.Performative.DATA,
             dialogue_reference=ml_trade_dialogue.dialogue_label.dialogue_reference,
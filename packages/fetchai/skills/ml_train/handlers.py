@@ -19,7 +19,6 @@
 
 """This module contains the handler for the 'ml_train' skill."""
 
-import pickle  # nosec
 import uuid
 from typing import Optional, cast
 
@@ -32,6 +31,7 @@ from aea.skills.base import Handler
 
 from packages.fetchai.protocols.ledger_api.message import LedgerApiMessage
 from packages.fetchai.protocols.ml_trade.message import MlTradeMessage
+from packages.fetchai.protocols.ml_trade.tensors import decode_tensors
 from packages.fetchai.protocols.oef_search.message import OefSearchMessage
 from packages.fetchai.skills.ml_train.dialogues import (
     DefaultDialogues,
@@ -217,7 +217,16 @@ class MlTradeHandler(Handler):
         """
         terms = ml_trade_msg.terms
         payload = ml_trade_msg.payload
-        data = pickle.loads(payload)  # nosec
+        try:
+            data = decode_tensors(payload) if payload else None
+        except ValueError as e:
+            # e.g. a pickled payload, from a data provider of an older version.
+            self.context.logger.warning(
+                "Ignoring data message with an unsupported payload from {}: {}".format(
+                    ml_trade_msg.counterparty[-5:], e
+                )
+            )
+            return
         if data is None:
             self.context.logger.info(
                 "Received data message with no data from {}".format(
@@ -230,7 +239,7 @@ class MlTradeHandler(Handler):
                     ml_trade_msg.counterparty[-5:], data[0].shape, terms.values
                 )
             )
-            # training_task = MLTrainTask(data, self.context.ml_model)
+            # training_task = MLTrainTask(payload, self.context.ml_model)
             # self.context.task_manager.enqueue_task(training_task)
             self.context.ml_model.update(data[0], data[1], 5)
             self.context.strategy.is_searching = True
@@ -20,7 +20,7 @@
 """This module contains the tasks for the 'ml_train' skill."""
 
 import logging
-from typing import Tuple
+from typing import Tuple, Union, cast
 
 import numpy as np
 
@@ -28,6 +28,8 @@ from tensorflow import keras
 
 from aea.skills.tasks import Task
 
+from packages.fetchai.protocols.ml_trade.tensors import decode_tensors
+
 logger = logging.getLogger("aea.packages.fetchai.skills.ml_train.tasks")
 
 
@@ -36,13 +38,23 @@ class MLTrainTask(Task):
 
     def __init__(
         self,
-        train_data: Tuple[np.ndarray, np.ndarray],
+        train_data: Union[bytes, Tuple[np.ndarray, np.ndarray]],
         model: keras.Model,
         epochs_per_batch: int = 10,
         batch_size: int = 32,
     ):
-        """Initialize the task."""
+        """
+        Initialize the task.
+
+        :param train_data: the training batch, either as arrays or as the tensor payload of a 'data' message.
+        :param model: the model to train.
+        :param epochs_per_batch: the number of epochs.
+        :param batch_size: the size of the training batches.
+        """
         super().__init__()
+        if isinstance(train_data, bytes):
+            # the arrays are read-only views on the payload: the batch is not copied.
+            train_data = cast(Tuple[np.ndarray, np.ndarray], decode_tensors(train_data))
         self.train_x, self.train_y = train_data
 
         self.model = model
@@ -25,12 +25,7 @@ import pprint
 from enum import Enum
 from typing import Dict, List, Optional, cast
 
-from eth_account.messages import encode_defunct
-
-from hexbytes import HexBytes
-
-from web3 import Web3
-
+from aea.crypto.ethereum import EthereumHelper
 from aea.helpers.preference_representations.base import (
     linear_utility,
     logarithmic_utility,
@@ -451,25 +446,15 @@ class Transaction:
 
         :return: True if the transaction has been signed by both parties
         """
-        w3 = Web3()
-        singable_message = encode_defunct(primitive=self.sender_hash)
-        result = (
-            w3.eth.account.recover_message(  # pylint: disable=no-member
-                signable_message=singable_message,
-                signature=HexBytes(self.sender_signature),
-            )
-            == self.sender_addr
+        sender_addresses = EthereumHelper.recover_message(
+            self.sender_hash, self.sender_signature
         )
-        counterparty_signable_message = encode_defunct(primitive=self.counterparty_hash)
-        result = (
-            result
-            and w3.eth.account.recover_message(  # pylint: disable=no-member
-                signable_message=counterparty_signable_message,
-                signature=HexBytes(self.counterparty_signature),
-            )
-            == self.counterparty_addr
+        counterparty_addresses = EthereumHelper.recover_message(
+            self.counterparty_hash, self.counterparty_signature
+        )
+        return sender_addresses == (self.sender_addr,) and counterparty_addresses == (
+            self.counterparty_addr,
         )
-        return result
 
     @classmethod
     def from_message(cls, message: TacMessage) -> "Transaction":
@@ -21,6 +21,7 @@
 
 from typing import cast
 
+from aea.helpers.search.models import Description
 from aea.skills.base import Behaviour
 from aea.skills.behaviours import TickerBehaviour
 
@@ -58,7 +59,6 @@ class GoodsRegisterAndSearchBehaviour(Behaviour):
 
             registration = cast(Registration, self.context.registration)
             if registration.is_time_to_update_services():
-                self._unregister_service()
                 self._register_service()
 
             search = cast(Search, self.context.search)
@@ -82,23 +82,17 @@ class GoodsRegisterAndSearchBehaviour(Behaviour):
         registration = cast(Registration, self.context.registration)
 
         if registration.registered_goods_demanded_description is not None:
-            oef_msg = OefSearchMessage(
-                performative=OefSearchMessage.Performative.UNREGISTER_SERVICE,
-                dialogue_reference=(str(registration.get_next_id()), ""),
-                service_description=registration.registered_goods_demanded_description,
+            self._send_registration_message(
+                OefSearchMessage.Performative.UNREGISTER_SERVICE,
+                registration.registered_goods_demanded_description,
             )
-            oef_msg.counterparty = self.context.search_service_address
-            self.context.outbox.put_message(message=oef_msg)
             registration.registered_goods_demanded_description = None
 
         if registration.registered_goods_supplied_description is not None:
-            oef_msg = OefSearchMessage(
-                performative=OefSearchMessage.Performative.UNREGISTER_SERVICE,
-                dialogue_reference=(str(registration.get_next_id()), ""),
-                service_description=registration.registered_goods_supplied_description,
+            self._send_registration_message(
+                OefSearchMessage.Performative.UNREGISTER_SERVICE,
+                registration.registered_goods_supplied_description,
             )
-            oef_msg.counterparty = self.context.search_service_address
-            self.context.outbox.put_message(message=oef_msg)
             registration.registered_goods_supplied_description = None
 
     def _register_service(self) -> None:
@@ -110,50 +104,90 @@ class GoodsRegisterAndSearchBehaviour(Behaviour):
             - as a buyer, listing the goods demanded, or
             - as both.
 
+        A description is unregistered and registered again only if it has
+        changed since it was registered, e.g. because the holdings changed.
+        An unchanged description is registered again after the refresh interval,
+        in case the service directory lost it.
+
         :return: None
         """
-        registration = cast(Registration, self.context.registration)
         strategy = cast(Strategy, self.context.strategy)
 
         if strategy.is_registering_as_seller:
-            self.context.logger.debug(
-                "[{}]: Updating service directory as seller with goods supplied.".format(
-                    self.context.agent_name
-                )
-            )
-            goods_supplied_description = strategy.get_own_service_description(
-                is_supply=True, is_search_description=False,
-            )
-            registration.registered_goods_supplied_description = (
-                goods_supplied_description
-            )
-            oef_msg = OefSearchMessage(
-                performative=OefSearchMessage.Performative.REGISTER_SERVICE,
-                dialogue_reference=(str(registration.get_next_id()), ""),
-                service_description=goods_supplied_description,
-            )
-            oef_msg.counterparty = self.context.search_service_address
-            self.context.outbox.put_message(message=oef_msg)
+            self._update_service(is_supply=True)
 
         if strategy.is_registering_as_buyer:
-            self.context.logger.debug(
-                "[{}]: Updating service directory as buyer with goods demanded.".format(
-                    self.context.agent_name
+            self._update_service(is_supply=False)
+
+    def _update_service(self, is_supply: bool) -> None:
+        """
+        Register the description of the goods supplied or demanded, if it has changed or is due to be refreshed.
+
+        :param is_supply: whether to register the goods supplied or demanded.
+        :return: None
+        """
+        registration = cast(Registration, self.context.registration)
+        strategy = cast(Strategy, self.context.strategy)
+        role, goods = ("seller", "supplied") if is_supply else ("buyer", "demanded")
+
+        description = strategy.get_own_service_description(
+            is_supply=is_supply, is_search_description=False,
+        )
+        if registration.is_registered(description, is_supply=is_supply):
+            if registration.is_time_to_refresh(is_supply=is_supply):
+                self.context.logger.debug(
+                    "[{}]: Refreshing service directory as {} with goods {}.".format(
+                        self.context.agent_name, role, goods
+                    )
                 )
+                self._send_registration_message(
+                    OefSearchMessage.Performative.REGISTER_SERVICE, description
+                )
+                registration.record_registration(is_supply=is_supply)
+            return
+
+        self.context.logger.debug(
+            "[{}]: Updating service directory as {} with goods {}.".format(
+                self.context.agent_name, role, goods
             )
-            goods_demanded_description = strategy.get_own_service_description(
-                is_supply=False, is_search_description=False,
-            )
-            registration.registered_goods_demanded_description = (
-                goods_demanded_description
-            )
-            oef_msg = OefSearchMessage(
-                performative=OefSearchMessage.Performative.REGISTER_SERVICE,
-                dialogue_reference=(str(registration.get_next_id()), ""),
-                service_description=goods_demanded_description,
+        )
+        if is_supply:
+            registered_description = registration.registered_goods_supplied_description
+            registration.registered_goods_supplied_description = description
+        else:
+            registered_description = registration.registered_goods_demanded_description
+            registration.registered_goods_demanded_description = description
+        if registered_description is not None:
+            self._send_registration_message(
+                OefSearchMessage.Performative.UNREGISTER_SERVICE,
+                registered_description,
             )
-            oef_msg.counterparty = self.context.search_service_address
-            self.context.outbox.put_message(message=oef_msg)
+        self._send_registration_message(
+            OefSearchMessage.Performative.REGISTER_SERVICE, description
+        )
+        registration.record_registration(is_supply=is_supply)
+        # the services found by the searches may change with the agent's own services.
+        search = cast(Search, self.context.search)
+        search.reset_search_interval()
+
+    def _send_registration_message(
+        self, performative: OefSearchMessage.Performative, description: Description
+    ) -> None:
+        """
+        Send a (un)registration message to the OEF Service Directory.
+
+        :param performative: the performative, to register or unregister the service.
+        :param description: the description of the service.
+        :return: None
+        """
+        registration = cast(Registration, self.context.registration)
+        oef_msg = OefSearchMessage(
+            performative=performative,
+            dialogue_reference=(str(registration.get_next_id()), ""),
+            service_description=description,
+        )
+        oef_msg.counterparty = self.context.search_service_address
+        self.context.outbox.put_message(message=oef_msg)
 
     def _search_services(self) -> None:
         """
@@ -709,10 +709,12 @@ class OEFSearchHandler(Handler):
                 agents.remove(self.context.agent_address)
             agents_less_self = tuple(agents)
             if search_id in search.ids_for_sellers:
+                search.record_search_result(True, agents_less_self)
                 self._handle_search(
                     agents_less_self, search_id, is_searching_for_sellers=True
                 )
             elif search_id in search.ids_for_buyers:
+                search.record_search_result(False, agents_less_self)
                 self._handle_search(
                     agents_less_self, search_id, is_searching_for_sellers=False
                 )
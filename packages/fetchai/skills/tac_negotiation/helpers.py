@@ -21,7 +21,7 @@
 
 import collections
 import copy
-from typing import Dict, List, Union, cast
+from typing import Dict, List, Optional, Union, cast
 
 from web3 import Web3
 
@@ -92,6 +92,7 @@ def build_goods_description(
     currency_id: str,
     is_supply: bool,
     is_search_description: bool,
+    data_model: Optional[DataModel] = None,
 ) -> Description:
     """
     Get the service description (good quantities supplied or demanded and their price).
@@ -100,6 +101,7 @@ def build_goods_description(
     :param currency_id: the currency used for pricing and transacting.
     :param is_supply: True if the description is indicating supply, False if it's indicating demand.
     :param is_search_description: Whether or not the description is used for search
+    :param data_model: the data model of the description, to reuse it instead of building it.
 
     :return: the description to advertise on the Service Directory.
     """
@@ -110,9 +112,10 @@ def build_goods_description(
             PREFIX + good_id: quantity
             for good_id, quantity in _good_id_to_quantities.items()
         }
-    data_model = _build_goods_datamodel(
-        good_ids=list(_good_id_to_quantities.keys()), is_supply=is_supply
-    )
+    if data_model is None:
+        data_model = _build_goods_datamodel(
+            good_ids=list(_good_id_to_quantities.keys()), is_supply=is_supply
+        )
     values = cast(Dict[str, Union[int, str]], _good_id_to_quantities)
     values.update({"currency_id": currency_id})
     desc = Description(values, data_model=data_model)
@@ -20,7 +20,7 @@
 """This package contains a class representing the registration state."""
 
 import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from aea.helpers.search.models import Description
 from aea.skills.base import Model
@@ -32,11 +32,14 @@ class Registration(Model):
     def __init__(self, **kwargs):
         """Instantiate the search class."""
         self._update_interval = kwargs.pop("update_interval", 5)  # type: int
+        self._refresh_interval = kwargs.pop("refresh_interval", 60)  # type: int
         super().__init__(**kwargs)
         self._id = 0
         self.registered_goods_demanded_description = None  # type: Optional[Description]
         self.registered_goods_supplied_description = None  # type: Optional[Description]
         self._last_update_time = datetime.datetime.now()  # type: datetime.datetime
+        # the time of the last registration of the supply and of the demand.
+        self._registration_times = {}  # type: Dict[bool, datetime.datetime]
 
     @property
     def id(self) -> int:
@@ -52,6 +55,45 @@ class Registration(Model):
         self._id += 1
         return self.id
 
+    def is_registered(self, description: Description, is_supply: bool) -> bool:
+        """
+        Check if a description is the one registered for the supply or the demand.
+
+        :param description: the description
+        :param is_supply: whether the description is of the supplied goods
+        :return: bool indicating whether the description is registered
+        """
+        registered_description = (
+            self.registered_goods_supplied_description
+            if is_supply
+            else self.registered_goods_demanded_description
+        )
+        return registered_description == description
+
+    def record_registration(self, is_supply: bool) -> None:
+        """
+        Record the registration of the description of the supply or the demand.
+
+        :param is_supply: whether the description is of the supplied goods
+        :return: None
+        """
+        self._registration_times[is_supply] = datetime.datetime.now()
+
+    def is_time_to_refresh(self, is_supply: bool) -> bool:
+        """
+        Check if the description of the supply or the demand should be registered again, even if unchanged.
+
+        The service directory may have lost it since, e.g. after a reconnection or a restart.
+
+        :param is_supply: whether the description is of the supplied goods
+        :return: bool indicating the action
+        """
+        registration_time = self._registration_times.get(is_supply)
+        if registration_time is None:
+            return True
+        diff = datetime.datetime.now() - registration_time
+        return diff.total_seconds() > self._refresh_interval
+
     def is_time_to_update_services(self) -> bool:
         """
         Check if the agent should update the service directory.
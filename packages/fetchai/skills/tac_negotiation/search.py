@@ -20,7 +20,7 @@
 """This package contains a class representing the search state."""
 
 import datetime
-from typing import Set
+from typing import Dict, Set, Tuple
 
 from aea.skills.base import Model
 
@@ -31,11 +31,16 @@ class Search(Model):
     def __init__(self, **kwargs):
         """Instantiate the search class."""
         self._search_interval = kwargs.pop("search_interval", 5)  # type: int
+        self._max_search_interval = kwargs.pop("max_search_interval", 60)  # type: int
         super().__init__(**kwargs)
         self._id = 0
         self._ids_for_sellers = set()  # type: Set[int]
         self._ids_for_buyers = set()  # type: Set[int]
         self._last_search_time = datetime.datetime.now()  # type: datetime.datetime
+        self._backoff_exponent = 0
+        self._last_results = {}  # type: Dict[bool, Tuple[str, ...]]
+        self._results_received = False
+        self._results_changed = False
 
     @property
     def id(self) -> int:
@@ -52,6 +57,19 @@ class Search(Model):
         """Get search ids for the buyers."""
         return self._ids_for_buyers
 
+    @property
+    def search_interval(self) -> float:
+        """
+        Get the current interval between searches.
+
+        It doubles after each round of searches whose results were the same as
+        those of the previous round, up to the maximum search interval.
+        """
+        return min(
+            self._search_interval * 2 ** self._backoff_exponent,
+            self._max_search_interval,
+        )
+
     def get_next_id(self, is_searching_for_sellers: bool) -> int:
         """
         Generate the next search id and stores it.
@@ -74,7 +92,42 @@ class Search(Model):
         """
         now = datetime.datetime.now()
         diff = now - self._last_search_time
-        result = diff.total_seconds() > self._search_interval
+        result = diff.total_seconds() > self.search_interval
         if result:
             self._last_search_time = now
+            self._update_backoff()
         return result
+
+    def record_search_result(
+        self, is_searching_for_sellers: bool, agents: Tuple[str, ...]
+    ) -> None:
+        """
+        Record the agents found by a search, to back off while they do not change.
+
+        :param is_searching_for_sellers: whether it is a seller search
+        :param agents: the agents found
+        :return: None
+        """
+        agents = tuple(sorted(agents))
+        self._results_received = True
+        if self._last_results.get(is_searching_for_sellers) != agents:
+            self._last_results[is_searching_for_sellers] = agents
+            self._results_changed = True
+
+    def reset_search_interval(self) -> None:
+        """
+        Reset the interval between searches, e.g. because the agent's own services have changed.
+
+        :return: None
+        """
+        self._backoff_exponent = 0
+
+    def _update_backoff(self) -> None:
+        """Back off if the results of the last round of searches were all unchanged."""
+        if self._results_received and not self._results_changed:
+            if self.search_interval < self._max_search_interval:
+                self._backoff_exponent += 1
+        else:
+            self._backoff_exponent = 0
+        self._results_received = False
+        self._results_changed = False
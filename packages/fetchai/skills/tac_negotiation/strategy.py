@@ -22,8 +22,9 @@
 import copy
 import random
 from enum import Enum
-from typing import Dict, Optional, cast
+from typing import Dict, List, Optional, Tuple, cast
 
+from aea.decision_maker.default import OwnershipState
 from aea.helpers.search.models import Description, Query
 from aea.protocols.signing.message import SigningMessage
 from aea.skills.base import Model
@@ -70,13 +71,17 @@ class Strategy(Model):
         self._is_contract_tx = kwargs.pop("is_contract_tx", False)
         self._ledger_id = kwargs.pop("ledger_id", "ethereum")
         super().__init__(**kwargs)
+        # the candidate proposals, by role, with the ownership state after locks and the fees they were generated from.
+        self._candidate_proposals = (
+            {}
+        )  # type: Dict[bool, Tuple[OwnershipState, Tuple[int, int], List[Description]]]
 
     @property
     def is_registering_as_seller(self) -> bool:
         """Check if the agent registers as a seller on the OEF service directory."""
         return (
             self._register_as == Strategy.RegisterAs.SELLER
-            or self._register_as == Strategy.RegisterAs.BUYER
+            or self._register_as == Strategy.RegisterAs.BOTH
         )
 
     @property
@@ -220,8 +225,13 @@ class Strategy(Model):
             proposals.append(proposal)
         if not proposals:
             return None
-        else:
-            return random.choice(proposals)  # nosec
+        candidate_proposal = random.choice(proposals)  # nosec
+        proposal = Description(
+            candidate_proposal.values, data_model=candidate_proposal.data_model
+        )
+        transactions = cast(Transactions, self.context.transactions)
+        proposal.values["tx_nonce"] = transactions.get_next_tx_nonce()
+        return proposal
 
     def get_proposal_for_query(
         self, query: Query, role: Dialogue.Role
@@ -258,10 +268,14 @@ class Strategy(Model):
                 )
             return proposal_description
 
-    def _generate_candidate_proposals(self, is_seller: bool):
+    def _generate_candidate_proposals(self, is_seller: bool) -> List[Description]:
         """
         Generate proposals from the agent in the role of seller/buyer.
 
+        The proposals have no transaction nonce. They are generated again only
+        if the holdings or the locks of the agent have changed, so they must not
+        be modified.
+
         :param is_seller: the bool indicating whether the agent is a seller.
 
         :return: a list of proposals in Description form
@@ -270,6 +284,17 @@ class Strategy(Model):
         ownership_state_after_locks = transactions.ownership_state_after_locks(
             is_seller=is_seller
         )
+        preferences = self.context.decision_maker_handler_context.preferences
+        seller_tx_fee = preferences.seller_transaction_fee
+        buyer_tx_fee = preferences.buyer_transaction_fee
+        cached = self._candidate_proposals.get(is_seller)
+        if (
+            cached is not None
+            and cached[0] is ownership_state_after_locks
+            and cached[1] == (seller_tx_fee, buyer_tx_fee)
+        ):
+            return cached[2]
+
         good_id_to_quantities = (
             self._supplied_goods(ownership_state_after_locks.quantities_by_good_id)
             if is_seller
@@ -278,19 +303,23 @@ class Strategy(Model):
         nil_proposal_dict = {
             good_id: 0 for good_id in good_id_to_quantities.keys()
         }  # type: Dict[str, int]
-        proposals = []
-        seller_tx_fee = (
-            self.context.decision_maker_handler_context.preferences.seller_transaction_fee
-        )
-        buyer_tx_fee = (
-            self.context.decision_maker_handler_context.preferences.buyer_transaction_fee
+        currency_id = list(ownership_state_after_locks.amount_by_currency_id.keys())[0]
+        switch = -1 if is_seller else 1
+        marginal_utilities = preferences.marginal_utilities_by_good_id(
+            ownership_state_after_locks, delta_quantity=switch
         )
-        currency_id = list(
-            self.context.decision_maker_handler_context.ownership_state.amount_by_currency_id.keys()
-        )[0]
+        data_model = None
+        proposals = []  # type: List[Description]
         for good_id, quantity in good_id_to_quantities.items():
             if is_seller and quantity == 0:
                 continue
+            breakeven_price_rounded = round(marginal_utilities[good_id]) * switch
+            if is_seller:
+                price = breakeven_price_rounded + seller_tx_fee + ROUNDING_ADJUSTMENT
+            else:
+                price = breakeven_price_rounded - buyer_tx_fee - ROUNDING_ADJUSTMENT
+            if not price > 0:
+                continue
             proposal_dict = copy.copy(nil_proposal_dict)
             proposal_dict[good_id] = 1
             proposal = build_goods_description(
@@ -298,37 +327,18 @@ class Strategy(Model):
                 currency_id=currency_id,
                 is_supply=is_seller,
                 is_search_description=False,
+                data_model=data_model,
             )
-            if is_seller:
-                delta_quantities_by_good_id = {
-                    good_id: quantity * -1
-                    for good_id, quantity in proposal_dict.items()
-                }  # type: Dict[str, int]
-            else:
-                delta_quantities_by_good_id = proposal_dict
-            marginal_utility_from_delta_good_holdings = self.context.decision_maker_handler_context.preferences.marginal_utility(
-                ownership_state=ownership_state_after_locks,
-                delta_quantities_by_good_id=delta_quantities_by_good_id,
-            )
-            switch = -1 if is_seller else 1
-            breakeven_price_rounded = (
-                round(marginal_utility_from_delta_good_holdings) * switch
-            )
-            if is_seller:
-                proposal.values["price"] = (
-                    breakeven_price_rounded + seller_tx_fee + ROUNDING_ADJUSTMENT
-                )
-            else:
-                proposal.values["price"] = (
-                    breakeven_price_rounded - buyer_tx_fee - ROUNDING_ADJUSTMENT
-                )
+            data_model = proposal.data_model
+            proposal.values["price"] = price
             proposal.values["seller_tx_fee"] = seller_tx_fee
             proposal.values["buyer_tx_fee"] = buyer_tx_fee
-            if not proposal.values["price"] > 0:
-                continue
-            tx_nonce = transactions.get_next_tx_nonce()
-            proposal.values["tx_nonce"] = tx_nonce
             proposals.append(proposal)
+        self._candidate_proposals[is_seller] = (
+            ownership_state_after_locks,
+            (seller_tx_fee, buyer_tx_fee),
+            proposals,
+        )
         return proposals
 
     def is_profitable_transaction(
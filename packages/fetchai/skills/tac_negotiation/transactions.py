@@ -58,6 +58,10 @@ class Transactions(Model):
         self._locked_txs = {}  # type: Dict[str, SigningMessage]
         self._locked_txs_as_buyer = {}  # type: Dict[str, SigningMessage]
         self._locked_txs_as_seller = {}  # type: Dict[str, SigningMessage]
+        # the ownership states after locks, by role, with the holdings they were computed from.
+        self._ownership_states_after_locks = (
+            {}
+        )  # type: Dict[bool, Tuple[Tuple[Dict[str, int], Dict[str, int]], OwnershipState]]
 
         self._last_update_for_transactions = (
             deque()
@@ -204,6 +208,7 @@ class Transactions(Model):
             self._locked_txs.pop(transaction_id, None)
             self._locked_txs_as_buyer.pop(transaction_id, None)
             self._locked_txs_as_seller.pop(transaction_id, None)
+            self._ownership_states_after_locks.clear()
 
             # check the next transaction, if present
             if len(queue) == 0:
@@ -327,6 +332,7 @@ class Transactions(Model):
             self._locked_txs_as_seller[transaction_id] = transaction_msg
         else:
             self._locked_txs_as_buyer[transaction_id] = transaction_msg
+        self._ownership_states_after_locks.pop(as_seller, None)
 
     def pop_locked_tx(self, transaction_msg: SigningMessage) -> SigningMessage:
         """
@@ -342,6 +348,7 @@ class Transactions(Model):
         transaction_msg = self._locked_txs.pop(transaction_id)
         self._locked_txs_as_buyer.pop(transaction_id, None)
         self._locked_txs_as_seller.pop(transaction_id, None)
+        self._ownership_states_after_locks.clear()
         return transaction_msg
 
     def ownership_state_after_locks(self, is_seller: bool) -> OwnershipState:
@@ -349,17 +356,31 @@ class Transactions(Model):
         Apply all the locks to the current ownership state of the agent.
 
         This assumes, that all the locked transactions will be successful.
+        The result is computed again only if the locks or the holdings of the
+        agent have changed since the last call, so it must not be modified.
 
         :param is_seller: Boolean indicating the role of the agent.
 
         :return: the agent state with the locks applied to current state
         """
+        ownership_state = self.context.decision_maker_handler_context.ownership_state
+        holdings = (
+            ownership_state.quantities_by_good_id,
+            ownership_state.amount_by_currency_id,
+        )
+        cached = self._ownership_states_after_locks.get(is_seller)
+        if cached is not None and cached[0] == holdings:
+            return cached[1]
         transaction_msgs = (
             list(self._locked_txs_as_seller.values())
             if is_seller
             else list(self._locked_txs_as_buyer.values())
         )
-        ownership_state_after_locks = self.context.decision_maker_handler_context.ownership_state.apply_transactions(
+        ownership_state_after_locks = ownership_state.apply_transactions(
             transaction_msgs
         )
+        self._ownership_states_after_locks[is_seller] = (
+            holdings,
+            ownership_state_after_locks,
+        )
         return ownership_state_after_locks
@@ -21,9 +21,10 @@
 
 import datetime
 import os.path
-import sqlite3
 from typing import Dict, cast
 
+from aea.helpers.sqlite import SQLiteDatabase
+
 my_path = os.path.dirname(__file__)
 
 DB_SOURCE = os.path.join(my_path, "dummy_weather_station_data.db")
@@ -39,15 +40,8 @@ class DBCommunication:
         :param source: the source
         """
         self.source = DB_SOURCE
-
-    def db_connection(self) -> sqlite3.Connection:
-        """
-        Get db connection.
-
-        :return: the db connection
-        """
-        con = sqlite3.connect(self.source)
-        return con
+        # the bundled database, with its index on idx, is only read.
+        self.db = SQLiteDatabase(self.source, read_only=True)
 
     def get_data_for_specific_dates(
         self, start_date: str, end_date: str
@@ -59,16 +53,11 @@ class DBCommunication:
         :param end_date: the end date
         :return: the data
         """
-        con = self.db_connection()
-        cur = con.cursor()
         start_dt = datetime.datetime.strptime(start_date, "%d/%m/%Y")
         start = start_dt.strftime("%s")
         end_dt = datetime.datetime.strptime(end_date, "%d/%m/%Y")
         end = end_dt.strftime("%s")
-        cur.execute(
+        data = self.db.execute(
             "SELECT * FROM data WHERE idx BETWEEN ? AND ?", (str(start), str(end))
         )
-        data = cast(Dict[str, int], cur.fetchall())
-        cur.close()
-        con.close()
-        return data
+        return cast(Dict[str, int], data)
@@ -23,10 +23,11 @@ import datetime
 import logging
 import os.path
 import random
-import sqlite3
 import time
 from typing import Dict, Union
 
+from aea.helpers.sqlite import SQLiteDatabase
+
 logger = logging.getLogger(
     "aea.packages.fetchai.skills.weather_station.dummy_weather_station_data"
 )
@@ -35,13 +36,8 @@ my_path = os.path.dirname(__file__)
 
 DB_SOURCE = os.path.join(my_path, "dummy_weather_station_data.db")
 
-# Checking if the database exists
-con = sqlite3.connect(DB_SOURCE)
-cur = con.cursor()
-
-cur.close()
-con.commit()
-con.close()
+# the rollback journal keeps the bundled database readable by read-only connections.
+db = SQLiteDatabase(DB_SOURCE, wal=False)
 
 # Create a table if it doesn't exist'
 command = """ CREATE TABLE IF NOT EXISTS data (
@@ -57,14 +53,9 @@ command = """ CREATE TABLE IF NOT EXISTS data (
                                  wind_dir REAL,
                                  wind_gust REAL)"""
 
-con = sqlite3.connect(DB_SOURCE)
-cur = con.cursor()
-cur.execute(command)
-cur.close()
-con.commit()
-if con is not None:
-    logger.debug("Weather station: I closed the db after checking it is populated!")
-    con.close()
+db.execute(command)
+db.execute("CREATE INDEX IF NOT EXISTS data_idx ON data (idx)")
+logger.debug("Weather station: I checked the db is populated!")
 
 
 class Forecast:
@@ -78,9 +69,7 @@ class Forecast:
         :param tagged_data: the data dictionary
         :return: None
         """
-        con = sqlite3.connect(DB_SOURCE)
-        cur = con.cursor()
-        cur.execute(
+        db.execute(
             """INSERT INTO data(abs_pressure,
                                        delay,
                                        hum_in,
@@ -107,9 +96,6 @@ class Forecast:
             ),
         )
         logger.info("Wheather station: I added data in the db!")
-        cur.close()
-        con.commit()
-        con.close()
 
     def generate(self):
         """Generate weather data."""
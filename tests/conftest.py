@@ -67,6 +67,7 @@ from aea.identity.base import Identity
 from aea.mail.base import Address
 from aea.test_tools.constants import DEFAULT_AUTHOR
 
+from packages.fetchai.connections.in_process.connection import InProcessConnection
 from packages.fetchai.connections.local.connection import LocalNode, OEFLocalConnection
 from packages.fetchai.connections.oef.connection import OEFConnection
 from packages.fetchai.connections.p2p_client.connection import (
@@ -663,6 +664,19 @@ def _make_local_connection(
     return oef_local_connection
 
 
+def _make_in_process_connection(
+    address: Address, fallback_connection: Optional[Connection] = None, **kwargs
+) -> Connection:
+    configuration = ConnectionConfig(connection_id=InProcessConnection.connection_id)
+    in_process_connection = InProcessConnection(
+        configuration=configuration,
+        identity=Identity("name", address),
+        fallback_connection=fallback_connection,
+        **kwargs,
+    )
+    return in_process_connection
+
+
 def _make_oef_connection(address: Address, oef_addr: str, oef_port: int):
     configuration = ConnectionConfig(
         addr=oef_addr, port=oef_port, connection_id=OEFConnection.connection_id
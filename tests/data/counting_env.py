@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a deterministic gym environment for testing purposes."""
+
+import gym
+
+
+class CountingEnv(gym.Env):
+    """An environment counting the sum of the actions, done after two steps."""
+
+    EPISODE_LENGTH = 2
+
+    def __init__(self):
+        """Initialize the environment."""
+        self.total = 0
+        self.steps = 0
+
+    def step(self, action):
+        """Add the action to the total."""
+        self.total += action
+        self.steps += 1
+        return self.total, float(action), self.steps >= self.EPISODE_LENGTH, {}
+
+    def reset(self):
+        """Reset the total."""
+        self.total = 0
+        self.steps = 0
+        return self.total
+
+    def render(self, mode="human"):
+        """Render nothing."""
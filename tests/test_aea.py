@@ -21,6 +21,7 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 from aea import AEA_DIR
 from aea.aea import AEA
@@ -29,7 +30,7 @@ from aea.configurations.base import PublicId
 from aea.crypto.fetchai import FetchAICrypto
 from aea.crypto.wallet import Wallet
 from aea.identity.base import Identity
-from aea.mail.base import Envelope
+from aea.mail.base import Envelope, EnvelopePool
 from aea.protocols.base import Protocol
 from aea.protocols.default.message import DefaultMessage
 from aea.registries.resources import Resources
@@ -258,6 +259,50 @@ def test_handle():
             aea.stop()
 
 
+def test_react_one_releases_envelopes():
+    """Test that the agent releases the envelopes it handles to the pool, and the handlers keep their messages."""
+    private_key_path = os.path.join(CUR_PATH, "data", "fet_private_key.txt")
+    builder = AEABuilder()
+    builder.set_name("my_name").add_private_key(FETCHAI, private_key_path)
+    builder.add_skill(Path(CUR_PATH, "data", "dummy_skill"))
+    aea = builder.build()
+    aea.setup()
+    dummy_handler = aea.resources.get_handler(
+        DefaultMessage.protocol_id, DUMMY_SKILL_PUBLIC_ID
+    )
+    message = DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES, content=b"hello"
+    )
+
+    try:
+        with mock.patch.object(Envelope, "pool", EnvelopePool()):
+            # an encoded message, as from a connection, and a message object, as from an in-process connection.
+            for envelope_message in (message.encode(), message):
+                envelope = Envelope.acquire(
+                    to=aea.identity.address,
+                    sender=aea.identity.address,
+                    protocol_id=DefaultMessage.protocol_id,
+                    message=envelope_message,
+                )
+                aea.multiplexer.in_queue.put(envelope)
+                aea._react_one()
+                assert len(Envelope.pool) == 1
+                assert (
+                    Envelope.acquire("to", "sender", PublicId("a", "b", "0.1.0"), b"")
+                    is envelope
+                )
+
+            # the dummy handler keeps the messages it handles.
+            assert len(dummy_handler.handled_messages) == 2
+            assert all(
+                handled_message.content == b"hello"
+                for handled_message in dummy_handler.handled_messages
+            )
+            assert dummy_handler.handled_messages[1] is message
+    finally:
+        aea.stop()
+
+
 def test_initialize_aea_programmatically():
     """Test that we can initialize an AEA programmatically."""
     with LocalNode() as node:
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This test module contains the tests for the `aea build` sub-command and the agent image."""
+
+from pathlib import Path
+from unittest import mock
+
+from aea.aea_builder import AEABuilder
+from aea.configurations.image import AgentImage, DEFAULT_AGENT_IMAGE_FILE
+from aea.test_tools.test_cases import AEATestCaseEmpty
+
+
+class TestBuild(AEATestCaseEmpty):
+    """Test the `aea build` command and the use of the agent image."""
+
+    @classmethod
+    def setup_class(cls):
+        """Set up the test class."""
+        super().setup_class()
+        cls.add_item("skill", "fetchai/echo:0.3.0")
+        cls.agent_path = Path(cls.t, cls.agent_name)
+
+    def setup(self):
+        """Build the agent image."""
+        self.run_cli_command("build", cwd=self._get_cwd())
+
+    def teardown(self):
+        """Remove the agent image."""
+        self.run_cli_command("build", "--remove", cwd=self._get_cwd())
+
+    def test_image_is_up_to_date(self):
+        """Test that the built image is present and valid."""
+        assert (self.agent_path / DEFAULT_AGENT_IMAGE_FILE).exists()
+        agent_image = AgentImage.load(self.agent_path)
+        assert agent_image is not None
+        assert agent_image.consistency_checked
+        assert agent_image.is_up_to_date(self.agent_path)
+        component_names = [c.directory for c in agent_image.components]
+        assert component_names[-1] == "vendor/fetchai/skills/echo"
+
+    def test_from_aea_project_uses_image(self):
+        """Test that the builder does not load the configuration files if the image is valid."""
+        with mock.patch.object(
+            AEABuilder, "_load_component_configurations"
+        ) as load_mock:
+            builder = AEABuilder.from_aea_project(self.agent_path)
+        load_mock.assert_not_called()
+        AgentImage.remove(self.agent_path)
+        expected = AEABuilder.from_aea_project(self.agent_path)
+        assert builder._package_dependency_manager.all_dependencies == (
+            expected._package_dependency_manager.all_dependencies
+        )
+        assert builder._name == expected._name
+        assert builder._private_key_paths == expected._private_key_paths
+
+    def test_image_invalidated_by_changes(self):
+        """Test that a change in a component file invalidates the image."""
+        behaviours_path = (
+            self.agent_path / "vendor" / "fetchai" / "skills" / "echo" / "behaviours.py"
+        )
+        content = behaviours_path.read_text()
+        try:
+            behaviours_path.write_text(content + "\n")
+            agent_image = AgentImage.load(self.agent_path)
+            assert agent_image is not None
+            assert not agent_image.is_up_to_date(self.agent_path)
+            with mock.patch.object(
+                AEABuilder,
+                "_load_component_configurations",
+                wraps=AEABuilder._load_component_configurations,
+                autospec=True,
+            ) as load_mock:
+                AEABuilder.from_aea_project(
+                    self.agent_path, skip_consistency_check=True
+                )
+            load_mock.assert_called_once()
+        finally:
+            behaviours_path.write_text(content)
+
+    def test_image_without_consistency_check(self):
+        """Test that an image built without consistency checks is used only when checks are skipped."""
+        AgentImage.remove(self.agent_path)
+        AEABuilder.build_agent_image(self.agent_path, skip_consistency_check=True)
+        agent_image = AgentImage.load(self.agent_path)
+        assert agent_image is not None
+        assert not agent_image.consistency_checked
+        assert not agent_image.is_up_to_date(self.agent_path)
+        assert agent_image.is_up_to_date(self.agent_path, skip_consistency_check=True)
+
+    def test_load_corrupted_image(self):
+        """Test that a corrupted image is ignored."""
+        (self.agent_path / DEFAULT_AGENT_IMAGE_FILE).write_text("{not json")
+        assert AgentImage.load(self.agent_path) is None
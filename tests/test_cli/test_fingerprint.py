@@ -18,6 +18,10 @@
 # ------------------------------------------------------------------------------
 """This test module contains the tests for CLI fingerprint command."""
 
+import os
+import shutil
+import tempfile
+from pathlib import Path
 from unittest import TestCase, mock
 
 from click import ClickException
@@ -25,8 +29,9 @@ from click.testing import CliRunner
 
 from aea.cli import cli
 from aea.cli.fingerprint import _fingerprint_item
+from aea.configurations.base import _compute_fingerprint
 
-from tests.conftest import CLI_LOG_OPTION
+from tests.conftest import CLI_LOG_OPTION, ROOT_DIR
 from tests.test_cli.tools_for_testing import ConfigLoaderMock, ContextMock, PublicIdMock
 
 
@@ -98,3 +103,66 @@ class FingerprintItemTestCase(TestCase):
         public_id = PublicIdMock()
         with self.assertRaises(ClickException):
             _fingerprint_item(ContextMock(), "skill", public_id)
+
+
+class FingerprintAllTestCase(TestCase):
+    """Test case for the 'aea fingerprint --all' command."""
+
+    def setUp(self):
+        """Set up a local registry with two packages."""
+        self.runner = CliRunner()
+        self.cwd = os.getcwd()
+        self.t = tempfile.mkdtemp()
+        for package in ("protocols/fipa", "skills/echo"):
+            shutil.copytree(
+                os.path.join(ROOT_DIR, "packages", "fetchai", package),
+                os.path.join(self.t, "packages", "fetchai", package),
+                ignore=shutil.ignore_patterns("__pycache__"),
+            )
+        self.skill_path = Path(self.t, "packages", "fetchai", "skills", "echo")
+        os.chdir(self.t)
+
+    def tearDown(self):
+        """Tear down the test."""
+        os.chdir(self.cwd)
+        shutil.rmtree(self.t, ignore_errors=True)
+
+    def test_fingerprint_all(self):
+        """Test that only the packages whose files changed are updated."""
+        protocol_config_path = Path(
+            self.t, "packages", "fetchai", "protocols", "fipa", "protocol.yaml"
+        )
+        protocol_config = protocol_config_path.read_text()
+        skill_config_path = self.skill_path / "skill.yaml"
+        skill_config = skill_config_path.read_text()
+        (self.skill_path / "behaviours.py").write_text("# changed\n")
+
+        result = self.runner.invoke(
+            cli, [*CLI_LOG_OPTION, "fingerprint", "--all"], standalone_mode=False
+        )
+        self.assertEqual(result.exit_code, 0, result.exception)
+        self.assertIn("Fingerprinted 2 packages", result.output)
+        self.assertIn("1 updated", result.output)
+
+        assert protocol_config_path.read_text() == protocol_config
+        new_skill_config = skill_config_path.read_text()
+        expected_fingerprint = _compute_fingerprint(self.skill_path, [])
+        assert new_skill_config.count(expected_fingerprint["behaviours.py"]) == 1
+        assert len(new_skill_config.splitlines()) == len(skill_config.splitlines())
+
+    def test_fingerprint_all_with_subcommand(self):
+        """Test that '--all' cannot be used with a subcommand."""
+        result = self.runner.invoke(
+            cli,
+            [*CLI_LOG_OPTION, "fingerprint", "--all", "skill", "fetchai/echo:0.3.0"],
+            standalone_mode=False,
+        )
+        self.assertNotEqual(result.exit_code, 0)
+
+    def test_fingerprint_all_without_registry(self):
+        """Test that '--all' fails without a local registry."""
+        shutil.rmtree(os.path.join(self.t, "packages"))
+        result = self.runner.invoke(
+            cli, [*CLI_LOG_OPTION, "fingerprint", "--all"], standalone_mode=False
+        )
+        self.assertNotEqual(result.exit_code, 0)
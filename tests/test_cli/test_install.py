@@ -21,7 +21,10 @@
 
 import os
 import shutil
+import subprocess  # nosec
+import sys
 import tempfile
+import zipfile
 from pathlib import Path
 from unittest import TestCase, mock
 
@@ -30,11 +33,16 @@ from click.testing import CliRunner
 import yaml
 
 from aea.cli import cli
-from aea.cli.install import _install_dependency
+from aea.cli.install import (
+    _get_pip_install_command,
+    _install_dependencies,
+    do_install,
+)
 from aea.configurations.base import DEFAULT_PROTOCOL_CONFIG_FILE
 from aea.exceptions import AEAException
 
 from tests.conftest import AUTHOR, CLI_LOG_OPTION, CUR_PATH
+from tests.test_cli.tools_for_testing import ContextMock
 
 
 class TestInstall:
@@ -200,13 +208,153 @@ class TestInstallWithRequirementFailsWhenFileIsBad:
 @mock.patch("aea.cli.install.subprocess.Popen")
 @mock.patch("aea.cli.install.subprocess.Popen.wait")
 @mock.patch("aea.cli.install.sys.exit")
-class InstallDependencyTestCase(TestCase):
-    """Test case for _install_dependency method."""
+class InstallDependenciesTestCase(TestCase):
+    """Test case for _install_dependencies method."""
 
-    def test__install_dependency_with_git_url(self, *mocks):
-        """Test for _install_dependency method with git url."""
+    def test__install_dependencies_with_git_url(self, *mocks):
+        """Test for _install_dependencies method with git url."""
         dependency = {
             "git": "url",
         }
         with self.assertRaises(AEAException):
-            _install_dependency("dependency_name", dependency)
+            _install_dependencies({"dependency_name": dependency})
+
+
+@mock.patch("aea.cli.install._run_install_subprocess", return_value=0)
+class InstallDependenciesByIndexTestCase(TestCase):
+    """Test case for the installation of the dependencies pinned to a package index."""
+
+    def test_separate_run_for_each_index(self, run_install_subprocess):
+        """Test that the dependencies pinned to an index are installed in their own run, from their index only."""
+        _install_dependencies(
+            {
+                "a_package": {"version": ">=1.0"},
+                "b_package": {"index": "https://test.pypi.org/simple"},
+                "c_package": {"version": "==0.1.0"},
+                "d_package": {"index": "https://test.pypi.org/simple"},
+                "e_package": {"index": "https://other.index/simple"},
+            }
+        )
+        commands = [call[0][0][4:] for call in run_install_subprocess.call_args_list]
+        assert commands == [
+            ["a_package>=1.0", "c_package==0.1.0"],
+            ["--index-url", "https://other.index/simple", "e_package"],
+            ["--index-url", "https://test.pypi.org/simple", "b_package", "d_package"],
+        ]
+
+    def test_single_run_without_index(self, run_install_subprocess):
+        """Test that all the dependencies are installed in one run when the indexes are ignored."""
+        _install_dependencies(
+            {
+                "a_package": {"version": ">=1.0"},
+                "b_package": {"index": "https://test.pypi.org/simple"},
+            },
+            no_index=True,
+        )
+        assert run_install_subprocess.call_count == 1
+        assert run_install_subprocess.call_args[0][0][4:] == [
+            "--no-index",
+            "a_package>=1.0",
+            "b_package",
+        ]
+
+
+class GetPipInstallCommandTestCase(TestCase):
+    """Test case for _get_pip_install_command method."""
+
+    def test_single_run_for_all_dependencies(self):
+        """Test that all the dependencies are installed with one command."""
+        dependencies = {
+            "b_package": {"version": "==0.1.0"},
+            "a_package": {"version": ">=1.0"},
+            "c_package": {"git": "https://github.com/an_user/a_repo.git", "ref": "v1"},
+        }
+        command = _get_pip_install_command(dependencies)
+        assert command == [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "a_package>=1.0",
+            "b_package==0.1.0",
+            "git+https://github.com/an_user/a_repo.git@v1#egg=c_package",
+        ]
+
+    def test_index_url(self):
+        """Test that the dependencies are installed from the given index only."""
+        command = _get_pip_install_command(
+            {"a_package": {"index": "https://test.pypi.org/simple"}},
+            index_url="https://test.pypi.org/simple",
+        )
+        assert command[4:] == [
+            "--index-url",
+            "https://test.pypi.org/simple",
+            "a_package",
+        ]
+
+    def test_offline(self):
+        """Test the command to install from a local directory only."""
+        dependencies = {"a_package": {"index": "https://test.pypi.org/simple"}}
+        command = _get_pip_install_command(
+            dependencies, find_links="wheelhouse", no_index=True
+        )
+        assert command[4:] == ["--no-index", "--find-links", "wheelhouse", "a_package"]
+
+
+def _make_wheel(wheelhouse: str, name: str, version: str) -> None:
+    """Write a minimal pure-Python wheel."""
+    dist_info = "{}-{}.dist-info".format(name, version)
+    files = {
+        "{}/__init__.py".format(name): '"""Test package."""\n',
+        "{}/METADATA".format(
+            dist_info
+        ): "Metadata-Version: 2.1\nName: {}\nVersion: {}\n".format(name, version),
+        "{}/WHEEL".format(
+            dist_info
+        ): "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+    }
+    files["{}/RECORD".format(dist_info)] = "".join(
+        "{},,\n".format(path) for path in [*files, "{}/RECORD".format(dist_info)]
+    )
+    wheel_path = os.path.join(
+        wheelhouse, "{}-{}-py3-none-any.whl".format(name, version)
+    )
+    with zipfile.ZipFile(wheel_path, "w") as wheel:
+        for path, content in files.items():
+            wheel.writestr(path, content)
+
+
+class TestInstallFromWheelhouse:
+    """Test that the dependencies can be installed offline from a local wheel cache."""
+
+    PACKAGE_NAME = "aea_test_wheelhouse_package"
+
+    @classmethod
+    def setup_class(cls):
+        """Set the test up."""
+        cls.t = tempfile.mkdtemp()
+        _make_wheel(cls.t, cls.PACKAGE_NAME, "0.1.0")
+        ctx = ContextMock()
+        ctx.get_dependencies = mock.Mock(
+            return_value={
+                cls.PACKAGE_NAME: {
+                    "version": "==0.1.0",
+                    "index": "https://unreachable.index/simple",
+                }
+            }
+        )
+        do_install(ctx, find_links=cls.t, no_index=True)
+
+    def test_package_installed(self):
+        """Test that the package has been installed."""
+        subprocess.check_call(  # nosec
+            [sys.executable, "-c", "import {}".format(self.PACKAGE_NAME)]
+        )
+
+    @classmethod
+    def teardown_class(cls):
+        """Tear the test down."""
+        subprocess.call(  # nosec
+            [sys.executable, "-m", "pip", "uninstall", "-y", cls.PACKAGE_NAME]
+        )
+        shutil.rmtree(cls.t, ignore_errors=True)
@@ -48,6 +48,12 @@ class TestInteractCommand(AEATestCaseMany):
         self.run_install()
 
         agent_process = self.run_agent()
+        missing_strings = self.missing_from_output(
+            agent_process, ("Start processing messages...",), is_terminating=False
+        )
+        assert missing_strings == [], "Strings {} didn't appear in output.".format(
+            missing_strings
+        )
         interaction_process = self.run_interaction()
 
         check_strings = ("Starting AEA interaction channel...",)
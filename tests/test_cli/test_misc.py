@@ -60,6 +60,7 @@ Options:
 Commands:
   add              Add a resource to the agent.
   add-key          Add a private key to the wallet.
+  build            Build the agent image to speed up the agent startup.
   config           Read or modify a configuration.
   create           Create an agent.
   delete           Delete an agent.
@@ -49,7 +49,7 @@ class TestRemoveProtocolWithPublicId:
         cls.t = tempfile.mkdtemp()
         # copy the 'packages' directory in the parent of the agent folder.
         shutil.copytree(Path(CUR_PATH, "..", "packages"), Path(cls.t, "packages"))
-        cls.protocol_id = "fetchai/gym:0.3.0"
+        cls.protocol_id = "fetchai/gym:0.4.0"
         cls.protocol_name = "gym"
 
         os.chdir(cls.t)
@@ -111,7 +111,7 @@ class TestRemoveProtocolFailsWhenProtocolDoesNotExist:
         cls.agent_name = "myagent"
         cls.cwd = os.getcwd()
         cls.t = tempfile.mkdtemp()
-        cls.protocol_id = "fetchai/gym:0.3.0"
+        cls.protocol_id = "fetchai/gym:0.4.0"
 
         os.chdir(cls.t)
         result = cls.runner.invoke(
@@ -166,7 +166,7 @@ class TestRemoveProtocolFailsWhenExceptionOccurs:
         cls.t = tempfile.mkdtemp()
         # copy the 'packages' directory in the parent of the agent folder.
         shutil.copytree(Path(CUR_PATH, "..", "packages"), Path(cls.t, "packages"))
-        cls.protocol_id = "fetchai/gym:0.3.0"
+        cls.protocol_id = "fetchai/gym:0.4.0"
 
         os.chdir(cls.t)
         result = cls.runner.invoke(
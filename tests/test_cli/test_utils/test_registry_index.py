@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This test module contains the tests for aea.cli.utils.registry_index module."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aea.cli.utils.formatting import retrieve_details
+from aea.cli.utils.registry_index import RegistryIndex
+from aea.configurations.base import PackageType
+from aea.configurations.loader import ConfigLoader
+
+from tests.conftest import ROOT_DIR
+
+
+PACKAGES = (
+    ("protocols", "fipa", "protocol.yaml"),
+    ("protocols", "ml_trade", "protocol.yaml"),
+    ("skills", "echo", "skill.yaml"),
+    ("agents", "my_first_aea", "aea-config.yaml"),
+)
+
+
+class RegistryIndexTestCase(TestCase):
+    """Test case for the RegistryIndex class."""
+
+    def setUp(self):
+        """Set up a registry with a few packages, and an empty index directory."""
+        self.t = tempfile.mkdtemp()
+        self.registry = os.path.join(self.t, "packages")
+        self.index_directory = os.path.join(self.t, "index")
+        for item_type_plural, name, _ in PACKAGES:
+            shutil.copytree(
+                os.path.join(ROOT_DIR, "packages", "fetchai", item_type_plural, name),
+                os.path.join(self.registry, "fetchai", item_type_plural, name),
+            )
+
+    def _index(self) -> RegistryIndex:
+        """Make an index of the registry."""
+        return RegistryIndex(self.registry, index_directory=self.index_directory)
+
+    def _bump_mtime(self, path: str) -> None:
+        """Move the modification time of a path forward."""
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    def test_items(self):
+        """Test the details of the packages are those of the configuration files."""
+        for item_type_plural, name, config_file in PACKAGES:
+            loader = ConfigLoader.from_configuration_type(
+                PackageType(item_type_plural[:-1])
+            )
+            expected = retrieve_details(
+                name,
+                loader,
+                os.path.join(
+                    self.registry, "fetchai", item_type_plural, name, config_file
+                ),
+            )
+            assert expected in self._index().items(item_type_plural)
+        assert len(self._index().items("protocols")) == 2
+        assert self._index().items("contracts") == []
+
+    def test_items_from_index(self):
+        """Test the configuration files are not loaded again if they have not changed."""
+        expected = self._index().items("protocols")
+        assert os.listdir(self._index().index_path) == ["fetchai.protocols.json"]
+        with mock.patch.object(
+            ConfigLoader, "load", side_effect=AssertionError("Not indexed.")
+        ):
+            assert self._index().items("protocols") == expected
+
+    def test_items_added_and_removed(self):
+        """Test new and removed packages are noticed through the directory modification time."""
+        self._index().items("protocols")
+        shutil.rmtree(os.path.join(self.registry, "fetchai", "protocols", "fipa"))
+        shutil.copytree(
+            os.path.join(ROOT_DIR, "packages", "fetchai", "protocols", "gym"),
+            os.path.join(self.registry, "fetchai", "protocols", "gym"),
+        )
+        self._bump_mtime(os.path.join(self.registry, "fetchai", "protocols"))
+        names = [details["name"] for details in self._index().items("protocols")]
+        assert names == ["gym", "ml_trade"]
+
+        shutil.rmtree(os.path.join(self.registry, "fetchai"))
+        assert self._index().items("protocols") == []
+
+    def test_items_modified(self):
+        """Test modified configuration files are loaded again."""
+        self._index().items("protocols")
+        config_path = os.path.join(
+            self.registry, "fetchai", "protocols", "fipa", "protocol.yaml"
+        )
+        content = Path(config_path).read_text()
+        Path(config_path).write_text(
+            content.replace("description:", "description: Changed.", 1)
+        )
+        self._bump_mtime(config_path)
+        details = [
+            details
+            for details in self._index().items("protocols")
+            if details["name"] == "fipa"
+        ]
+        assert details[0]["description"].startswith("Changed.")
+
+    def test_get(self):
+        """Test the entry of a package holds its fingerprint."""
+        details = self._index().get("skills", "fetchai", "echo")
+        assert details["public_id"].startswith("fetchai/echo:")
+        assert "behaviours.py" in details["fingerprint"]
+        assert self._index().get("skills", "fetchai", "missing") is None
+        assert self._index().get("skills", "other_author", "echo") is None
+
+    def test_update_item(self):
+        """Test an item written to the registry is indexed."""
+        shutil.copytree(
+            os.path.join(ROOT_DIR, "packages", "fetchai", "protocols", "gym"),
+            os.path.join(self.registry, "fetchai", "protocols", "gym"),
+        )
+        self._index().update_item("protocols", "fetchai", "gym")
+        with mock.patch.object(
+            ConfigLoader, "load", side_effect=AssertionError("Not indexed.")
+        ):
+            assert self._index().get("protocols", "fetchai", "gym")["name"] == "gym"
+
+    def test_corrupted_index(self):
+        """Test a corrupted index file is rebuilt."""
+        index = self._index()
+        index.items("protocols")
+        Path(index.index_path, "fetchai.protocols.json").write_text("{")
+        assert len(self._index().items("protocols")) == 2
+
+    def test_save_not_writable(self):
+        """Test the index is not saved, without errors, if the index directory is not writable."""
+        Path(self.index_directory).write_text("")
+        assert len(self._index().items("protocols")) == 2
+
+    def tearDown(self):
+        """Tear the test down."""
+        shutil.rmtree(self.t, ignore_errors=True)
@@ -23,13 +23,18 @@ from builtins import FileNotFoundError
 from typing import cast
 from unittest import TestCase, mock
 
+import click
 from click import BadParameter, ClickException
 
 from jsonschema import ValidationError
 
 from yaml import YAMLError
 
-from aea.cli.utils.click_utils import AEAJsonPathType, PublicIdParameter
+from aea.cli.utils.click_utils import (
+    AEAJsonPathType,
+    LazyGroup,
+    PublicIdParameter,
+)
 from aea.cli.utils.config import (
     _init_cli_config,
     get_or_create_cli_config,
@@ -266,10 +271,8 @@ def _raise_validation_error(*args, **kwargs):
 class FindItemLocallyTestCase(TestCase):
     """Test case for find_item_locally method."""
 
-    @mock.patch("aea.cli.utils.package_utils.Path.exists", return_value=True)
     @mock.patch(
-        "aea.cli.utils.package_utils.ConfigLoader.from_configuration_type",
-        _raise_validation_error,
+        "aea.cli.utils.package_utils.RegistryIndex.get", _raise_validation_error,
     )
     def test_find_item_locally_bad_config(self, *mocks):
         """Test find_item_locally for bad config result."""
@@ -279,13 +282,20 @@ class FindItemLocallyTestCase(TestCase):
 
         self.assertIn("configuration file not valid", cm.exception.message)
 
-    @mock.patch("aea.cli.utils.package_utils.Path.exists", return_value=True)
-    @mock.patch("aea.cli.utils.package_utils.Path.open", mock.mock_open())
+    @mock.patch("aea.cli.utils.package_utils.RegistryIndex.get", return_value=None)
+    def test_find_item_locally_not_found(self, *mocks):
+        """Test find_item_locally for not found result."""
+        public_id = PublicIdMock.from_str("fetchai/echo:0.3.0")
+        with self.assertRaises(ClickException) as cm:
+            find_item_locally(ContextMock(), "skill", public_id)
+
+        self.assertIn("Cannot find skill", cm.exception.message)
+
     @mock.patch(
-        "aea.cli.utils.package_utils.ConfigLoader.from_configuration_type",
-        return_value=ConfigLoaderMock(),
+        "aea.cli.utils.package_utils.RegistryIndex.get",
+        return_value={"author": "fetchai", "version": "0.2.0"},
     )
-    def test_find_item_locally_cant_find(self, from_conftype_mock, *mocks):
+    def test_find_item_locally_cant_find(self, *mocks):
         """Test find_item_locally for can't find result."""
         public_id = PublicIdMock.from_str("fetchai/echo:0.3.0")
         with self.assertRaises(ClickException) as cm:
@@ -398,6 +408,32 @@ class AEAJsonPathTypeTestCase(TestCase):
             obj.convert(value, "param", "ctx")
 
 
+class LazyGroupTestCase(TestCase):
+    """Test case for LazyGroup class."""
+
+    def setUp(self):
+        """Set up the test case."""
+        self.group = LazyGroup(name="group")
+        self.group.add_lazy_command("run", "aea.cli.run:run")
+        self.ctx = click.Context(self.group)
+
+    def test_list_commands_does_not_import(self):
+        """Test that listing the subcommands does not load them."""
+        self.assertEqual(self.group.list_commands(self.ctx), ["run"])
+        self.assertEqual(self.group.commands, {})
+
+    def test_get_command_positive(self):
+        """Test that the subcommand is loaded on first use."""
+        from aea.cli.run import run  # pylint: disable=import-outside-toplevel
+
+        self.assertIs(self.group.get_command(self.ctx, "run"), run)
+        self.assertIs(self.group.commands["run"], run)
+
+    def test_get_command_unknown(self):
+        """Test that an unknown subcommand is not found."""
+        self.assertIsNone(self.group.get_command(self.ctx, "unknown"))
+
+
 @mock.patch("aea.cli.utils.package_utils.LedgerApis", mock.MagicMock())
 class TryGetBalanceTestCase(TestCase):
     """Test case for try_get_balance method."""
@@ -21,7 +21,7 @@ import io
 from enum import Enum
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, List, Sequence
+from typing import Any, Dict, List, Sequence
 from unittest import TestCase
 
 from jsonschema.exceptions import ValidationError  # type: ignore
@@ -35,6 +35,7 @@ from aea.aea_builder import AEABuilder
 from aea.configurations.base import AgentConfig, PackageType
 from aea.configurations.loader import ConfigLoader
 from aea.helpers.exception_policy import ExceptionPolicyEnum
+from aea.multiplexer import OutBoxPolicy
 
 from tests.conftest import ROOT_DIR
 
@@ -250,3 +251,128 @@ class TestRuntimeModeConfigVariable(BaseConfigTestVariable):
     REQUIRED = False
     AEA_ATTR_NAME = "_runtime_mode"
     AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_RUNTIME_MODE
+
+
+class TestPriorityLanesConfigVariable(BaseConfigTestVariable):
+    """Test `priority_lanes` aea config option."""
+
+    OPTION_NAME = "priority_lanes"
+    CONFIG_ATTR_NAME = "priority_lanes"
+    GOOD_VALUES = [
+        {"ledger": {"weight": 4, "protocols": ["fetchai/ledger_api:0.1.0"]}},
+        {
+            "ledger": {"weight": 4, "protocols": ["fetchai/ledger_api:0.1.0"]},
+            "default": {"weight": 2},
+        },
+    ]
+    INCORRECT_VALUES = [
+        None,
+        "sTrING?",
+        {"ledger": {"protocols": ["fetchai/ledger_api:0.1.0"]}},
+        {"ledger": {"weight": 0}},
+        {"ledger": {"weight": 1, "protocols": ["not a public id"]}},
+        {"ledger": {"weight": 1, "priority": 1}},
+    ]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = {}  # type: ignore
+
+    def test_no_variable_passed(self) -> None:
+        """Test option not specified in config."""
+        configuration = self._make_configuration(NotSet)
+        assert configuration.priority_lanes == {}
+        assert "priority_lanes" not in configuration.json
+
+    def test_good_value_passed(self) -> None:
+        """Test correct values parsed, set and dumped."""
+        super().test_good_value_passed()
+        for good_value in self.GOOD_VALUES:
+            configuration = self._make_configuration(good_value)
+            assert configuration.json["priority_lanes"] == good_value
+            assert (
+                AgentConfig.from_json(configuration.json).priority_lanes == good_value
+            )
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the priority lanes of the AEA in the configuration format."""
+        result = {}  # type: Dict[str, Dict[str, Any]]
+        for lane in aea.multiplexer.priority_lanes:
+            result[lane.name] = {"weight": lane.weight}
+            if lane.protocols:
+                result[lane.name]["protocols"] = sorted(map(str, lane.protocols))
+        return result
+
+
+class TestInQueueHighWatermarkConfigVariable(BaseConfigTestVariable):
+    """Test `in_queue_high_watermark` aea config option."""
+
+    OPTION_NAME = "in_queue_high_watermark"
+    CONFIG_ATTR_NAME = "in_queue_high_watermark"
+    GOOD_VALUES = [1, 1000]
+    INCORRECT_VALUES = ["sTrING?", 0, 1.1]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = None
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the high watermark of the in queue of the AEA."""
+        return aea.multiplexer._in_queue_high_watermark
+
+
+class TestInQueueLowWatermarkConfigVariable(BaseConfigTestVariable):
+    """Test `in_queue_low_watermark` aea config option."""
+
+    OPTION_NAME = "in_queue_low_watermark"
+    CONFIG_ATTR_NAME = "in_queue_low_watermark"
+    BASE_CONFIG = base_config + "in_queue_high_watermark: 1000\n"
+    GOOD_VALUES = [0, 100]
+    INCORRECT_VALUES = ["sTrING?", -1, 1.1]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = 500
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the low watermark of the in queue of the AEA."""
+        return aea.multiplexer._in_queue_low_watermark
+
+
+class TestOutQueueMaxsizeConfigVariable(BaseConfigTestVariable):
+    """Test `out_queue_maxsize` aea config option."""
+
+    OPTION_NAME = "out_queue_maxsize"
+    CONFIG_ATTR_NAME = "out_queue_maxsize"
+    GOOD_VALUES = [0, 1000]
+    INCORRECT_VALUES = ["sTrING?", -1, 1.1]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_OUT_QUEUE_MAXSIZE
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the maximum size of the out queue of the AEA."""
+        return aea.multiplexer._out_queue_maxsize
+
+
+class TestOutboxPolicyConfigVariable(BaseConfigTestVariable):
+    """Test `outbox_policy` aea config option."""
+
+    OPTION_NAME = "outbox_policy"
+    CONFIG_ATTR_NAME = "outbox_policy"
+    GOOD_VALUES = OutBoxPolicy  # type: ignore
+    INCORRECT_VALUES = [None, "sTrING?", -1]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_OUTBOX_POLICY
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the policy of the outbox of the AEA."""
+        return aea.outbox.policy
+
+
+class TestOutboxTimeoutConfigVariable(BaseConfigTestVariable):
+    """Test `outbox_timeout` aea config option."""
+
+    OPTION_NAME = "outbox_timeout"
+    CONFIG_ATTR_NAME = "outbox_timeout"
+    GOOD_VALUES = [0, 1.1]
+    INCORRECT_VALUES = ["sTrING?", -1]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = None
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the timeout of the outbox of the AEA."""
+        return aea.outbox._timeout
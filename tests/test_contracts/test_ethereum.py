@@ -36,7 +36,7 @@ from aea.contracts import contract_registry
 from aea.contracts.base import Contract
 from aea.crypto.registries import ledger_apis_registry
 
-from tests.conftest import ROOT_DIR
+from tests.conftest import ETHEREUM_ADDRESS_ONE, ROOT_DIR
 
 
 @pytest.fixture()
@@ -76,3 +76,29 @@ def test_get_instance_no_address(dummy_contract):
     )
     instance = dummy_contract.get_instance(ledger_api)
     assert type(instance) == web3._utils.datatypes.PropertyCheckingFactory
+
+
+def test_get_instance_cached(dummy_contract):
+    """Tests the contract instances are cached by the ledger API, and can be cleared."""
+    ledger_api = ledger_apis_registry.make(
+        "ethereum",
+        address="https://ropsten.infura.io/v3/f00f7b3ba0e848ddbdc8941c527447fe",
+    )
+    instance = dummy_contract.get_instance(ledger_api)
+    assert dummy_contract.get_instance(ledger_api) is instance
+    instance_at_address = dummy_contract.get_instance(ledger_api, ETHEREUM_ADDRESS_ONE)
+    assert instance_at_address is not instance
+    assert (
+        dummy_contract.get_instance(ledger_api, ETHEREUM_ADDRESS_ONE)
+        is instance_at_address
+    )
+
+    ledger_api.clear_contract_instances(contract_address=ETHEREUM_ADDRESS_ONE)
+    assert (
+        dummy_contract.get_instance(ledger_api, ETHEREUM_ADDRESS_ONE)
+        is not instance_at_address
+    )
+    assert dummy_contract.get_instance(ledger_api) is instance
+
+    ledger_api.clear_contract_instances(dummy_contract.contract_interface)
+    assert dummy_contract.get_instance(ledger_api) is not instance
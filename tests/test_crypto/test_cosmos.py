@@ -18,12 +18,18 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the tests of the ethereum module."""
+import json
 import logging
+import socket
+import threading
 import time
-from unittest.mock import MagicMock
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from aea.crypto.base import RecoveryCache
 from aea.crypto.cosmos import CosmosApi, CosmosCrypto, CosmosFaucetApi
 
 from tests.conftest import (
@@ -66,6 +72,42 @@ def test_sign_and_recover_message():
     ), "Failed to recover the correct address."
 
 
+def test_recover_messages():
+    """Test the batch recovery of signed messages, in the process."""
+    account = CosmosCrypto(COSMOS_PRIVATE_KEY_PATH)
+    signature = account.sign_message(message=b"hello")
+    other_signature = account.sign_message(message=b"hello again")
+    CosmosApi.recover_message.cache.clear()
+    results = CosmosApi.recover_messages(
+        [
+            (b"hello", signature, False),
+            (b"hello again", other_signature, False),
+            (b"hello", signature, False),
+        ]
+    )
+    assert len(results) == 3
+    assert all(account.address in addresses for addresses in results)
+    assert results[0] == results[2] == CosmosApi.recover_message(b"hello", signature)
+    assert len(CosmosApi.recover_message.cache) == 2
+
+
+def test_recovery_cache_bounded():
+    """Test the recovery cache evicts the least recently used recoveries."""
+    cache = RecoveryCache(maxsize=2)
+    keys = [RecoveryCache.key(b"message", str(i)) for i in range(3)]
+    assert keys[0] != RecoveryCache.key(b"message", "0", is_deprecated_mode=True)
+    cache.put(keys[0], ("address_0",))
+    cache.put(keys[1], ("address_1",))
+    assert cache.get(keys[0]) == ("address_0",)
+    cache.put(keys[2], ("address_2",))
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == ("address_0",)
+    assert cache.get(keys[2]) == ("address_2",)
+    cache.clear()
+    assert cache.get(keys[0]) is None
+
+
 def test_dump_positive():
     """Test dump."""
     account = CosmosCrypto(COSMOS_PRIVATE_KEY_PATH)
@@ -169,3 +211,231 @@ def test_get_wealth_positive(caplog):
         cc = CosmosCrypto()
         cosmos_faucet_api.get_wealth(cc.address)
         assert "Wealth generated" in caplog.text
+
+
+class _MockCosmosRestServer(ThreadingMixIn, HTTPServer):
+    """A mock of the account and transaction endpoints of the Cosmos REST API."""
+
+    ACCOUNT_NUMBER = 42
+    daemon_threads = True
+
+    def __init__(self):
+        """Initialize the server on a free port."""
+        super().__init__(("127.0.0.1", 0), _MockCosmosRestHandler)
+        self.sequences = {}
+        # whether the transactions are settled when they are accepted, or kept in the mempool.
+        self.settle = True
+        self.unsettled = {}
+        self.account_requests = 0
+        self.connections = 0
+        self.txs = []
+
+    @property
+    def address(self) -> str:
+        """Get the address of the server."""
+        return "http://{}:{}".format(*self.server_address)
+
+
+class _MockCosmosRestHandler(BaseHTTPRequestHandler):
+    """Handle the requests to the mock Cosmos REST API."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        """Count the connections."""
+        super().setup()
+        self.server.connections += 1
+
+    def _reply(self, status: int, body: dict) -> None:
+        """Send a JSON response."""
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Get the account number and the sequence of the settled transactions of an account."""
+        address = self.path.split("/")[-1]
+        self.server.account_requests += 1
+        sequence = self.server.sequences.get(address, 0) - self.server.unsettled.get(
+            address, 0
+        )
+        value = {
+            "account_number": str(self.server.ACCOUNT_NUMBER),
+            "sequence": str(sequence),
+        }
+        self._reply(200, {"result": {"value": value}})
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Accept a transaction if its sequence is the next one of its sender."""
+        tx = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        address = tx["tx"]["msg"][0]["value"]["from_address"]
+        signature = tx["tx"]["signatures"][0]
+        expected_sequence = self.server.sequences.get(address, 0)
+        if int(signature["sequence"]) != expected_sequence or int(
+            signature["account_number"]
+        ) != (self.server.ACCOUNT_NUMBER):
+            self._reply(500, {"error": "signature verification failed"})
+            return
+        self.server.sequences[address] = expected_sequence + 1
+        if not self.server.settle:
+            self.server.unsettled[address] = self.server.unsettled.get(address, 0) + 1
+        self.server.txs.append(tx)
+        self._reply(
+            200, {"height": "0", "txhash": "{:064X}".format(len(self.server.txs))}
+        )
+
+    def log_message(self, *args):
+        """Do not log the requests."""
+
+
+@pytest.fixture
+def mock_cosmos_rest_server():
+    """Run a mock Cosmos REST API in a thread."""
+    server = _MockCosmosRestServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _transfer(cosmos_api: CosmosApi, account: CosmosCrypto, destination: str):
+    """Build a transfer transaction of an account."""
+    return cosmos_api.get_transfer_transaction(
+        sender_address=account.address,
+        destination_address=destination,
+        amount=1000,
+        tx_fee=100,
+        tx_nonce="something",
+    )
+
+
+def test_sequences_allocated_locally(mock_cosmos_rest_server):
+    """Test the sequences are retrieved once, and the transactions sent without waiting for the receipts."""
+    cosmos_api = CosmosApi(address=mock_cosmos_rest_server.address)
+    account = CosmosCrypto()
+    destination = CosmosCrypto().address
+    transactions = [_transfer(cosmos_api, account, destination) for _ in range(5)]
+    assert mock_cosmos_rest_server.account_requests == 1
+    assert [tx["sequence"] for tx in transactions] == ["0", "1", "2", "3", "4"]
+    assert {tx["account_number"] for tx in transactions} == {"42"}
+
+    for tx in transactions:
+        tx_digest = cosmos_api.send_signed_transaction(account.sign_transaction(tx))
+        assert tx_digest is not None
+    assert len(mock_cosmos_rest_server.txs) == 5
+
+
+def test_sequence_resynchronised_on_failed_send(mock_cosmos_rest_server):
+    """Test the sequence is retrieved again after a transaction could not be sent."""
+    cosmos_api = CosmosApi(address=mock_cosmos_rest_server.address)
+    account = CosmosCrypto()
+    destination = CosmosCrypto().address
+    tx = _transfer(cosmos_api, account, destination)
+    assert cosmos_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+
+    # a transaction sent from elsewhere, e.g. another agent with the same key.
+    mock_cosmos_rest_server.sequences[account.address] += 1
+
+    stale_tx = _transfer(cosmos_api, account, destination)
+    assert stale_tx["sequence"] == "1"
+    assert (
+        cosmos_api.send_signed_transaction(account.sign_transaction(stale_tx)) is None
+    )
+
+    tx = _transfer(cosmos_api, account, destination)
+    assert mock_cosmos_rest_server.account_requests == 2
+    assert tx["sequence"] == "2"
+    assert cosmos_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+
+
+def test_unsettled_sequences_not_reused_on_failed_send(mock_cosmos_rest_server):
+    """Test the sequences of the transactions not yet settled are not allocated again after a transaction could not be sent."""
+    mock_cosmos_rest_server.settle = False
+    cosmos_api = CosmosApi(address=mock_cosmos_rest_server.address)
+    account = CosmosCrypto()
+    destination = CosmosCrypto().address
+    for _ in range(2):
+        tx = _transfer(cosmos_api, account, destination)
+        assert (
+            cosmos_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+        )
+
+    failed_tx = _transfer(cosmos_api, account, destination)
+    with patch.object(cosmos_api, "_try_send_signed_transaction", return_value=None):
+        assert (
+            cosmos_api.send_signed_transaction(account.sign_transaction(failed_tx))
+            is None
+        )
+
+    tx = _transfer(cosmos_api, account, destination)
+    assert mock_cosmos_rest_server.account_requests == 2
+    assert tx["sequence"] == failed_tx["sequence"] == "2"
+    assert cosmos_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+
+
+def test_sequence_resynchronised_after_gap(mock_cosmos_rest_server):
+    """Test the sequence is retrieved again after the resync timeout, when a transaction was built but not sent."""
+    cosmos_api = CosmosApi(
+        address=mock_cosmos_rest_server.address, nonce_resync_timeout=0.1
+    )
+    account = CosmosCrypto()
+    destination = CosmosCrypto().address
+    abandoned_tx = _transfer(cosmos_api, account, destination)
+    assert abandoned_tx["sequence"] == "0"
+
+    time.sleep(0.2)
+    tx = _transfer(cosmos_api, account, destination)
+    assert mock_cosmos_rest_server.account_requests == 2
+    assert tx["sequence"] == "0"
+    assert cosmos_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+
+
+def test_sequences_kept_when_sender_unknown(mock_cosmos_rest_server):
+    """Test the sequences are not reset when the sender of a transaction which could not be sent is unknown."""
+    cosmos_api = CosmosApi(address=mock_cosmos_rest_server.address)
+    account = CosmosCrypto()
+    destination = CosmosCrypto().address
+    tx = _transfer(cosmos_api, account, destination)
+    assert cosmos_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+
+    with patch.object(cosmos_api, "_try_send_signed_transaction", return_value=None):
+        assert cosmos_api.send_signed_transaction({"tx": {}}) is None
+
+    tx = _transfer(cosmos_api, account, destination)
+    assert mock_cosmos_rest_server.account_requests == 1
+    assert tx["sequence"] == "1"
+
+
+def test_http_connections_kept_alive(mock_cosmos_rest_server):
+    """Test the requests to the REST API reuse the same connection."""
+    cosmos_api = CosmosApi(address=mock_cosmos_rest_server.address)
+    account = CosmosCrypto()
+    destination = CosmosCrypto().address
+    for _ in range(3):
+        tx = _transfer(cosmos_api, account, destination)
+        assert (
+            cosmos_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+        )
+    cosmos_api._nonce_manager.reset()
+    assert _transfer(cosmos_api, account, destination)["sequence"] == "3"
+    assert mock_cosmos_rest_server.account_requests == 2
+    assert mock_cosmos_rest_server.connections == 1
+
+
+def test_http_timeout():
+    """Test the requests to the REST API time out."""
+    with socket.socket() as server_socket:
+        # the connections are accepted by the system, but never answered.
+        server_socket.bind(("127.0.0.1", 0))
+        server_socket.listen(1)
+        cosmos_api = CosmosApi(
+            address="http://{}:{}".format(*server_socket.getsockname()), timeout=0.2
+        )
+        start_time = time.time()
+        assert cosmos_api.get_balance(CosmosCrypto().address) is None
+        assert time.time() - start_time < 5
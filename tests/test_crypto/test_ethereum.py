@@ -21,13 +21,21 @@
 
 import hashlib
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from unittest import mock
 from unittest.mock import MagicMock
 
 import eth_account
 
+from eth_tester import EthereumTester
+
 import pytest
 
+from web3 import EthereumTesterProvider, Web3
+
 from aea.crypto.ethereum import EthereumApi, EthereumCrypto, EthereumFaucetApi
 
 from tests.conftest import (
@@ -95,6 +103,56 @@ def test_sign_and_recover_message_deprecated():
     ), "Failed to recover the correct address."
 
 
+def test_recover_message_cached():
+    """Test the recovered addresses of a signed message are cached."""
+    account = EthereumCrypto(ETHEREUM_PRIVATE_KEY_PATH)
+    message = b"hello cache"
+    signature = account.sign_message(message=message)
+    EthereumApi.recover_message.cache.clear()
+    with mock.patch.object(
+        eth_account.Account,
+        "recover_message",
+        wraps=eth_account.Account.recover_message,
+    ) as recover_mock:
+        for _ in range(3):
+            assert EthereumApi.recover_message(message, signature) == (account.address,)
+        assert EthereumApi.recover_message(message, signature, False) == (
+            account.address,
+        )
+    recover_mock.assert_called_once()
+    assert len(EthereumApi.recover_message.cache) == 1
+
+
+def test_recover_messages():
+    """Test the batch recovery of signed messages, in worker processes."""
+    account = EthereumCrypto(ETHEREUM_PRIVATE_KEY_PATH)
+    requests = []
+    for i in range(150):
+        message = "batch message {}".format(i).encode("utf-8")
+        requests.append((message, account.sign_message(message=message), False))
+    message_hash = hashlib.sha256(b"batch hash").digest()
+    requests.append(
+        (
+            message_hash,
+            account.sign_message(message=message_hash, is_deprecated_mode=True),
+            True,
+        )
+    )
+    # duplicated requests are recovered once.
+    requests.extend(requests[:10])
+    EthereumApi.recover_message.cache.clear()
+    results = EthereumApi.recover_messages(requests, processes=2)
+    assert results == [(account.address,)] * len(requests)
+    assert len(EthereumApi.recover_message.cache) == 151
+
+    # all the recoveries are now cached.
+    with mock.patch(
+        "aea.crypto.base._recover_messages_uncached", return_value=[]
+    ) as recover_mock:
+        assert EthereumApi.recover_messages(requests) == results
+    recover_mock.assert_called_once_with(EthereumApi, [])
+
+
 def test_dump_positive():
     """Test dump."""
     account = EthereumCrypto(ETHEREUM_PRIVATE_KEY_PATH)
@@ -191,3 +249,147 @@ def test_get_wealth_positive(caplog):
         assert (
             "Response: " in caplog.text
         ), f"Cannot find message in output: {caplog.text}"
+
+
+def _tester_api() -> EthereumApi:
+    """Get an Ethereum API to an in-process chain."""
+    config = dict(ETHEREUM_TESTNET_CONFIG)  # type: Dict[str, Any]
+    ethereum_api = EthereumApi(**config)
+    ethereum_api._api = Web3(EthereumTesterProvider(EthereumTester()))
+    return ethereum_api
+
+
+def _funded_account(ethereum_api: EthereumApi) -> EthereumCrypto:
+    """Get a new account, funded by an account of the in-process chain."""
+    account = EthereumCrypto()
+    web3 = ethereum_api.api
+    web3.eth.sendTransaction(
+        {"from": web3.eth.accounts[0], "to": account.address, "value": 10 ** 19}
+    )
+    return account
+
+
+def _transfer(ethereum_api: EthereumApi, account: EthereumCrypto, destination: str):
+    """Build a transfer transaction of an account."""
+    return ethereum_api.get_transfer_transaction(
+        sender_address=account.address,
+        destination_address=destination,
+        amount=1000,
+        tx_fee=30000,
+        tx_nonce="0x",
+        chain_id=ethereum_api.api.eth.chainId,
+    )
+
+
+def test_nonces_allocated_locally():
+    """Test the nonces are retrieved once, and the transactions sent without waiting for the receipts."""
+    ethereum_api = _tester_api()
+    account = _funded_account(ethereum_api)
+    destination = EthereumCrypto().address
+    with mock.patch.object(
+        ethereum_api,
+        "_try_get_transaction_count",
+        wraps=ethereum_api._try_get_transaction_count,
+    ) as get_transaction_count:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            transactions = list(
+                executor.map(
+                    lambda _: _transfer(ethereum_api, account, destination), range(8)
+                )
+            )
+        assert get_transaction_count.call_count == 1
+    assert sorted(tx["nonce"] for tx in transactions) == list(range(8))
+
+    tx_digests = [
+        ethereum_api.send_signed_transaction(account.sign_transaction(tx))
+        for tx in sorted(transactions, key=lambda tx: tx["nonce"])
+    ]
+    assert None not in tx_digests
+    assert ethereum_api.get_balance(destination) == 8 * 1000
+
+
+def test_nonce_resynchronised_on_failed_send():
+    """Test the nonce is retrieved again after a transaction could not be sent."""
+    ethereum_api = _tester_api()
+    account = _funded_account(ethereum_api)
+    destination = EthereumCrypto().address
+    first_tx = _transfer(ethereum_api, account, destination)
+    assert (
+        ethereum_api.send_signed_transaction(account.sign_transaction(first_tx))
+        is not None
+    )
+
+    # a transaction sent with the same nonce from elsewhere, e.g. another agent with the same key.
+    external_tx = dict(first_tx, nonce=first_tx["nonce"] + 1)
+    ethereum_api.api.eth.sendRawTransaction(
+        account.sign_transaction(external_tx).rawTransaction
+    )
+
+    stale_tx = _transfer(ethereum_api, account, destination)
+    assert stale_tx["nonce"] == external_tx["nonce"]
+    assert (
+        ethereum_api.send_signed_transaction(account.sign_transaction(stale_tx)) is None
+    )
+
+    tx = _transfer(ethereum_api, account, destination)
+    assert tx["nonce"] == external_tx["nonce"] + 1
+    assert (
+        ethereum_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+    )
+
+
+def test_nonce_resynchronised_after_gap():
+    """Test the nonce is retrieved again after the resync timeout, when a transaction was built but not sent."""
+    ethereum_api = _tester_api()
+    ethereum_api._nonce_manager.resync_timeout = 0.1
+    account = _funded_account(ethereum_api)
+    destination = EthereumCrypto().address
+    abandoned_tx = _transfer(ethereum_api, account, destination)
+
+    time.sleep(0.2)
+    tx = _transfer(ethereum_api, account, destination)
+    assert tx["nonce"] == abandoned_tx["nonce"]
+    assert (
+        ethereum_api.send_signed_transaction(account.sign_transaction(tx)) is not None
+    )
+
+
+def test_nonces_kept_when_sender_unknown():
+    """Test the nonces are not reset when the sender of a transaction which could not be sent is unknown."""
+    ethereum_api = _tester_api()
+    account = _funded_account(ethereum_api)
+    destination = EthereumCrypto().address
+    tx = _transfer(ethereum_api, account, destination)
+    with mock.patch.object(
+        ethereum_api,
+        "_try_get_transaction_count",
+        wraps=ethereum_api._try_get_transaction_count,
+    ) as get_transaction_count:
+        assert ethereum_api.send_signed_transaction(object()) is None
+        next_tx = _transfer(ethereum_api, account, destination)
+        get_transaction_count.assert_not_called()
+    assert next_tx["nonce"] == tx["nonce"] + 1
+
+
+def test_nonce_retrieval_does_not_block_other_senders():
+    """Test the nonce of a sender is allocated while the transaction count of another one is retrieved."""
+    ethereum_api = _tester_api()
+    slow_sender, sender = EthereumCrypto().address, EthereumCrypto().address
+    retrieving, retrieved = threading.Event(), threading.Event()
+    get_transaction_count = ethereum_api._try_get_transaction_count
+
+    def _get_transaction_count(address: str) -> Optional[int]:
+        if address == slow_sender:
+            retrieving.set()
+            assert retrieved.wait(5)
+        return get_transaction_count(address)
+
+    with mock.patch.object(
+        ethereum_api, "_try_get_transaction_count", side_effect=_get_transaction_count
+    ):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            slow_nonce = executor.submit(ethereum_api.allocate_nonce, slow_sender)
+            assert retrieving.wait(5)
+            assert ethereum_api.allocate_nonce(sender) == 0
+            retrieved.set()
+            assert slow_nonce.result() == 0
@@ -20,6 +20,7 @@
 """This module contains the tests of the ethereum module."""
 import logging
 import time
+from unittest import mock
 from unittest.mock import MagicMock
 
 from fetchai.ledger.transaction import Transaction
@@ -86,6 +87,22 @@ def test_api_none():
     assert fetchai_api.api is not None, "The api property is None."
 
 
+def test_api_http_session():
+    """Test the endpoints of the api share a pooled HTTP session."""
+    with mock.patch("aea.crypto.fetchai.FetchaiLedgerApi") as fetchai_ledger_api:
+        fetchai_api = FetchAIApi(host="127.0.0.1", port=8000, pool_size=4, timeout=5)
+    fetchai_ledger_api.assert_called_once_with(host="127.0.0.1", port=8000)
+    api = fetchai_api.api
+    session = api.tokens._session
+    assert all(
+        endpoint._session is session
+        for endpoint in (api.contracts, api.tx, api.server, api.governance)
+    )
+    adapter = session.get_adapter("https://127.0.0.1:8000")
+    assert adapter._timeout == 5
+    assert adapter._pool_maxsize == 4
+
+
 def test_generate_nonce():
     """Test generate nonce."""
     nonce = FetchAIApi.generate_tx_nonce(
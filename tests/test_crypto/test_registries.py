@@ -19,11 +19,19 @@
 
 """This module contains tests for aea.crypto.registries"""
 
+import subprocess  # nosec
+import sys
 from typing import Optional
 
 from aea.crypto.base import Crypto
-from aea.crypto.fetchai import FetchAIApi, FetchAICrypto
-from aea.crypto.registries import make_crypto, make_ledger_api
+from aea.crypto.fetchai import FetchAIApi, FetchAICrypto, FetchAIFaucetApi
+from aea.crypto.registries import (
+    faucet_apis_registry,
+    ledger_apis_registry,
+    make_crypto,
+    make_faucet_api,
+    make_ledger_api,
+)
 from aea.crypto.registries.base import ItemId, Registry
 
 
@@ -80,3 +88,26 @@ def test_registry():
     registry = Registry[Crypto]()
     item_id = ItemId("fetchai")
     assert not registry.has_spec(item_id), "Registry should be empty"
+
+
+def test_make_faucet_api_fetchai_positive():
+    """Test make_faucet_api for fetchai."""
+    faucet_api = make_faucet_api("fetchai")
+    assert isinstance(faucet_api, FetchAIFaucetApi)
+    assert "fetchai" in faucet_apis_registry.supported_ids
+
+
+def test_get_class():
+    """Test that the registry returns the class of an item."""
+    assert ledger_apis_registry.get_class("fetchai") is FetchAIApi
+
+
+def test_ledger_backends_are_imported_lazily():
+    """Test that importing the framework does not import the ledger backends."""
+    code = (
+        "import sys; import aea.aea_builder; import aea.cli.core; "
+        "backends = ['aea.crypto.fetchai', 'aea.crypto.ethereum', 'aea.crypto.cosmos']; "
+        "print([m for m in backends if m in sys.modules])"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code])  # nosec
+    assert output.decode().strip() == "[]"
@@ -550,3 +550,87 @@ class TestDecisionMaker2:
         """Tear the tests down."""
         cls._unpatch_logger()
         cls.decision_maker.stop()
+
+
+class TestDecisionMakerBatches:
+    """Test the decision maker handles the queued messages in batches."""
+
+    @classmethod
+    def setup_class(cls):
+        """Initialise a decision maker which is not started."""
+        private_key_pem_path = os.path.join(CUR_PATH, "data", "fet_private_key.txt")
+        cls.wallet = Wallet({FetchAICrypto.identifier: private_key_pem_path})
+        cls.identity = Identity(
+            "test",
+            addresses=cls.wallet.addresses,
+            default_address_key=FetchAICrypto.identifier,
+        )
+        cls.decision_maker_handler = DecisionMakerHandler(
+            identity=cls.identity, wallet=cls.wallet
+        )
+        cls.decision_maker = DecisionMaker(cls.decision_maker_handler, max_batch_size=3)
+
+    def _signing_message(self, ledger_id: str) -> SigningMessage:
+        """Make a message signing request."""
+        signing_msg = SigningMessage(
+            performative=SigningMessage.Performative.SIGN_MESSAGE,
+            dialogue_reference=SigningDialogues(
+                "agent"
+            ).new_self_initiated_dialogue_reference(),
+            skill_callback_ids=(str(PublicId("author", "a_skill", "0.1.0")),),
+            skill_callback_info={},
+            terms=Terms(
+                ledger_id=ledger_id,
+                sender_address="pk1",
+                counterparty_address="pk2",
+                amount_by_currency_id={"FET": -1},
+                is_sender_payable_tx_fee=True,
+                quantities_by_good_id={"good_id": 10},
+                nonce="transaction nonce",
+            ),
+            raw_message=RawMessage(ledger_id, b"message"),
+        )
+        signing_msg.counterparty = "decision_maker"
+        return signing_msg
+
+    def test_protected_get_batch(self):
+        """Test the in queue gives the queued messages up to the batch size."""
+        in_queue = self.decision_maker.message_in_queue
+        access_code = self.decision_maker._queue_access_code
+        with pytest.raises(ValueError):
+            in_queue.protected_get_batch("some_invalid_code", 3)
+        messages = [self._signing_message("fetchai") for _ in range(4)]
+        for message in messages:
+            in_queue.put_nowait(message)
+        assert in_queue.protected_get_batch(access_code, 3) == messages[:3]
+        assert in_queue.protected_get_batch(access_code, 3) == messages[3:]
+        assert in_queue.empty()
+
+    def test_handle_batch(self):
+        """Test the responses of a batch are put on the out queue together, in order."""
+        messages = [
+            self._signing_message("fetchai"),
+            self._signing_message("unknown"),
+            self._signing_message("fetchai"),
+        ]
+        with mock.patch.object(
+            self.decision_maker.message_out_queue,
+            "put_many",
+            wraps=self.decision_maker.message_out_queue.put_many,
+        ) as put_many:
+            self.decision_maker.handle_batch(messages)
+        put_many.assert_called_once()
+        responses = [
+            self.decision_maker.message_out_queue.get_nowait() for _ in messages
+        ]
+        assert [response.target for response in responses] == [
+            message.message_id for message in messages
+        ]
+        assert [response.performative for response in responses] == [
+            SigningMessage.Performative.SIGNED_MESSAGE,
+            SigningMessage.Performative.ERROR,
+            SigningMessage.Performative.SIGNED_MESSAGE,
+        ]
+        assert [response.dialogue_reference[0] for response in responses] == [
+            message.dialogue_reference[0] for message in messages
+        ]
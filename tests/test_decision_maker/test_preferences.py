@@ -133,6 +133,37 @@ def test_marginal_utility():
     assert marginal_utility is not None, "Marginal utility must not be none."
 
 
+def test_marginal_utilities_by_good_id():
+    """Test the marginal utilities of the goods are those of changing each good on its own."""
+    utility_params = {"good_1": 20.0, "good_2": 10.0, "good_3": 5.0}
+    good_holdings = {"good_1": 2, "good_2": 0, "good_3": 5}
+    preferences = Preferences()
+    preferences.set(
+        utility_params_by_good_id=utility_params,
+        exchange_params_by_currency_id={"FET": 10.0},
+    )
+    ownership_state = OwnershipState()
+    ownership_state.set(
+        amount_by_currency_id={"FET": 100}, quantities_by_good_id=good_holdings,
+    )
+    for delta_quantity in (1, -1):
+        marginal_utilities = preferences.marginal_utilities_by_good_id(
+            ownership_state, delta_quantity
+        )
+        assert set(marginal_utilities.keys()) == set(good_holdings.keys())
+        for good_id in good_holdings.keys():
+            delta_good_holdings = {
+                other_good_id: delta_quantity if other_good_id == good_id else 0
+                for other_good_id in good_holdings.keys()
+            }
+            assert marginal_utilities[good_id] == pytest.approx(
+                preferences.marginal_utility(
+                    ownership_state=ownership_state,
+                    delta_quantities_by_good_id=delta_good_holdings,
+                )
+            )
+
+
 def test_score_diff_from_transaction():
     """Test the difference between the scores."""
     good_holdings = {"good_id": 2}
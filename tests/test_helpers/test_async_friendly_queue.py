@@ -25,7 +25,7 @@ from threading import Thread
 
 import pytest
 
-from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
+from aea.helpers.async_friendly_queue import AsyncFriendlyQueue, WeightedFairQueue
 
 
 def test_same_thread() -> None:
@@ -81,3 +81,122 @@ def test_many_threads_with_asyncio() -> None:
         t.join()
 
     assert len(results) == num_threads
+
+
+@pytest.mark.asyncio
+async def test_put_many() -> None:
+    """Test AsyncFriendlyQueue.put_many puts the items in order, and wakes up a waiter."""
+    sq = AsyncFriendlyQueue()
+    task = asyncio.ensure_future(sq.async_get())
+    await asyncio.sleep(0.01)
+    sq.put_many([])
+    assert not task.done()
+    sq.put_many(["item_1", "item_2", "item_3"])
+    assert await asyncio.wait_for(task, 1) == "item_1"
+    assert [sq.get_nowait(), sq.get_nowait()] == ["item_2", "item_3"]
+    assert sq.empty()
+
+    bounded_sq = AsyncFriendlyQueue(maxsize=5)
+    bounded_sq.put_many(["item_1", "item_2"])
+    assert [bounded_sq.get_nowait(), bounded_sq.get_nowait()] == ["item_1", "item_2"]
+
+
+@pytest.mark.asyncio
+async def test_async_wait_drained() -> None:
+    """Test waiting for the queue to be drained from another thread."""
+    sq = AsyncFriendlyQueue()
+    await asyncio.wait_for(sq.async_wait_drained(0), 1)
+    for _ in range(5):
+        sq.put("item")
+
+    waiter = asyncio.ensure_future(sq.async_wait_drained(2))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    def consume(count):
+        for _ in range(count):
+            time.sleep(0.01)
+            sq.get()
+
+    thread = Thread(target=consume, args=(2,))
+    thread.start()
+    await asyncio.sleep(0.1)
+    thread.join()
+    assert not waiter.done()
+
+    sq.get_nowait()
+    await asyncio.wait_for(waiter, 1)
+    assert sq.qsize() == 2
+    assert sq._drained_waiters == []
+
+
+@pytest.mark.asyncio
+async def test_async_wait_drained_cancelled() -> None:
+    """Test that a cancelled waiter is removed."""
+    sq = AsyncFriendlyQueue()
+    sq.put("item")
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(sq.async_wait_drained(0), 0.05)
+    assert sq._drained_waiters == []
+    sq.get()
+
+
+def _make_weighted_fair_queue(**weights: int) -> WeightedFairQueue:
+    """Make a queue of (lane, index) items."""
+    return WeightedFairQueue(weights, lambda item: item[0], "default")
+
+
+def test_weighted_fair_queue_fifo_within_lane() -> None:
+    """Test that items of the same lane are dequeued in FIFO order."""
+    sq = _make_weighted_fair_queue(default=1, high=3)
+    for i in range(5):
+        sq.put(("high", i))
+    assert [sq.get_nowait() for _ in range(5)] == [("high", i) for i in range(5)]
+    with pytest.raises(Empty):
+        sq.get_nowait()
+
+
+def test_weighted_fair_queue_shares() -> None:
+    """Test that the lanes are served proportionally to their weights."""
+    sq = _make_weighted_fair_queue(default=1, high=3)
+    for i in range(100):
+        sq.put(("default", i))
+    for i in range(30):
+        sq.put(("high", i))
+    assert sq.qsize() == 130
+    assert sq.lane_sizes() == {"default": 100, "high": 30}
+
+    first = [sq.get_nowait()[0] for _ in range(40)]
+    assert first.count("high") == 30
+    assert first.count("default") == 10
+    # the low-priority lane is not starved, even when the high-priority lane is busy
+    assert "default" in first[:4]
+    assert sq.lane_sizes() == {"default": 90, "high": 0}
+
+
+def test_weighted_fair_queue_unknown_lane() -> None:
+    """Test that items without a known lane go to the default lane."""
+    sq = _make_weighted_fair_queue(default=1)
+    sq.put(("unknown", 0))
+    sq.put((None, 1))
+    assert sq.lane_sizes() == {"default": 2}
+    assert sq.get() == ("unknown", 0)
+    assert sq.get() == (None, 1)
+
+
+def test_weighted_fair_queue_bad_values() -> None:
+    """Test the validation of the weights."""
+    with pytest.raises(AssertionError):
+        WeightedFairQueue({"high": 1}, lambda item: item, "default")
+    with pytest.raises(AssertionError):
+        WeightedFairQueue({"default": 0}, lambda item: item, "default")
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_queue_async_get() -> None:
+    """Test getting from the queue asynchronously."""
+    sq = _make_weighted_fair_queue(default=1, high=2)
+    getter = asyncio.ensure_future(sq.async_get())
+    await asyncio.sleep(0.01)
+    sq.put(("high", 0))
+    assert await asyncio.wait_for(getter, 1) == ("high", 0)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests for the fingerprint engine."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from aea.helpers.fingerprint import FileHashCache, FingerprintEngine
+from aea.helpers.ipfs.base import IPFSHashOnly
+
+from tests.conftest import ROOT_DIR
+
+ECHO_SKILL_PATH = Path(ROOT_DIR, "packages", "fetchai", "skills", "echo")
+
+
+def _expected_fingerprint(directory: Path) -> dict:
+    """Compute the fingerprint file by file."""
+    hasher = IPFSHashOnly()
+    return {
+        path.relative_to(directory).as_posix(): hasher.get(str(path))
+        for path in directory.glob("**/*")
+        if path.is_file() and (path.match("*.py") or not path.match("*.pyc"))
+    }
+
+
+class TestFingerprintEngine:
+    """Test the fingerprint engine."""
+
+    def setup(self):
+        """Set up the test."""
+        self.t = tempfile.mkdtemp()
+        self.package_path = Path(self.t, "echo")
+        shutil.copytree(
+            str(ECHO_SKILL_PATH),
+            str(self.package_path),
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        self.large_file = self.package_path / "large.bin"
+        self.large_file.write_bytes(os.urandom(FingerprintEngine.PARALLEL_MIN_SIZE * 2))
+        (self.package_path / "other.bin").write_bytes(
+            os.urandom(FingerprintEngine.PARALLEL_MIN_SIZE)
+        )
+        self.cache_path = os.path.join(self.t, "cache", "fingerprint_cache.json")
+
+    def teardown(self):
+        """Tear down the test."""
+        shutil.rmtree(self.t, ignore_errors=True)
+
+    def test_compute_without_workers(self):
+        """Test that the engine computes the same fingerprint of hashing file by file."""
+        engine = FingerprintEngine(max_workers=1)
+        assert engine.compute(self.package_path, ["*.pyc"]) == _expected_fingerprint(
+            self.package_path
+        )
+
+    def test_compute_with_workers(self):
+        """Test that the engine computes the same fingerprint using the thread pool."""
+        engine = FingerprintEngine(max_workers=4)
+        with mock.patch.object(
+            engine, "_get_executor", wraps=engine._get_executor
+        ) as executor_mock:
+            fingerprint = engine.compute(self.package_path, ["*.pyc"])
+        executor_mock.assert_called_once()
+        assert fingerprint == _expected_fingerprint(self.package_path)
+
+    def test_compute_many(self):
+        """Test the fingerprint of several packages at once."""
+        other_path = Path(self.t, "other")
+        other_path.mkdir()
+        (other_path / "file.txt").write_text("content")
+        engine = FingerprintEngine()
+        fingerprints = engine.compute_many(
+            [(self.package_path, ["*.pyc"]), (other_path, None)]
+        )
+        assert fingerprints == [
+            _expected_fingerprint(self.package_path),
+            {"file.txt": IPFSHashOnly().get(str(other_path / "file.txt"))},
+        ]
+
+    def test_ignore_patterns(self):
+        """Test that the ignore patterns do not apply to Python files."""
+        files = FingerprintEngine.list_files(self.package_path, ["*.py", "*.bin"])
+        names = {path.name for path in files}
+        assert "behaviours.py" in names
+        assert "large.bin" not in names
+
+    def test_cache_hit_and_invalidation(self):
+        """Test that unchanged files are not hashed again, and changed ones are."""
+        engine = FingerprintEngine(cache=FileHashCache(self.cache_path))
+        expected = engine.compute(self.package_path, ["*.pyc"])
+
+        with mock.patch.object(
+            IPFSHashOnly, "get", side_effect=AssertionError("Not cached.")
+        ):
+            assert engine.compute(self.package_path, ["*.pyc"]) == expected
+
+        content = os.urandom(FingerprintEngine.PARALLEL_MIN_SIZE * 3)
+        self.large_file.write_bytes(content)
+        fingerprint = engine.compute(self.package_path, ["*.pyc"])
+        assert fingerprint["large.bin"] != expected["large.bin"]
+        assert fingerprint == _expected_fingerprint(self.package_path)
+
+    def test_cache_persistence(self):
+        """Test that the cache is shared across engines through the cache file."""
+        expected = FingerprintEngine(cache=FileHashCache(self.cache_path)).compute(
+            self.package_path, ["*.pyc"]
+        )
+        assert os.path.exists(self.cache_path)
+
+        engine = FingerprintEngine(cache=FileHashCache(self.cache_path))
+        with mock.patch.object(
+            IPFSHashOnly, "get", side_effect=AssertionError("Not cached.")
+        ):
+            assert engine.compute(self.package_path, ["*.pyc"]) == expected
+
+    def test_corrupted_cache_file(self):
+        """Test that a corrupted cache file is ignored."""
+        os.makedirs(os.path.dirname(self.cache_path))
+        Path(self.cache_path).write_text("{not json")
+        engine = FingerprintEngine(cache=FileHashCache(self.cache_path))
+        assert engine.compute(self.package_path, ["*.pyc"]) == _expected_fingerprint(
+            self.package_path
+        )
+
+    def test_cache_trimmed(self):
+        """Test that only the used entries are saved when the cache is too large."""
+        cache = FileHashCache(self.cache_path)
+        cache.set(("/unused", 1, 1), "hash")
+        cache.save()
+        engine = FingerprintEngine(cache=FileHashCache(self.cache_path))
+        with mock.patch.object(FileHashCache, "MAX_ENTRIES", 1):
+            engine.compute(self.package_path, ["*.pyc"])
+        cache = FileHashCache(self.cache_path)
+        assert cache.get(("/unused", 1, 1)) is None
+        key = FingerprintEngine._get_key(self.large_file)
+        assert cache.get(key) is not None
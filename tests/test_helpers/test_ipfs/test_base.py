@@ -20,6 +20,8 @@
 """This module contains the tests for the ipfs helper module."""
 
 import os
+import tempfile
+from unittest import mock
 
 from aea.helpers.ipfs.base import IPFSHashOnly
 
@@ -32,3 +34,17 @@ def test_get_hash():
     """Test get hash IPFSHashOnly."""
     ipfs_hash = IPFSHashOnly().get(file_path=os.path.join(CUR_PATH, FILE_PATH))
     assert ipfs_hash == "QmWeMu9JFPUcYdz4rwnWiJuQ6QForNFRsjBiN5PtmkEg4A"
+
+
+def test_get_hash_streaming():
+    """Test that large files are hashed in chunks with the same result."""
+    content = os.urandom(100) + b"\r\n" + os.urandom(1000) + b"\r"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "file.bin")
+        with open(file_path, "wb") as file:
+            file.write(content)
+        expected = IPFSHashOnly().get(file_path)
+        with mock.patch.object(
+            IPFSHashOnly, "STREAMING_THRESHOLD", 10
+        ), mock.patch.object(IPFSHashOnly, "CHUNK_SIZE", 101):
+            assert IPFSHashOnly().get(file_path) == expected
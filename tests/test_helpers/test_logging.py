@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests for the logging helpers."""
+
+import logging
+
+from aea.helpers.logging import AgentLogMessage, AgentLoggerAdapter
+
+
+class _Unrenderable:
+    """An object that fails the test if rendered."""
+
+    def __str__(self):
+        raise AssertionError("Rendered.")
+
+    __repr__ = __str__
+
+
+class _ListHandler(logging.Handler):
+    """A handler that keeps the records."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestAgentLoggerAdapter:
+    """Test the agent logger adapter."""
+
+    def setup(self):
+        """Set up the test."""
+        self.logger = logging.getLogger("aea.test_agent_logger_adapter")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.handler = _ListHandler()
+        self.logger.addHandler(self.handler)
+        self.adapter = AgentLoggerAdapter(self.logger, agent_name="agent%name")
+
+    def teardown(self):
+        """Tear down the test."""
+        self.logger.removeHandler(self.handler)
+
+    def test_message_rendered(self):
+        """Test that the agent name is prepended and the arguments are applied."""
+        self.adapter.info("Received %s from %r", 1, "sender")
+        self.adapter.info("100%")
+        messages = [record.getMessage() for record in self.handler.records]
+        assert messages == [
+            "[agent%name] Received 1 from 'sender'",
+            "[agent%name] 100%",
+        ]
+
+    def test_mapping_argument(self):
+        """Test that a single mapping argument is used for named placeholders, as in the logging module."""
+        self.adapter.info(
+            "Received %(amount)d from %(sender)s", {"amount": 1, "sender": "a"}
+        )
+        self.adapter.info("Received %s", {})
+        messages = [record.getMessage() for record in self.handler.records]
+        assert messages == [
+            "[agent%name] Received 1 from a",
+            "[agent%name] Received {}",
+        ]
+
+    def test_structured_record(self):
+        """Test that the record keeps the agent name, the message and the arguments."""
+        self.adapter.warning("Message %s", "arg", extra={"key": "value"})
+        (record,) = self.handler.records
+        assert isinstance(record.msg, AgentLogMessage)
+        assert record.msg.agent_name == "agent%name"
+        assert record.msg.msg == "Message %s"
+        assert record.msg.args == ("arg",)
+        assert record.agent_name == "agent%name"
+        assert record.key == "value"
+
+    def test_disabled_level_not_rendered(self):
+        """Test that nothing is rendered nor recorded if the level is disabled."""
+        self.adapter.debug("Envelope %s", _Unrenderable())
+        assert self.handler.records == []
+
+    def test_exception(self):
+        """Test logging an exception."""
+        try:
+            raise ValueError("error")
+        except ValueError:
+            self.adapter.exception("Exception %d", 1)
+        (record,) = self.handler.records
+        assert record.getMessage() == "[agent%name] Exception 1"
+        assert record.exc_info[0] is ValueError
@@ -19,9 +19,12 @@
 
 """This module contains the tests for the preference representations helper module."""
 
+import pytest
+
 from aea.helpers.preference_representations.base import (
     linear_utility,
     logarithmic_utility,
+    marginal_logarithmic_utilities,
 )
 
 
@@ -36,6 +39,26 @@ def test_logarithmic_utility():
     ), "Utility should be positive."
 
 
+def test_marginal_logarithmic_utilities():
+    """Test the marginal logarithmic utilities are the changes of the utility."""
+    utility_params = {"good_1": 0.2, "good_2": 0.8}
+    quantities = {"good_1": 2, "good_2": 0}
+    marginal_utilities = marginal_logarithmic_utilities(
+        utility_params_by_good_id=utility_params,
+        quantities_by_good_id=quantities,
+        delta_quantity=-1,
+    )
+    current_utility = logarithmic_utility(utility_params, quantities)
+    assert marginal_utilities["good_1"] == pytest.approx(
+        logarithmic_utility(utility_params, {"good_1": 1, "good_2": 0})
+        - current_utility
+    )
+    assert marginal_utilities["good_2"] == pytest.approx(
+        logarithmic_utility(utility_params, {"good_1": 2, "good_2": -1})
+        - current_utility
+    )
+
+
 def test_linear_utility():
     """Test logarithmic utlity."""
     assert (
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the SQLite access layer."""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aea.helpers.sqlite import SQLiteDatabase
+
+
+class TestSQLiteDatabase:
+    """Test the SQLite access layer."""
+
+    def setup(self):
+        """Set up the test."""
+        self.t = tempfile.mkdtemp()
+        self.db = SQLiteDatabase(os.path.join(self.t, "test.db"))
+        self.db.execute("CREATE TABLE data (epoch INTEGER, value TEXT)")
+
+    def test_wal_mode(self):
+        """Test that the database is in WAL journal mode."""
+        assert self.db.execute("PRAGMA journal_mode") == [("wal",)]
+
+    def test_execute_many_and_query(self):
+        """Test batched inserts and queries."""
+        rows = [(epoch, str(epoch)) for epoch in range(100)]
+        assert self.db.execute_many("INSERT INTO data VALUES (?, ?)", rows) == 100
+        assert self.db.execute(
+            "SELECT value FROM data WHERE epoch BETWEEN ? AND ?", (10, 12)
+        ) == [("10",), ("11",), ("12",)]
+
+    def test_execute_many_is_atomic(self):
+        """Test that a failed batch is rolled back."""
+        self.db.execute("CREATE UNIQUE INDEX data_epoch ON data (epoch)")
+        with pytest.raises(sqlite3.IntegrityError):
+            self.db.execute_many(
+                "INSERT INTO data VALUES (?, ?)", [(1, "a"), (2, "b"), (1, "c")]
+            )
+        assert self.db.execute("SELECT COUNT(*) FROM data") == [(0,)]
+
+    def test_connection_per_thread(self):
+        """Test that each thread reuses its own connection."""
+        assert self.db.connection is self.db.connection
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(lambda: self.db.connection).result()
+            assert other is not self.db.connection
+            assert executor.submit(lambda: self.db.connection).result() is other
+            executor.submit(
+                self.db.execute, "INSERT INTO data VALUES (?, ?)", (1, "a")
+            ).result()
+        assert self.db.execute("SELECT COUNT(*) FROM data") == [(1,)]
+
+    def test_close(self):
+        """Test that closing the connections does not prevent further use."""
+        connection = self.db.connection
+        self.db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+        assert self.db.connection is not connection
+        assert self.db.execute("SELECT COUNT(*) FROM data") == [(0,)]
+
+    def test_read_only(self):
+        """Test that a read-only database can be queried, but not modified."""
+        path = os.path.join(self.t, "read_only.db")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE data (epoch INTEGER, value TEXT)")
+        connection.execute("INSERT INTO data VALUES (1, 'a')")
+        connection.commit()
+        connection.close()
+        os.chmod(path, 0o444)
+
+        db = SQLiteDatabase(path, read_only=True)
+        try:
+            assert db.execute("SELECT value FROM data") == [("a",)]
+            assert db.execute("PRAGMA journal_mode") == [("delete",)]
+            with pytest.raises(sqlite3.OperationalError):
+                db.execute("INSERT INTO data VALUES (2, 'b')")
+        finally:
+            db.close()
+        assert not os.path.exists(path + "-wal")
+
+    def test_read_only_missing_file(self):
+        """Test that a missing database is not created in read-only mode."""
+        path = os.path.join(self.t, "missing.db")
+        db = SQLiteDatabase(path, read_only=True)
+        with pytest.raises(sqlite3.OperationalError):
+            db.execute("SELECT 1")
+        assert not os.path.exists(path)
+
+    def teardown(self):
+        """Tear down the test."""
+        self.db.close()
+        shutil.rmtree(self.t, ignore_errors=True)
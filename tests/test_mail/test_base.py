@@ -26,7 +26,13 @@ import pytest
 
 import aea
 from aea.configurations.base import PublicId
-from aea.mail.base import Envelope, EnvelopeContext, ProtobufEnvelopeSerializer, URI
+from aea.mail.base import (
+    Envelope,
+    EnvelopeContext,
+    EnvelopePool,
+    ProtobufEnvelopeSerializer,
+    URI,
+)
 from aea.multiplexer import InBox, Multiplexer, OutBox
 from aea.protocols.base import Message
 from aea.protocols.default.message import DefaultMessage
@@ -272,6 +278,38 @@ def test_envelope_serialization():
     assert actual_envelope == expected_envelope
 
 
+def test_envelope_pool():
+    """Test a released envelope is reused by the next envelope acquired."""
+    protocol_id = PublicId("author", "name", "0.1.0")
+    with unittest.mock.patch.object(Envelope, "pool", EnvelopePool(max_size=1)):
+        envelope = Envelope.acquire(
+            to="to",
+            sender="sender",
+            protocol_id=protocol_id,
+            message=b"message",
+            context=EnvelopeContext(uri=URI("/uri")),
+        )
+        envelope.release()
+        Envelope(
+            to="to", sender="sender", protocol_id=protocol_id, message=b""
+        ).release()
+        assert len(Envelope.pool) == 1
+        assert envelope.message == b"" and envelope.context is None
+
+        decoded = Envelope.decode(
+            Envelope(
+                to="other", sender="sender", protocol_id=protocol_id, message=b"hello",
+            ).encode()
+        )
+        assert decoded is envelope
+        assert decoded.to == "other" and decoded.message == b"hello"
+        assert decoded.context == EnvelopeContext()
+        assert len(Envelope.pool) == 0
+
+    envelope.release()
+    assert envelope.message == b"hello"
+
+
 def test_envelope_message_bytes():
     """Test the property Envelope.message_bytes."""
     message = DefaultMessage(DefaultMessage.Performative.BYTES, content=b"message")
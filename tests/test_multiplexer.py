@@ -20,21 +20,32 @@
 """This module contains the tests for the Multiplexer."""
 
 import asyncio
+import os
+import queue
 import shutil
 import tempfile
 import time
 import unittest.mock
 from pathlib import Path
 from threading import Thread
+from typing import List, Optional
 from unittest import mock
 
+import psutil  # type: ignore
+
 import pytest
 
 import aea
-from aea.configurations.base import PublicId
+from aea.configurations.base import ConnectionConfig, PublicId
 from aea.identity.base import Identity
 from aea.mail.base import AEAConnectionError, Envelope, EnvelopeContext
-from aea.multiplexer import Multiplexer
+from aea.multiplexer import (
+    InBox,
+    Multiplexer,
+    OutBox,
+    OutBoxPolicy,
+    PriorityLane,
+)
 from aea.protocols.default.message import DefaultMessage
 
 from packages.fetchai.connections.local.connection import LocalNode
@@ -47,6 +58,7 @@ from .conftest import (
     _make_stub_connection,
     logger,
 )
+from .data.dummy_connection.connection import DummyConnection
 
 
 @pytest.mark.asyncio
@@ -439,3 +451,285 @@ def test_send_message_no_supported_protocol():
             )
 
         multiplexer.disconnect()
+
+
+class FloodConnection(DummyConnection):
+    """A connection that receives envelopes as fast as they are requested, and sends them slowly."""
+
+    def __init__(self, payload_size: int = 10, **kwargs):
+        """Initialize."""
+        super().__init__(**kwargs)
+        self.payload_size = payload_size
+        self.received = 0
+        self.sending = None  # type: Optional[Envelope]
+        self.sent = []  # type: List[Envelope]
+        self.can_send = None  # type: Optional[asyncio.Event]
+
+    async def connect(self, *args, **kwargs):
+        """Connect."""
+        await super().connect(*args, **kwargs)
+        self.can_send = asyncio.Event()
+
+    async def send(self, envelope: Envelope):
+        """Send an envelope, once allowed."""
+        self.sending = envelope
+        assert self.can_send is not None
+        await self.can_send.wait()
+        self.sent.append(envelope)
+
+    async def receive(self, *args, **kwargs):
+        """Receive a new envelope."""
+        await asyncio.sleep(0)
+        self.received += 1
+        return Envelope(
+            to="address",
+            sender="sender",
+            protocol_id=DefaultMessage.protocol_id,
+            message=os.urandom(self.payload_size),
+        )
+
+
+def _make_flood_connection(payload_size: int = 10) -> FloodConnection:
+    return FloodConnection(
+        payload_size=payload_size,
+        configuration=ConnectionConfig(connection_id=DummyConnection.connection_id),
+        identity=Identity("name", "address"),
+    )
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    """Wait for a condition to become true."""
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "Condition not met."
+        time.sleep(0.01)
+
+
+def _make_envelope() -> Envelope:
+    message = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"hello",
+    )
+    message.counterparty = "address"
+    return Envelope(
+        to="address",
+        sender="address",
+        protocol_id=DefaultMessage.protocol_id,
+        message=message,
+    )
+
+
+def test_in_queue_watermarks():
+    """Test that the receiving is suspended at the high watermark and resumed at the low watermark."""
+    connection = _make_flood_connection()
+    multiplexer = Multiplexer(
+        [connection], in_queue_high_watermark=10, in_queue_low_watermark=5
+    )
+    multiplexer.connect()
+    try:
+        _wait_for(lambda: multiplexer.is_receiving_suspended)
+        received = connection.received
+        time.sleep(0.1)
+        assert connection.received == received
+        assert multiplexer.in_queue.qsize() == 10
+
+        for _ in range(4):
+            multiplexer.get(block=True)
+        time.sleep(0.1)
+        assert connection.received == received
+
+        multiplexer.get(block=True)
+        _wait_for(lambda: connection.received > received)
+        _wait_for(lambda: multiplexer.is_receiving_suspended)
+        stats = multiplexer.queue_stats
+        assert stats["in_queue_size"] == 10
+        assert stats["receiving_suspensions"] == 2
+    finally:
+        multiplexer.disconnect()
+
+
+def test_in_queue_watermarks_bad_values():
+    """Test the validation of the watermarks."""
+    with pytest.raises(AssertionError):
+        Multiplexer([_make_dummy_connection()], in_queue_high_watermark=0)
+    with pytest.raises(AssertionError):
+        Multiplexer(
+            [_make_dummy_connection()],
+            in_queue_high_watermark=10,
+            in_queue_low_watermark=10,
+        )
+
+
+def test_outbox_block_policy():
+    """Test that the blocking policy waits for a free slot in the out queue."""
+    connection = _make_flood_connection()
+    multiplexer = Multiplexer(
+        [connection], in_queue_high_watermark=1, out_queue_maxsize=2
+    )
+    multiplexer.connect()
+    outbox = OutBox(multiplexer, "address", timeout=0.5)
+    try:
+        # one envelope is held by the sending loop, two are in the queue.
+        outbox.put(_make_envelope())
+        _wait_for(lambda: connection.sending is not None)
+        for _ in range(2):
+            outbox.put(_make_envelope())
+        with pytest.raises(queue.Full):
+            outbox.put(_make_envelope())
+        assert multiplexer.queue_stats["out_queue_size"] == 2
+
+        multiplexer._loop.call_soon_threadsafe(connection.can_send.set)
+        outbox.put(_make_envelope())
+        _wait_for(lambda: len(connection.sent) == 4)
+        # the envelope that timed out is never sent.
+        time.sleep(0.2)
+        assert len(connection.sent) == 4
+    finally:
+        multiplexer.disconnect()
+
+
+def test_outbox_block_policy_in_loop():
+    """Test that the blocking policy does not wait, nor schedule envelopes, when called from the event loop."""
+    connection = _make_flood_connection()
+    multiplexer = Multiplexer(
+        [connection], in_queue_high_watermark=1, out_queue_maxsize=2
+    )
+    multiplexer.connect()
+    outbox = OutBox(multiplexer, "address")
+
+    async def put_envelopes() -> None:
+        for _ in range(2):
+            outbox.put(_make_envelope())
+        for _ in range(3):
+            with pytest.raises(queue.Full):
+                outbox.put(_make_envelope())
+
+    try:
+        outbox.put(_make_envelope())
+        _wait_for(lambda: connection.sending is not None)
+        multiplexer._thread_runner.call(put_envelopes()).result(5)
+        assert multiplexer.queue_stats["out_queue_size"] == 2
+
+        multiplexer._loop.call_soon_threadsafe(connection.can_send.set)
+        _wait_for(lambda: len(connection.sent) == 3)
+        time.sleep(0.2)
+        assert len(connection.sent) == 3
+    finally:
+        multiplexer.disconnect()
+
+
+def test_outbox_drop_oldest_policy():
+    """Test that the drop-oldest policy discards the oldest envelopes in the out queue."""
+    connection = _make_flood_connection()
+    multiplexer = Multiplexer(
+        [connection], in_queue_high_watermark=1, out_queue_maxsize=2
+    )
+    multiplexer.connect()
+    outbox = OutBox(multiplexer, "address", policy=OutBoxPolicy.DROP_OLDEST)
+    assert outbox.policy == OutBoxPolicy.DROP_OLDEST
+    envelopes = [_make_envelope() for _ in range(6)]
+    try:
+        # the first envelope is held by the sending loop.
+        outbox.put(envelopes[0])
+        _wait_for(lambda: connection.sending is envelopes[0])
+        for envelope in envelopes[1:]:
+            outbox.put(envelope)
+        _wait_for(lambda: multiplexer.queue_stats["out_queue_size"] == 2)
+        assert multiplexer.queue_stats["dropped_envelopes"] == 3
+
+        multiplexer._loop.call_soon_threadsafe(connection.can_send.set)
+        _wait_for(lambda: len(connection.sent) == 3)
+        assert connection.sent[0] is envelopes[0]
+        assert connection.sent[1:] == envelopes[4:]
+    finally:
+        multiplexer.disconnect()
+
+
+def test_outbox_async_put():
+    """Test that the envelopes can be put in the out queue from another event loop."""
+    connection = _make_flood_connection()
+    multiplexer = Multiplexer(
+        [connection], in_queue_high_watermark=1, out_queue_maxsize=1
+    )
+    multiplexer.connect()
+    outbox = OutBox(multiplexer, "address")
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(outbox.async_put(_make_envelope()))
+        loop.run_until_complete(outbox.async_put(_make_envelope()))
+        with pytest.raises(asyncio.TimeoutError):
+            loop.run_until_complete(
+                asyncio.wait_for(outbox.async_put(_make_envelope()), 0.2)
+            )
+
+        multiplexer._loop.call_soon_threadsafe(connection.can_send.set)
+        loop.run_until_complete(outbox.async_put(_make_envelope()))
+        _wait_for(lambda: len(connection.sent) == 3)
+    finally:
+        loop.close()
+        multiplexer.disconnect()
+
+
+def test_flood_memory_stays_flat():
+    """Test that flooding the multiplexer of a slow agent does not grow the memory."""
+    process = psutil.Process()
+    connection = _make_flood_connection(payload_size=100 * 1024)
+    multiplexer = Multiplexer([connection], in_queue_high_watermark=20)
+    multiplexer.connect()
+    try:
+        _wait_for(lambda: multiplexer.is_receiving_suspended)
+        rss_start = process.memory_info().rss
+        max_in_queue_size = 0
+        # the agent consumes 2000 envelopes, 200MB, much more slowly than they arrive.
+        for _ in range(2000):
+            max_in_queue_size = max(max_in_queue_size, multiplexer.in_queue.qsize())
+            multiplexer.get(block=True)
+        rss_end = process.memory_info().rss
+    finally:
+        multiplexer.disconnect()
+    assert connection.received >= 2000
+    assert max_in_queue_size <= 20
+    assert rss_end - rss_start < 20 * 1024 * 1024
+
+
+def test_priority_lanes():
+    """Test that the envelopes of a high-priority lane overtake the default lane."""
+    multiplexer = Multiplexer([_make_dummy_connection()])
+    multiplexer.set_priority_lanes(
+        [PriorityLane("high", 3, [UNKNOWN_PROTOCOL_PUBLIC_ID])]
+    )
+    inbox = InBox(multiplexer)
+    for _ in range(8):
+        multiplexer.in_queue.put(_make_envelope())
+    for _ in range(3):
+        envelope = _make_envelope()
+        envelope.protocol_id = UNKNOWN_PROTOCOL_PUBLIC_ID
+        multiplexer.in_queue.put(envelope)
+
+    protocol_ids = [inbox.get_nowait().protocol_id for _ in range(11)]
+    assert protocol_ids[:4].count(UNKNOWN_PROTOCOL_PUBLIC_ID) == 3
+    assert protocol_ids[4:] == [DefaultMessage.protocol_id] * 7
+    assert inbox.empty()
+
+
+def test_priority_lanes_bad_values():
+    """Test the validation of the priority lanes."""
+    with pytest.raises(AssertionError):
+        PriorityLane("high", 0, [UNKNOWN_PROTOCOL_PUBLIC_ID])
+    multiplexer = Multiplexer([_make_dummy_connection()])
+    with pytest.raises(AssertionError):
+        multiplexer.set_priority_lanes(
+            [
+                PriorityLane("high", 3, [UNKNOWN_PROTOCOL_PUBLIC_ID]),
+                PriorityLane("low", 1, [UNKNOWN_PROTOCOL_PUBLIC_ID]),
+            ]
+        )
+    multiplexer.connect()
+    try:
+        with pytest.raises(AssertionError):
+            multiplexer.set_priority_lanes([])
+    finally:
+        multiplexer.disconnect()
@@ -31,9 +31,13 @@ from aea.identity.base import Identity
 from aea.mail.base import Envelope
 
 from packages.fetchai.connections.gym.connection import GymConnection
+from packages.fetchai.connections.gym.vector_env import SubprocessVectorEnv
 from packages.fetchai.protocols.gym.message import GymMessage
 
 from tests.conftest import ROOT_DIR, UNKNOWN_PROTOCOL_PUBLIC_ID
+from tests.data.counting_env import CountingEnv
+
+COUNTING_ENV = "tests.data.counting_env.CountingEnv"
 
 logger = logging.getLogger(__name__)
 
@@ -178,3 +182,148 @@ class TestGymConnection:
         )
         assert gym_con.channel.gym_env is not None
         os.chdir(curdir)
+
+
+class TestSubprocessVectorEnv:
+    """Test the vector of environments stepped in subprocesses."""
+
+    def setup(self):
+        """Start a vector of 5 environments on 2 workers."""
+        self.vector_env = SubprocessVectorEnv(COUNTING_ENV, nb_envs=5, nb_workers=2)
+
+    def teardown(self):
+        """Stop the workers."""
+        self.vector_env.stop()
+
+    def test_step_and_reset(self):
+        """Test that the copies are stepped in order, and reset when done."""
+        assert self.vector_env.reset() == [0] * 5
+        observations, rewards, dones, infos = self.vector_env.step([1, 2, 3, 4, 5])
+        assert observations == [1, 2, 3, 4, 5]
+        assert rewards == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert dones == [False] * 5
+        assert infos == [{}] * 5
+
+        observations, _, dones, infos = self.vector_env.step([1] * 5)
+        assert observations == [0] * 5
+        assert dones == [True] * 5
+        assert [info["terminal_observation"] for info in infos] == [2, 3, 4, 5, 6]
+
+    def test_wrong_number_of_actions(self):
+        """Test that a step needs one action per copy."""
+        with pytest.raises(ValueError, match="Expected 5 actions"):
+            self.vector_env.step([1, 2])
+
+    def test_error_in_worker(self):
+        """Test that the errors of the environments are raised."""
+        with pytest.raises(TypeError):
+            self.vector_env.step(["a"] * 5)
+
+    def test_fork_not_allowed(self):
+        """Test that the workers are not forked from the threads of the agent."""
+        with pytest.raises(AssertionError, match="cannot be forked"):
+            SubprocessVectorEnv(COUNTING_ENV, nb_envs=2, start_method="fork")
+
+
+class TestGymConnectionVectorised:
+    """Test the gym connection with several copies of the environment."""
+
+    def setup(self):
+        """Initialise the class."""
+        configuration = ConnectionConfig(
+            connection_id=GymConnection.connection_id,
+            env=COUNTING_ENV,
+            nb_envs=3,
+            nb_workers=2,
+        )
+        self.my_address = "my_key"
+        identity = Identity("name", address=self.my_address)
+        self.gym_con = GymConnection(
+            gym_env=CountingEnv(), identity=identity, configuration=configuration
+        )
+        self.loop = asyncio.get_event_loop()
+
+    def teardown(self):
+        """Clean up after tests."""
+        self.loop.run_until_complete(self.gym_con.disconnect())
+
+    def _envelope(self, msg: GymMessage) -> Envelope:
+        """Make an envelope to the gym."""
+        msg.counterparty = "_to_key"
+        return Envelope(
+            to="_to_key",
+            sender=self.my_address,
+            protocol_id=GymMessage.protocol_id,
+            message=msg,
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_act_batch(self):
+        """Test that a batch of actions is answered with a batch of percepts."""
+        await self.gym_con.connect()
+        msg = GymMessage(
+            performative=GymMessage.Performative.ACT_BATCH,
+            actions=GymMessage.AnyObject([1, 2, 3]),
+            step_id=1,
+        )
+        await self.gym_con.send(self._envelope(msg))
+
+        envelope = await asyncio.wait_for(self.gym_con.receive(), timeout=3)
+        percept = envelope.message
+        assert percept.performative == GymMessage.Performative.PERCEPT_BATCH
+        assert percept.step_id == 1
+        assert percept.observations.any == [1, 2, 3]
+        assert percept.rewards == (1.0, 2.0, 3.0)
+        assert percept.dones == (False, False, False)
+        assert percept.infos.any == [{}, {}, {}]
+
+    @pytest.mark.asyncio
+    async def test_send_reset_and_close(self):
+        """Test that reset and close are applied to the copies, with no reply."""
+        await self.gym_con.connect()
+        vector_env = self.gym_con.channel._vector_env
+        with patch.object(vector_env, "reset") as mock_reset, patch.object(
+            vector_env, "close"
+        ) as mock_close:
+            await self.gym_con.send(
+                self._envelope(GymMessage(performative=GymMessage.Performative.RESET))
+            )
+            await self.gym_con.send(
+                self._envelope(GymMessage(performative=GymMessage.Performative.CLOSE))
+            )
+        mock_reset.assert_called_once()
+        mock_close.assert_called_once()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(self.gym_con.receive(), timeout=0.5)
+
+    @pytest.mark.asyncio
+    async def test_copies_need_entry_point(self):
+        """Test that the copies are created from the entry point of the environment."""
+        self.gym_con.channel.env_entry_point = None
+        with pytest.raises(ValueError, match="entry point of the environment"):
+            await self.gym_con.connect()
+
+    @pytest.mark.asyncio
+    async def test_act_batch_needs_copies(self):
+        """Test that batches of actions are rejected with a single environment."""
+        self.gym_con.channel.nb_envs = 1
+        await self.gym_con.connect()
+        assert self.gym_con.channel._vector_env is None
+        msg = GymMessage(
+            performative=GymMessage.Performative.ACT_BATCH,
+            actions=GymMessage.AnyObject([1]),
+            step_id=1,
+        )
+        with pytest.raises(ValueError):
+            await self.gym_con.send(self._envelope(msg))
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_workers(self):
+        """Test that the workers are stopped on disconnection."""
+        await self.gym_con.connect()
+        processes = list(self.gym_con.channel._vector_env._processes)
+        assert len(processes) == 2
+        await self.gym_con.disconnect()
+        assert self.gym_con.channel._vector_env is None
+        assert not any(process.is_alive() for process in processes)
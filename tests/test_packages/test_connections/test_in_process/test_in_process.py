@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the in-process connection."""
+import asyncio
+
+import pytest
+
+from aea.mail.base import AEAConnectionError, Envelope
+from aea.multiplexer import Multiplexer
+from aea.protocols.default.message import DefaultMessage
+
+from packages.fetchai.connections.in_process.connection import (
+    IN_PROCESS_NODE,
+    InProcessRegistry,
+)
+from packages.fetchai.connections.local.connection import LocalNode
+
+from tests.conftest import _make_in_process_connection, _make_local_connection
+
+
+def _make_envelope(to: str, sender: str) -> Envelope:
+    """Make an envelope with a default message."""
+    msg = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"hello",
+    )
+    return Envelope(
+        to=to, sender=sender, protocol_id=DefaultMessage.protocol_id, message=msg,
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_same_loop_is_direct():
+    """Test that on the same loop the envelope is put in the recipient queue without copies."""
+    registry = InProcessRegistry()
+    connection1 = _make_in_process_connection("agent_1", in_process_registry=registry)
+    connection2 = _make_in_process_connection("agent_2", in_process_registry=registry)
+    await connection1.connect()
+    await connection2.connect()
+    try:
+        envelope = _make_envelope("agent_2", "agent_1")
+        await connection1.send(envelope)
+        # delivered synchronously, no loop iteration needed
+        assert connection2._reader.qsize() == 1
+        received = await connection2.receive()
+        assert received is envelope
+    finally:
+        await connection1.disconnect()
+        await connection2.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_send_to_unknown_address_without_fallback():
+    """Test that an error is sent back if the recipient is not in the process."""
+    registry = InProcessRegistry()
+    connection = _make_in_process_connection("agent_1", in_process_registry=registry)
+    await connection.connect()
+    try:
+        await connection.send(_make_envelope("unknown", "agent_1"))
+        envelope = await asyncio.wait_for(connection.receive(), timeout=1.0)
+        assert envelope.sender == IN_PROCESS_NODE
+        assert envelope.to == "agent_1"
+        assert envelope.message.performative == DefaultMessage.Performative.ERROR
+    finally:
+        await connection.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_address_registered_twice():
+    """Test that two connections cannot register the same address."""
+    registry = InProcessRegistry()
+    connection1 = _make_in_process_connection("agent_1", in_process_registry=registry)
+    connection2 = _make_in_process_connection("agent_1", in_process_registry=registry)
+    await connection1.connect()
+    try:
+        with pytest.raises(AEAConnectionError, match="already registered"):
+            await connection2.connect()
+        assert not connection2.connection_status.is_connected
+    finally:
+        await connection1.disconnect()
+    assert "agent_1" not in registry
+
+
+@pytest.mark.asyncio
+async def test_not_connected_raises():
+    """Test that sending and receiving when not connected raises."""
+    connection = _make_in_process_connection("agent_1")
+    with pytest.raises(AEAConnectionError, match="Connection not established yet."):
+        await connection.send(_make_envelope("agent_2", "agent_1"))
+    with pytest.raises(AEAConnectionError, match="Connection not established yet."):
+        await connection.receive()
+
+
+def test_communication_between_multiplexers():
+    """Test that two multiplexers running in different threads can communicate."""
+    registry = InProcessRegistry()
+    multiplexer1 = Multiplexer(
+        [_make_in_process_connection("agent_1", in_process_registry=registry)]
+    )
+    multiplexer2 = Multiplexer(
+        [_make_in_process_connection("agent_2", in_process_registry=registry)]
+    )
+    multiplexer1.connect()
+    multiplexer2.connect()
+    try:
+        envelope = _make_envelope("agent_2", "agent_1")
+        multiplexer1.put(envelope)
+        received = multiplexer2.get(block=True, timeout=2.0)
+        assert received is envelope
+
+        reply = _make_envelope("agent_1", "agent_2")
+        multiplexer2.put(reply)
+        assert multiplexer1.get(block=True, timeout=2.0) is reply
+    finally:
+        multiplexer1.disconnect()
+        multiplexer2.disconnect()
+
+
+def test_fallback_connection():
+    """Test that envelopes to addresses outside the process go through the fallback."""
+    registry = InProcessRegistry()
+    with LocalNode() as node:
+        multiplexer1 = Multiplexer(
+            [
+                _make_in_process_connection(
+                    "agent_1",
+                    fallback_connection=_make_local_connection("agent_1", node),
+                    in_process_registry=registry,
+                )
+            ]
+        )
+        multiplexer2 = Multiplexer([_make_local_connection("agent_2", node)])
+        multiplexer1.connect()
+        multiplexer2.connect()
+        try:
+            multiplexer1.put(_make_envelope("agent_2", "agent_1"))
+            received = multiplexer2.get(block=True, timeout=2.0)
+            assert received.sender == "agent_1"
+
+            multiplexer2.put(_make_envelope("agent_1", "agent_2"))
+            received = multiplexer1.get(block=True, timeout=2.0)
+            assert received.sender == "agent_2"
+        finally:
+            multiplexer1.disconnect()
+            multiplexer2.disconnect()
@@ -20,6 +20,7 @@
 import asyncio
 from pathlib import Path
 from typing import cast
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -286,3 +287,39 @@ async def test_get_handler():
         ContractApiRequestDispatcher(ConnectionStatus()).get_handler(
             ContractApiMessage.Performative.ERROR
         )
+
+
+def test_contract_cache():
+    """Test the contracts are cached by the dispatcher until they are invalidated."""
+    dispatcher = ContractApiRequestDispatcher(ConnectionStatus())
+    contract_id = "fetchai/erc1155:0.6.0"
+    contract, api = Mock(), Mock()
+    with patch.object(
+        dispatcher.ledger_api_registry, "make", return_value=api
+    ), patch.object(
+        dispatcher.contract_registry, "make", return_value=contract
+    ) as make_mock:
+        assert dispatcher.ledger_api(EthereumCrypto.identifier) is api
+        assert dispatcher.get_contract(contract_id) is contract
+        assert dispatcher.get_contract(contract_id) is contract
+        assert make_mock.call_count == 1
+
+        dispatcher.invalidate_contracts(
+            contract_id,
+            ledger_id=EthereumCrypto.identifier,
+            contract_address=ETHEREUM_ADDRESS_ONE,
+        )
+        api.clear_contract_instances.assert_called_once_with(
+            contract.contract_interface, ETHEREUM_ADDRESS_ONE
+        )
+        dispatcher.get_contract(contract_id)
+        assert make_mock.call_count == 1
+
+        dispatcher.invalidate_contracts(contract_id)
+        dispatcher.get_contract(contract_id)
+        assert make_mock.call_count == 2
+
+        dispatcher.invalidate_contracts()
+        api.clear_contract_instances.assert_called_with(None, None)
+        dispatcher.get_contract(contract_id)
+        assert make_mock.call_count == 3
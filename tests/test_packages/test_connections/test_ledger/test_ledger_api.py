@@ -379,3 +379,17 @@ async def test_attempts_get_transaction_receipt():
             msg = dispatcher.get_transaction_receipt(mock_api, message, dialogue)
 
     assert msg.performative == LedgerApiMessage.Performative.ERROR
+
+
+def test_ledger_api_cached():
+    """Test the ledger APIs are created once per dispatcher."""
+    dispatcher = LedgerApiRequestDispatcher(ConnectionStatus())
+    with patch.object(
+        dispatcher.ledger_api_registry,
+        "make",
+        side_effect=lambda *args, **kwargs: Mock(),
+    ) as make_mock:
+        api = dispatcher.ledger_api(EthereumCrypto.identifier)
+        assert dispatcher.ledger_api(EthereumCrypto.identifier) is api
+        assert dispatcher.ledger_api(FetchAICrypto.identifier) is not api
+        assert make_mock.call_count == 2
@@ -23,13 +23,21 @@ import unittest.mock
 
 import pytest
 
-from aea.helpers.search.models import Constraint, ConstraintType, Description, Query
+from aea.helpers.search.models import (
+    Attribute,
+    Constraint,
+    ConstraintType,
+    DataModel,
+    Description,
+    Query,
+)
 from aea.mail.base import AEAConnectionError, Envelope
 from aea.multiplexer import Multiplexer
 from aea.protocols.default.message import DefaultMessage
 
-from packages.fetchai.connections.local.connection import LocalNode
+from packages.fetchai.connections.local.connection import DEFAULT_OEF, LocalNode
 from packages.fetchai.protocols.fipa.message import FipaMessage
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
 
 from tests.conftest import _make_local_connection
 
@@ -223,3 +231,99 @@ async def test_connecting_to_node_with_same_key():
         assert ret is not None and isinstance(ret, asyncio.Queue)
         ret = await node.connect(address, my_queue)
         assert ret is None
+
+
+def _oef_envelope(sender: str, **kwargs) -> Envelope:
+    """Make an envelope of an oef search message to the node."""
+    return Envelope(
+        to=DEFAULT_OEF,
+        sender=sender,
+        protocol_id=OefSearchMessage.protocol_id,
+        message=OefSearchMessage(dialogue_reference=(sender, ""), **kwargs),
+    )
+
+
+def _get_all(queue: asyncio.Queue) -> list:
+    """Get the envelopes in a queue."""
+    envelopes = []
+    while not queue.empty():
+        envelopes.append(queue.get_nowait())
+    return envelopes
+
+
+@pytest.mark.asyncio
+async def test_search_by_data_model():
+    """Test that a search finds the agents registered with the data model of the query only."""
+    node = LocalNode(loop=asyncio.get_event_loop())
+    attribute = Attribute("price", int, True)
+    data_model = DataModel("service", [attribute])
+    other_attributes = DataModel("service", [attribute, Attribute("city", str, False)])
+    other_name = DataModel("other_service", [attribute])
+    queues = {}
+    for address, model in (
+        ("agent_1", data_model),
+        ("agent_2", data_model),
+        ("agent_3", other_attributes),
+        ("agent_4", other_name),
+    ):
+        queues[address] = asyncio.Queue()
+        await node.connect(address, queues[address])
+        await node._handle_envelope(
+            _oef_envelope(
+                address,
+                performative=OefSearchMessage.Performative.REGISTER_SERVICE,
+                service_description=Description({"price": 1}, data_model=model),
+            )
+        )
+
+    query = Query([Constraint("price", ConstraintType(">", 0))], model=data_model)
+    await node._handle_envelopes(
+        [
+            _oef_envelope(
+                "agent_1",
+                performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+                query=query,
+            )
+        ]
+        * 3
+    )
+    await asyncio.sleep(0)
+    responses = _get_all(queues["agent_1"])
+    assert len(responses) == 3
+    for response in responses:
+        assert response.message.agents == ("agent_1", "agent_2")
+
+    await node._handle_envelope(
+        _oef_envelope(
+            "agent_2",
+            performative=OefSearchMessage.Performative.UNREGISTER_SERVICE,
+            service_description=Description({"price": 1}, data_model=data_model),
+        )
+    )
+    await node.disconnect("agent_3")
+    await asyncio.sleep(0)
+    assert set(node.services) == {"agent_1", "agent_4"}
+    assert node._services_by_model == {
+        "service": {"agent_1": [Description({"price": 1}, data_model=data_model)]},
+        "other_service": {
+            "agent_4": [Description({"price": 1}, data_model=other_name)]
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_send_to_disconnected_agent():
+    """Test that the envelopes to an agent which is not connected anymore are dropped."""
+    node = LocalNode(loop=asyncio.get_event_loop())
+    queue = asyncio.Queue()  # type: asyncio.Queue
+    await node.connect("agent", queue)
+    await node.disconnect("agent")
+    await node._handle_envelope(
+        _oef_envelope(
+            "agent",
+            performative=OefSearchMessage.Performative.UNREGISTER_SERVICE,
+            service_description=Description({"price": 1}),
+        )
+    )
+    await asyncio.sleep(0)
+    assert queue.empty()
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This test module contains the tests for the framing and the reconnection of the Libp2p tcp client connection."""
+
+import asyncio
+import struct
+from typing import List, Optional
+
+import pytest
+
+from aea.mail.base import Envelope
+from aea.protocols.default.message import DefaultMessage
+
+from packages.fetchai.connections.p2p_libp2p_client.connection import (
+    P2PLibp2pClientConnection,
+)
+
+from tests.conftest import _make_libp2p_client_connection, get_unused_tcp_port
+
+
+def _frame(data: bytes) -> bytes:
+    """Prefix data with its length, as the node does."""
+    return struct.pack("!I", len(data)) + data
+
+
+class _StandInNode:
+    """A stand-in for a delegate node, which echoes the envelopes."""
+
+    def __init__(self, port: int):
+        """Initialize the stand-in node."""
+        self.port = port
+        self.server = None  # type: Optional[asyncio.AbstractServer]
+        self.writers = []  # type: List[asyncio.StreamWriter]
+        self.connections = 0
+
+    async def start(self) -> None:
+        """Start listening."""
+        self.server = await asyncio.start_server(
+            self._handle, "127.0.0.1", self.port, reuse_address=True
+        )
+
+    async def stop(self) -> None:
+        """Stop listening, and close the connections."""
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+        self.drop_connections()
+
+    def drop_connections(self) -> None:
+        """Close the connections."""
+        for writer in self.writers:
+            writer.close()
+        self.writers = []
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.writers.append(writer)
+        self.connections += 1
+        try:
+            size = struct.unpack("!I", await reader.readexactly(4))[0]
+            await reader.readexactly(size)
+            writer.write(_frame(b"DONE"))
+            while True:
+                size = struct.unpack("!I", await reader.readexactly(4))[0]
+                writer.write(_frame(await reader.readexactly(size)))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+
+def _make_envelope(to: str, content: bytes) -> Envelope:
+    """Make an envelope to an address."""
+    msg = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=content,
+    )
+    return Envelope(
+        to=to, sender=to, protocol_id=DefaultMessage.protocol_id, message=msg,
+    )
+
+
+def test_parse_frames():
+    """Test that the complete frames are taken from the buffer, and the rest is kept."""
+    buffer = bytearray(_frame(b"first") + _frame(b"") + _frame(b"second")[:-2])
+    assert P2PLibp2pClientConnection._parse_frames(buffer) == [b"first", b""]
+    assert buffer == _frame(b"second")[:-2]
+    buffer.extend(b"nd")
+    assert P2PLibp2pClientConnection._parse_frames(buffer) == [b"second"]
+    assert buffer == bytearray()
+
+
+@pytest.mark.asyncio
+class TestLibp2pClientConnectionReconnection:
+    """Test the client connection against a stand-in node."""
+
+    async def _connect(self, **config) -> P2PLibp2pClientConnection:
+        self.node = _StandInNode(get_unused_tcp_port())
+        await self.node.start()
+        self.connection = _make_libp2p_client_connection(node_port=self.node.port)
+        for key, value in config.items():
+            setattr(self.connection, key, value)
+        await self.connection.connect()
+        return self.connection
+
+    async def _close(self) -> None:
+        if (
+            self.connection.connection_status.is_connected
+            or self.connection.connection_status.is_connecting
+        ):
+            await self.connection.disconnect()
+        await self.node.stop()
+
+    async def _wait_for_disconnection(self) -> None:
+        assert self.connection._is_reconnected is not None
+        while self.connection._is_reconnected.is_set():
+            await asyncio.sleep(0.01)
+
+    async def test_send_many(self):
+        """Test that the envelopes sent together are all received, in order."""
+        connection = await self._connect()
+        try:
+            envelopes = [
+                _make_envelope(connection.address, str(i).encode()) for i in range(100)
+            ]
+            for envelope in envelopes:
+                await connection.send(envelope)
+            for envelope in envelopes:
+                received = await asyncio.wait_for(connection.receive(), timeout=5)
+                assert received.encode() == envelope.encode()
+        finally:
+            await self._close()
+
+    async def test_reconnect_and_resend(self):
+        """Test that the envelopes sent while the node is down are sent after the reconnection."""
+        connection = await self._connect()
+        try:
+            await self.node.stop()
+            await self._wait_for_disconnection()
+            envelopes = [
+                _make_envelope(connection.address, str(i).encode()) for i in range(10)
+            ]
+            for envelope in envelopes:
+                await connection.send(envelope)
+            await self.node.start()
+            for envelope in envelopes:
+                received = await asyncio.wait_for(connection.receive(), timeout=5)
+                assert received.encode() == envelope.encode()
+            assert self.node.connections == 2
+        finally:
+            await self._close()
+
+    async def test_resend_queue_bounded(self):
+        """Test that the oldest envelopes are dropped while reconnecting, beyond the resend queue size."""
+        connection = await self._connect(resend_queue_size=3)
+        try:
+            await self.node.stop()
+            await self._wait_for_disconnection()
+            envelopes = [
+                _make_envelope(connection.address, str(i).encode()) for i in range(5)
+            ]
+            for envelope in envelopes:
+                await connection.send(envelope)
+            await self.node.start()
+            for envelope in envelopes[2:]:
+                received = await asyncio.wait_for(connection.receive(), timeout=5)
+                assert received.encode() == envelope.encode()
+        finally:
+            await self._close()
+
+    async def test_reconnection_fails(self):
+        """Test that the connection is closed when all the reconnection attempts fail."""
+        connection = await self._connect(reconnect_attempts=2)
+        try:
+            await self.node.stop()
+            assert await asyncio.wait_for(connection.receive(), timeout=5) is None
+            assert not connection.connection_status.is_connected
+        finally:
+            await self._close()
+
+    def _fail_writes(self) -> None:
+        """Make the writes to the current tcp connection fail, as when the node is lost while sending."""
+
+        async def drain() -> None:
+            raise ConnectionResetError("connection lost")
+
+        self.connection._writer.drain = drain  # type: ignore
+
+    async def test_sender_reconnects(self):
+        """Test that the connection is reestablished when a write fails."""
+        connection = await self._connect()
+        try:
+            self._fail_writes()
+            await connection.send(_make_envelope(connection.address, b"lost"))
+            while self.node.connections < 2:
+                await asyncio.sleep(0.01)
+            envelope = _make_envelope(connection.address, b"hello")
+            await connection.send(envelope)
+            received = await asyncio.wait_for(connection.receive(), timeout=5)
+            while received.encode() != envelope.encode():
+                received = await asyncio.wait_for(connection.receive(), timeout=5)
+            assert connection.connection_status.is_connected
+        finally:
+            await self._close()
+
+    async def test_sender_reconnection_fails(self):
+        """Test that the connection is closed when the reconnection attempts after a failed write all fail."""
+        connection = await self._connect(reconnect_attempts=2)
+        try:
+            # only the sender notices the lost connection.
+            assert connection._process_messages_task is not None
+            connection._process_messages_task.cancel()
+            await self.node.stop()
+            self._fail_writes()
+            await connection.send(_make_envelope(connection.address, b"lost"))
+            assert await asyncio.wait_for(connection.receive(), timeout=5) is None
+            assert not connection.connection_status.is_connected
+        finally:
+            await self._close()
@@ -18,8 +18,12 @@
 # ------------------------------------------------------------------------------
 
 """The tests module contains the tests of the packages/contracts/erc1155 dir."""
+from eth_tester import EthereumTester
+
 import pytest
 
+from web3 import EthereumTesterProvider, Web3
+
 from aea.crypto.ethereum import EthereumCrypto
 from aea.crypto.registries import crypto_registry, ledger_apis_registry
 
@@ -232,3 +236,29 @@ def test_get_batch_atomic_swap(ledger_api, crypto_api, erc1155_contract):
             for key in ["value", "chainId", "gas", "gasPrice", "nonce", "to", "from"]
         ]
     ), "Error, found: {}".format(tx)
+
+
+def test_nonces_shared_with_transfers(erc1155_contract):
+    """Test the transactions of the contract and the transfers of an address do not reuse their nonces."""
+    ledger_api = ledger_apis_registry.make(
+        EthereumCrypto.identifier, **ETHEREUM_TESTNET_CONFIG
+    )
+    ledger_api._api = Web3(EthereumTesterProvider(EthereumTester()))
+    deployer_address = EthereumCrypto().address
+    transfer_tx = ledger_api.get_transfer_transaction(
+        sender_address=deployer_address,
+        destination_address=ETHEREUM_ADDRESS_ONE,
+        amount=1000,
+        tx_fee=30000,
+        tx_nonce="0x",
+    )
+    deploy_tx = erc1155_contract.get_deploy_transaction(
+        ledger_api=ledger_api, deployer_address=deployer_address
+    )
+    create_tx = erc1155_contract.get_create_batch_transaction(
+        ledger_api=ledger_api,
+        contract_address=ETHEREUM_ADDRESS_ONE,
+        deployer_address=deployer_address,
+        token_ids=erc1155_contract.generate_token_ids(token_type=1, nb_tokens=10),
+    )
+    assert [transfer_tx["nonce"], deploy_tx["nonce"], create_tx["nonce"]] == [0, 1, 2]
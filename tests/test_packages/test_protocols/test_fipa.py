@@ -31,6 +31,7 @@ from aea.helpers.search.models import Constraint, ConstraintType, Description, Q
 from aea.mail.base import Address, Envelope
 from aea.protocols.base import Message
 
+from packages.fetchai.protocols.fipa import serialization as fipa_serialization
 from packages.fetchai.protocols.fipa.dialogues import FipaDialogue, FipaDialogues
 from packages.fetchai.protocols.fipa.message import FipaMessage
 
@@ -336,7 +337,7 @@ def test_fipa_encoding_unknown_performative():
     )
 
     with pytest.raises(ValueError, match="Performative not valid:"):
-        with mock.patch.object(FipaMessage.Performative, "__eq__", return_value=False):
+        with mock.patch.dict(fipa_serialization._ENCODERS, clear=True):
             FipaMessage.serializer.encode(msg)
 
 
@@ -351,7 +352,7 @@ def test_fipa_decoding_unknown_performative():
 
     encoded_msg = FipaMessage.serializer.encode(msg)
     with pytest.raises(ValueError, match="Performative not valid:"):
-        with mock.patch.object(FipaMessage.Performative, "__eq__", return_value=False):
+        with mock.patch.dict(fipa_serialization._DECODERS, clear=True):
             FipaMessage.serializer.decode(encoded_msg)
 
 
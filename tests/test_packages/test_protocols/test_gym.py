@@ -37,6 +37,19 @@ def test_gym_message_instantiation():
         done=True,
         step_id=1,
     )
+    assert GymMessage(
+        performative=GymMessage.Performative.ACT_BATCH,
+        actions=GymMessage.AnyObject(["action_1", "action_2"]),
+        step_id=1,
+    )
+    assert GymMessage(
+        performative=GymMessage.Performative.PERCEPT_BATCH,
+        observations=GymMessage.AnyObject(["observation_1", "observation_2"]),
+        rewards=(0.0, 1.0),
+        infos=GymMessage.AnyObject([{}, {"some_key": "some_value"}]),
+        dones=(False, True),
+        step_id=1,
+    )
     assert GymMessage(performative=GymMessage.Performative.RESET)
     assert GymMessage(performative=GymMessage.Performative.CLOSE)
     assert str(GymMessage.Performative.CLOSE) == "close"
@@ -66,3 +79,27 @@ def test_gym_serialization():
     actual_msg = GymMessage.serializer.decode(msg_bytes)
     expected_msg = msg
     assert expected_msg == actual_msg
+
+
+def test_gym_batch_serialization():
+    """Test that the serialization works for the batch messages."""
+    msg = GymMessage(
+        performative=GymMessage.Performative.ACT_BATCH,
+        actions=GymMessage.AnyObject([(1, 2), (3, 4), (5, 6)]),
+        step_id=1,
+    )
+    msg_bytes = GymMessage.serializer.encode(msg)
+    actual_msg = GymMessage.serializer.decode(msg_bytes)
+    assert msg == actual_msg
+
+    msg = GymMessage(
+        performative=GymMessage.Performative.PERCEPT_BATCH,
+        observations=GymMessage.AnyObject([None, None, None]),
+        rewards=(0.0, 1.0, 0.5),
+        infos=GymMessage.AnyObject([{}, {}, {"some_key": "some_value"}]),
+        dones=(False, True, False),
+        step_id=1,
+    )
+    msg_bytes = GymMessage.serializer.encode(msg)
+    actual_msg = GymMessage.serializer.decode(msg_bytes)
+    assert msg == actual_msg
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2019 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests of the tensor encoding of the ml_trade protocol."""
+
+import pickle  # nosec
+
+import numpy as np
+
+import pytest
+
+from aea.helpers.search.models import Description
+
+from packages.fetchai.protocols.ml_trade.message import MlTradeMessage
+from packages.fetchai.protocols.ml_trade.tensors import (
+    ALIGNMENT,
+    FORMAT_VERSION,
+    MAGIC,
+    decode_tensors,
+    encode_tensors,
+)
+
+DTYPES = [
+    "bool",
+    "int8",
+    "uint8",
+    "<i2",
+    ">i2",
+    "<u4",
+    ">i4",
+    "<i8",
+    ">u8",
+    "<f2",
+    "<f4",
+    ">f4",
+    "<f8",
+    ">f8",
+    "<c8",
+    ">c16",
+    "<M8[ms]",
+    "<m8[s]",
+    "<U3",
+    "S5",
+]
+SHAPES = [(), (0,), (1,), (7,), (3, 0), (4, 5), (2, 3, 4), (1, 1, 1, 1, 9)]
+
+
+def _random_array(rng: np.random.RandomState, dtype: str, shape: tuple) -> np.ndarray:
+    """Make an array of random bytes, with a given dtype and shape."""
+    dtype_ = np.dtype(dtype)
+    size = int(np.prod(shape, dtype=np.int64))
+    if dtype_.kind == "b":
+        return rng.randint(0, 2, size=shape).astype(dtype_)
+    if dtype_.kind in ("f", "c"):
+        # random bytes may be NaNs, which are not equal to themselves.
+        return (rng.standard_normal(size) * 1000).reshape(shape).astype(dtype_)
+    if dtype_.kind == "U":
+        letters = np.array(list("abcdefghij"))  # type: np.ndarray
+        return np.array(
+            ["".join(rng.choice(letters, 3)) for _ in range(size)], dtype=dtype_
+        ).reshape(shape)
+    raw = rng.randint(0, 256, size=size * dtype_.itemsize).astype(np.uint8)
+    return raw.view(dtype_).reshape(shape)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_dtype_and_shape_fidelity(dtype):
+    """Test that random arrays of any dtype and shape are decoded with the same values."""
+    rng = np.random.RandomState(sum(map(ord, dtype)))
+    tensors = [_random_array(rng, dtype, shape) for shape in SHAPES]
+    decoded = decode_tensors(encode_tensors(tensors))
+
+    assert len(decoded) == len(tensors)
+    for tensor, result in zip(tensors, decoded):
+        assert result.shape == tensor.shape
+        assert result.dtype == tensor.dtype.newbyteorder("<")
+        assert np.array_equal(result, tensor)
+
+
+def test_mixed_batch_and_random_layouts():
+    """Test batches of arrays with random dtypes, shapes and memory layouts."""
+    rng = np.random.RandomState(42)
+    for _ in range(50):
+        tensors = []
+        for _ in range(rng.randint(0, 5)):
+            dtype = DTYPES[rng.randint(len(DTYPES))]
+            shape = tuple(rng.randint(0, 5, size=rng.randint(0, 4)))
+            tensor = _random_array(rng, dtype, shape)
+            if tensor.ndim > 1 and rng.randint(2):
+                tensor = tensor.T
+            elif tensor.ndim == 1 and rng.randint(2):
+                tensor = tensor[::2]
+            tensors.append(tensor)
+        decoded = decode_tensors(encode_tensors(tensors))
+        assert [result.shape for result in decoded] == [t.shape for t in tensors]
+        assert all(np.array_equal(r, t) for r, t in zip(decoded, tensors))
+
+
+def test_decoded_arrays_are_views():
+    """Test that the decoded arrays are aligned, read-only views on the payload."""
+    x = np.arange(10 * 28 * 28, dtype=np.float32).reshape(10, 28, 28)
+    y = np.arange(10, dtype=np.uint8)
+    payload = encode_tensors((x, y))
+    buffer = np.frombuffer(payload, dtype=np.uint8)
+
+    decoded_x, decoded_y = decode_tensors(payload)
+    for result in (decoded_x, decoded_y):
+        assert np.shares_memory(result, buffer)
+        assert not result.flags.writeable
+        assert (result.ctypes.data - buffer.ctypes.data) % ALIGNMENT == 0
+    assert np.array_equal(decoded_x, x)
+    assert np.array_equal(decoded_y, y)
+
+
+def test_payload_in_message():
+    """Test the tensor payload through the serializer of the ml_trade protocol."""
+    data = np.random.rand(5, 28, 28), np.arange(5)
+    terms = Description({"batch_size": 5, "price": 10})
+    msg = MlTradeMessage(
+        performative=MlTradeMessage.Performative.DATA,
+        terms=terms,
+        payload=encode_tensors(data),
+    )
+    recovered_msg = MlTradeMessage.serializer.decode(
+        MlTradeMessage.serializer.encode(msg)
+    )
+    assert recovered_msg == msg
+    x, y = decode_tensors(recovered_msg.payload)
+    assert np.array_equal(x, data[0])
+    assert np.array_equal(y, data[1])
+
+
+def test_unsupported_dtypes():
+    """Test that arrays of objects and records cannot be encoded."""
+    with pytest.raises(ValueError, match="Cannot encode tensors"):
+        encode_tensors([np.array([1, "a", None], dtype=object)])
+    with pytest.raises(ValueError, match="Cannot encode tensors"):
+        encode_tensors([np.zeros(3, dtype=[("a", "<i4"), ("b", "<f8")])])
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        b"AEAT",
+        pickle.dumps((np.zeros(3), np.zeros(3))),
+        encode_tensors([np.zeros(3)])[:-1],
+        encode_tensors([np.zeros((2, 2))])[:20],
+    ],
+)
+def test_invalid_payload(payload):
+    """Test that invalid payloads are rejected."""
+    with pytest.raises(ValueError):
+        decode_tensors(payload)
+
+
+def test_unsupported_version():
+    """Test that the payloads of another version of the encoding are rejected."""
+    payload = bytearray(encode_tensors([np.zeros(3)]))
+    payload[len(MAGIC)] = FORMAT_VERSION + 1
+    with pytest.raises(ValueError, match="Unsupported tensor payload version"):
+        decode_tensors(bytes(payload))
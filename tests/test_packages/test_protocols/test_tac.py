@@ -23,6 +23,7 @@ from unittest import mock
 
 import pytest
 
+from packages.fetchai.protocols.tac import serialization as tac_serialization
 from packages.fetchai.protocols.tac.message import TacMessage
 
 
@@ -143,8 +144,7 @@ def test_tac_serialization():
     with pytest.raises(
         ValueError, match="Performative not valid: transaction_confirmation"
     ):
-        with mock.patch.object(TacMessage, "Performative") as mocked_type:
-            mocked_type.TRANSACTION_CONFIRMATION.value = "unknown"
+        with mock.patch.dict(tac_serialization._ENCODERS, clear=True):
             TacMessage.serializer.encode(msg)
 
     msg = TacMessage(
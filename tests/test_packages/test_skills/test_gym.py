@@ -75,3 +75,43 @@ class TestGymSkill(AEATestCaseEmpty):
         assert (
             self.is_successfully_terminated()
         ), "Gym agent wasn't successfully terminated."
+
+
+class TestGymSkillVectorised(AEATestCaseEmpty):
+    """Test that gym skill works with several copies of the environment."""
+
+    @skip_test_windows
+    def test_gym_vectorised(self):
+        """Run the gym skill sequence, stepping several copies of the environment."""
+        self.add_item("skill", "fetchai/gym:0.4.0")
+        self.add_item("connection", "fetchai/gym:0.4.0")
+        self.run_install()
+        self.set_config("agent.default_connection", "fetchai/gym:0.4.0")
+        self.set_config(
+            "vendor.fetchai.connections.gym.config.env", "gyms.env.BanditNArmedRandom"
+        )
+        gyms_src = os.path.join(ROOT_DIR, "examples", "gym_ex", "gyms")
+        gyms_dst = os.path.join(self.agent_name, "gyms")
+        shutil.copytree(gyms_src, gyms_dst)
+
+        # step 4 copies of the environment at once
+        self.set_config("vendor.fetchai.connections.gym.config.nb_envs", 4, "int")
+        self.set_config("vendor.fetchai.skills.gym.handlers.gym.args.nb_envs", 4, "int")
+        self.set_config(
+            "vendor.fetchai.skills.gym.handlers.gym.args.nb_steps", 40, "int"
+        )
+
+        gym_aea_process = self.run_agent()
+
+        check_strings = (
+            "Training starting ...",
+            "Training finished. You can exit now via CTRL+C.",
+        )
+        missing_strings = self.missing_from_output(gym_aea_process, check_strings)
+        assert (
+            missing_strings == []
+        ), "Strings {} didn't appear in agent output.".format(missing_strings)
+
+        assert (
+            self.is_successfully_terminated()
+        ), "Gym agent wasn't successfully terminated."
@@ -19,15 +19,47 @@
 
 """This test module contains the integration test for the weather skills."""
 
+import pickle  # nosec
 import sys
+from unittest.mock import MagicMock
+
+import numpy as np
 
 import pytest
 
+from aea.helpers.search.models import Description
 from aea.test_tools.test_cases import AEATestCaseMany, UseOef
 
+from packages.fetchai.protocols.ml_trade.message import MlTradeMessage
+from packages.fetchai.protocols.ml_trade.tensors import encode_tensors
+from packages.fetchai.skills.ml_train.handlers import MlTradeHandler
+
 from tests.conftest import FUNDED_FET_PRIVATE_KEY_1
 
 
+def _data_message(payload: bytes) -> MlTradeMessage:
+    """Make a data message with a payload."""
+    message = MlTradeMessage(
+        performative=MlTradeMessage.Performative.DATA,
+        terms=Description({"batch_size": 5}),
+        payload=payload,
+    )
+    message.counterparty = "data_provider_address"
+    return message
+
+
+def test_ml_train_ignores_unsupported_payload():
+    """Test that the model trainer ignores the data whose payload is not in the tensor encoding."""
+    handler = MlTradeHandler(name="ml_trade", skill_context=MagicMock())
+    data = np.zeros((5, 2)), np.zeros(5)
+    handler._handle_data(_data_message(pickle.dumps(data)), MagicMock())
+    handler.context.ml_model.update.assert_not_called()
+    handler.context.logger.warning.assert_called_once()
+
+    handler._handle_data(_data_message(encode_tensors(data)), MagicMock())
+    handler.context.ml_model.update.assert_called_once()
+
+
 class TestMLSkills(AEATestCaseMany, UseOef):
     """Test that ml skills work."""
 
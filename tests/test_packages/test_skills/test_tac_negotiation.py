@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This test module contains the tests for the service registration and search of the tac negotiation skill."""
+
+import datetime
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from aea.helpers.search.models import Description
+
+from packages.fetchai.protocols.oef_search.message import OefSearchMessage
+from packages.fetchai.skills.tac_negotiation.behaviours import (
+    GoodsRegisterAndSearchBehaviour,
+)
+from packages.fetchai.skills.tac_negotiation.registration import Registration
+from packages.fetchai.skills.tac_negotiation.search import Search
+from packages.fetchai.skills.tac_negotiation.strategy import Strategy
+
+
+def _make_search(**kwargs) -> Search:
+    """Make a search model, due to search."""
+    search = Search(name="search", skill_context=MagicMock(), **kwargs)
+    _make_due(search)
+    return search
+
+
+def _make_due(search: Search) -> None:
+    """Make the search model due to search."""
+    search._last_search_time = datetime.datetime.now() - datetime.timedelta(
+        seconds=search.search_interval + 1
+    )
+
+
+def _search_round(search: Search, agents: List[str]) -> float:
+    """Record a round of searches finding the agents, and return the next search interval."""
+    search.record_search_result(True, tuple(agents))
+    _make_due(search)
+    assert search.is_time_to_search_services()
+    return search.search_interval
+
+
+class TestSearchBackoff:
+    """Test the interval between the searches."""
+
+    def test_interval_doubles_while_results_unchanged(self):
+        """Test the interval doubles after each round of searches with the same results."""
+        search = _make_search(search_interval=5, max_search_interval=60)
+        assert search.search_interval == 5
+        intervals = [_search_round(search, ["agent_1"]) for _ in range(3)]
+        assert intervals == [5, 10, 20]
+
+    def test_interval_capped(self):
+        """Test the interval does not exceed the maximum search interval."""
+        search = _make_search(search_interval=5, max_search_interval=30)
+        intervals = [_search_round(search, ["agent_1"]) for _ in range(6)]
+        assert intervals == [5, 10, 20, 30, 30, 30]
+
+    def test_interval_reset_when_results_change(self):
+        """Test the interval is reset when the results of the searches change."""
+        search = _make_search(search_interval=5, max_search_interval=60)
+        for _ in range(3):
+            _search_round(search, ["agent_1"])
+        assert search.search_interval > 5
+        assert _search_round(search, ["agent_1", "agent_2"]) == 5
+
+    def test_interval_reset_explicitly(self):
+        """Test the interval is reset when the agent's own services change."""
+        search = _make_search(search_interval=5, max_search_interval=60)
+        for _ in range(3):
+            _search_round(search, ["agent_1"])
+        search.reset_search_interval()
+        assert search.search_interval == 5
+
+    def test_not_due(self):
+        """Test it is not time to search before the interval has elapsed."""
+        search = _make_search(search_interval=5)
+        assert search.is_time_to_search_services()
+        assert not search.is_time_to_search_services()
+
+
+class TestServiceRegistration:
+    """Test the behaviour registers the services only when they change."""
+
+    def setup(self):
+        """Set the tests up."""
+        self.context = MagicMock()
+        self.context.search_service_address = "search_service_address"
+        self.context.registration = Registration(
+            name="registration", skill_context=self.context
+        )
+        self.context.search = Search(name="search", skill_context=self.context)
+        self.behaviour = GoodsRegisterAndSearchBehaviour(
+            name="register_and_search", skill_context=self.context
+        )
+        self.descriptions = {
+            True: Description({"supplied": 1}),
+            False: Description({"demanded": 1}),
+        }
+
+    def _set_strategy(self, register_as: str) -> None:
+        """Use a strategy registering as the role, with the current descriptions."""
+        strategy = Strategy(
+            name="strategy", skill_context=self.context, register_as=register_as
+        )
+
+        def get_own_service_description(
+            is_supply: bool, is_search_description: bool
+        ) -> Description:
+            return self.descriptions[is_supply]
+
+        strategy.get_own_service_description = get_own_service_description  # type: ignore
+        self.context.strategy = strategy
+
+    def _sent_messages(self) -> List[OefSearchMessage]:
+        """Get the messages put in the outbox since the last call."""
+        messages = [
+            call[1]["message"]
+            for call in self.context.outbox.put_message.call_args_list
+        ]
+        self.context.outbox.put_message.reset_mock()
+        return messages
+
+    def test_register_both(self):
+        """Test an agent registering as both registers its supply and its demand."""
+        self._set_strategy("both")
+        self.behaviour._register_service()
+        messages = self._sent_messages()
+        assert [message.performative for message in messages] == [
+            OefSearchMessage.Performative.REGISTER_SERVICE,
+            OefSearchMessage.Performative.REGISTER_SERVICE,
+        ]
+        assert [message.service_description for message in messages] == [
+            self.descriptions[True],
+            self.descriptions[False],
+        ]
+        registration = self.context.registration
+        assert registration.registered_goods_supplied_description == (
+            self.descriptions[True]
+        )
+        assert registration.registered_goods_demanded_description == (
+            self.descriptions[False]
+        )
+
+    def test_unchanged_not_registered_again(self):
+        """Test an unchanged description is not registered again."""
+        self._set_strategy("both")
+        self.behaviour._register_service()
+        self._sent_messages()
+        self.behaviour._register_service()
+        assert self._sent_messages() == []
+
+    def test_unchanged_registered_again_when_due(self):
+        """Test an unchanged description is registered again after the refresh interval, without resetting the search interval."""
+        self._set_strategy("both")
+        self.behaviour._register_service()
+        self._sent_messages()
+        registration = self.context.registration
+        registration._registration_times[True] -= datetime.timedelta(
+            seconds=registration._refresh_interval + 1
+        )
+        with patch.object(self.context.search, "reset_search_interval") as reset:
+            self.behaviour._register_service()
+        reset.assert_not_called()
+        messages = self._sent_messages()
+        assert [
+            (message.performative, message.service_description) for message in messages
+        ] == [(OefSearchMessage.Performative.REGISTER_SERVICE, self.descriptions[True])]
+        assert not registration.is_time_to_refresh(is_supply=True)
+        self.behaviour._register_service()
+        assert self._sent_messages() == []
+
+    def test_changed_registered_again(self):
+        """Test a changed description is unregistered, then registered again, and resets the search interval."""
+        self._set_strategy("seller")
+        self.behaviour._register_service()
+        self._sent_messages()
+        old_description = self.descriptions[True]
+        self.descriptions[True] = Description({"supplied": 2})
+        with patch.object(self.context.search, "reset_search_interval") as reset:
+            self.behaviour._register_service()
+        reset.assert_called_once()
+        messages = self._sent_messages()
+        assert [
+            (message.performative, message.service_description) for message in messages
+        ] == [
+            (OefSearchMessage.Performative.UNREGISTER_SERVICE, old_description),
+            (OefSearchMessage.Performative.REGISTER_SERVICE, self.descriptions[True]),
+        ]
+        assert self.context.registration.registered_goods_demanded_description is None
@@ -22,12 +22,22 @@
 import os
 import shutil
 import tempfile
+from copy import copy
 from pathlib import Path
 
+import pytest
+
 from aea import AEA_DIR
 from aea.configurations.constants import DEFAULT_PROTOCOL
 from aea.mail.base import Envelope
-from aea.protocols.base import JSONSerializer, Message, ProtobufSerializer, Protocol
+from aea.protocols.base import (
+    JSONSerializer,
+    Message,
+    ProtobufSerializer,
+    Protocol,
+    SlottedMessage,
+)
+from aea.protocols.default.message import DefaultMessage
 
 from tests.conftest import UNKNOWN_PROTOCOL_PUBLIC_ID
 
@@ -98,6 +108,93 @@ class TestBaseSerializations:
         assert "Hello" in self.message2.body.keys()
 
 
+class SampleSlottedMessage(SlottedMessage):
+    """A message with two fields in slots."""
+
+    __slots__ = ("_content", "_count")
+
+
+class TestSlottedMessage:
+    """Test the messages storing their fields in slots."""
+
+    def test_fields(self):
+        """Test the fields are collected from the slots."""
+        assert SampleSlottedMessage._fields == ("content", "count")
+        assert not hasattr(SampleSlottedMessage(), "__dict__")
+
+    def test_set_get_unset(self):
+        """Test set, get, is_set and unset on fields and on other keys."""
+        message = SampleSlottedMessage(content="hello", other=1)
+        assert message._content == "hello"
+        assert message.get("content") == "hello"
+        assert message.get("count") is None
+        assert message.is_set("content") and not message.is_set("count")
+        assert message.get("other") == 1 and message.is_set("other")
+        message.set("count", 2)
+        message.unset("content")
+        message.unset("other")
+        message.unset("missing")
+        assert message.body == {"count": 2}
+        assert message._body_size() == 1
+
+    def test_body(self):
+        """Test the body is built from the slots and can be replaced."""
+        message = SampleSlottedMessage(body={"content": "hello"}, other=1)
+        assert message.body == {"content": "hello", "other": 1}
+        message.body = {"count": 3}
+        assert message.body == {"count": 3}
+        assert not message.is_set("content")
+
+    def test_body_view(self):
+        """Test the changes to the body are applied to the message."""
+        message = SampleSlottedMessage(content="hello", other=1)
+        body = message.body
+        body["count"] = 2
+        body["another"] = 3
+        del body["content"]
+        del body["other"]
+        assert message.get("count") == 2 and message.get("another") == 3
+        assert not message.is_set("content") and not message.is_set("other")
+        assert dict(body) == {"count": 2, "another": 3}
+        assert len(body) == 2 and "count" in body and "content" not in body
+        with pytest.raises(KeyError):
+            body["content"]
+        with pytest.raises(KeyError):
+            del body["content"]
+
+        body_copy = copy(body)
+        assert isinstance(body_copy, dict)
+        body_copy["count"] = 4
+        assert message.get("count") == 2
+
+        message.body = message.body
+        assert message.body == {"count": 2, "another": 3}
+
+    def test_equality_with_dictionary_message(self):
+        """Test a slotted message equals a message with the same body."""
+        message = SampleSlottedMessage(content="hello")
+        assert message == Message(content="hello")
+        assert str(message) == str(Message(content="hello"))
+
+    def test_generated_message(self):
+        """Test a generated message in 'slots' mode."""
+        message = DefaultMessage(
+            performative=DefaultMessage.Performative.BYTES, content=b"hello"
+        )
+        assert message.content == b"hello"
+        assert list(message.body.keys()) == [
+            "dialogue_reference",
+            "message_id",
+            "target",
+            "performative",
+            "content",
+        ]
+        assert message._is_consistent()
+        assert DefaultMessage.serializer.decode(message.encode()) == message
+        with pytest.raises(AssertionError, match="'error_code' content is not set."):
+            message.error_code
+
+
 class TestProtocolFromDir:
     """Test the 'Protocol.from_dir' method."""
 
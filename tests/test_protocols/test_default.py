@@ -25,6 +25,7 @@ from unittest import mock
 
 import pytest
 
+from aea.protocols.default import serialization as default_serialization
 from aea.protocols.default.message import DefaultMessage
 
 
@@ -42,10 +43,7 @@ def test_default_bytes_serialization():
     assert expected_msg == actual_msg
 
     with pytest.raises(ValueError):
-        with mock.patch(
-            "aea.protocols.default.message.DefaultMessage.Performative"
-        ) as mock_type_enum:
-            mock_type_enum.BYTES.value = "unknown"
+        with mock.patch.dict(default_serialization._ENCODERS, clear=True):
             assert DefaultMessage.serializer.encode(expected_msg), ""
 
 
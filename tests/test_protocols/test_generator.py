@@ -461,6 +461,62 @@ class UnionSubTypeToProtobufVariableNameTestCase(TestCase):
         mock.assert_called_once()
 
 
+@mock.patch("aea.protocols.generator.base.check_prerequisites")
+class SlottedMessageGenerationTestCase(TestCase):
+    """Test case for the generation of message classes in 'slots' mode."""
+
+    def test_fipa_message_matches_package(self, *mocks):
+        """Test the fipa message generated in 'slots' mode is the one of the package."""
+        black = pytest.importorskip("black")
+        protocol_generator = ProtocolGenerator(
+            os.path.join(
+                ROOT_DIR, "examples", "protocol_specification_ex", "fipa.yaml"
+            ),
+            path_to_protocol_package="packages.fetchai.protocols.",
+            slots=True,
+        )
+        generated = black.format_str(
+            protocol_generator._message_class_str(), mode=black.FileMode()
+        )
+        expected = Path(
+            ROOT_DIR, "packages", "fetchai", "protocols", "fipa", "message.py"
+        ).read_text()
+        assert generated.splitlines()[4:] == expected.splitlines()[4:]
+
+    def test_fipa_serialization_matches_package(self, *mocks):
+        """Test the fipa serialization generated in 'slots' mode is the one of the package."""
+        black = pytest.importorskip("black")
+        protocol_generator = ProtocolGenerator(
+            os.path.join(
+                ROOT_DIR, "examples", "protocol_specification_ex", "fipa.yaml"
+            ),
+            path_to_protocol_package="packages.fetchai.protocols.",
+            slots=True,
+        )
+        generated = black.format_str(
+            protocol_generator._serialization_class_str(), mode=black.FileMode()
+        )
+        expected = Path(
+            ROOT_DIR, "packages", "fetchai", "protocols", "fipa", "serialization.py"
+        ).read_text()
+        assert generated.splitlines()[4:] == expected.splitlines()[4:]
+        assert "_ENCODERS = {" in generated and "_DECODERS = {" in generated
+        assert "CopyFrom" not in generated
+
+    def test_message_without_slots(self, *mocks):
+        """Test the message generated by default stores its fields in the body."""
+        protocol_generator = ProtocolGenerator(
+            os.path.join(
+                ROOT_DIR, "examples", "protocol_specification_ex", "fipa.yaml"
+            ),
+            path_to_protocol_package="packages.fetchai.protocols.",
+        )
+        message_str = protocol_generator._message_class_str()
+        assert "class FipaMessage(Message):" in message_str
+        assert "__slots__" not in message_str
+        assert "len(self.body)" in message_str
+
+
 class ProtocolGeneratorTestCase(TestCase):
     """Test case for ProtocolGenerator class."""
 
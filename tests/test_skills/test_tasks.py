@@ -138,6 +138,15 @@ class TaskManagerTestCase(TestCase):
         obj._results_by_task_id = {"task_id": "result"}
         obj.get_task_result("task_id")
 
+    def test_discard_task_result(self):
+        """Test discard_task_result method."""
+        obj = TaskManager()
+        obj._results_by_task_id = {"task_id": "result"}
+        obj.discard_task_result("task_id")
+        assert obj._results_by_task_id == {}
+        with self.assertRaises(ValueError):
+            obj.discard_task_result("task_id")
+
 
 class TestTaskPoolManagementManager(TestCase):
     """Tests for pool management by task manager. Lazy and non lazy."""
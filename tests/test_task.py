@@ -17,13 +17,25 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the tests for the task manager."""
+import asyncio
+import sys
 from multiprocessing.pool import AsyncResult
 
+import numpy as np
+
 import pytest
 
 from aea.skills.tasks import Task, TaskManager
 
 
+def _describe_bytes(data: bytes):
+    return type(data).__name__, len(data), data[:3]
+
+
+def _describe_array(array: np.ndarray):
+    return array.shape, array.dtype.str, float(array.sum()), array.flags.owndata
+
+
 class MyTask(Task):
     def __init__(self, return_value):
         super().__init__()
@@ -130,6 +142,77 @@ class TestTaskManager:
         with pytest.raises(AttributeError, match="Can't pickle local object"):
             expected_task = task_result.get(self.WAIT_TIMEOUT)  # noqa
 
+    def test_task_result_kept_until_discarded(self):
+        """Test that the task manager keeps the results until they are discarded."""
+        task_id = self.task_manager.enqueue_task(self._return_a_constant, args=(32,))
+        task_result = self.task_manager.get_task_result(task_id)
+        assert self.task_manager.get_task_result(task_id) is task_result
+        self.task_manager.discard_task_result(task_id)
+        assert task_id not in self.task_manager._results_by_task_id
+        with pytest.raises(ValueError):
+            self.task_manager.get_task_result(task_id)
+        with pytest.raises(ValueError):
+            self.task_manager.discard_task_result(task_id)
+        assert task_result.get(self.WAIT_TIMEOUT) == 42
+
+    @pytest.mark.asyncio
+    async def test_task_future(self):
+        """Test that the future of a task is resolved on the event loop."""
+        kept_results = dict(self.task_manager._results_by_task_id)
+        future = self.task_manager.enqueue_task_future(
+            self._return_a_constant, args=(32,)
+        )
+        assert await asyncio.wait_for(future, self.WAIT_TIMEOUT) == 42
+        assert self.task_manager._results_by_task_id == kept_results
+
+    @pytest.mark.asyncio
+    async def test_task_future_exception(self):
+        """Test that the future of a failed task is resolved with the exception."""
+        future = self.task_manager.enqueue_task_future(self._return_a_constant)
+        with pytest.raises(TypeError, match="missing .+ required positional argument:"):
+            await asyncio.wait_for(future, self.WAIT_TIMEOUT)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="shared memory requires python 3.8"
+    )
+    def test_shared_memory_arguments(self):
+        """Test that large bytes and numpy arguments are passed through shared memory."""
+        task_manager = TaskManager(shared_memory_threshold=1024)
+        task_manager.start()
+        try:
+            data = b"abc" * 1000
+            task_id = task_manager.enqueue_task(_describe_bytes, args=(data,))
+            assert len(task_manager._shared_blocks_by_task_id[task_id]) == 1
+            result = task_manager.get_task_result(task_id).get(self.WAIT_TIMEOUT)
+            assert result == ("bytes", 3000, b"abc")
+
+            array = np.arange(1000, dtype=np.float64).reshape(10, 100)
+            task_id = task_manager.enqueue_task(_describe_array, kwds={"array": array})
+            result = task_manager.get_task_result(task_id).get(self.WAIT_TIMEOUT)
+            assert result == ((10, 100), "<f8", float(array.sum()), False)
+
+            small = np.arange(10)
+            task_id = task_manager.enqueue_task(_describe_array, args=(small,))
+            assert task_id not in task_manager._shared_blocks_by_task_id
+            result = task_manager.get_task_result(task_id).get(self.WAIT_TIMEOUT)
+            assert result[3] is True
+
+            assert task_manager._shared_blocks_by_task_id == {}
+        finally:
+            task_manager.stop()
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="shared memory requires python 3.8"
+    )
+    def test_shared_memory_released_on_stop(self):
+        """Test that the shared memory blocks of pending tasks are released when stopping."""
+        task_manager = TaskManager(shared_memory_threshold=1)
+        task_manager.start()
+        task_manager.enqueue_task(self._return_a_constant, args=(b"x",))
+        task_manager.stop()
+        assert task_manager._shared_blocks_by_task_id == {}
+        assert task_manager._results_by_task_id == {}
+
     @classmethod
     def teardown_class(cls):
         """Tear the test down."""